@@ -332,6 +332,19 @@ _PRIVATE_KEY_SIGNING_FILES = (
 
 GRPCIO_CC_SRCS += _PRIVATE_KEY_SIGNING_FILES
 
+_CHANNELZ_FILES = (
+    os.path.join(
+        PYTHON_STEM,
+        "grpc",
+        "_cython",
+        "_cygrpc",
+        "channelz",
+        "channelz_py_wrapper.cc",
+    ),
+)
+
+GRPCIO_CC_SRCS += _CHANNELZ_FILES
+
 CORE_C_FILES = tuple(grpc_core_dependencies.CORE_SOURCE_FILES)
 if "win32" in sys.platform:
     CORE_C_FILES = filter(lambda x: "third_party/cares" not in x, CORE_C_FILES)
@@ -12,10 +12,13 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
+#include "src/core/channelz/v2tov1/legacy_api.h"
+
 #include <grpc/grpc.h>
 #include <grpc/support/alloc.h>
 #include <grpc/support/string_util.h>
 
+#include <limits>
 #include <string>
 #include <vector>
 
@@ -47,39 +50,32 @@ std::string StripAdditionalInfoFromJson(absl::string_view json_str) {
   return JsonDump(Json::FromObject(std::move(object)));
 }
 
-namespace {
-
-class RegistryEntityFetcher : public EntityFetcher {
- public:
-  absl::StatusOr<std::string> GetEntity(int64_t id) override {
-    auto node = ChannelzRegistry::GetNode(id);
-    if (node == nullptr) {
-      return absl::NotFoundError(absl::StrCat("Entity not found: ", id));
-    }
-    return node->SerializeEntityToString(absl::ZeroDuration());
+absl::StatusOr<std::string> RegistryEntityFetcher::GetEntity(int64_t id) {
+  auto node = ChannelzRegistry::GetNode(id);
+  if (node == nullptr) {
+    return absl::NotFoundError(absl::StrCat("Entity not found: ", id));
   }
+  return node->SerializeEntityToString(absl::ZeroDuration());
+}
 
-  absl::StatusOr<std::vector<std::string>> GetEntitiesWithParent(
-      int64_t parent_id) override {
-    auto node = ChannelzRegistry::GetNode(parent_id);
-    if (node == nullptr) {
-      return absl::NotFoundError(
-          absl::StrCat("Parent entity not found: ", parent_id));
-    }
-    auto [nodes, end] = ChannelzRegistry::GetChildren(
-        node.get(), 0, std::numeric_limits<size_t>::max());
-    DCHECK(end);
-    std::vector<std::string> children_str;
-    for (const auto& child_node : nodes) {
-      if (child_node == nullptr) continue;
-      children_str.push_back(
-          child_node->SerializeEntityToString(absl::ZeroDuration()));
-    }
-    return children_str;
+absl::StatusOr<std::vector<std::string>>
+RegistryEntityFetcher::GetEntitiesWithParent(int64_t parent_id) {
+  auto node = ChannelzRegistry::GetNode(parent_id);
+  if (node == nullptr) {
+    return absl::NotFoundError(
+        absl::StrCat("Parent entity not found: ", parent_id));
   }
-};
-
-}  // namespace
+  auto [nodes, end] = ChannelzRegistry::GetChildren(
+      node.get(), 0, std::numeric_limits<size_t>::max());
+  DCHECK(end);
+  std::vector<std::string> children_str;
+  for (const auto& child_node : nodes) {
+    if (child_node == nullptr) continue;
+    children_str.push_back(
+        child_node->SerializeEntityToString(absl::ZeroDuration()));
+  }
+  return children_str;
+}
 
 }  // namespace v2tov1
 }  // namespace channelz
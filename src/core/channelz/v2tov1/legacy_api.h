@@ -15,8 +15,12 @@
 #ifndef GRPC_SRC_CORE_CHANNELZ_V2TOV1_LEGACY_API_H
 #define GRPC_SRC_CORE_CHANNELZ_V2TOV1_LEGACY_API_H
 
+#include <cstdint>
 #include <string>
+#include <vector>
 
+#include "src/core/channelz/v2tov1/convert.h"
+#include "absl/status/statusor.h"
 #include "absl/strings/string_view.h"
 
 namespace grpc_core {
@@ -25,6 +29,14 @@ namespace v2tov1 {
 
 std::string StripAdditionalInfoFromJson(absl::string_view json_str);
 
+// Fetches entities from the global ChannelzRegistry.
+class RegistryEntityFetcher : public EntityFetcher {
+ public:
+  absl::StatusOr<std::string> GetEntity(int64_t id) override;
+  absl::StatusOr<std::vector<std::string>> GetEntitiesWithParent(
+      int64_t parent_id) override;
+};
+
 }  // namespace v2tov1
 }  // namespace channelz
 }  // namespace grpc_core
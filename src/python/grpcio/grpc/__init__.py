@@ -787,6 +787,62 @@ class UnaryUnaryMultiCallable(abc.ABC):
         """
         raise NotImplementedError()
 
+    def batch(
+        self,
+        requests,
+        timeout=None,
+        metadata=None,
+        credentials=None,
+        wait_for_ready=None,
+        compression=None,
+    ):
+        """Asynchronously invokes the underlying RPC once per request.
+
+        The RPCs share a single deadline, metadata and options, and are all
+        started before this method returns.
+
+        This is an EXPERIMENTAL API.
+
+        Args:
+          requests: An iterable of request values, one per RPC.
+          timeout: An optional duration of time in seconds to allow for
+            all of the RPCs, measured from the start of the batch.
+          metadata: Optional :term:`metadata` to be transmitted to the
+            service-side of every RPC.
+          credentials: An optional CallCredentials for the RPCs. Only valid for
+            secure Channel.
+          wait_for_ready: An optional flag to enable :term:`wait_for_ready` mechanism.
+          compression: An element of grpc.Compression, e.g.
+            grpc.Compression.Gzip.
+
+        Returns:
+          A list of objects that are both Calls for the RPCs and Futures, in
+            the order of requests. grpc.experimental.as_completed yields them
+            in the order in which they terminate instead.
+
+        Raises:
+          RpcError: If a request could not be serialized. No RPC is left in
+            flight in that case.
+        """
+        futures = []
+        try:
+            for request in requests:
+                futures.append(
+                    self.future(
+                        request,
+                        timeout=timeout,
+                        metadata=metadata,
+                        credentials=credentials,
+                        wait_for_ready=wait_for_ready,
+                        compression=compression,
+                    )
+                )
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+        return futures
+
 
 class UnaryStreamMultiCallable(abc.ABC):
     """Affords invoking a unary-stream RPC from client-side."""
@@ -911,6 +967,9 @@ class StreamUnaryMultiCallable(abc.ABC):
 
         Args:
           request_iterator: An iterator that yields request values for the RPC.
+            EXPERIMENTAL: If None, the requests are instead sent with the
+            write and done_writing methods of the returned object, without
+            a thread consuming them.
           timeout: An optional duration of time in seconds to allow for
             the RPC. If None, the timeout is considered infinite.
           metadata: Optional :term:`metadata` to be transmitted to the
@@ -948,6 +1007,9 @@ class StreamStreamMultiCallable(abc.ABC):
 
         Args:
           request_iterator: An iterator that yields request values for the RPC.
+            EXPERIMENTAL: If None, the requests are instead sent with the
+            write and done_writing methods of the returned object, without
+            a thread consuming them.
           timeout: An optional duration of time in seconds to allow for
             the RPC. If not specified, the timeout is considered infinite.
           metadata: Optional :term:`metadata` to be transmitted to the
@@ -1188,12 +1250,24 @@ class ServicerContext(RpcContext, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
-    def set_compression(self, compression):
+    def set_compression(
+        self, compression, *, min_message_size=None, offload_message_size=None
+    ):
         """Set the compression algorithm to be used for the entire call.
 
         Args:
           compression: An element of grpc.Compression, e.g.
             grpc.Compression.Gzip.
+          min_message_size: EXPERIMENTAL: An optional size in bytes below
+            which response messages are sent uncompressed.
+          offload_message_size: EXPERIMENTAL: An optional size in bytes from
+            which response messages are compressed by the thread sending
+            them, before they are handed to the gRPC runtime, rather than by
+            the thread driving the transport. Only applies if called before
+            the initial metadata is sent. Not supported by the promise-based
+            server call of the gRPC runtime, which compresses the
+            precompressed messages again, so clients would receive them
+            still compressed.
         """
         raise NotImplementedError()
 
@@ -2215,8 +2289,9 @@ def server(
       options: An optional list of key-value pairs (:term:`channel_arguments` in gRPC runtime)
         to configure the channel.
       maximum_concurrent_rpcs: The maximum number of concurrent RPCs this server
-        will service before returning RESOURCE_EXHAUSTED status, or None to
-        indicate no limit.
+        will service before returning RESOURCE_EXHAUSTED status, None to
+        indicate no limit, or a grpc.experimental.AdaptiveConcurrencyLimiter
+        to limit every method to a limit that adapts to its latency.
       compression: An element of grpc.Compression, e.g.
         grpc.Compression.Gzip. This compression algorithm will be used for the
         lifetime of the server unless overridden.
@@ -25,6 +25,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -42,6 +43,7 @@ from grpc import _observability
 from grpc._cython import cygrpc
 from grpc._typing import ChannelArgumentType
 from grpc._typing import DeserializingFunction
+from grpc._typing import IntegratedCallBatchFactory
 from grpc._typing import IntegratedCallFactory
 from grpc._typing import MetadataType
 from grpc._typing import NullaryCallbackType
@@ -134,6 +136,7 @@ class _RPCState:
     rpc_end_time: Optional[float]  # In relative seconds
     method: Optional[str]
     target: Optional[str]
+    phase_timer: Optional[_observability.ClientRpcPhaseTimer]
 
     def __init__(
         self,
@@ -160,12 +163,13 @@ class _RPCState:
         self.code = code
         self.details = details
         self.debug_error_string = None
-        # The following three fields are used for observability.
+        # The following fields are used for observability.
         # Updates to those fields do not trigger self.condition.
         self.rpc_start_time = None
         self.rpc_end_time = None
         self.method = None
         self.target = None
+        self.phase_timer = None
 
         # The semantics of grpc.Future.cancel and grpc.Future.cancelled are
         # slightly wonky, so they have to be tracked separately from the rest of the
@@ -188,22 +192,61 @@ def _abort(state: _RPCState, code: grpc.StatusCode, details: str) -> None:
         state.trailing_metadata = ()
 
 
+def _serialize_request(
+    request: Any,
+    request_serializer: Optional[SerializingFunction],
+    phase_timer: Optional[_observability.ClientRpcPhaseTimer],
+) -> Optional[bytes]:
+    if phase_timer is None:
+        return _common.serialize(request, request_serializer)
+    start_ns = time.monotonic_ns()
+    serialized_request = _common.serialize(request, request_serializer)
+    phase_timer.add("serialization", start_ns)
+    return serialized_request
+
+
+def _deserialize_response(
+    serialized_response: bytes,
+    response_deserializer: Optional[DeserializingFunction],
+    phase_timer: Optional[_observability.ClientRpcPhaseTimer],
+) -> Any:
+    if phase_timer is None:
+        return _common.deserialize(serialized_response, response_deserializer)
+    start_ns = phase_timer.response_received()
+    response = _common.deserialize(serialized_response, response_deserializer)
+    phase_timer.add("deserialization", start_ns)
+    return response
+
+
+def _response_delivered(state: _RPCState) -> None:
+    if state.phase_timer is not None:
+        state.phase_timer.response_delivered()
+
+
+def _responses_abandoned(state: _RPCState) -> None:
+    if state.phase_timer is not None:
+        state.phase_timer.responses_abandoned()
+
+
 def _handle_event(
     event: cygrpc.BaseEvent,
     state: _RPCState,
     response_deserializer: Optional[DeserializingFunction],
 ) -> List[NullaryCallbackType]:
     callbacks = []
+    phase_timer = state.phase_timer
     for batch_operation in event.batch_operations:
         operation_type = batch_operation.type()
         state.due.remove(operation_type)
         if operation_type == cygrpc.OperationType.receive_initial_metadata:
             state.initial_metadata = batch_operation.initial_metadata()
+            if phase_timer is not None:
+                phase_timer.add("initial_metadata", phase_timer.start_ns)
         elif operation_type == cygrpc.OperationType.receive_message:
             serialized_response = batch_operation.message()
             if serialized_response is not None:
-                response = _common.deserialize(
-                    serialized_response, response_deserializer
+                response = _deserialize_response(
+                    serialized_response, response_deserializer, phase_timer
                 )
                 if response is None:
                     details = "Exception deserializing response!"
@@ -227,6 +270,8 @@ def _handle_event(
                     state.debug_error_string = batch_operation.error_string()
             state.rpc_end_time = time.perf_counter()
             _observability.maybe_record_rpc_latency(state)
+            if phase_timer is not None:
+                phase_timer.status_received()
             callbacks.extend(state.callbacks)
             state.callbacks = None
     return callbacks
@@ -238,6 +283,8 @@ def _event_handler(
     def handle_event(event):
         with state.condition:
             callbacks = _handle_event(event, state, response_deserializer)
+            if callbacks:
+                _response_delivered(state)
             state.condition.notify_all()
             done = not state.due
         for callback in callbacks:
@@ -254,8 +301,71 @@ def _event_handler(
     return handle_event
 
 
+def _send_request(
+    state: _RPCState,
+    call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall],
+    request: Any,
+    request_serializer: SerializingFunction,
+    event_handler: Optional[UserTag],
+) -> bool:
+    """Sends a request and blocks until the transport has taken it.
+
+    Returns:
+      Whether the RPC is still active after the request was sent.
+    """
+    serialized_request = _serialize_request(
+        request, request_serializer, state.phase_timer
+    )
+    with state.condition:
+        if state.code is not None or state.cancelled:
+            return False
+        if serialized_request is None:
+            code = grpc.StatusCode.INTERNAL
+            details = "Exception serializing request!"
+            call.cancel(
+                _common.STATUS_CODE_TO_CYGRPC_STATUS_CODE[code],
+                details,
+            )
+            _abort(state, code, details)
+            return False
+        state.due.add(cygrpc.OperationType.send_message)
+        operations = (
+            cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
+        )
+        operating = call.operate(operations, event_handler)
+        if not operating:
+            state.due.remove(cygrpc.OperationType.send_message)
+            return False
+
+        def _done():
+            return (
+                state.code is not None
+                or cygrpc.OperationType.send_message not in state.due
+            )
+
+        _common.wait(
+            state.condition.wait,
+            _done,
+            spin_cb=functools.partial(cygrpc.block_if_fork_in_progress, state),
+        )
+        return state.code is None
+
+
+def _send_close_from_client(
+    state: _RPCState,
+    call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall],
+    event_handler: Optional[UserTag],
+) -> None:
+    with state.condition:
+        if state.code is None:
+            state.due.add(cygrpc.OperationType.send_close_from_client)
+            operations = (cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),)
+            operating = call.operate(operations, event_handler)
+            if not operating:
+                state.due.remove(cygrpc.OperationType.send_close_from_client)
+
+
 # TODO(xuanwn): Create a base class for IntegratedCall and SegregatedCall.
-# pylint: disable=too-many-statements
 def _consume_request_iterator(
     request_iterator: Iterator,
     state: _RPCState,
@@ -265,7 +375,7 @@ def _consume_request_iterator(
 ) -> None:
     """Consume a request supplied by the user."""
 
-    def consume_request_iterator():  # pylint: disable=too-many-branches
+    def consume_request_iterator():
         # Iterate over the request iterator until it is exhausted or an error
         # condition is encountered.
         while True:
@@ -290,58 +400,11 @@ def _consume_request_iterator(
             finally:
                 if not return_from_user_request_generator_invoked:
                     cygrpc.return_from_user_request_generator()
-            serialized_request = _common.serialize(request, request_serializer)
-            with state.condition:
-                if state.code is None and not state.cancelled:
-                    if serialized_request is None:
-                        code = grpc.StatusCode.INTERNAL
-                        details = "Exception serializing request!"
-                        call.cancel(
-                            _common.STATUS_CODE_TO_CYGRPC_STATUS_CODE[code],
-                            details,
-                        )
-                        _abort(state, code, details)
-                        return
-                    state.due.add(cygrpc.OperationType.send_message)
-                    operations = (
-                        cygrpc.SendMessageOperation(
-                            serialized_request, _EMPTY_FLAGS
-                        ),
-                    )
-                    operating = call.operate(operations, event_handler)
-                    if not operating:
-                        state.due.remove(cygrpc.OperationType.send_message)
-                        return
-
-                    def _done():
-                        return (
-                            state.code is not None
-                            or cygrpc.OperationType.send_message
-                            not in state.due
-                        )
-
-                    _common.wait(
-                        state.condition.wait,
-                        _done,
-                        spin_cb=functools.partial(
-                            cygrpc.block_if_fork_in_progress, state
-                        ),
-                    )
-                    if state.code is not None:
-                        return
-                else:
-                    return
-        with state.condition:
-            if state.code is None:
-                state.due.add(cygrpc.OperationType.send_close_from_client)
-                operations = (
-                    cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
-                )
-                operating = call.operate(operations, event_handler)
-                if not operating:
-                    state.due.remove(
-                        cygrpc.OperationType.send_close_from_client
-                    )
+            if not _send_request(
+                state, call, request, request_serializer, event_handler
+            ):
+                return
+        _send_close_from_client(state, call, event_handler)
 
     consumption_thread = cygrpc.ForkManagedThread(
         target=consume_request_iterator
@@ -350,6 +413,81 @@ def _consume_request_iterator(
     consumption_thread.start()
 
 
+class _RequestWriter:
+    """Sends the requests written to a call started without an iterator.
+
+    Requests are sent on the writing thread, so such calls need no thread of
+    their own to consume requests.
+    """
+
+    _state: _RPCState
+    _call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall]
+    _request_serializer: SerializingFunction
+    _event_handler: Optional[UserTag]
+    _lock: threading.Lock
+    _done_writing: bool
+
+    def __init__(
+        self,
+        state: _RPCState,
+        call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall],
+        request_serializer: SerializingFunction,
+        event_handler: Optional[UserTag],
+    ):
+        self._state = state
+        self._call = call
+        self._request_serializer = request_serializer
+        self._event_handler = event_handler
+        # Serializes writers so that requests are sent one at a time.
+        self._lock = threading.Lock()
+        self._done_writing = False
+
+    def write(self, request: Any) -> bool:
+        with self._lock:
+            if self._done_writing:
+                raise grpc.experimental.UsageError(
+                    "Cannot write to a call after done_writing()."
+                )
+            return _send_request(
+                self._state,
+                self._call,
+                request,
+                self._request_serializer,
+                self._event_handler,
+            )
+
+    def done_writing(self) -> None:
+        with self._lock:
+            if not self._done_writing:
+                self._done_writing = True
+                _send_close_from_client(
+                    self._state, self._call, self._event_handler
+                )
+
+
+def _start_sending_requests(
+    request_iterator: Optional[Iterator],
+    state: _RPCState,
+    call: Union[cygrpc.IntegratedCall, cygrpc.SegregatedCall],
+    request_serializer: SerializingFunction,
+    event_handler: Optional[UserTag],
+) -> Optional[_RequestWriter]:
+    """Consumes request_iterator, or returns a writer if there is none."""
+    if request_iterator is None:
+        return _RequestWriter(state, call, request_serializer, event_handler)
+    _consume_request_iterator(
+        request_iterator, state, call, request_serializer, event_handler
+    )
+    return None
+
+
+def _phase_timings(state: _RPCState) -> Optional[Dict[str, float]]:
+    with state.condition:
+        if state.phase_timer is None:
+            return None
+        return state.phase_timer.durations_ms()
+
+
 def _rpc_state_string(class_name: str, rpc_state: _RPCState) -> str:
     """Calculates error string for RPC."""
     with rpc_state.condition:
@@ -399,6 +537,7 @@ class _InactiveRpcError(grpc.RpcError, grpc.Call, grpc.Future):
             )
             self._state.response = copy.copy(state.response)
             self._state.debug_error_string = copy.copy(state.debug_error_string)
+            self._state.phase_timer = state.phase_timer
 
     def initial_metadata(self) -> Optional[MetadataType]:
         return self._state.initial_metadata
@@ -415,6 +554,10 @@ class _InactiveRpcError(grpc.RpcError, grpc.Call, grpc.Future):
     def debug_error_string(self) -> Optional[str]:
         return _common.decode(self._state.debug_error_string)
 
+    def phase_timings(self) -> Optional[Dict[str, float]]:
+        """See _Rendezvous.phase_timings."""
+        return _phase_timings(self._state)
+
     def _repr(self) -> str:
         return _rpc_state_string(self.__class__.__name__, self._state)
 
@@ -526,8 +669,12 @@ class _Rendezvous(grpc.RpcError, grpc.RpcContext):
                 self._state.cancelled = True
                 _abort(self._state, code, details)
                 self._state.condition.notify_all()
-                return True
-            return False
+                cancelled = True
+            else:
+                cancelled = False
+        if cancelled:
+            _responses_abandoned(self._state)
+        return cancelled
 
     def add_callback(self, callback: NullaryCallbackType) -> bool:
         """See grpc.RpcContext.add_callback"""
@@ -537,6 +684,18 @@ class _Rendezvous(grpc.RpcError, grpc.RpcContext):
             self._state.callbacks.append(callback)
             return True
 
+    def phase_timings(self) -> Optional[Dict[str, float]]:
+        """Returns the time the RPC spent in each of its phases so far.
+
+        THIS IS AN EXPERIMENTAL API.
+
+        Returns:
+          The latency of each phase in milliseconds, keyed by the phase names
+          of grpc._observability.ObservabilityPlugin.record_client_rpc_phases,
+          or None if the RPC was started without phase timing enabled.
+        """
+        return _phase_timings(self._state)
+
     def __iter__(self):
         return self
 
@@ -572,6 +731,7 @@ class _Rendezvous(grpc.RpcError, grpc.RpcContext):
                     self._state.details,
                 )
                 self._state.condition.notify_all()
+        _responses_abandoned(self._state)
 
 
 class _SingleThreadedRendezvous(
@@ -624,6 +784,7 @@ class _SingleThreadedRendezvous(
                     "result() when the RPC is complete."
                 )
                 raise grpc.experimental.UsageError(error_msg)
+            _response_delivered(self._state)
             if self._state.code is grpc.StatusCode.OK:
                 return self._state.response
             if self._state.cancelled:
@@ -730,6 +891,8 @@ class _SingleThreadedRendezvous(
             callbacks = _handle_event(
                 event, self._state, self._response_deserializer
             )
+            if callbacks:
+                _response_delivered(self._state)
             for callback in callbacks:
                 # NOTE(gnossen): We intentionally allow exceptions to bubble up
                 # to the user when running on a single thread.
@@ -743,6 +906,7 @@ class _SingleThreadedRendezvous(
                 if self._state.response is not None:
                     response = self._state.response
                     self._state.response = None
+                    _response_delivered(self._state)
                     return response
                 if cygrpc.OperationType.receive_message not in self._state.due:
                     if self._state.code is grpc.StatusCode.OK:
@@ -797,9 +961,73 @@ class _MultiThreadedRendezvous(
 
     This extra thread allows _MultiThreadedRendezvous to fulfill the grpc.Future interface
     and to mediate a bidirection streaming RPC.
+
+    Attributes:
+      _request_writer: The _RequestWriter of a client-streaming RPC started
+        without a request iterator, or None.
     """
 
     _state: _RPCState
+    _request_writer: Optional[_RequestWriter]
+
+    def __init__(
+        self,
+        state: _RPCState,
+        call: Union[cygrpc.SegregatedCall, cygrpc.IntegratedCall],
+        response_deserializer: Optional[DeserializingFunction],
+        deadline: Optional[float],
+        request_writer: Optional[_RequestWriter] = None,
+    ):
+        super(_MultiThreadedRendezvous, self).__init__(
+            state, call, response_deserializer, deadline
+        )
+        self._request_writer = request_writer
+
+    def write(self, request: Any) -> None:
+        """Sends a request of an RPC started without a request iterator.
+
+        Blocks until the transport has taken the request, which applies the
+        flow control of the RPC to the writer.
+
+        THIS IS AN EXPERIMENTAL API.
+
+        Args:
+          request: The request value to send.
+
+        Raises:
+          grpc.RpcError: If the RPC terminated with a non-OK status before
+            the request could be sent.
+          grpc.experimental.UsageError: If the RPC was started with a request
+            iterator, done_writing() was called, or the RPC already
+            completed successfully.
+        """
+        if self._request_writer is None:
+            raise grpc.experimental.UsageError(
+                "Cannot write to a call started with a request iterator."
+            )
+        if not self._request_writer.write(request):
+            with self._state.condition:
+                _common.wait(self._state.condition.wait, self._is_complete)
+                if self._state.code is not grpc.StatusCode.OK:
+                    raise self
+            raise grpc.experimental.UsageError(
+                "Cannot write to a call that already completed."
+            )
+
+    def done_writing(self) -> None:
+        """Signals the end of the requests of an RPC started without them.
+
+        THIS IS AN EXPERIMENTAL API.
+
+        Raises:
+          grpc.experimental.UsageError: If the RPC was started with a request
+            iterator.
+        """
+        if self._request_writer is None:
+            raise grpc.experimental.UsageError(
+                "Cannot half-close a call started with a request iterator."
+            )
+        self._request_writer.done_writing()
 
     def initial_metadata(self) -> Optional[MetadataType]:
         """See grpc.Call.initial_metadata"""
@@ -876,6 +1104,7 @@ class _MultiThreadedRendezvous(
             )
             if timed_out:
                 raise grpc.FutureTimeoutError()
+            _response_delivered(self._state)
             if self._state.code is grpc.StatusCode.OK:
                 return self._state.response
             if self._state.cancelled:
@@ -957,6 +1186,7 @@ class _MultiThreadedRendezvous(
             if self._state.response is not None:
                 response = self._state.response
                 self._state.response = None
+                _response_delivered(self._state)
                 return response
             if cygrpc.OperationType.receive_message not in self._state.due:
                 if self._state.code is grpc.StatusCode.OK:
@@ -969,28 +1199,35 @@ def _start_unary_request(
     request: Any,
     timeout: Optional[float],
     request_serializer: Optional[SerializingFunction],
+    phase_timer: Optional[_observability.ClientRpcPhaseTimer],
 ) -> Tuple[Optional[float], Optional[bytes], Optional[grpc.RpcError]]:
     deadline = _deadline(timeout)
-    serialized_request = _common.serialize(request, request_serializer)
+    serialized_request = _serialize_request(
+        request, request_serializer, phase_timer
+    )
     if serialized_request is None:
-        state = _RPCState(
-            (),
-            (),
-            (),
-            grpc.StatusCode.INTERNAL,
-            "Exception serializing request!",
-        )
-        error = _InactiveRpcError(state)
-        return deadline, None, error
+        return deadline, None, _serialization_error()
     return deadline, serialized_request, None
 
 
+def _serialization_error() -> grpc.RpcError:
+    state = _RPCState(
+        (),
+        (),
+        (),
+        grpc.StatusCode.INTERNAL,
+        "Exception serializing request!",
+    )
+    return _InactiveRpcError(state)
+
+
 def _end_unary_response_blocking(
     state: _RPCState,
     call: cygrpc.SegregatedCall,
     with_call: bool,
     deadline: Optional[float],
 ) -> Union[ResponseType, Tuple[ResponseType, grpc.Call]]:
+    _response_delivered(state)
     if state.code is grpc.StatusCode.OK:
         if with_call:
             rendezvous = _MultiThreadedRendezvous(state, call, None, deadline)
@@ -1039,9 +1276,60 @@ def _determine_deadline(user_deadline: Optional[float]) -> Optional[float]:
     return min(parent_deadline, user_deadline)
 
 
+def _serialize_batch_requests(
+    requests: Iterable[Any],
+    request_serializer: Optional[SerializingFunction],
+    method: bytes,
+    target: bytes,
+) -> List[Tuple[bytes, Optional[_observability.ClientRpcPhaseTimer]]]:
+    serialized_requests_and_phase_timers = []
+    for request in requests:
+        phase_timer = _observability.maybe_create_client_rpc_phase_timer(
+            method, target
+        )
+        serialized_request = _serialize_request(
+            request, request_serializer, phase_timer
+        )
+        if serialized_request is None:
+            raise _serialization_error()
+        serialized_requests_and_phase_timers.append(
+            (serialized_request, phase_timer)
+        )
+    return serialized_requests_and_phase_timers
+
+
+def _encode_batch_metadata(
+    metadata: Optional[MetadataType],
+    compression: Optional[grpc.Compression],
+) -> Optional[MetadataType]:
+    # Encoded once here, the metadata is shared by every RPC of the batch.
+    augmented_metadata = _compression.augment_metadata(metadata, compression)
+    if not augmented_metadata or isinstance(
+        augmented_metadata, cygrpc.EncodedMetadata
+    ):
+        return augmented_metadata
+    return cygrpc.EncodedMetadata(augmented_metadata)
+
+
+def _unary_unary_operations(
+    metadata: Optional[MetadataType],
+    initial_metadata_flags: int,
+    serialized_request: bytes,
+) -> Sequence[cygrpc.Operation]:
+    return (
+        cygrpc.SendInitialMetadataOperation(metadata, initial_metadata_flags),
+        cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
+        cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
+        cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),
+        cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),
+        cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
+    )
+
+
 class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
     _channel: cygrpc.Channel
     _managed_call: IntegratedCallFactory
+    _managed_call_batch: IntegratedCallBatchFactory
     _method: bytes
     _target: bytes
     _request_serializer: Optional[SerializingFunction]
@@ -1053,6 +1341,7 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
         "_channel",
         "_context",
         "_managed_call",
+        "_managed_call_batch",
         "_method",
         "_request_serializer",
         "_response_deserializer",
@@ -1064,6 +1353,7 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
         self,
         channel: cygrpc.Channel,
         managed_call: IntegratedCallFactory,
+        managed_call_batch: IntegratedCallBatchFactory,
         method: bytes,
         target: bytes,
         request_serializer: Optional[SerializingFunction],
@@ -1072,6 +1362,7 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
     ):
         self._channel = channel
         self._managed_call = managed_call
+        self._managed_call_batch = managed_call_batch
         self._method = method
         self._target = target
         self._request_serializer = request_serializer
@@ -1092,8 +1383,11 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
         Optional[float],
         Optional[grpc.RpcError],
     ]:
+        phase_timer = _observability.maybe_create_client_rpc_phase_timer(
+            self._method, self._target
+        )
         deadline, serialized_request, rendezvous = _start_unary_request(
-            request, timeout, self._request_serializer
+            request, timeout, self._request_serializer, phase_timer
         )
         initial_metadata_flags = _InitialMetadataFlags().with_wait_for_ready(
             wait_for_ready
@@ -1104,15 +1398,9 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
         if serialized_request is None:
             return None, None, None, rendezvous
         state = _RPCState(_UNARY_UNARY_INITIAL_DUE, None, None, None, None)
-        operations = (
-            cygrpc.SendInitialMetadataOperation(
-                augmented_metadata, initial_metadata_flags
-            ),
-            cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
-            cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
-            cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),
-            cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),
-            cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
+        state.phase_timer = phase_timer
+        operations = _unary_unary_operations(
+            augmented_metadata, initial_metadata_flags, serialized_request
         )
         return state, operations, deadline, None
 
@@ -1215,6 +1503,81 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
             state, call, self._response_deserializer, deadline
         )
 
+    def _batch_operations(
+        self,
+        serialized_requests: Sequence[
+            Tuple[bytes, Optional[_observability.ClientRpcPhaseTimer]]
+        ],
+        metadata: Optional[MetadataType],
+        initial_metadata_flags: int,
+    ) -> Tuple[
+        List[_RPCState],
+        List[Tuple[Sequence[Sequence[cygrpc.Operation]], UserTag]],
+    ]:
+        method = _common.decode(self._method)
+        target = _common.decode(self._target)
+        rpc_start_time = time.perf_counter()
+        states = []
+        operationses_and_event_handlers = []
+        for serialized_request, phase_timer in serialized_requests:
+            state = _RPCState(_UNARY_UNARY_INITIAL_DUE, None, None, None, None)
+            state.rpc_start_time = rpc_start_time
+            state.method = method
+            state.target = target
+            state.phase_timer = phase_timer
+            states.append(state)
+            operations = _unary_unary_operations(
+                metadata, initial_metadata_flags, serialized_request
+            )
+            operationses_and_event_handlers.append(
+                (
+                    (operations,),
+                    _event_handler(state, self._response_deserializer),
+                )
+            )
+        return states, operationses_and_event_handlers
+
+    def batch(
+        self,
+        requests: Iterable[Any],
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> List[_MultiThreadedRendezvous]:
+        # Everything that does not depend on the request is computed once for
+        # the whole batch, and every request is serialized before any RPC is
+        # started so that a serialization failure leaves nothing in flight.
+        serialized_requests = _serialize_batch_requests(
+            requests, self._request_serializer, self._method, self._target
+        )
+        deadline = _deadline(timeout)
+        states, operationses_and_event_handlers = self._batch_operations(
+            serialized_requests,
+            _encode_batch_metadata(metadata, compression),
+            _InitialMetadataFlags().with_wait_for_ready(wait_for_ready),
+        )
+        if not states:
+            return []
+        calls = self._managed_call_batch(
+            cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS,
+            self._method,
+            None,
+            deadline,
+            metadata,
+            None if credentials is None else credentials._credentials,
+            operationses_and_event_handlers,
+            self._context,
+            self._registered_call_handle,
+        )
+        return [
+            _MultiThreadedRendezvous(
+                state, call, self._response_deserializer, deadline
+            )
+            for state, call in zip(states, calls)
+        ]
+
 
 class _SingleThreadedUnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
     _channel: cygrpc.Channel
@@ -1262,8 +1625,11 @@ class _SingleThreadedUnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
         compression: Optional[grpc.Compression] = None,
     ) -> _SingleThreadedRendezvous:
         deadline = _deadline(timeout)
-        serialized_request = _common.serialize(
-            request, self._request_serializer
+        phase_timer = _observability.maybe_create_client_rpc_phase_timer(
+            self._method, self._target
+        )
+        serialized_request = _serialize_request(
+            request, self._request_serializer, phase_timer
         )
         if serialized_request is None:
             state = _RPCState(
@@ -1276,6 +1642,7 @@ class _SingleThreadedUnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
             raise _InactiveRpcError(state)
 
         state = _RPCState(_UNARY_STREAM_INITIAL_DUE, None, None, None, None)
+        state.phase_timer = phase_timer
         call_credentials = (
             None if credentials is None else credentials._credentials
         )
@@ -1365,8 +1732,11 @@ class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
         wait_for_ready: Optional[bool] = None,
         compression: Optional[grpc.Compression] = None,
     ) -> _MultiThreadedRendezvous:
+        phase_timer = _observability.maybe_create_client_rpc_phase_timer(
+            self._method, self._target
+        )
         deadline, serialized_request, rendezvous = _start_unary_request(
-            request, timeout, self._request_serializer
+            request, timeout, self._request_serializer, phase_timer
         )
         initial_metadata_flags = _InitialMetadataFlags().with_wait_for_ready(
             wait_for_ready
@@ -1377,6 +1747,7 @@ class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
             metadata, compression
         )
         state = _RPCState(_UNARY_STREAM_INITIAL_DUE, None, None, None, None)
+        state.phase_timer = phase_timer
         operations = (
             (
                 cygrpc.SendInitialMetadataOperation(
@@ -1459,6 +1830,9 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
     ) -> Tuple[_RPCState, cygrpc.SegregatedCall]:
         deadline = _deadline(timeout)
         state = _RPCState(_STREAM_UNARY_INITIAL_DUE, None, None, None, None)
+        state.phase_timer = _observability.maybe_create_client_rpc_phase_timer(
+            self._method, self._target
+        )
         initial_metadata_flags = _InitialMetadataFlags().with_wait_for_ready(
             wait_for_ready
         )
@@ -1533,7 +1907,7 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
 
     def future(
         self,
-        request_iterator: Iterator,
+        request_iterator: Optional[Iterator] = None,
         timeout: Optional[float] = None,
         metadata: Optional[MetadataType] = None,
         credentials: Optional[grpc.CallCredentials] = None,
@@ -1542,6 +1916,9 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
     ) -> _MultiThreadedRendezvous:
         deadline = _deadline(timeout)
         state = _RPCState(_STREAM_UNARY_INITIAL_DUE, None, None, None, None)
+        state.phase_timer = _observability.maybe_create_client_rpc_phase_timer(
+            self._method, self._target
+        )
         event_handler = _event_handler(state, self._response_deserializer)
         initial_metadata_flags = _InitialMetadataFlags().with_wait_for_ready(
             wait_for_ready
@@ -1566,15 +1943,18 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
             self._context,
             self._registered_call_handle,
         )
-        _consume_request_iterator(
-            request_iterator,
+        return _MultiThreadedRendezvous(
             state,
             call,
-            self._request_serializer,
-            event_handler,
-        )
-        return _MultiThreadedRendezvous(
-            state, call, self._response_deserializer, deadline
+            self._response_deserializer,
+            deadline,
+            _start_sending_requests(
+                request_iterator,
+                state,
+                call,
+                self._request_serializer,
+                event_handler,
+            ),
         )
 
 
@@ -1620,7 +2000,7 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
 
     def __call__(
         self,
-        request_iterator: Iterator,
+        request_iterator: Optional[Iterator] = None,
         timeout: Optional[float] = None,
         metadata: Optional[MetadataType] = None,
         credentials: Optional[grpc.CallCredentials] = None,
@@ -1629,6 +2009,9 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
     ) -> _MultiThreadedRendezvous:
         deadline = _deadline(timeout)
         state = _RPCState(_STREAM_STREAM_INITIAL_DUE, None, None, None, None)
+        state.phase_timer = _observability.maybe_create_client_rpc_phase_timer(
+            self._method, self._target
+        )
         initial_metadata_flags = _InitialMetadataFlags().with_wait_for_ready(
             wait_for_ready
         )
@@ -1660,15 +2043,18 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
             self._context,
             self._registered_call_handle,
         )
-        _consume_request_iterator(
-            request_iterator,
+        return _MultiThreadedRendezvous(
             state,
             call,
-            self._request_serializer,
-            event_handler,
-        )
-        return _MultiThreadedRendezvous(
-            state, call, self._response_deserializer, deadline
+            self._response_deserializer,
+            deadline,
+            _start_sending_requests(
+                request_iterator,
+                state,
+                call,
+                self._request_serializer,
+                event_handler,
+            ),
         )
 
 
@@ -1801,6 +2187,84 @@ def _channel_managed_call_management(state: _ChannelCallState):
     return create
 
 
+def _channel_managed_call_batch_management(state: _ChannelCallState):
+    # pylint: disable=too-many-arguments
+    def create_batch(
+        flags: int,
+        method: bytes,
+        host: Optional[str],
+        deadline: Optional[float],
+        metadata: Optional[MetadataType],
+        credentials: Optional[cygrpc.CallCredentials],
+        operationses_and_event_handlers: Sequence[
+            Tuple[Sequence[Sequence[cygrpc.Operation]], UserTag]
+        ],
+        context: Any,
+        _registered_call_handle: Optional[int],
+    ) -> Sequence[cygrpc.IntegratedCall]:
+        """Creates many cygrpc.IntegratedCalls in a single pass.
+
+        Args:
+          flags: An integer bitfield of call flags.
+          method: The RPC method.
+          host: A host string for the created calls.
+          deadline: A float to be the deadline of every created call or None
+            if the calls are to have an infinite deadline.
+          metadata: The metadata for every call or None.
+          credentials: A cygrpc.CallCredentials or None.
+          operationses_and_event_handlers: A sequence with one pair per call
+            of a sequence of sequences of cygrpc.Operations to be started on
+            the call and a behavior to call to handle the events resultant
+            from those operations.
+          context: Context object for distributed tracing.
+          _registered_call_handle: An int representing the call handle of the
+            method, or None if the method is not registered.
+
+        Returns:
+          A sequence of cygrpc.IntegratedCalls, one per element of
+            operationses_and_event_handlers and in the same order.
+        """
+        operationses_and_tagses = tuple(
+            tuple(
+                (
+                    operation,
+                    event_handler,
+                )
+                for operation in operations
+            )
+            for operations, event_handler in operationses_and_event_handlers
+        )
+        with state.lock:
+            calls, error = state.channel.integrated_calls(
+                flags,
+                method,
+                host,
+                deadline,
+                metadata,
+                credentials,
+                operationses_and_tagses,
+                context,
+                _registered_call_handle,
+            )
+            if calls:
+                if state.managed_calls == 0:
+                    state.managed_calls = len(calls)
+                    _run_channel_spin_thread(state)
+                else:
+                    state.managed_calls += len(calls)
+        if error is not None:
+            # The application only learns of the calls if all of them start.
+            for call in calls:
+                call.cancel(
+                    cygrpc.StatusCode.cancelled,
+                    "Another call of the batch failed to start!",
+                )
+            raise error
+        return calls
+
+    return create_batch
+
+
 class _ChannelConnectivityState:
     lock: threading.RLock
     channel: cygrpc.Channel
@@ -2128,6 +2592,7 @@ class Channel(grpc.Channel):
         return _UnaryUnaryMultiCallable(
             self._channel,
             _channel_managed_call_management(self._call_state),
+            _channel_managed_call_batch_management(self._call_state),
             _common.encode(method),
             _common.encode(self._target),
             request_serializer,
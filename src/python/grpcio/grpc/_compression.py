@@ -14,7 +14,8 @@
 
 from __future__ import annotations
 
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
+import zlib
 
 import grpc
 from grpc._cython import cygrpc
@@ -30,6 +31,12 @@ _METADATA_STRING_MAPPING = {
     Gzip: "gzip",
 }
 
+# The zlib window bits producing the format core uses for each algorithm.
+_ZLIB_WBITS = {
+    Deflate: zlib.MAX_WBITS,
+    Gzip: zlib.MAX_WBITS | 16,
+}
+
 
 def _compression_algorithm_to_metadata_value(
     compression: grpc.Compression,
@@ -58,6 +65,10 @@ def augment_metadata(
 ):
     if not metadata and not compression:
         return None
+    if not compression and isinstance(metadata, cygrpc.EncodedMetadata):
+        # NOTE: Passed through untouched so that its pre-encoded slices are
+        # reused rather than re-encoded from a plain tuple copy.
+        return metadata
     base_metadata = tuple(metadata) if metadata else ()
     compression_metadata = (
         (compression_algorithm_to_metadata(compression),) if compression else ()
@@ -65,6 +76,94 @@ def augment_metadata(
     return base_metadata + compression_metadata
 
 
+def compress_message(
+    message: bytes, compression: grpc.Compression
+) -> Optional[bytes]:
+    """Compresses a message the way core does.
+
+    Returns:
+      The compressed message, or None if compressing it would not shrink it.
+    """
+    compressor = zlib.compressobj(
+        zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, _ZLIB_WBITS[compression]
+    )
+    compressed = compressor.compress(message) + compressor.flush()
+    return compressed if len(compressed) < len(message) else None
+
+
+class MessageCompressionPolicy:
+    """Decides how each message sent on a call is compressed by its size.
+
+    Attributes:
+      compression: The compression algorithm of the call.
+      min_message_size: The size in bytes below which messages are sent
+        uncompressed, or None to compress messages of any size.
+      offload_message_size: The size in bytes from which messages are
+        compressed by gRPC Python, on the thread sending them, rather than by
+        core on the thread driving the transport. None leaves compressing
+        every message to core. Core's promise-based server call
+        (src/core/call/server_call.cc) ignores the compression of a message
+        and would compress offloaded messages twice, so offloading is only
+        correct on the filter-stack server call.
+    """
+
+    __slots__ = ("compression", "min_message_size", "offload_message_size")
+
+    compression: grpc.Compression
+    min_message_size: Optional[int]
+    offload_message_size: Optional[int]
+
+    def __init__(
+        self,
+        compression: grpc.Compression,
+        min_message_size: Optional[int] = None,
+        offload_message_size: Optional[int] = None,
+    ):
+        for name, size in (
+            ("min_message_size", min_message_size),
+            ("offload_message_size", offload_message_size),
+        ):
+            if size is not None and size < 0:
+                raise ValueError("%s must not be negative." % name)
+        self.compression = compression
+        self.min_message_size = min_message_size
+        self.offload_message_size = offload_message_size
+
+    def _is_too_small(self, message: bytes) -> bool:
+        return (
+            self.min_message_size is not None
+            and len(message) < self.min_message_size
+        )
+
+    def offloads(self, message: bytes) -> bool:
+        """Returns whether gRPC Python compresses the message itself."""
+        return (
+            self.offload_message_size is not None
+            and self.compression in _ZLIB_WBITS
+            and len(message) >= self.offload_message_size
+            and not self._is_too_small(message)
+        )
+
+    def compress(
+        self, message: bytes
+    ) -> Tuple[bytes, int, cygrpc.CompressionAlgorithm]:
+        """Prepares a message to be sent.
+
+        Returns:
+          The payload, the write flags and the compression algorithm of the
+          payload, which are the arguments of its cygrpc.SendMessageOperation.
+          Payloads compressed here are sent by core as they are.
+        """
+        if self._is_too_small(message):
+            return message, cygrpc.WriteFlag.no_compress, NoCompression
+        if not self.offloads(message):
+            return message, 0, NoCompression
+        compressed = compress_message(message, self.compression)
+        if compressed is None:
+            return message, cygrpc.WriteFlag.no_compress, NoCompression
+        return compressed, 0, self.compression
+
+
 __all__ = (
     "Deflate",
     "Gzip",
@@ -0,0 +1,215 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A per-method concurrency limit that adapts to the latency of RPCs."""
+
+import collections
+import math
+import threading
+from typing import Dict, Optional
+
+# Methods seen after this many share one limit, so that clients cannot grow
+# the limiter without bound by calling methods that do not exist.
+_MAXIMUM_TRACKED_METHODS = 1024
+_OTHER_METHODS = ""
+
+
+class AdaptiveConcurrencyLimiterStats(
+    collections.namedtuple(
+        "AdaptiveConcurrencyLimiterStats",
+        (
+            "limit",
+            "in_flight",
+            "rejected_count",
+        ),
+    )
+):
+    """A snapshot of the concurrency limit of a method.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    Attributes:
+      limit: The number of RPCs of the method allowed to run concurrently.
+      in_flight: The number of RPCs of the method currently running.
+      rejected_count: The number of RPCs of the method rejected so far.
+    """
+
+
+class _MethodLimit:
+    __slots__ = ("limit", "in_flight", "rejected_count", "long_latency")
+
+    def __init__(self, limit: float):
+        self.limit = limit
+        self.in_flight = 0
+        self.rejected_count = 0
+        self.long_latency = None
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the concurrent RPCs of every method to an adaptive limit.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    Passed as the maximum_concurrent_rpcs of grpc.server or grpc.aio.server,
+    it gives every method its own limit, starting at initial_limit. RPCs of
+    a method arriving while the method is at its limit fail with
+    RESOURCE_EXHAUSTED before any handler lookup or interceptor runs.
+
+    The latency of every completed RPC is compared with a long-term average
+    of the latency of its method. While the latency stays within tolerance
+    times the average the limit grows by about its square root, and beyond
+    that the limit shrinks in proportion to the latency increase, so that
+    the limit settles where adding concurrency stops adding throughput.
+    """
+
+    _initial_limit: int
+    _min_limit: int
+    _max_limit: int
+    _tolerance: float
+    _smoothing: float
+    _long_window: int
+    _lock: threading.Lock
+    _methods: Dict[str, _MethodLimit]
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        long_window: int = 600,
+    ):
+        """Constructor.
+
+        Args:
+          initial_limit: The limit of a method before any of its RPCs
+            completed.
+          min_limit: The smallest limit of a method.
+          max_limit: The largest limit of a method.
+          tolerance: How many times its long-term average the latency of a
+            method may grow before its limit shrinks.
+          smoothing: The weight of every new limit estimate, between 0 and 1.
+          long_window: The number of RPCs over which the long-term average
+            latency of a method is taken.
+        """
+        if not 0 < min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "Limits must satisfy 0 < min_limit <= initial_limit <="
+                " max_limit"
+            )
+        if tolerance < 1:
+            raise ValueError("tolerance must be at least 1")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        if long_window <= 0:
+            raise ValueError("long_window must be greater than 0")
+        self._initial_limit = initial_limit
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._tolerance = tolerance
+        self._smoothing = smoothing
+        self._long_window = long_window
+        self._lock = threading.Lock()
+        self._methods = {}
+
+    def try_acquire(self, method: str) -> bool:
+        """Admits an RPC of a method if the method is below its limit.
+
+        Every admitted RPC must be followed by a call to release.
+
+        Args:
+          method: The fully-qualified name of the method of the RPC.
+
+        Returns:
+          Whether the RPC was admitted.
+        """
+        with self._lock:
+            method_limit = self._method_limit(method)
+            if method_limit.in_flight >= int(method_limit.limit):
+                method_limit.rejected_count += 1
+                return False
+            method_limit.in_flight += 1
+            return True
+
+    def release(self, method: str, latency: Optional[float]) -> None:
+        """Records the completion of an RPC admitted by try_acquire.
+
+        Args:
+          method: The fully-qualified name of the method of the RPC.
+          latency: The time in seconds the RPC took, or None if it was not
+            serviced and should not affect the limit.
+        """
+        with self._lock:
+            method_limit = self._method_limit(method)
+            in_flight = method_limit.in_flight
+            method_limit.in_flight -= 1
+            if latency is not None:
+                self._update(method_limit, latency, in_flight)
+
+    def stats(self) -> Dict[str, AdaptiveConcurrencyLimiterStats]:
+        """Returns the limits of the methods seen so far.
+
+        Methods seen after the first 1024 are reported together under the
+        empty string.
+        """
+        with self._lock:
+            return {
+                method: AdaptiveConcurrencyLimiterStats(
+                    int(method_limit.limit),
+                    method_limit.in_flight,
+                    method_limit.rejected_count,
+                )
+                for method, method_limit in self._methods.items()
+            }
+
+    def _method_limit(self, method: str) -> _MethodLimit:
+        method_limit = self._methods.get(method)
+        if method_limit is None:
+            if len(self._methods) >= _MAXIMUM_TRACKED_METHODS:
+                method = _OTHER_METHODS
+                method_limit = self._methods.get(method)
+            if method_limit is None:
+                method_limit = _MethodLimit(self._initial_limit)
+                self._methods[method] = method_limit
+        return method_limit
+
+    def _update(
+        self, method_limit: _MethodLimit, latency: float, in_flight: int
+    ) -> None:
+        if method_limit.long_latency is None:
+            method_limit.long_latency = latency
+        else:
+            method_limit.long_latency += (
+                latency - method_limit.long_latency
+            ) / self._long_window
+            # Let the average catch up quickly once latency drops for good.
+            if method_limit.long_latency > 2 * latency:
+                method_limit.long_latency *= 0.95
+        if in_flight < method_limit.limit / 2:
+            # The method is not using its limit, so latency says nothing
+            # about whether the limit is right.
+            return
+        if latency <= 0:
+            gradient = 1.0
+        else:
+            gradient = max(
+                0.5,
+                min(1.0, self._tolerance * method_limit.long_latency / latency),
+            )
+        estimate = method_limit.limit * gradient + math.sqrt(method_limit.limit)
+        limit = (
+            method_limit.limit * (1 - self._smoothing)
+            + estimate * self._smoothing
+        )
+        method_limit.limit = min(max(limit, self._min_limit), self._max_limit)
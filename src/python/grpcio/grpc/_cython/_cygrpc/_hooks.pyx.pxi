@@ -16,14 +16,31 @@
 cdef object _custom_op_on_c_call(int op, grpc_call *call):
   raise NotImplementedError("No custom hooks are implemented")
 
+# The CallDetails of the RPC each thread of a sync server is serving, keyed by
+# thread identifier, so that profilers can attribute samples to methods.
+_SERVING_THREADS = {}
+
 def install_context_from_request_call_event(RequestCallEvent event):
   maybe_save_server_trace_context(event)
+  _SERVING_THREADS[threading.get_ident()] = event.call_details
 
 def install_context_from_request_call_event_aio(GrpcCallWrapper event):
   pass
 
 def uninstall_context():
-  pass
+  _SERVING_THREADS.pop(threading.get_ident(), None)
+
+def get_serving_thread_methods():
+  """Returns the method, in bytes, of the RPC each thread is serving.
+
+  Returns:
+    A dict from thread identifier to the method of the RPC the thread is
+    serving, for the threads of sync servers serving one.
+  """
+  return {
+      thread_id: call_details.method
+      for thread_id, call_details in list(_SERVING_THREADS.items())
+  }
 
 def build_census_context():
   pass
@@ -43,8 +43,13 @@ cdef class _AioCall(GrpcCallWrapper):
         int _send_initial_metadata_flags
         object _call_tracer_capsule
 
+        # Times the phases of the RPC if the observability plugin asks so,
+        # otherwise None.
+        readonly object _phase_timer
+
     cdef void _create_grpc_call(self, object timeout, bytes method, CallCredentials credentials, object registered_call_handle) except *
     cdef void _maybe_save_registered_method(self, bytes method) except *
     cdef void _maybe_set_client_call_tracer_on_call(self, bytes method) except *
     cdef void _set_status(self, AioRpcStatus status) except *
     cdef void _set_initial_metadata(self, tuple initial_metadata) except *
+    cdef void _maybe_mark_response_received(self, ReceiveMessageOperation op) except *
@@ -62,6 +62,8 @@ cdef class _AioCall(GrpcCallWrapper):
         self._deadline = deadline
         self._send_initial_metadata_flags = _get_send_initial_metadata_flags(wait_for_ready)
         self._call_tracer_capsule = None
+        self._phase_timer = _observability.maybe_create_client_rpc_phase_timer(
+            method, channel.target)
         self._create_grpc_call(deadline, method, call_credentials, registered_call_handle)
 
     def __dealloc__(self):
@@ -175,6 +177,8 @@ cdef class _AioCall(GrpcCallWrapper):
 
         # No more waiters should be expected since status has been set.
         self._status = status
+        if self._phase_timer is not None:
+            self._phase_timer.status_received()
 
         if self._initial_metadata is None:
             self._set_initial_metadata(_IMMUTABLE_EMPTY_METADATA)
@@ -202,12 +206,20 @@ cdef class _AioCall(GrpcCallWrapper):
         # No more waiters should be expected since initial metadata has been
         # set.
         self._initial_metadata = initial_metadata
+        if self._phase_timer is not None:
+            self._phase_timer.add('initial_metadata', self._phase_timer.start_ns)
 
         for waiter in self._waiters_initial_metadata:
             if not waiter.done():
                 waiter.set_result(None)
         self._waiters_initial_metadata = []
 
+    cdef void _maybe_mark_response_received(self, ReceiveMessageOperation op) except *:
+        # Marked before the status is set, so that the phases of the RPC
+        # wait for the application to take the response.
+        if self._phase_timer is not None and op.message() is not None:
+            self._phase_timer.response_received()
+
     def add_done_callback(self, callback):
         if self.done():
             callback()
@@ -369,6 +381,7 @@ cdef class _AioCall(GrpcCallWrapper):
                             self._loop)
 
         self._set_initial_metadata(receive_initial_metadata_op.initial_metadata())
+        self._maybe_mark_response_received(receive_message_op)
 
         cdef grpc_status_code code
         code = receive_status_on_client_op.code()
@@ -415,6 +428,8 @@ cdef class _AioCall(GrpcCallWrapper):
             self._loop
         )
         if received_message is not None:
+            if self._phase_timer is not None:
+                self._phase_timer.response_received()
             return received_message
         else:
             return EOF
@@ -518,6 +533,7 @@ cdef class _AioCall(GrpcCallWrapper):
         await execute_batch(self,
                             inbound_ops,
                             self._loop)
+        self._maybe_mark_response_received(receive_message_op)
 
         cdef grpc_status_code code
         code = receive_status_on_client_op.code()
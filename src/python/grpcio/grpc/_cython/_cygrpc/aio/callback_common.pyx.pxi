@@ -140,8 +140,11 @@ async def _send_message(GrpcCallWrapper grpc_call_wrapper,
                         bytes message,
                         Operation send_initial_metadata_op,
                         int write_flag,
-                        object loop):
-    cdef SendMessageOperation op = SendMessageOperation(message, write_flag)
+                        object loop,
+                        grpc_compression_algorithm compression=GRPC_COMPRESS_NONE):
+    cdef SendMessageOperation op = SendMessageOperation(message,
+                                                        write_flag,
+                                                        compression)
     cdef tuple ops = (op,)
     if send_initial_metadata_op is not None:
         ops = (send_initial_metadata_op,) + ops
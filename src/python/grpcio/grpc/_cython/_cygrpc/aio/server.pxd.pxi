@@ -33,8 +33,10 @@ cdef class RPCState(GrpcCallWrapper):
     cdef str status_details
     cdef tuple trailing_metadata
     cdef object compression_algorithm
+    cdef object compression_policy  # Optional[grpc._compression.MessageCompressionPolicy]
     cdef bint disable_next_compression
     cdef object callbacks
+    cdef object phase_timer  # Optional[grpc._observability.RpcPhaseTimer]
 
     cdef bytes method(self)
     cdef tuple invocation_metadata(self)
@@ -96,5 +98,6 @@ cdef class AioServer:
     cdef tuple _interceptors
     cdef object _thread_pool  # concurrent.futures.ThreadPoolExecutor
     cdef _ConcurrentRpcLimiter _limiter
+    cdef object _concurrency_limiter  # AdaptiveConcurrencyLimiter
 
     cdef thread_pool(self)
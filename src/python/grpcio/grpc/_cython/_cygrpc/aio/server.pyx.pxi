@@ -59,8 +59,10 @@ cdef class RPCState:
         self.status_details = ''
         self.trailing_metadata = _IMMUTABLE_EMPTY_METADATA
         self.compression_algorithm = None
+        self.compression_policy = None
         self.disable_next_compression = False
         self.callbacks = []
+        self.phase_timer = None
 
     cdef bytes method(self):
         return _slice_bytes(self.details.method)
@@ -112,6 +114,24 @@ cdef class RPCState:
         shutdown_grpc_aio()
 
 
+async def _prepare_message(RPCState rpc_state, bytes raw_message, object loop):
+    """Returns the payload, write flag and compression of a response message.
+
+    Messages the compression policy of the RPC compresses ahead of Core are
+    compressed in the thread pool of the server, or the default executor of
+    the loop, so that the event loop does not stall on them.
+    """
+    cdef int write_flag = rpc_state.get_write_flag()
+    cdef object policy = rpc_state.compression_policy
+    if write_flag != _EMPTY_FLAG or policy is None:
+        return raw_message, write_flag, GRPC_COMPRESS_NONE
+    if policy.offloads(raw_message):
+        return await loop.run_in_executor(rpc_state.server.thread_pool(),
+                                          policy.compress,
+                                          raw_message)
+    return policy.compress(raw_message)
+
+
 cdef class _ServicerContext:
 
     def __cinit__(self,
@@ -134,17 +154,33 @@ cdef class _ServicerContext:
         if raw_message is None:
             return EOF
         else:
-            return deserialize(self._request_deserializer,
-                            raw_message)
+            return _deserialize_timed(self._rpc_state,
+                                      self._request_deserializer,
+                                      raw_message)
 
     async def write(self, object message):
+        cdef object phase_timer = self._rpc_state.phase_timer
+        cdef bytes raw_message
         self._rpc_state.raise_for_termination()
 
+        if phase_timer is None:
+            raw_message = serialize(self._response_serializer, message)
+        else:
+            start_ns = time.monotonic_ns()
+            raw_message = serialize(self._response_serializer, message)
+            start_ns = phase_timer.add('serialization', start_ns)
+        raw_message, write_flag, compression = await _prepare_message(
+            self._rpc_state,
+            raw_message,
+            self._loop)
         await _send_message(self._rpc_state,
-                            serialize(self._response_serializer, message),
+                            raw_message,
                             self._rpc_state.create_send_initial_metadata_op_if_not_sent(),
-                            self._rpc_state.get_write_flag(),
-                            self._loop)
+                            write_flag,
+                            self._loop,
+                            compression)
+        if phase_timer is not None:
+            phase_timer.add('send', start_ns)
         self._rpc_state.metadata_sent = True
 
     async def send_initial_metadata(self, object metadata):
@@ -226,11 +262,26 @@ cdef class _ServicerContext:
     def details(self):
         return self._rpc_state.status_details
 
-    def set_compression(self, object compression):
+    def set_compression(self,
+                        object compression,
+                        *,
+                        object min_message_size=None,
+                        object offload_message_size=None):
+        # This needs to be loaded at run time once everything
+        # has been loaded.
+        from grpc import _compression
+
         if self._rpc_state.metadata_sent:
             raise RuntimeError('Compression setting must be specified before sending initial metadata')
         else:
             self._rpc_state.compression_algorithm = compression
+            if min_message_size is None and offload_message_size is None:
+                self._rpc_state.compression_policy = None
+            else:
+                self._rpc_state.compression_policy = _compression.MessageCompressionPolicy(
+                    compression,
+                    min_message_size,
+                    offload_message_size)
 
     def disable_next_message_compression(self):
         self._rpc_state.disable_next_compression = True
@@ -326,8 +377,15 @@ cdef class _SyncServicerContext:
     def set_details(self, str details):
         self._context.set_details(details)
 
-    def set_compression(self, object compression):
-        self._context.set_compression(compression)
+    def set_compression(self,
+                        object compression,
+                        *,
+                        object min_message_size=None,
+                        object offload_message_size=None):
+        self._context.set_compression(
+            compression,
+            min_message_size=min_message_size,
+            offload_message_size=offload_message_size)
 
     def disable_next_message_compression(self):
         self._context.disable_next_message_compression()
@@ -390,20 +448,73 @@ cdef class _MethodResolver:
 
 async def _find_method_handler(str method, tuple metadata,
                                object method_resolver,
-                               tuple interceptors):
+                               tuple interceptors,
+                               object phase_timer=None):
     def query_handlers(handler_call_details):
-        return method_resolver.resolve_handler(handler_call_details)
+        if phase_timer is None:
+            return method_resolver.resolve_handler(handler_call_details)
+        start_ns = time.monotonic_ns()
+        # Time around the lookup is spent in interceptors.
+        phase_timer.add_since_mark('interceptors', 'interceptors')
+        try:
+            return method_resolver.resolve_handler(handler_call_details)
+        finally:
+            phase_timer.add('lookup', start_ns)
+            if interceptors:
+                phase_timer.mark('interceptors')
 
     cdef _HandlerCallDetails handler_call_details = _HandlerCallDetails(method,
                                                                         metadata)
     # interceptor
     if interceptors:
-        return await _run_interceptor(iter(interceptors), query_handlers,
-                                      handler_call_details)
+        if phase_timer is not None:
+            phase_timer.mark('interceptors')
+        try:
+            return await _run_interceptor(iter(interceptors), query_handlers,
+                                          handler_call_details)
+        finally:
+            if phase_timer is not None:
+                phase_timer.add_since_mark('interceptors', 'interceptors')
     else:
         return query_handlers(handler_call_details)
 
 
+cdef object _deserialize_timed(RPCState rpc_state,
+                               object deserializer,
+                               bytes raw_message):
+    if rpc_state.phase_timer is None:
+        return deserialize(deserializer, raw_message)
+    start_ns = time.monotonic_ns()
+    try:
+        return deserialize(deserializer, raw_message)
+    finally:
+        rpc_state.phase_timer.add('deserialization', start_ns)
+
+
+def _call_sync_handler_timed(object phase_timer, object handler, *args):
+    """Times a sync handler and its wait for the thread pool."""
+    start_ns = phase_timer.add_since_mark('queue', 'queue')
+    try:
+        return handler(*args)
+    finally:
+        phase_timer.add('handler', start_ns)
+
+
+async def _time_response_generator(object response_generator,
+                                   object phase_timer):
+    """Times the handler producing each response of a generator."""
+    cdef object response_message
+    while True:
+        start_ns = time.monotonic_ns()
+        try:
+            response_message = await response_generator.__anext__()
+        except StopAsyncIteration:
+            return
+        finally:
+            phase_timer.add('handler', start_ns)
+        yield response_message
+
+
 async def _finish_handler_with_unary_response(RPCState rpc_state,
                                               object unary_handler,
                                               object request,
@@ -419,17 +530,27 @@ async def _finish_handler_with_unary_response(RPCState rpc_state,
     # Executes application logic
     cdef object response_message
     cdef _SyncServicerContext sync_servicer_context
+    cdef object phase_timer = rpc_state.phase_timer
     install_context_from_request_call_event_aio(rpc_state)
 
     if _is_async_handler(unary_handler):
         # Run async method handlers in this coroutine
+        if phase_timer is not None:
+            start_ns = time.monotonic_ns()
         response_message = await unary_handler(
             request,
             servicer_context,
         )
+        if phase_timer is not None:
+            phase_timer.add('handler', start_ns)
     else:
         # Run sync method handlers in the thread pool
         sync_servicer_context = _SyncServicerContext(servicer_context)
+        if phase_timer is not None:
+            phase_timer.mark('queue')
+            unary_handler = functools.partial(_call_sync_handler_timed,
+                                              phase_timer,
+                                              unary_handler)
         response_message = await loop.run_in_executor(
             rpc_state.server.thread_pool(),
             unary_handler,
@@ -446,18 +567,28 @@ async def _finish_handler_with_unary_response(RPCState rpc_state,
     # Serializes the response message
     cdef bytes response_raw
     if rpc_state.status_code == StatusCode.ok:
+        if phase_timer is not None:
+            start_ns = time.monotonic_ns()
         response_raw = serialize(
             response_serializer,
             response_message,
         )
+        if phase_timer is not None:
+            phase_timer.add('serialization', start_ns)
     else:
         # Discards the response message if the status code is non-OK.
         response_raw = b''
 
+    # Compresses the response message ahead of Core if the policy says so
+    response_raw, write_flag, compression = await _prepare_message(
+        rpc_state,
+        response_raw,
+        loop)
+
     # Assembles the batch operations
     cdef tuple finish_ops
     finish_ops = (
-        SendMessageOperation(response_raw, rpc_state.get_write_flag()),
+        SendMessageOperation(response_raw, write_flag, compression),
         SendStatusFromServerOperation(
             rpc_state.trailing_metadata,
             rpc_state.status_code,
@@ -471,7 +602,11 @@ async def _finish_handler_with_unary_response(RPCState rpc_state,
             None)
     rpc_state.metadata_sent = True
     rpc_state.status_sent = True
+    if phase_timer is not None:
+        start_ns = time.monotonic_ns()
     await execute_batch(rpc_state, finish_ops, loop)
+    if phase_timer is not None:
+        phase_timer.add('send', start_ns)
     uninstall_context()
 
 
@@ -488,15 +623,21 @@ async def _finish_handler_with_stream_responses(RPCState rpc_state,
     """
     cdef object async_response_generator
     cdef object response_message
+    cdef object phase_timer = rpc_state.phase_timer
     install_context_from_request_call_event_aio(rpc_state)
 
     if inspect.iscoroutinefunction(stream_handler):
         # Case 1: Coroutine async handler - using reader-writer API
-        # The handler uses reader / writer API, returns None.
+        # The handler uses reader / writer API, returns None. Its reads and
+        # writes are timed again as their own phases.
+        if phase_timer is not None:
+            start_ns = time.monotonic_ns()
         await stream_handler(
             request,
             servicer_context,
         )
+        if phase_timer is not None:
+            phase_timer.add('handler', start_ns)
     else:
         if inspect.isasyncgenfunction(stream_handler):
             # Case 2: Async handler - async generator
@@ -514,6 +655,11 @@ async def _finish_handler_with_stream_responses(RPCState rpc_state,
             async_response_generator = generator_to_async_generator(gen,
                                                                     loop,
                                                                     rpc_state.server.thread_pool())
+        if phase_timer is not None:
+            async_response_generator = _time_response_generator(
+                async_response_generator,
+                phase_timer,
+            )
 
         # Consumes messages from the generator
         async for response_message in async_response_generator:
@@ -541,7 +687,11 @@ async def _finish_handler_with_stream_responses(RPCState rpc_state,
         )
     rpc_state.metadata_sent = True
     rpc_state.status_sent = True
+    if phase_timer is not None:
+        start_ns = time.monotonic_ns()
     await execute_batch(rpc_state, finish_ops, loop)
+    if phase_timer is not None:
+        phase_timer.add('send', start_ns)
     uninstall_context()
 
 
@@ -555,7 +705,8 @@ async def _handle_unary_unary_rpc(object method_handler,
         return
 
     # Deserializes the request message
-    cdef object request_message = deserialize(
+    cdef object request_message = _deserialize_timed(
+        rpc_state,
         method_handler.request_deserializer,
         request_raw,
     )
@@ -588,7 +739,8 @@ async def _handle_unary_stream_rpc(object method_handler,
         return
 
     # Deserializes the request message
-    cdef object request_message = deserialize(
+    cdef object request_message = _deserialize_timed(
+        rpc_state,
         method_handler.request_deserializer,
         request_raw,
     )
@@ -830,12 +982,34 @@ async def _handle_rpc(str method_name,
                       tuple interceptors,
                       RPCState rpc_state, object loop, bint concurrency_exceeded):
     cdef object method_handler
+    # Rejects before any handler lookup or interceptor runs.
+    if concurrency_exceeded:
+        rpc_state.status_sent = True
+        await _send_error_status_from_server(
+            rpc_state,
+            StatusCode.resource_exhausted,
+            'Concurrent RPC limit exceeded!',
+            _IMMUTABLE_EMPTY_METADATA,
+            rpc_state.create_send_initial_metadata_op_if_not_sent(),
+            loop
+        )
+        return
+
+    rpc_state.phase_timer = _observability.maybe_create_rpc_phase_timer()
+    if rpc_state.phase_timer is not None:
+        rpc_state.callbacks.append(functools.partial(
+            _observability.maybe_record_server_rpc_phases,
+            method_name,
+            rpc_state.phase_timer,
+        ))
+
     # Finds the method handler (application logic)
     method_handler = await _find_method_handler(
         method_name,
         rpc_state.invocation_metadata(),
         method_resolver,
         interceptors,
+        rpc_state.phase_timer,
     )
     if method_handler is None:
         rpc_state.status_sent = True
@@ -849,18 +1023,6 @@ async def _handle_rpc(str method_name,
         )
         return
 
-    if concurrency_exceeded:
-        rpc_state.status_sent = True
-        await _send_error_status_from_server(
-            rpc_state,
-            StatusCode.resource_exhausted,
-            'Concurrent RPC limit exceeded!',
-            _IMMUTABLE_EMPTY_METADATA,
-            rpc_state.create_send_initial_metadata_op_if_not_sent(),
-            loop
-        )
-        return
-
     # Handles unary-unary case
     if not method_handler.request_streaming and not method_handler.response_streaming:
         await _handle_unary_unary_rpc(method_handler,
@@ -931,10 +1093,15 @@ cdef class _ConcurrentRpcLimiter:
         rpc_task.add_done_callback(self._decrease_active_rpcs_count)
 
 
+def _release_concurrency(object concurrency_limiter, str method_name,
+                         double start_time, object unused_rpc_task):
+    concurrency_limiter.release(method_name, time.monotonic() - start_time)
+
+
 cdef class AioServer:
 
     def __init__(self, loop, thread_pool, generic_handlers, interceptors,
-                 options, maximum_concurrent_rpcs):
+                 options, maximum_concurrent_rpcs, concurrency_limiter=None):
         init_grpc_aio()
         # NOTE(lidiz) Core objects won't be deallocated automatically.
         # If AioServer.shutdown is not called, those objects will leak.
@@ -969,6 +1136,7 @@ cdef class AioServer:
         self._thread_pool = thread_pool
         if maximum_concurrent_rpcs is not None:
             self._limiter = _ConcurrentRpcLimiter(maximum_concurrent_rpcs)
+        self._concurrency_limiter = concurrency_limiter
 
     def add_generic_rpc_handlers(self, object generic_rpc_handlers):
         self._generic_handlers.extend(generic_rpc_handlers)
@@ -1104,16 +1272,19 @@ cdef class AioServer:
                             pending_futures[new_fut] = method_bytes
                         continue
 
-                    concurrency_exceeded = False
-                    if self._limiter is not None:
-                        self._limiter.check_before_request_call()
-                        concurrency_exceeded = self._limiter.limiter_concurrency_exceeded
-
                     if method_bytes is not None:
                         method_name = method_bytes.decode()
                     else:
                         method_name = rpc_state.method().decode()
 
+                    concurrency_exceeded = False
+                    if self._limiter is not None:
+                        self._limiter.check_before_request_call()
+                        concurrency_exceeded = self._limiter.limiter_concurrency_exceeded
+                    if self._concurrency_limiter is not None:
+                        concurrency_exceeded = not self._concurrency_limiter.try_acquire(
+                            method_name)
+
                     # Creates the dedicated RPC coroutine. If we schedule it right now,
                     # there is no guarantee if the cancellation listening coroutine is
                     # ready or not. So, we should control the ordering by scheduling
@@ -1144,6 +1315,12 @@ cdef class AioServer:
 
                     if self._limiter is not None and not concurrency_exceeded:
                         self._limiter.decrease_once_finished(rpc_task)
+                    if self._concurrency_limiter is not None and not concurrency_exceeded:
+                        rpc_task.add_done_callback(functools.partial(
+                            _release_concurrency,
+                            self._concurrency_limiter,
+                            method_name,
+                            time.monotonic()))
 
                     if self._status == AIO_SERVER_STATUS_RUNNING:
                         # Unconditionally re-arm the call request future even when concurrency_exceeded
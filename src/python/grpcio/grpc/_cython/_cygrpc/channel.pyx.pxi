@@ -352,6 +352,25 @@ cdef IntegratedCall _integrated_call(
   return IntegratedCall(state, call_state)
 
 
+cdef tuple _integrated_calls(
+    _ChannelState state, int flags, method, host, object deadline,
+    object metadata, CallCredentials credentials,
+    operationses_and_user_tagses, object context,
+    object registered_call_handle):
+  cdef list calls = []
+  # The condition is reentrant; holding it across the whole batch means it is
+  # acquired once rather than contended for once per call.
+  with state.condition:
+    try:
+      for operationses_and_user_tags in operationses_and_user_tagses:
+        calls.append(_integrated_call(
+            state, flags, method, host, deadline, metadata, credentials,
+            operationses_and_user_tags, context, registered_call_handle))
+    except Exception as exception:
+      return tuple(calls), exception
+  return tuple(calls), None
+
+
 cdef object _process_segregated_call_tag(
     _ChannelState state, _CallState call_state,
     grpc_completion_queue *c_completion_queue, _BatchOperationTag tag):
@@ -547,6 +566,27 @@ cdef class Channel:
         self._state, flags, method, host, deadline, metadata, credentials,
         operationses_and_tags, context, registered_call_handle)
 
+  def integrated_calls(
+      self, int flags, method, host, object deadline, object metadata,
+      CallCredentials credentials, operationses_and_tagses,
+      object context = None, object registered_call_handle = None):
+    """Starts many calls to the same method sharing deadline and metadata.
+
+    Args:
+      operationses_and_tagses: A sequence with one element per call, each
+        element being the operationses_and_tags of that call as accepted by
+        integrated_call.
+
+    Returns:
+      A pair of a tuple of the IntegratedCalls that were started, in the order
+      of operationses_and_tagses, and either None or the exception that
+      prevented the remaining calls from starting. The started calls' events
+      are delivered through next_call_event regardless.
+    """
+    return _integrated_calls(
+        self._state, flags, method, host, deadline, metadata, credentials,
+        operationses_and_tagses, context, registered_call_handle)
+
   def next_call_event(self):
     def on_success(tag):
       if tag is not None:
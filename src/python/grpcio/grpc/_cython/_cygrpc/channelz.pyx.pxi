@@ -69,3 +69,92 @@ def channelz_get_socket(socket_id):
         raise ValueError('Failed to get the socket, please ensure your' \
                          ' socket_id==%s is valid' % (socket_id))
     return c_returned_str
+
+
+# The following return the serialized channelz protobuf responses, built
+# without the JSON round trip of the functions above.
+
+def channelz_get_top_channels_proto(start_channel_id, max_results):
+  cdef intptr_t c_start_channel_id = start_channel_id
+  cdef intptr_t c_max_results = max_results
+  cdef string response
+  cdef bint ok
+  with nogil:
+    ok = ChannelzGetTopChannels(
+        c_start_channel_id, c_max_results, &response)
+  if not ok:
+    raise ValueError('Failed to get top channels, please ensure your' \
+                     ' start_channel_id==%s is valid' % start_channel_id)
+  return <bytes>response
+
+def channelz_get_servers_proto(start_server_id, max_results):
+  cdef intptr_t c_start_server_id = start_server_id
+  cdef intptr_t c_max_results = max_results
+  cdef string response
+  cdef bint ok
+  with nogil:
+    ok = ChannelzGetServers(c_start_server_id, c_max_results, &response)
+  if not ok:
+    raise ValueError('Failed to get servers, please ensure your' \
+                     ' start_server_id==%s is valid' % start_server_id)
+  return <bytes>response
+
+def channelz_get_server_proto(server_id):
+  cdef intptr_t c_server_id = server_id
+  cdef string response
+  cdef bint ok
+  with nogil:
+    ok = ChannelzGetServer(c_server_id, &response)
+  if not ok:
+    raise ValueError('Failed to get the server, please ensure your' \
+                     ' server_id==%s is valid' % server_id)
+  return <bytes>response
+
+def channelz_get_server_sockets_proto(server_id, start_socket_id, max_results):
+  cdef intptr_t c_server_id = server_id
+  cdef intptr_t c_start_socket_id = start_socket_id
+  cdef intptr_t c_max_results = max_results
+  cdef string response
+  cdef bint ok
+  with nogil:
+    ok = ChannelzGetServerSockets(
+        c_server_id, c_start_socket_id, c_max_results, &response)
+  if not ok:
+    raise ValueError('Failed to get server sockets, please ensure your' \
+                     ' server_id==%s and start_socket_id==%s and' \
+                     ' max_results==%s is valid' %
+                     (server_id, start_socket_id, max_results))
+  return <bytes>response
+
+def channelz_get_channel_proto(channel_id):
+  cdef intptr_t c_channel_id = channel_id
+  cdef string response
+  cdef bint ok
+  with nogil:
+    ok = ChannelzGetChannel(c_channel_id, &response)
+  if not ok:
+    raise ValueError('Failed to get the channel, please ensure your' \
+                     ' channel_id==%s is valid' % (channel_id))
+  return <bytes>response
+
+def channelz_get_subchannel_proto(subchannel_id):
+  cdef intptr_t c_subchannel_id = subchannel_id
+  cdef string response
+  cdef bint ok
+  with nogil:
+    ok = ChannelzGetSubchannel(c_subchannel_id, &response)
+  if not ok:
+    raise ValueError('Failed to get the subchannel, please ensure your' \
+                     ' subchannel_id==%s is valid' % (subchannel_id))
+  return <bytes>response
+
+def channelz_get_socket_proto(socket_id):
+  cdef intptr_t c_socket_id = socket_id
+  cdef string response
+  cdef bint ok
+  with nogil:
+    ok = ChannelzGetSocket(c_socket_id, &response)
+  if not ok:
+    raise ValueError('Failed to get the socket, please ensure your' \
+                     ' socket_id==%s is valid' % (socket_id))
+  return <bytes>response
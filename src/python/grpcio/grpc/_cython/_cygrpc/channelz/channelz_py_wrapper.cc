@@ -0,0 +1,243 @@
+//
+//
+// Copyright 2026 gRPC authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//
+
+#include "src/python/grpcio/grpc/_cython/_cygrpc/channelz/channelz_py_wrapper.h"
+
+#include <optional>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include "src/core/channelz/channelz.h"
+#include "src/core/channelz/channelz_registry.h"
+#include "src/core/channelz/v2tov1/convert.h"
+#include "src/core/channelz/v2tov1/legacy_api.h"
+#include "src/core/lib/iomgr/exec_ctx.h"
+#include "src/core/util/upb_utils.h"
+#include "src/proto/grpc/channelz/channelz.upb.h"
+#include "upb/mem/arena.hpp"
+#include "absl/log/log.h"
+#include "absl/status/statusor.h"
+#include "absl/time/time.h"
+
+namespace grpc_python {
+
+namespace {
+
+using grpc_core::channelz::BaseNode;
+using grpc_core::channelz::ChannelzRegistry;
+using grpc_core::channelz::v2tov1::RegistryEntityFetcher;
+
+// The page size of ChannelzRegistry::GetTopChannels and GetServers, which back
+// the JSON C-API.
+constexpr size_t kDefaultMaxResults = 100;
+
+size_t PageSize(intptr_t max_results) {
+  return max_results <= 0 ? kDefaultMaxResults
+                          : static_cast<size_t>(max_results);
+}
+
+using Converter = absl::StatusOr<std::string> (*)(
+    const std::string& serialized_entity,
+    grpc_core::channelz::v2tov1::EntityFetcher& fetcher, bool json);
+
+// Returns the node converted to its serialized v1 message, or an empty
+// optional if the conversion failed.
+std::optional<std::string> ConvertNode(BaseNode& node, Converter converter,
+                                       RegistryEntityFetcher& fetcher) {
+  auto serialized_v1 = converter(
+      node.SerializeEntityToString(absl::ZeroDuration()), fetcher, false);
+  if (!serialized_v1.ok()) {
+    LOG(ERROR) << "Failed to convert channelz entity " << node.uuid() << ": "
+               << serialized_v1.status();
+    return std::nullopt;
+  }
+  return std::move(*serialized_v1);
+}
+
+template <typename Message>
+bool SerializeTo(const Message* message,
+                 char* (*serialize)(const Message*, upb_Arena*, size_t*),
+                 upb_Arena* arena, std::string* response) {
+  size_t length;
+  char* bytes = serialize(message, arena, &length);
+  if (bytes == nullptr) return false;
+  response->assign(bytes, length);
+  return true;
+}
+
+// Builds a paginated response holding the conversion of each of nodes.
+template <typename Response, typename Entity>
+bool GetEntities(
+    const std::vector<grpc_core::WeakRefCountedPtr<BaseNode>>& nodes,
+    bool end, Converter converter, Response* (*response_new)(upb_Arena*),
+    Entity** (*resize)(Response*, size_t, upb_Arena*),
+    Entity* (*parse)(const char*, size_t, upb_Arena*),
+    void (*set_end)(Response*, bool),
+    char* (*serialize)(const Response*, upb_Arena*, size_t*),
+    std::string* response) {
+  upb::Arena arena;
+  RegistryEntityFetcher fetcher;
+  std::vector<Entity*> entities;
+  entities.reserve(nodes.size());
+  for (const auto& node : nodes) {
+    if (node == nullptr) continue;
+    auto serialized_v1 = ConvertNode(*node, converter, fetcher);
+    if (!serialized_v1.has_value()) continue;
+    Entity* entity =
+        parse(serialized_v1->data(), serialized_v1->size(), arena.ptr());
+    if (entity != nullptr) entities.push_back(entity);
+  }
+  Response* message = response_new(arena.ptr());
+  Entity** slots = resize(message, entities.size(), arena.ptr());
+  for (size_t i = 0; i < entities.size(); ++i) {
+    slots[i] = entities[i];
+  }
+  set_end(message, end);
+  return SerializeTo(message, serialize, arena.ptr(), response);
+}
+
+// Builds a response holding the conversion of node alone.
+template <typename Response, typename Entity>
+bool GetEntity(BaseNode& node, Converter converter,
+               Response* (*response_new)(upb_Arena*),
+               Entity* (*parse)(const char*, size_t, upb_Arena*),
+               void (*set_entity)(Response*, Entity*),
+               char* (*serialize)(const Response*, upb_Arena*, size_t*),
+               std::string* response) {
+  upb::Arena arena;
+  RegistryEntityFetcher fetcher;
+  auto serialized_v1 = ConvertNode(node, converter, fetcher);
+  if (!serialized_v1.has_value()) return false;
+  Entity* entity =
+      parse(serialized_v1->data(), serialized_v1->size(), arena.ptr());
+  if (entity == nullptr) return false;
+  Response* message = response_new(arena.ptr());
+  set_entity(message, entity);
+  return SerializeTo(message, serialize, arena.ptr(), response);
+}
+
+}  // namespace
+
+bool ChannelzGetTopChannels(intptr_t start_channel_id, intptr_t max_results,
+                            std::string* response) {
+  grpc_core::ExecCtx exec_ctx;
+  auto [channels, end] = ChannelzRegistry::GetNodesOfType(
+      start_channel_id, BaseNode::EntityType::kTopLevelChannel,
+      PageSize(max_results));
+  return GetEntities(channels, end, grpc_core::channelz::v2tov1::ConvertChannel,
+                     grpc_channelz_v1_GetTopChannelsResponse_new,
+                     grpc_channelz_v1_GetTopChannelsResponse_resize_channel,
+                     grpc_channelz_v1_Channel_parse,
+                     grpc_channelz_v1_GetTopChannelsResponse_set_end,
+                     grpc_channelz_v1_GetTopChannelsResponse_serialize,
+                     response);
+}
+
+bool ChannelzGetServers(intptr_t start_server_id, intptr_t max_results,
+                        std::string* response) {
+  grpc_core::ExecCtx exec_ctx;
+  auto [servers, end] = ChannelzRegistry::GetNodesOfType(
+      start_server_id, BaseNode::EntityType::kServer, PageSize(max_results));
+  return GetEntities(servers, end, grpc_core::channelz::v2tov1::ConvertServer,
+                     grpc_channelz_v1_GetServersResponse_new,
+                     grpc_channelz_v1_GetServersResponse_resize_server,
+                     grpc_channelz_v1_Server_parse,
+                     grpc_channelz_v1_GetServersResponse_set_end,
+                     grpc_channelz_v1_GetServersResponse_serialize, response);
+}
+
+bool ChannelzGetServer(intptr_t server_id, std::string* response) {
+  grpc_core::ExecCtx exec_ctx;
+  auto server_node = ChannelzRegistry::GetServer(server_id);
+  if (server_node == nullptr) return false;
+  return GetEntity(*server_node, grpc_core::channelz::v2tov1::ConvertServer,
+                   grpc_channelz_v1_GetServerResponse_new,
+                   grpc_channelz_v1_Server_parse,
+                   grpc_channelz_v1_GetServerResponse_set_server,
+                   grpc_channelz_v1_GetServerResponse_serialize, response);
+}
+
+bool ChannelzGetServerSockets(intptr_t server_id, intptr_t start_socket_id,
+                              intptr_t max_results, std::string* response) {
+  grpc_core::ExecCtx exec_ctx;
+  auto server_node = ChannelzRegistry::GetServer(server_id);
+  if (server_node == nullptr) return false;
+  auto [sockets, end] = ChannelzRegistry::GetChildrenOfType(
+      start_socket_id, server_node.get(), BaseNode::EntityType::kSocket,
+      PageSize(max_results));
+  // Only references are returned, which need no conversion. The names are
+  // not copied as the nodes outlive the serialization below.
+  upb::Arena arena;
+  auto* message = grpc_channelz_v1_GetServerSocketsResponse_new(arena.ptr());
+  for (const auto& socket_node : sockets) {
+    if (socket_node == nullptr) continue;
+    auto* socket_ref = grpc_channelz_v1_GetServerSocketsResponse_add_socket_ref(
+        message, arena.ptr());
+    grpc_channelz_v1_SocketRef_set_socket_id(socket_ref, socket_node->uuid());
+    grpc_channelz_v1_SocketRef_set_name(
+        socket_ref, grpc_core::StdStringToUpbString(socket_node->name()));
+  }
+  grpc_channelz_v1_GetServerSocketsResponse_set_end(message, end);
+  return SerializeTo(message,
+                     grpc_channelz_v1_GetServerSocketsResponse_serialize,
+                     arena.ptr(), response);
+}
+
+bool ChannelzGetChannel(intptr_t channel_id, std::string* response) {
+  grpc_core::ExecCtx exec_ctx;
+  auto channel_node = ChannelzRegistry::GetChannel(channel_id);
+  if (channel_node == nullptr) return false;
+  return GetEntity(*channel_node, grpc_core::channelz::v2tov1::ConvertChannel,
+                   grpc_channelz_v1_GetChannelResponse_new,
+                   grpc_channelz_v1_Channel_parse,
+                   grpc_channelz_v1_GetChannelResponse_set_channel,
+                   grpc_channelz_v1_GetChannelResponse_serialize, response);
+}
+
+bool ChannelzGetSubchannel(intptr_t subchannel_id, std::string* response) {
+  grpc_core::ExecCtx exec_ctx;
+  auto subchannel_node = ChannelzRegistry::GetSubchannel(subchannel_id);
+  if (subchannel_node == nullptr) return false;
+  return GetEntity(*subchannel_node,
+                   grpc_core::channelz::v2tov1::ConvertSubchannel,
+                   grpc_channelz_v1_GetSubchannelResponse_new,
+                   grpc_channelz_v1_Subchannel_parse,
+                   grpc_channelz_v1_GetSubchannelResponse_set_subchannel,
+                   grpc_channelz_v1_GetSubchannelResponse_serialize, response);
+}
+
+bool ChannelzGetSocket(intptr_t socket_id, std::string* response) {
+  grpc_core::ExecCtx exec_ctx;
+  auto node = ChannelzRegistry::GetNode(socket_id);
+  if (node == nullptr) return false;
+  Converter converter;
+  if (node->type() == BaseNode::EntityType::kSocket) {
+    converter = grpc_core::channelz::v2tov1::ConvertSocket;
+  } else if (node->type() == BaseNode::EntityType::kListenSocket) {
+    converter = grpc_core::channelz::v2tov1::ConvertListenSocket;
+  } else {
+    return false;
+  }
+  return GetEntity(*node, converter, grpc_channelz_v1_GetSocketResponse_new,
+                   grpc_channelz_v1_Socket_parse,
+                   grpc_channelz_v1_GetSocketResponse_set_socket,
+                   grpc_channelz_v1_GetSocketResponse_serialize, response);
+}
+
+}  // namespace grpc_python
@@ -0,0 +1,48 @@
+//
+//
+// Copyright 2026 gRPC authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//
+
+#ifndef GRPC_CHANNELZ_PY_WRAPPER_H
+#define GRPC_CHANNELZ_PY_WRAPPER_H
+
+#include <cstddef>
+#include <cstdint>
+#include <string>
+
+namespace grpc_python {
+
+// Each of these builds the serialized grpc.channelz.v1 response to the
+// corresponding Channelz RPC directly from the channelz registry, without
+// going through JSON as the grpc_channelz_get_* C-API does. They return false
+// if the requested entity does not exist, in which case response is left
+// untouched.
+//
+// A max_results of 0 or less selects the default page size of the registry.
+bool ChannelzGetTopChannels(intptr_t start_channel_id, intptr_t max_results,
+                            std::string* response);
+bool ChannelzGetServers(intptr_t start_server_id, intptr_t max_results,
+                        std::string* response);
+bool ChannelzGetServer(intptr_t server_id, std::string* response);
+bool ChannelzGetServerSockets(intptr_t server_id, intptr_t start_socket_id,
+                              intptr_t max_results, std::string* response);
+bool ChannelzGetChannel(intptr_t channel_id, std::string* response);
+bool ChannelzGetSubchannel(intptr_t subchannel_id, std::string* response);
+bool ChannelzGetSocket(intptr_t socket_id, std::string* response);
+
+}  // namespace grpc_python
+
+#endif  // GRPC_CHANNELZ_PY_WRAPPER_H
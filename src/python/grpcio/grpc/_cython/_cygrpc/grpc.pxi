@@ -80,6 +80,18 @@ cdef extern from "src/core/lib/surface/call.h":
 
   void* grpc_call_tracer_get(grpc_call* call) nogil
 
+cdef extern from "src/python/grpcio/grpc/_cython/_cygrpc/channelz/channelz_py_wrapper.h" namespace "grpc_python":
+  bint ChannelzGetTopChannels(intptr_t start_channel_id, intptr_t max_results,
+                              string* response) nogil
+  bint ChannelzGetServers(intptr_t start_server_id, intptr_t max_results,
+                          string* response) nogil
+  bint ChannelzGetServer(intptr_t server_id, string* response) nogil
+  bint ChannelzGetServerSockets(intptr_t server_id, intptr_t start_socket_id,
+                                intptr_t max_results, string* response) nogil
+  bint ChannelzGetChannel(intptr_t channel_id, string* response) nogil
+  bint ChannelzGetSubchannel(intptr_t subchannel_id, string* response) nogil
+  bint ChannelzGetSocket(intptr_t socket_id, string* response) nogil
+
 cdef extern from "grpc/support/alloc.h":
 
   void *gpr_malloc(size_t size) nogil
@@ -118,6 +130,9 @@ cdef extern from "grpc/grpc.h":
   grpc_slice grpc_slice_from_copied_buffer(const char *source, size_t len) nogil
   grpc_slice grpc_slice_copy(grpc_slice s) nogil
 
+  int grpc_header_key_is_legal(grpc_slice slice) nogil
+  int grpc_header_nonbin_value_is_legal(grpc_slice slice) nogil
+
   # Declare functions for function-like macros (because Cython)...
   void *grpc_slice_start_ptr "GRPC_SLICE_START_PTR" (grpc_slice s) nogil
   size_t grpc_slice_length "GRPC_SLICE_LENGTH" (grpc_slice s) nogil
@@ -821,6 +836,12 @@ cdef extern from "grpc/compression.h":
       const grpc_compression_options *opts,
       grpc_compression_algorithm algorithm) nogil
 
+cdef extern from "grpc/byte_buffer.h":
+
+  grpc_byte_buffer *grpc_raw_compressed_byte_buffer_create(
+      grpc_slice *slices, size_t nslices,
+      grpc_compression_algorithm compression) nogil
+
 cdef extern from "grpc/impl/codegen/compression_types.h":
 
   const char *_GRPC_COMPRESSION_REQUEST_ALGORITHM_MD_KEY \
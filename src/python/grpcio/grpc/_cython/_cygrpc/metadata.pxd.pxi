@@ -13,6 +13,12 @@
 # limitations under the License.
 
 
+cdef class _EncodedSlices:
+
+  cdef grpc_metadata *_c_metadata
+  cdef size_t _c_count
+
+
 cdef void _store_c_metadata(
     metadata, grpc_metadata **c_metadata, size_t *c_count) except *
 
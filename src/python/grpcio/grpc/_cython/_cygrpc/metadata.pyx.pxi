@@ -24,9 +24,93 @@ class InitialMetadataFlags:
 _Metadatum = collections.namedtuple('_Metadatum', ('key', 'value',))
 
 
+cdef tuple _encoded_metadatum(object key, object value):
+  cdef bytes encoded_key = _encode(key)
+  encoded_value = value if encoded_key[-4:] == b'-bin' else _encode(value)
+  if not isinstance(encoded_value, bytes):
+    raise TypeError('Binary metadata key="%s" expected bytes, got %s' % (
+      key,
+      type(encoded_value)
+    ))
+  return encoded_key, encoded_value
+
+
+cdef class _EncodedSlices:
+  """Owns the C key/value slices of an EncodedMetadata."""
+
+  def __cinit__(self, tuple encoded_metadata):
+    self._c_metadata = NULL
+    self._c_count = 0
+    if not encoded_metadata:
+      return
+    self._c_metadata = <grpc_metadata *>gpr_malloc(
+        len(encoded_metadata) * sizeof(grpc_metadata))
+    for encoded_key, encoded_value in encoded_metadata:
+      self._c_metadata[self._c_count].key = _slice_from_bytes(encoded_key)
+      self._c_metadata[self._c_count].value = _slice_from_bytes(encoded_value)
+      self._c_count += 1
+      if not grpc_header_key_is_legal(
+          self._c_metadata[self._c_count - 1].key):
+        raise ValueError('Illegal metadata key: %r' % (encoded_key,))
+      if encoded_key[-4:] != b'-bin' and not grpc_header_nonbin_value_is_legal(
+          self._c_metadata[self._c_count - 1].value):
+        raise ValueError('Illegal metadata value for key %r: %r' % (
+          encoded_key, encoded_value))
+
+  def __dealloc__(self):
+    if 0 < self._c_count:
+      _release_c_metadata(self._c_metadata, self._c_count)
+    elif self._c_metadata != NULL:
+      gpr_free(self._c_metadata)
+
+
+class EncodedMetadata(tuple):
+  """Metadata validated and encoded once for reuse across many RPCs.
+
+  An EncodedMetadata is a tuple of (key, value) pairs, normalized the way a
+  receiving peer would see them, and can be passed anywhere metadata is
+  accepted. When it reaches Core it is not encoded again; the pre-built
+  slices are shared by reference.
+  """
+
+  def __new__(cls, metadata=()):
+    encoded_metadata = tuple(
+        _encoded_metadatum(key, value) for key, value in metadata)
+    self = tuple.__new__(cls, tuple(
+        _Metadatum(
+            _decode(encoded_key),
+            encoded_value if encoded_key[-4:] == b'-bin'
+            else _decode(encoded_value))
+        for encoded_key, encoded_value in encoded_metadata))
+    self._encoded_slices = _EncodedSlices(encoded_metadata)
+    return self
+
+  def __reduce__(self):
+    return EncodedMetadata, (tuple(self),)
+
+
+cdef void _store_encoded_c_metadata(
+    _EncodedSlices encoded_slices,
+    grpc_metadata **c_metadata,
+    size_t *c_count) except *:
+  c_count[0] = encoded_slices._c_count
+  if encoded_slices._c_count == 0:
+    c_metadata[0] = NULL
+    return
+  c_metadata[0] = <grpc_metadata *>gpr_malloc(
+      encoded_slices._c_count * sizeof(grpc_metadata))
+  for index in range(encoded_slices._c_count):
+    c_metadata[0][index].key = grpc_slice_ref(
+        encoded_slices._c_metadata[index].key)
+    c_metadata[0][index].value = grpc_slice_ref(
+        encoded_slices._c_metadata[index].value)
+
+
 cdef void _store_c_metadata(
     metadata, grpc_metadata **c_metadata, size_t *c_count) except *:
-  if metadata is None:
+  if isinstance(metadata, EncodedMetadata):
+    _store_encoded_c_metadata(metadata._encoded_slices, c_metadata, c_count)
+  elif metadata is None:
     c_count[0] = 0
     c_metadata[0] = NULL
   else:
@@ -39,13 +123,7 @@ cdef void _store_c_metadata(
       c_metadata[0] = <grpc_metadata *>gpr_malloc(
           metadatum_count * sizeof(grpc_metadata))
       for index, (key, value) in enumerate(metadata):
-        encoded_key = _encode(key)
-        encoded_value = value if encoded_key[-4:] == b'-bin' else _encode(value)
-        if not isinstance(encoded_value, bytes):
-          raise TypeError('Binary metadata key="%s" expected bytes, got %s' % (
-            key,
-            type(encoded_value)
-          ))
+        encoded_key, encoded_value = _encoded_metadatum(key, value)
         c_metadata[0][index].key = _slice_from_bytes(encoded_key)
         c_metadata[0][index].value = _slice_from_bytes(encoded_value)
 
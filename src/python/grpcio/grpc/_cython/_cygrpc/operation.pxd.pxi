@@ -37,6 +37,7 @@ cdef class SendMessageOperation(Operation):
 
   cdef readonly bytes _message
   cdef readonly int _flags
+  cdef readonly grpc_compression_algorithm _compression
   cdef grpc_byte_buffer *_c_message_byte_buffer
 
   cdef void c(self) except *
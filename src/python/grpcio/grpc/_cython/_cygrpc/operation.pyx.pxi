@@ -48,12 +48,18 @@ cdef class SendInitialMetadataOperation(Operation):
 
 cdef class SendMessageOperation(Operation):
 
-  def __cinit__(self, bytes message, int flags):
+  def __cinit__(self, bytes message, int flags,
+                grpc_compression_algorithm compression=GRPC_COMPRESS_NONE):
+    # A message already compressed with the compression of its call is sent
+    # by core as it is. The promise-based server call of core
+    # (src/core/call/server_call.cc) ignores the compression of the byte
+    # buffer and compresses such a message a second time.
     if message is None:
       self._message = b''
     else:
       self._message = message
     self._flags = flags
+    self._compression = compression
 
   def type(self):
     return GRPC_OP_SEND_MESSAGE
@@ -63,8 +69,12 @@ cdef class SendMessageOperation(Operation):
     self.c_op.flags = self._flags
     cdef grpc_slice message_slice = grpc_slice_from_copied_buffer(
         self._message, len(self._message))
-    self._c_message_byte_buffer = grpc_raw_byte_buffer_create(
-        &message_slice, 1)
+    if self._compression == GRPC_COMPRESS_NONE:
+      self._c_message_byte_buffer = grpc_raw_byte_buffer_create(
+          &message_slice, 1)
+    else:
+      self._c_message_byte_buffer = grpc_raw_compressed_byte_buffer_create(
+          &message_slice, 1, self._compression)
     grpc_slice_unref(message_slice)
     self.c_op.data.send_message.send_message = self._c_message_byte_buffer
 
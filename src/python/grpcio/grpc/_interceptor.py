@@ -20,6 +20,7 @@ from typing import Any, Callable, Optional, Sequence, Tuple, Union
 
 import grpc
 
+from . import _observability
 from ._typing import DeserializingFunction
 from ._typing import DoneCallbackType
 from ._typing import MetadataType
@@ -325,9 +326,10 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
             except Exception as exception:  # pylint:disable=broad-except
                 return _FailureOutcome(exception, sys.exc_info()[2])
 
-        call = self._interceptor.intercept_unary_unary(
-            continuation, client_call_details, request
-        )
+        with _observability.client_interception():
+            call = self._interceptor.intercept_unary_unary(
+                continuation, client_call_details, request
+            )
         return call.result(), call
 
     def with_call(
@@ -385,9 +387,10 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
             )
 
         try:
-            return self._interceptor.intercept_unary_unary(
-                continuation, client_call_details, request
-            )
+            with _observability.client_interception():
+                return self._interceptor.intercept_unary_unary(
+                    continuation, client_call_details, request
+                )
         except Exception as exception:  # pylint:disable=broad-except
             return _FailureOutcome(exception, sys.exc_info()[2])
 
@@ -444,9 +447,10 @@ class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
             )
 
         try:
-            return self._interceptor.intercept_unary_stream(
-                continuation, client_call_details, request
-            )
+            with _observability.client_interception():
+                return self._interceptor.intercept_unary_stream(
+                    continuation, client_call_details, request
+                )
         except Exception as exception:  # pylint:disable=broad-except
             return _FailureOutcome(exception, sys.exc_info()[2])
 
@@ -527,9 +531,10 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
             except Exception as exception:  # pylint:disable=broad-except
                 return _FailureOutcome(exception, sys.exc_info()[2])
 
-        call = self._interceptor.intercept_stream_unary(
-            continuation, client_call_details, request_iterator
-        )
+        with _observability.client_interception():
+            call = self._interceptor.intercept_stream_unary(
+                continuation, client_call_details, request_iterator
+            )
         return call.result(), call
 
     def with_call(
@@ -552,7 +557,7 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
 
     def future(
         self,
-        request_iterator: RequestIterableType,
+        request_iterator: Optional[RequestIterableType] = None,
         timeout: Optional[float] = None,
         metadata: Optional[MetadataType] = None,
         credentials: Optional[grpc.CallCredentials] = None,
@@ -587,9 +592,10 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
             )
 
         try:
-            return self._interceptor.intercept_stream_unary(
-                continuation, client_call_details, request_iterator
-            )
+            with _observability.client_interception():
+                return self._interceptor.intercept_stream_unary(
+                    continuation, client_call_details, request_iterator
+                )
         except Exception as exception:  # pylint:disable=broad-except
             return _FailureOutcome(exception, sys.exc_info()[2])
 
@@ -611,7 +617,7 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
 
     def __call__(
         self,
-        request_iterator: RequestIterableType,
+        request_iterator: Optional[RequestIterableType] = None,
         timeout: Optional[float] = None,
         metadata: Optional[MetadataType] = None,
         credentials: Optional[grpc.CallCredentials] = None,
@@ -646,9 +652,10 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
             )
 
         try:
-            return self._interceptor.intercept_stream_stream(
-                continuation, client_call_details, request_iterator
-            )
+            with _observability.client_interception():
+                return self._interceptor.intercept_stream_stream(
+                    continuation, client_call_details, request_iterator
+                )
         except Exception as exception:  # pylint:disable=broad-except
             return _FailureOutcome(exception, sys.exc_info()[2])
 
@@ -16,14 +16,18 @@ from __future__ import annotations
 
 import abc
 import contextlib
+import contextvars
 import logging
 import threading
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
+    Dict,
     Generator,
     Generic,
     List,
+    Mapping,
     Optional,
     Tuple,
     TypeVar,
@@ -43,10 +47,18 @@ ServerCallTracerFactoryCapsule = TypeVar("ServerCallTracerFactoryCapsule")
 
 _plugin_lock: threading.RLock = threading.RLock()
 _OBSERVABILITY_PLUGIN: Optional["ObservabilityPlugin"] = None
+# Whether the registered plugin times the phases of RPCs, read without
+# _plugin_lock on the path of every RPC.
+_phase_timing_enabled: bool = False
 _SERVICES_TO_EXCLUDE: List[bytes] = [
     b"google.monitoring.v3.MetricService",
     b"google.devtools.cloudtrace.v2.TraceService",
 ]
+# The time.monotonic_ns() at which the client interceptors of the RPC being
+# started in this context began to run.
+_interception_start_ns: contextvars.ContextVar[Optional[int]] = (
+    contextvars.ContextVar("interception_start_ns", default=None)
+)
 
 
 class ServerCallTracerFactory:
@@ -84,10 +96,13 @@ class ObservabilityPlugin(
       _tracing_enabled: A bool indicates whether stats(metrics) is enabled.
       _registered_methods: A set which stores the registered method names in
         bytes.
+      _phase_timing_enabled: A bool indicates whether the phases of RPCs are
+        timed.
     """
 
     _tracing_enabled: bool = False
     _stats_enabled: bool = False
+    _phase_timing_enabled: bool = False
 
     @abc.abstractmethod
     def create_client_call_tracer(
@@ -176,6 +191,51 @@ class ObservabilityPlugin(
         """
         raise NotImplementedError()
 
+    def record_server_rpc_phases(
+        self, method: str, phases: Mapping[str, float]
+    ) -> None:
+        """Record the time a server spent in each phase of an RPC.
+
+        After register the plugin, if phase timing is enabled, this method
+        will be called at the end of each RPC handled by a server, typically
+        to record every phase in a histogram.
+
+        Args:
+          method: The fully-qualified name of the RPC method being invoked.
+          phases: The latency of each phase of the RPC in milliseconds, keyed
+            by phase name: "lookup" for finding the method handler,
+            "interceptors" for server interceptors, "deserialization" for
+            request messages, "queue" for waiting for a thread pool,
+            "handler" for the application handler, "serialization" for
+            response messages, "send" for waiting on the transport to send
+            messages and status, and "total" from the arrival of the RPC to
+            its end. Phases the RPC did not go through are left out.
+        """
+
+    def record_client_rpc_phases(
+        self, method: str, target: str, phases: Mapping[str, float]
+    ) -> None:
+        """Record the time a client spent in each phase of an RPC.
+
+        After register the plugin, if phase timing is enabled, this method
+        will be called once an RPC made by a client has received its status
+        and the application has taken its last response. Responses the
+        application never takes are not waited for.
+
+        Args:
+          method: The fully-qualified name of the RPC method being invoked.
+          target: The target name of the RPC method being invoked.
+          phases: The latency of each phase of the RPC in milliseconds, keyed
+            by phase name: "interceptors" for client interceptors up to the
+            start of the call, "serialization" for request messages,
+            "initial_metadata" from the start of the RPC to the receipt of
+            initial metadata, "deserialization" for response messages,
+            "delivery" from the receipt of each response to the
+            application taking it, deserialization included, and "total"
+            from the start of the RPC to the receipt of its status. Phases
+            the RPC did not go through are left out.
+        """
+
     def set_tracing(self, enable: bool) -> None:
         """Enable or disable tracing.
 
@@ -192,6 +252,18 @@ class ObservabilityPlugin(
         """
         self._stats_enabled = enable
 
+    def set_phase_timing(self, enable: bool) -> None:
+        """Enable or disable timing the phases of RPCs.
+
+        Args:
+          enable: A bool indicates whether phase timing should be enabled.
+        """
+        global _phase_timing_enabled  # pylint: disable=global-statement # noqa: PLW0603
+        with _plugin_lock:
+            self._phase_timing_enabled = enable
+            if _OBSERVABILITY_PLUGIN is self:
+                _phase_timing_enabled = enable
+
     def save_registered_method(self, method_name: bytes) -> None:
         """Saves the method name to registered_method list.
 
@@ -215,6 +287,159 @@ class ObservabilityPlugin(
     def observability_enabled(self) -> bool:
         return self.tracing_enabled or self.stats_enabled
 
+    @property
+    def phase_timing_enabled(self) -> bool:
+        return self._phase_timing_enabled
+
+
+class RpcPhaseTimer:
+    """Accumulates the time an RPC spends in each of its phases.
+
+    Phases are timed with time.monotonic_ns() and may be entered many times,
+    as for every message of a streaming RPC. A phase starting on one thread
+    and ending on another is timed from a named mark, so the phases and
+    marks are guarded by a lock.
+    """
+
+    __slots__ = ("start_ns", "marks", "phases", "_lock")
+
+    start_ns: int
+    marks: Dict[str, int]
+    phases: Dict[str, int]
+    _lock: threading.Lock
+
+    def __init__(self):
+        self.start_ns = time.monotonic_ns()
+        self.marks = {}
+        self.phases = {}
+        self._lock = threading.Lock()
+
+    def add(self, phase: str, since_ns: int) -> int:
+        """Adds the time from since_ns to now to a phase.
+
+        Returns:
+          The time.monotonic_ns() used as now.
+        """
+        with self._lock:
+            return self._add(phase, since_ns)
+
+    def mark(self, name: str) -> None:
+        now_ns = time.monotonic_ns()
+        with self._lock:
+            self.marks[name] = now_ns
+
+    def add_since_mark(self, phase: str, name: str) -> Optional[int]:
+        """Adds the time from a mark to now to a phase and clears the mark.
+
+        Returns:
+          The time.monotonic_ns() used as now, or None if the mark is not set.
+        """
+        with self._lock:
+            return self._add_since_mark(phase, name)
+
+    def durations_ms(self) -> Dict[str, float]:
+        with self._lock:
+            return {phase: ns / 1e6 for phase, ns in self.phases.items()}
+
+    def _add(self, phase: str, since_ns: int) -> int:
+        now_ns = time.monotonic_ns()
+        self.phases[phase] = self.phases.get(phase, 0) + now_ns - since_ns
+        return now_ns
+
+    def _add_since_mark(self, phase: str, name: str) -> Optional[int]:
+        since_ns = self.marks.pop(name, None)
+        if since_ns is None:
+            return None
+        return self._add(phase, since_ns)
+
+
+class ClientRpcPhaseTimer(RpcPhaseTimer):
+    """Times the phases of an RPC made by a client.
+
+    A response marks "delivery" when it arrives, and the phase is timed when
+    the application takes it. The phases are recorded once the RPC received
+    its status and either no response awaits the application or the
+    application abandoned the RPC by cancelling it or dropping its call.
+    """
+
+    __slots__ = ("method", "target", "finished", "abandoned", "recorded")
+
+    method: bytes
+    target: bytes
+    finished: bool
+    abandoned: bool
+    recorded: bool
+
+    def __init__(
+        self,
+        method: bytes,
+        target: bytes,
+        interception_start_ns: Optional[int] = None,
+    ):
+        super().__init__()
+        self.method = method
+        self.target = target
+        self.finished = False
+        self.abandoned = False
+        self.recorded = False
+        if interception_start_ns is not None:
+            self.add("interceptors", interception_start_ns)
+            self.start_ns = interception_start_ns
+
+    def response_received(self) -> int:
+        """Marks the arrival of a response.
+
+        Returns:
+          The time.monotonic_ns() of the mark.
+        """
+        now_ns = time.monotonic_ns()
+        with self._lock:
+            self.marks["delivery"] = now_ns
+        return now_ns
+
+    def response_delivered(self) -> None:
+        """Times the delivery of the last response to the application."""
+        with self._lock:
+            record = (
+                self._add_since_mark("delivery", "delivery") is not None
+                and self.finished
+                and self._take_record()
+            )
+        if record:
+            maybe_record_client_rpc_phases(self)
+
+    def status_received(self) -> None:
+        """Ends the RPC on the receipt of its status."""
+        with self._lock:
+            if self.finished:
+                return
+            self._add("total", self.start_ns)
+            self.finished = True
+            if self.abandoned:
+                self.marks.pop("delivery", None)
+            record = "delivery" not in self.marks and self._take_record()
+        if record:
+            maybe_record_client_rpc_phases(self)
+
+    def responses_abandoned(self) -> None:
+        """Stops waiting for the application to take its responses.
+
+        Called when the application cancels the RPC or drops its call, so the
+        phases are recorded even if a response is never taken.
+        """
+        with self._lock:
+            self.abandoned = True
+            self.marks.pop("delivery", None)
+            record = self.finished and self._take_record()
+        if record:
+            maybe_record_client_rpc_phases(self)
+
+    def _take_record(self) -> bool:
+        if self.recorded:
+            return False
+        self.recorded = True
+        return True
+
 
 @contextlib.contextmanager
 def get_plugin() -> Generator[Optional[ObservabilityPlugin], None, None]:
@@ -239,11 +464,16 @@ def set_plugin(observability_plugin: Optional[ObservabilityPlugin]) -> None:
     time of calling this method.
     """
     global _OBSERVABILITY_PLUGIN  # pylint: disable=global-statement # noqa: PLW0603
+    global _phase_timing_enabled  # pylint: disable=global-statement # noqa: PLW0603
     with _plugin_lock:
         if observability_plugin and _OBSERVABILITY_PLUGIN:
             error_msg = "observability_plugin was already set!"
             raise ValueError(error_msg)
         _OBSERVABILITY_PLUGIN = observability_plugin
+        _phase_timing_enabled = (
+            observability_plugin is not None
+            and observability_plugin.phase_timing_enabled
+        )
 
 
 def observability_init(observability_plugin: ObservabilityPlugin) -> None:
@@ -295,6 +525,87 @@ def maybe_record_rpc_latency(state: "_RPCState") -> None:
             )
 
 
+def maybe_create_rpc_phase_timer() -> Optional[RpcPhaseTimer]:
+    """Creates an RpcPhaseTimer if the plugin has phase timing enabled."""
+    if _phase_timing_enabled:
+        return RpcPhaseTimer()
+    return None
+
+
+@contextlib.contextmanager
+def client_interception() -> Generator[None, None, None]:
+    """Times the client interceptors of the RPCs started within the block.
+
+    Nested blocks, as for channels intercepted more than once, are timed by
+    the outermost one.
+    """
+    if not _phase_timing_enabled or _interception_start_ns.get() is not None:
+        yield
+        return
+    token = _interception_start_ns.set(time.monotonic_ns())
+    try:
+        yield
+    finally:
+        _interception_start_ns.reset(token)
+
+
+def maybe_create_client_rpc_phase_timer(
+    method: bytes, target: bytes
+) -> Optional[ClientRpcPhaseTimer]:
+    """Creates a ClientRpcPhaseTimer if the plugin has phase timing enabled.
+
+    Args:
+      method: The fully-qualified name of the RPC method in bytes.
+      target: The target of the channel of the RPC in bytes.
+    """
+    if not _phase_timing_enabled:
+        return None
+    for exclude_prefix in _SERVICES_TO_EXCLUDE:
+        if exclude_prefix in method:
+            return None
+    return ClientRpcPhaseTimer(method, target, _interception_start_ns.get())
+
+
+def maybe_record_client_rpc_phases(phase_timer: ClientRpcPhaseTimer) -> None:
+    """Record the phases of an RPC made by a client.
+
+    Args:
+      phase_timer: The ClientRpcPhaseTimer of the RPC.
+    """
+    with get_plugin() as plugin:
+        if plugin and plugin.phase_timing_enabled:
+            try:
+                plugin.record_client_rpc_phases(
+                    phase_timer.method.decode("utf8"),
+                    phase_timer.target.decode("utf8"),
+                    phase_timer.durations_ms(),
+                )
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Exception recording RPC phases!")
+
+
+def maybe_record_server_rpc_phases(
+    method: str, phase_timer: RpcPhaseTimer
+) -> None:
+    """Record the phases of an RPC handled by a server.
+
+    This method will be called at the end of each RPC timed by the server.
+
+    Args:
+      method: The fully-qualified name of the RPC method.
+      phase_timer: The RpcPhaseTimer of the RPC.
+    """
+    phase_timer.add("total", phase_timer.start_ns)
+    with get_plugin() as plugin:
+        if plugin and plugin.phase_timing_enabled:
+            try:
+                plugin.record_server_rpc_phases(
+                    method, phase_timer.durations_ms()
+                )
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Exception recording RPC phases!")
+
+
 def create_server_call_tracer_factory_option(
     xds: bool,
 ) -> Union[Tuple[ChannelArgumentType], Tuple[()]]:
@@ -20,6 +20,7 @@ import collections
 from concurrent import futures
 import contextvars
 import enum
+import functools
 import logging
 import threading
 import time
@@ -27,6 +28,7 @@ import traceback
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     Iterable,
     Iterator,
@@ -38,12 +40,16 @@ from typing import (
     Tuple,
     Union,
 )
+import weakref
 
 import grpc
 from grpc import _common
 from grpc import _compression
+from grpc import _concurrency_limiter
 from grpc import _interceptor
 from grpc import _observability
+from grpc import _server_executor
+from grpc import _utilities
 from grpc._cython import cygrpc
 from grpc._typing import ArityAgnosticMethodHandler
 from grpc._typing import ChannelArgumentType
@@ -58,6 +64,10 @@ from typing_extensions import override
 
 _LOGGER = logging.getLogger(__name__)
 
+MaximumConcurrentRpcs = Optional[
+    Union[int, _concurrency_limiter.AdaptiveConcurrencyLimiter]
+]
+
 _SHUTDOWN_TAG = "shutdown"
 _REQUEST_CALL_TAG = "request_call"
 
@@ -81,6 +91,14 @@ _EMPTY_FLAGS = 0
 
 _DEALLOCATED_SERVER_CHECK_PERIOD_S = 1.0
 _INF_TIMEOUT = 1e9
+# The deadline cygrpc reports for an RPC without one is the far end of
+# gpr_inf_future, about 9.2e18 seconds after the epoch.
+_NO_DEADLINE_THRESHOLD = 1e18
+
+# How long a handler that overran its inline budget runs in the thread pool
+# before it is tried inline again.
+_INLINE_DEMOTION_PERIOD_S = 10.0
+_INLINE_DEMOTIONS = weakref.WeakKeyDictionary()
 
 
 def _serialized_request(request_event: cygrpc.BaseEvent) -> bytes:
@@ -187,6 +205,7 @@ class _RPCState:
     client: str
     initial_metadata_allowed: bool
     compression_algorithm: Optional[grpc.Compression]
+    compression_policy: Optional[_compression.MessageCompressionPolicy]
     disable_next_compression: bool
     trailing_metadata: Optional[MetadataType]
     code: Optional[grpc.StatusCode]
@@ -195,6 +214,8 @@ class _RPCState:
     rpc_errors: List[Exception]
     callbacks: Optional[List[NullaryCallbackType]]
     aborted: bool
+    handler_call_details: Optional[_HandlerCallDetails]
+    phase_timer: Optional[_observability.RpcPhaseTimer]
 
     def __init__(self):
         self.context = contextvars.Context()
@@ -204,6 +225,7 @@ class _RPCState:
         self.client = _OPEN
         self.initial_metadata_allowed = True
         self.compression_algorithm = None
+        self.compression_policy = None
         self.disable_next_compression = False
         self.trailing_metadata = None
         self.code = None
@@ -212,6 +234,8 @@ class _RPCState:
         self.rpc_errors = []
         self.callbacks = []
         self.aborted = False
+        self.handler_call_details = None
+        self.phase_timer = None
 
 
 def _raise_rpc_error(state: _RPCState) -> None:
@@ -296,6 +320,8 @@ def _abort(
         )
         state.statused = True
         state.due.add(token)
+        if state.phase_timer is not None:
+            state.phase_timer.mark("send")
 
 
 def _receive_close_on_server(state: _RPCState) -> ServerCallbackTag:
@@ -325,9 +351,13 @@ def _receive_message(
                 state.condition.notify_all()
                 return _possibly_finish_call(state, _RECEIVE_MESSAGE_TOKEN)
         else:
+            phase_timer = state.phase_timer
+            start_ns = None if phase_timer is None else time.monotonic_ns()
             request = _common.deserialize(
                 serialized_request, request_deserializer
             )
+            if phase_timer is not None:
+                phase_timer.add("deserialization", start_ns)
             with state.condition:
                 if request is None:
                     _abort(
@@ -418,9 +448,25 @@ class _Context(grpc.ServicerContext):
             for key, value in auth_context_dict.items()
         }
 
-    def set_compression(self, compression: grpc.Compression) -> None:
+    def set_compression(
+        self,
+        compression: grpc.Compression,
+        *,
+        min_message_size: Optional[int] = None,
+        offload_message_size: Optional[int] = None,
+    ) -> None:
+        if min_message_size is None and offload_message_size is None:
+            policy = None
+        else:
+            policy = _compression.MessageCompressionPolicy(
+                compression, min_message_size, offload_message_size
+            )
         with self._state.condition:
             self._state.compression_algorithm = compression
+            # Responses may only be compressed ahead of core with the
+            # compression announced in the initial metadata.
+            if self._state.initial_metadata_allowed:
+                self._state.compression_policy = policy
 
     def send_initial_metadata(self, initial_metadata: MetadataType) -> None:
         with self._state.condition:
@@ -545,6 +591,20 @@ class _RequestIterator:
         return self._next()
 
 
+def _abort_missing_unary_request(
+    rpc_event: cygrpc.BaseEvent, state: _RPCState
+) -> None:
+    details = '"{}" requires exactly one request message.'.format(
+        rpc_event.call_details.method
+    )
+    _abort(
+        state,
+        rpc_event.call,
+        cygrpc.StatusCode.unimplemented,
+        _common.encode(details),
+    )
+
+
 def _unary_request(
     rpc_event: cygrpc.BaseEvent,
     state: _RPCState,
@@ -563,17 +623,7 @@ def _unary_request(
                 state.condition.wait()
                 if state.request is None:
                     if state.client is _CLOSED:
-                        details = (
-                            '"{}" requires exactly one request message.'.format(
-                                rpc_event.call_details.method
-                            )
-                        )
-                        _abort(
-                            state,
-                            rpc_event.call,
-                            cygrpc.StatusCode.unimplemented,
-                            _common.encode(details),
-                        )
+                        _abort_missing_unary_request(rpc_event, state)
                         return None
                     if state.client is _CANCELLED:
                         return None
@@ -595,9 +645,11 @@ def _call_behavior(
 ) -> Tuple[Union[ResponseType, Iterator[ResponseType]], bool]:
     from grpc import _create_servicer_context
 
+    phase_timer = state.phase_timer
     with _create_servicer_context(
         rpc_event, state, request_deserializer
     ) as context:
+        start_ns = None if phase_timer is None else time.monotonic_ns()
         try:
             response_or_iterator = None
             if send_response_callback is not None:
@@ -641,6 +693,9 @@ def _call_behavior(
                         _common.encode(details),
                     )
             return None, False
+        finally:
+            if phase_timer is not None:
+                phase_timer.add("handler", start_ns)
 
 
 def _take_response_from_response_iterator(
@@ -648,6 +703,8 @@ def _take_response_from_response_iterator(
     state: _RPCState,
     response_iterator: Iterator[ResponseType],
 ) -> Tuple[ResponseType, bool]:
+    phase_timer = state.phase_timer
+    start_ns = None if phase_timer is None else time.monotonic_ns()
     try:
         return next(response_iterator), True
     except StopIteration:
@@ -671,6 +728,9 @@ def _take_response_from_response_iterator(
                     _common.encode(details),
                 )
         return None, False
+    finally:
+        if phase_timer is not None:
+            phase_timer.add("handler", start_ns)
 
 
 def _serialize_response(
@@ -679,7 +739,11 @@ def _serialize_response(
     response: Any,
     response_serializer: Optional[SerializingFunction],
 ) -> Optional[bytes]:
+    phase_timer = state.phase_timer
+    start_ns = None if phase_timer is None else time.monotonic_ns()
     serialized_response = _common.serialize(response, response_serializer)
+    if phase_timer is not None:
+        phase_timer.add("serialization", start_ns)
     if serialized_response is None:
         with state.condition:
             _abort(
@@ -692,12 +756,22 @@ def _serialize_response(
     return serialized_response
 
 
-def _get_send_message_op_flags_from_state(
-    state: _RPCState,
-) -> Union[int, cygrpc.WriteFlag]:
-    if state.disable_next_compression:
-        return cygrpc.WriteFlag.no_compress
-    return _EMPTY_FLAGS
+def _get_send_message_operation(
+    state: _RPCState, serialized_response: bytes
+) -> cygrpc.Operation:
+    # Called on the thread sending the response without holding the lock of
+    # the RPC, so that compressing a large response ahead of core stalls
+    # neither the serving thread nor the other users of the RPC.
+    with state.condition:
+        disable_compression = state.disable_next_compression
+        policy = state.compression_policy
+    if disable_compression:
+        return cygrpc.SendMessageOperation(
+            serialized_response, cygrpc.WriteFlag.no_compress
+        )
+    if policy is None:
+        return cygrpc.SendMessageOperation(serialized_response, _EMPTY_FLAGS)
+    return cygrpc.SendMessageOperation(*policy.compress(serialized_response))
 
 
 def _reset_per_message_state(state: _RPCState) -> None:
@@ -708,26 +782,23 @@ def _reset_per_message_state(state: _RPCState) -> None:
 def _send_response(
     rpc_event: cygrpc.BaseEvent, state: _RPCState, serialized_response: bytes
 ) -> bool:
+    phase_timer = state.phase_timer
+    start_ns = None if phase_timer is None else time.monotonic_ns()
+    send_message_operation = _get_send_message_operation(
+        state, serialized_response
+    )
     with state.condition:
         if not _is_rpc_state_active(state):
             return False
         if state.initial_metadata_allowed:
             operations = (
                 _get_initial_metadata_operation(state, None),
-                cygrpc.SendMessageOperation(
-                    serialized_response,
-                    _get_send_message_op_flags_from_state(state),
-                ),
+                send_message_operation,
             )
             state.initial_metadata_allowed = False
             token = _SEND_INITIAL_METADATA_AND_SEND_MESSAGE_TOKEN
         else:
-            operations = (
-                cygrpc.SendMessageOperation(
-                    serialized_response,
-                    _get_send_message_op_flags_from_state(state),
-                ),
-            )
+            operations = (send_message_operation,)
             token = _SEND_MESSAGE_TOKEN
         rpc_event.call.start_server_batch(
             operations, _send_message(state, token)
@@ -737,14 +808,124 @@ def _send_response(
         while True:
             state.condition.wait()
             if token not in state.due:
+                if phase_timer is not None:
+                    phase_timer.add("send", start_ns)
                 return _is_rpc_state_active(state)
 
 
+class _ResponsePipeline:
+    """Sends the serialized responses of a streaming RPC back to back.
+
+    The handler thread buffers up to lookahead serialized responses ahead of
+    the transport instead of waiting for each send to complete. The
+    completion of a send starts the next buffered one from the serving
+    thread, so producing and serializing responses overlaps their
+    transmission.
+    """
+
+    _rpc_event: cygrpc.BaseEvent
+    _state: _RPCState
+    _lookahead: int
+    _buffer: Deque[cygrpc.Operation]
+    _sending: bool
+
+    def __init__(
+        self, rpc_event: cygrpc.BaseEvent, state: _RPCState, lookahead: int
+    ):
+        self._rpc_event = rpc_event
+        self._state = state
+        self._lookahead = lookahead
+        self._buffer = collections.deque()
+        self._sending = False
+
+    def send(self, serialized_response: bytes) -> bool:
+        """Sends or buffers a response, blocking while the buffer is full.
+
+        Returns:
+          Whether the RPC is still active.
+        """
+        phase_timer = self._state.phase_timer
+        start_ns = None if phase_timer is None else time.monotonic_ns()
+        send_message_operation = _get_send_message_operation(
+            self._state, serialized_response
+        )
+        with self._state.condition:
+            while (
+                _is_rpc_state_active(self._state)
+                and len(self._buffer) >= self._lookahead
+            ):
+                self._state.condition.wait()
+            if phase_timer is not None:
+                phase_timer.add("send", start_ns)
+            if not _is_rpc_state_active(self._state):
+                return False
+            _reset_per_message_state(self._state)
+            if self._sending:
+                self._buffer.append(send_message_operation)
+            else:
+                self._start_send(send_message_operation)
+            return True
+
+    def flush(self) -> bool:
+        """Blocks until every buffered response has been sent.
+
+        Returns:
+          Whether the RPC is still active.
+        """
+        phase_timer = self._state.phase_timer
+        start_ns = None if phase_timer is None else time.monotonic_ns()
+        with self._state.condition:
+            while _is_rpc_state_active(self._state) and self._sending:
+                self._state.condition.wait()
+            if phase_timer is not None:
+                phase_timer.add("send", start_ns)
+            return _is_rpc_state_active(self._state)
+
+    def _start_send(self, send_message_operation: cygrpc.Operation) -> None:
+        if self._state.initial_metadata_allowed:
+            operations = (
+                _get_initial_metadata_operation(self._state, None),
+                send_message_operation,
+            )
+            self._state.initial_metadata_allowed = False
+            token = _SEND_INITIAL_METADATA_AND_SEND_MESSAGE_TOKEN
+        else:
+            operations = (send_message_operation,)
+            token = _SEND_MESSAGE_TOKEN
+        self._rpc_event.call.start_server_batch(
+            operations, self._on_sent(token)
+        )
+        self._state.due.add(token)
+        self._sending = True
+
+    def _on_sent(self, token: str) -> ServerCallbackTag:
+        def on_sent(unused_send_message_event):
+            with self._state.condition:
+                # Finish with the completed send before the next one reuses
+                # its token.
+                finished = _possibly_finish_call(self._state, token)
+                self._sending = False
+                if self._buffer and _is_rpc_state_active(self._state):
+                    self._start_send(self._buffer.popleft())
+                else:
+                    self._buffer.clear()
+                self._state.condition.notify_all()
+                return finished
+
+        return on_sent
+
+
 def _status(
     rpc_event: cygrpc.BaseEvent,
     state: _RPCState,
     serialized_response: Optional[bytes],
 ) -> None:
+    if serialized_response is None:
+        send_message_operation = None
+    else:
+        send_message_operation = _get_send_message_operation(
+            state, serialized_response
+        )
     with state.condition:
         if state.client is not _CANCELLED:
             code = _completion_code(state)
@@ -756,13 +937,8 @@ def _status(
             ]
             if state.initial_metadata_allowed:
                 operations.append(_get_initial_metadata_operation(state, None))
-            if serialized_response is not None:
-                operations.append(
-                    cygrpc.SendMessageOperation(
-                        serialized_response,
-                        _get_send_message_op_flags_from_state(state),
-                    )
-                )
+            if send_message_operation is not None:
+                operations.append(send_message_operation)
             rpc_event.call.start_server_batch(
                 operations,
                 _send_status_from_server(state, _SEND_STATUS_FROM_SERVER_TOKEN),
@@ -770,6 +946,8 @@ def _status(
             state.statused = True
             _reset_per_message_state(state)
             state.due.add(_SEND_STATUS_FROM_SERVER_TOKEN)
+            if state.phase_timer is not None:
+                state.phase_timer.mark("send")
 
 
 def _unary_response_in_pool(
@@ -781,6 +959,8 @@ def _unary_response_in_pool(
     response_serializer: Optional[SerializingFunction],
 ) -> None:
     cygrpc.install_context_from_request_call_event(rpc_event)
+    if state.phase_timer is not None:
+        state.phase_timer.add_since_mark("queue", "queue")
 
     try:
         argument = argument_thunk()
@@ -809,16 +989,30 @@ def _stream_response_in_pool(
     response_serializer: Optional[SerializingFunction],
 ) -> None:
     cygrpc.install_context_from_request_call_event(rpc_event)
+    if state.phase_timer is not None:
+        state.phase_timer.add_since_mark("queue", "queue")
+    lookahead = getattr(behavior, "experimental_response_lookahead", None)
+    pipeline = (
+        _ResponsePipeline(rpc_event, state, lookahead)
+        if _is_valid_response_lookahead(lookahead)
+        else None
+    )
 
     def send_response(response: Any) -> None:
         if response is None:
+            if pipeline is not None:
+                pipeline.flush()
             _status(rpc_event, state, None)
         else:
             serialized_response = _serialize_response(
                 rpc_event, state, response, response_serializer
             )
-            if serialized_response is not None:
+            if serialized_response is None:
+                return
+            if pipeline is None:
                 _send_response(rpc_event, state, serialized_response)
+            else:
+                pipeline.send(serialized_response)
 
     try:
         argument = argument_thunk()
@@ -876,26 +1070,194 @@ def _select_thread_pool_for_behavior(
     default_thread_pool: futures.ThreadPoolExecutor,
 ) -> futures.ThreadPoolExecutor:
     if hasattr(behavior, "experimental_thread_pool") and isinstance(
-        behavior.experimental_thread_pool, futures.ThreadPoolExecutor
+        behavior.experimental_thread_pool,
+        (
+            futures.ThreadPoolExecutor,
+            _server_executor.DeadlineAwareExecutor,
+            _server_executor.WeightedFairExecutor,
+        ),
     ):
         return behavior.experimental_thread_pool
     return default_thread_pool
 
 
+def _shed_rpc(
+    rpc_event: cygrpc.BaseEvent, state: _RPCState, expired: bool
+) -> None:
+    with state.condition:
+        if expired:
+            _abort(
+                state,
+                rpc_event.call,
+                cygrpc.StatusCode.deadline_exceeded,
+                b"Deadline Exceeded",
+            )
+        else:
+            _abort(
+                state,
+                rpc_event.call,
+                cygrpc.StatusCode.resource_exhausted,
+                b"Server queue is full!",
+            )
+
+
+def _submit_in_pool(
+    thread_pool: futures.ThreadPoolExecutor,
+    in_pool: Callable[..., None],
+    rpc_event: cygrpc.BaseEvent,
+    state: _RPCState,
+    *args: Any,
+) -> futures.Future:
+    if state.phase_timer is not None:
+        state.phase_timer.mark("queue")
+    if isinstance(thread_pool, _server_executor.DeadlineAwareExecutor):
+        deadline = rpc_event.call_details.deadline
+        return thread_pool.submit_with_deadline(
+            None if deadline >= _NO_DEADLINE_THRESHOLD else deadline,
+            functools.partial(_shed_rpc, rpc_event, state),
+            state.context.run,
+            in_pool,
+            rpc_event,
+            state,
+            *args,
+        )
+    if isinstance(thread_pool, _server_executor.WeightedFairExecutor):
+        return thread_pool.submit_rpc(
+            state.handler_call_details,
+            functools.partial(_shed_rpc, rpc_event, state),
+            state.context.run,
+            in_pool,
+            rpc_event,
+            state,
+            *args,
+        )
+    return thread_pool.submit(
+        state.context.run, in_pool, rpc_event, state, *args
+    )
+
+
+def _inline_budget(behavior: ArityAgnosticMethodHandler) -> Optional[float]:
+    budget = getattr(behavior, "experimental_inline_budget", None)
+    if not _is_valid_inline_budget(budget):
+        return None
+    try:
+        demoted_until = _INLINE_DEMOTIONS.get(behavior)
+    except TypeError:
+        return budget
+    if demoted_until is not None:
+        if time.monotonic() < demoted_until:
+            return None
+        del _INLINE_DEMOTIONS[behavior]
+    return budget
+
+
+def _demote_inline_behavior(
+    behavior: ArityAgnosticMethodHandler, budget: float, elapsed: float
+) -> None:
+    _LOGGER.warning(
+        "%s took %.6fs, over its inline budget of %.6fs; running it in the"
+        " thread pool for the next %.1fs.",
+        getattr(behavior, "__qualname__", behavior),
+        elapsed,
+        budget,
+        _INLINE_DEMOTION_PERIOD_S,
+    )
+    try:
+        _INLINE_DEMOTIONS[behavior] = (
+            time.monotonic() + _INLINE_DEMOTION_PERIOD_S
+        )
+    except TypeError:
+        pass
+
+
+def _received_unary_request(
+    rpc_event: cygrpc.BaseEvent, state: _RPCState
+) -> Any:
+    with state.condition:
+        request = state.request
+        state.request = None
+        if request is None and state.client is _CLOSED:
+            _abort_missing_unary_request(rpc_event, state)
+        return request
+
+
+def _receive_unary_request_and_respond_inline(
+    rpc_event: cygrpc.BaseEvent,
+    state: _RPCState,
+    method_handler: grpc.RpcMethodHandler,
+    budget: float,
+    rpc_future: futures.Future,
+) -> ServerCallbackTag:
+    receive_message = _receive_message(
+        state, rpc_event.call, method_handler.request_deserializer
+    )
+
+    def receive_unary_request_and_respond_inline(receive_message_event):
+        finished = receive_message(receive_message_event)
+        start_time = time.monotonic()
+        try:
+            state.context.run(
+                _unary_response_in_pool,
+                rpc_event,
+                state,
+                method_handler.unary_unary,
+                lambda: _received_unary_request(rpc_event, state),
+                method_handler.request_deserializer,
+                method_handler.response_serializer,
+            )
+        finally:
+            try:
+                elapsed = time.monotonic() - start_time
+                if elapsed > budget:
+                    _demote_inline_behavior(
+                        method_handler.unary_unary, budget, elapsed
+                    )
+            finally:
+                rpc_future.set_result(None)
+        return finished
+
+    return receive_unary_request_and_respond_inline
+
+
+def _handle_unary_unary_inline(
+    rpc_event: cygrpc.BaseEvent,
+    state: _RPCState,
+    method_handler: grpc.RpcMethodHandler,
+    budget: float,
+) -> futures.Future:
+    # The serving thread cannot wait for the request like a pool thread
+    # does, so the handler runs from the completion of its receipt instead.
+    rpc_future = futures.Future()
+    rpc_future.set_running_or_notify_cancel()
+    rpc_event.call.start_server_batch(
+        (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),),
+        _receive_unary_request_and_respond_inline(
+            rpc_event, state, method_handler, budget, rpc_future
+        ),
+    )
+    state.due.add(_RECEIVE_MESSAGE_TOKEN)
+    return rpc_future
+
+
 def _handle_unary_unary(
     rpc_event: cygrpc.BaseEvent,
     state: _RPCState,
     method_handler: grpc.RpcMethodHandler,
     default_thread_pool: futures.ThreadPoolExecutor,
 ) -> futures.Future:
+    budget = _inline_budget(method_handler.unary_unary)
+    if budget is not None:
+        return _handle_unary_unary_inline(
+            rpc_event, state, method_handler, budget
+        )
     unary_request = _unary_request(
         rpc_event, state, method_handler.request_deserializer
     )
     thread_pool = _select_thread_pool_for_behavior(
         method_handler.unary_unary, default_thread_pool
     )
-    return thread_pool.submit(
-        state.context.run,
+    return _submit_in_pool(
+        thread_pool,
         _unary_response_in_pool,
         rpc_event,
         state,
@@ -918,8 +1280,8 @@ def _handle_unary_stream(
     thread_pool = _select_thread_pool_for_behavior(
         method_handler.unary_stream, default_thread_pool
     )
-    return thread_pool.submit(
-        state.context.run,
+    return _submit_in_pool(
+        thread_pool,
         _stream_response_in_pool,
         rpc_event,
         state,
@@ -942,8 +1304,8 @@ def _handle_stream_unary(
     thread_pool = _select_thread_pool_for_behavior(
         method_handler.stream_unary, default_thread_pool
     )
-    return thread_pool.submit(
-        state.context.run,
+    return _submit_in_pool(
+        thread_pool,
         _unary_response_in_pool,
         rpc_event,
         state,
@@ -966,8 +1328,8 @@ def _handle_stream_stream(
     thread_pool = _select_thread_pool_for_behavior(
         method_handler.stream_stream, default_thread_pool
     )
-    return thread_pool.submit(
-        state.context.run,
+    return _submit_in_pool(
+        thread_pool,
         _stream_response_in_pool,
         rpc_event,
         state,
@@ -984,10 +1346,22 @@ def _find_method_handler(
     method_with_handler: _Method,
     interceptor_pipeline: Optional[_interceptor._ServicePipeline],
 ) -> Optional[grpc.RpcMethodHandler]:
+    phase_timer = state.phase_timer
+
     def query_handlers(
         handler_call_details: _HandlerCallDetails,
     ) -> Optional[grpc.RpcMethodHandler]:
-        return method_with_handler.handler(handler_call_details)
+        if phase_timer is None:
+            return method_with_handler.handler(handler_call_details)
+        start_ns = time.monotonic_ns()
+        # Time around the lookup is spent in interceptors.
+        phase_timer.add_since_mark("interceptors", "interceptors")
+        try:
+            return method_with_handler.handler(handler_call_details)
+        finally:
+            phase_timer.add("lookup", start_ns)
+            if interceptor_pipeline is not None:
+                phase_timer.mark("interceptors")
 
     method_name = method_with_handler.name()
     if not method_name:
@@ -997,11 +1371,20 @@ def _find_method_handler(
         method_name,
         rpc_event.invocation_metadata,
     )
+    state.handler_call_details = handler_call_details
 
     if interceptor_pipeline is not None:
-        return state.context.run(
-            interceptor_pipeline.execute, query_handlers, handler_call_details
-        )
+        if phase_timer is not None:
+            phase_timer.mark("interceptors")
+        try:
+            return state.context.run(
+                interceptor_pipeline.execute,
+                query_handlers,
+                handler_call_details,
+            )
+        finally:
+            if phase_timer is not None:
+                phase_timer.add_since_mark("interceptors", "interceptors")
     return state.context.run(query_handlers, handler_call_details)
 
 
@@ -1056,6 +1439,14 @@ def _handle_with_method_handler(
         )
 
 
+def _record_rpc_phases(state: _RPCState) -> None:
+    # The RPC ends once the status is sent.
+    state.phase_timer.add_since_mark("send", "send")
+    _observability.maybe_record_server_rpc_phases(
+        state.handler_call_details.method, state.phase_timer
+    )
+
+
 def _handle_call(
     rpc_event: cygrpc.BaseEvent,
     method_with_handler: _Method,
@@ -1078,6 +1469,19 @@ def _handle_call(
         return None, None
     if rpc_event.call_details.method or method_with_handler.name():
         rpc_state = _RPCState()
+        if concurrency_exceeded:
+            _reject_rpc(
+                rpc_event,
+                rpc_state,
+                cygrpc.StatusCode.resource_exhausted,
+                b"Concurrent RPC limit exceeded!",
+            )
+            return rpc_state, None
+        rpc_state.phase_timer = _observability.maybe_create_rpc_phase_timer()
+        if rpc_state.phase_timer is not None:
+            rpc_state.callbacks.append(
+                functools.partial(_record_rpc_phases, rpc_state)
+            )
         try:
             method_handler = _find_method_handler(
                 rpc_event,
@@ -1103,14 +1507,6 @@ def _handle_call(
                 b"Method not found!",
             )
             return rpc_state, None
-        if concurrency_exceeded:
-            _reject_rpc(
-                rpc_event,
-                rpc_state,
-                cygrpc.StatusCode.resource_exhausted,
-                b"Concurrent RPC limit exceeded!",
-            )
-            return rpc_state, None
         return (
             rpc_state,
             _handle_with_method_handler(
@@ -1139,6 +1535,9 @@ class _ServerState:
     termination_event: threading.Event
     shutdown_events: List[threading.Event]
     maximum_concurrent_rpcs: Optional[int]
+    concurrency_limiter: Optional[
+        _concurrency_limiter.AdaptiveConcurrencyLimiter
+    ]
     active_rpc_count: int
     rpc_states: Set[_RPCState]
     due: Set[str]
@@ -1152,7 +1551,7 @@ class _ServerState:
         generic_handlers: Sequence[grpc.GenericRpcHandler],
         interceptor_pipeline: Optional[_interceptor._ServicePipeline],
         thread_pool: futures.ThreadPoolExecutor,
-        maximum_concurrent_rpcs: Optional[int],
+        maximum_concurrent_rpcs: MaximumConcurrentRpcs,
     ):
         self.lock = threading.RLock()
         self.completion_queue = completion_queue
@@ -1163,7 +1562,15 @@ class _ServerState:
         self.stage = _ServerStage.STOPPED
         self.termination_event = threading.Event()
         self.shutdown_events = [self.termination_event]
-        self.maximum_concurrent_rpcs = maximum_concurrent_rpcs
+        if isinstance(
+            maximum_concurrent_rpcs,
+            _concurrency_limiter.AdaptiveConcurrencyLimiter,
+        ):
+            self.maximum_concurrent_rpcs = None
+            self.concurrency_limiter = maximum_concurrent_rpcs
+        else:
+            self.maximum_concurrent_rpcs = maximum_concurrent_rpcs
+            self.concurrency_limiter = None
         self.active_rpc_count = 0
         self.registered_method_handlers = {}
 
@@ -1239,6 +1646,40 @@ def _on_call_completed(state: _ServerState) -> None:
         state.active_rpc_count -= 1
 
 
+def _acquire_concurrency(
+    state: _ServerState,
+    event: cygrpc.BaseEvent,
+    registered_method_name: Optional[str],
+) -> Tuple[bool, Optional[str]]:
+    """Admits a call against the concurrency limits of the server.
+
+    Returns:
+      Whether the call exceeds the concurrency limits, and the method whose
+      adaptive limit the call holds, if any.
+    """
+    if state.concurrency_limiter is None:
+        concurrency_exceeded = (
+            state.maximum_concurrent_rpcs is not None
+            and state.active_rpc_count >= state.maximum_concurrent_rpcs
+        )
+        return concurrency_exceeded, None
+    if not event.success:
+        return False, None
+    method = registered_method_name or _common.decode(event.call_details.method)
+    if state.concurrency_limiter.try_acquire(method):
+        return False, method
+    return True, None
+
+
+def _release_concurrency(
+    state: _ServerState, method: str, start_time: float
+) -> Callable[[futures.Future], None]:
+    def release_concurrency(unused_future: futures.Future) -> None:
+        state.concurrency_limiter.release(method, time.monotonic() - start_time)
+
+    return release_concurrency
+
+
 # pylint: disable=too-many-branches
 def _process_event_and_continue(
     state: _ServerState, event: cygrpc.BaseEvent
@@ -1268,9 +1709,8 @@ def _process_event_and_continue(
             )
         with state.lock:
             state.due.remove(event.tag)
-            concurrency_exceeded = (
-                state.maximum_concurrent_rpcs is not None
-                and state.active_rpc_count >= state.maximum_concurrent_rpcs
+            concurrency_exceeded, limited_method = _acquire_concurrency(
+                state, event, registered_method_name
             )
             rpc_state, rpc_future = _handle_call(
                 event,
@@ -1286,6 +1726,14 @@ def _process_event_and_continue(
                 rpc_future.add_done_callback(
                     lambda _unused_future: _on_call_completed(state)
                 )
+                if limited_method is not None:
+                    rpc_future.add_done_callback(
+                        _release_concurrency(
+                            state, limited_method, time.monotonic()
+                        )
+                    )
+            elif limited_method is not None:
+                state.concurrency_limiter.release(limited_method, None)
             if state.stage is _ServerStage.STARTED:
                 if registered_method_name in state.registered_method_handlers:
                     _request_registered_call(state, registered_method_name)
@@ -1388,6 +1836,62 @@ def _validate_generic_rpc_handlers(
             raise AttributeError(error_msg)
 
 
+def _is_valid_response_lookahead(lookahead: Any) -> bool:
+    return (
+        isinstance(lookahead, int)
+        and not isinstance(lookahead, bool)
+        and lookahead > 0
+    )
+
+
+def _validate_response_lookahead(
+    method_handlers: Iterable[grpc.RpcMethodHandler],
+) -> None:
+    for method_handler in method_handlers:
+        if not method_handler.response_streaming:
+            continue
+        behavior = (
+            method_handler.stream_stream
+            if method_handler.request_streaming
+            else method_handler.unary_stream
+        )
+        lookahead = getattr(behavior, "experimental_response_lookahead", None)
+        if lookahead is not None and not _is_valid_response_lookahead(
+            lookahead
+        ):
+            raise ValueError(
+                "experimental_response_lookahead must be a positive integer,"
+                f" got {lookahead!r}"
+            )
+
+
+def _is_valid_inline_budget(budget: Any) -> bool:
+    return (
+        isinstance(budget, (int, float))
+        and not isinstance(budget, bool)
+        and budget > 0
+    )
+
+
+def _validate_inline_budget(
+    method_handlers: Iterable[grpc.RpcMethodHandler],
+) -> None:
+    for method_handler in method_handlers:
+        if (
+            method_handler.request_streaming
+            or method_handler.response_streaming
+        ):
+            continue
+        budget = getattr(
+            method_handler.unary_unary, "experimental_inline_budget", None
+        )
+        if budget is not None and not _is_valid_inline_budget(budget):
+            raise ValueError(
+                "experimental_inline_budget must be a positive number,"
+                f" got {budget!r}"
+            )
+
+
 def _augment_options(
     base_options: Sequence[ChannelArgumentType],
     compression: Optional[grpc.Compression],
@@ -1414,7 +1918,7 @@ class _Server(grpc.Server):
         generic_handlers: Sequence[grpc.GenericRpcHandler],
         interceptors: Sequence[grpc.ServerInterceptor],
         options: Sequence[ChannelArgumentType],
-        maximum_concurrent_rpcs: Optional[int],
+        maximum_concurrent_rpcs: MaximumConcurrentRpcs,
         compression: Optional[grpc.Compression],
         xds: bool,
     ):
@@ -1435,6 +1939,14 @@ class _Server(grpc.Server):
         self, generic_rpc_handlers: Iterable[grpc.GenericRpcHandler]
     ) -> None:
         _validate_generic_rpc_handlers(generic_rpc_handlers)
+        for generic_rpc_handler in generic_rpc_handlers:
+            if isinstance(
+                generic_rpc_handler, _utilities.DictionaryGenericHandler
+            ):
+                _validate_response_lookahead(
+                    generic_rpc_handler.method_handlers()
+                )
+                _validate_inline_budget(generic_rpc_handler.method_handlers())
         _add_generic_handlers(self._state, generic_rpc_handlers)
 
     def add_registered_method_handlers(
@@ -1452,6 +1964,8 @@ class _Server(grpc.Server):
                 return
 
         # TODO(xuanwn): We should validate method_handlers first.
+        _validate_response_lookahead(method_handlers.values())
+        _validate_inline_budget(method_handlers.values())
         method_to_handlers = {
             _common.fully_qualified_method(service_name, method): method_handler
             for method, method_handler in method_handlers.items()
@@ -1503,7 +2017,7 @@ def create_server(
     generic_rpc_handlers: Sequence[grpc.GenericRpcHandler],
     interceptors: Sequence[grpc.ServerInterceptor],
     options: Sequence[ChannelArgumentType],
-    maximum_concurrent_rpcs: Optional[int],
+    maximum_concurrent_rpcs: MaximumConcurrentRpcs,
     compression: Optional[grpc.Compression],
     xds: bool,
 ) -> _Server:
@@ -0,0 +1,724 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Executors that schedule the RPCs of a sync server."""
+
+import collections
+from concurrent import futures
+import heapq
+import itertools
+import math
+import os
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+ShedCallback = Callable[[bool], Any]
+
+
+class DeadlineAwareExecutorStats(
+    collections.namedtuple(
+        "DeadlineAwareExecutorStats",
+        (
+            "queue_depth",
+            "dequeued_count",
+            "expired_count",
+            "rejected_count",
+            "total_queue_wait",
+            "max_queue_wait",
+        ),
+    )
+):
+    """A snapshot of the queue of a DeadlineAwareExecutor.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    Attributes:
+      queue_depth: The number of work items waiting for a worker.
+      dequeued_count: The number of work items taken from the queue, whether
+        they were run or shed.
+      expired_count: The number of RPCs shed because their deadline passed
+        while they were queued.
+      rejected_count: The number of RPCs shed because the queue was full.
+      total_queue_wait: The sum of the seconds every dequeued work item
+        spent in the queue.
+      max_queue_wait: The longest time in seconds a dequeued work item spent
+        in the queue.
+    """
+
+
+def _run(future: futures.Future, fn: Callable[..., Any], *args, **kwargs):
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        result = fn(*args, **kwargs)
+    except BaseException as exception:  # pylint: disable=broad-except
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+
+
+class _WorkItem:
+    __slots__ = (
+        "priority",
+        "sequence",
+        "expiry",
+        "enqueued",
+        "future",
+        "on_shed",
+        "fn",
+        "args",
+        "kwargs",
+    )
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self, priority, sequence, expiry, future, on_shed, fn, args, kwargs
+    ):
+        self.priority = priority
+        self.sequence = sequence
+        self.expiry = expiry
+        self.enqueued = time.monotonic()
+        self.future = future
+        self.on_shed = on_shed
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def __lt__(self, other: "_WorkItem") -> bool:
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+    def expired(self, now: float) -> bool:
+        return (
+            self.on_shed is not None
+            and self.expiry is not None
+            and self.expiry <= now
+        )
+
+    def run(self, expired: bool) -> None:
+        if expired:
+            _run(self.future, self.on_shed, True)
+        else:
+            _run(self.future, self.fn, *self.args, **self.kwargs)
+
+
+class _WorkerPoolExecutor(futures.Executor):
+    """The worker threads and shutdown of the executors of this module.
+
+    Subclasses queue work under _condition and hand it to the workers
+    through _take.
+    """
+
+    _max_workers: int
+    _thread_name_prefix: str
+    _condition: threading.Condition
+    _threads: Set[threading.Thread]
+    _idle_workers: int
+    _shutdown: bool
+
+    def __init__(self, max_workers: Optional[int], thread_name_prefix: str):
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix or "%s-%d" % (
+            type(self).__name__,
+            id(self),
+        )
+        self._condition = threading.Condition()
+        self._threads = set()
+        self._idle_workers = 0
+        self._shutdown = False
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                for work_item in self._clear():
+                    work_item.future.cancel()
+            self._condition.notify_all()
+            threads = tuple(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def _queue_depth(self) -> int:
+        raise NotImplementedError()
+
+    def _clear(self) -> Iterable[_WorkItem]:
+        """Empties the queue and returns the work items it held."""
+        raise NotImplementedError()
+
+    def _take(self) -> Optional[Tuple[_WorkItem, bool, Any]]:
+        """Dequeues the next work item a worker may run.
+
+        Returns:
+          None if no queued work item may run now, and otherwise the work
+          item, whether it expired, and the value passed to _finished once
+          the work item ran.
+        """
+        raise NotImplementedError()
+
+    def _finished(self, token: Any) -> None:
+        """Called without _condition held after a work item ran."""
+
+    def _check_running(self) -> None:
+        if self._shutdown:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+
+    def _enqueued(self) -> None:
+        if (
+            self._queue_depth() > self._idle_workers
+            and len(self._threads) < self._max_workers
+        ):
+            self._start_worker()
+        self._condition.notify()
+
+    def _start_worker(self) -> None:
+        thread = threading.Thread(
+            name="%s_%d" % (self._thread_name_prefix, len(self._threads)),
+            target=self._work,
+            daemon=True,
+        )
+        self._threads.add(thread)
+        thread.start()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                taken = self._take()
+                while taken is None:
+                    if self._shutdown and not self._queue_depth():
+                        return
+                    self._idle_workers += 1
+                    self._condition.wait()
+                    self._idle_workers -= 1
+                    taken = self._take()
+            work_item, expired, token = taken
+            del taken
+            work_item.run(expired)
+            del work_item
+            self._finished(token)
+
+
+class DeadlineAwareExecutor(_WorkerPoolExecutor):
+    """A thread pool for grpc.server that knows the deadlines of RPCs.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    Passed as the thread pool of grpc.server, or as the
+    experimental_thread_pool of a method handler, it queues RPCs by deadline
+    instead of by arrival, so the RPC closest to its deadline runs first. An
+    RPC without a deadline is queued as if its deadline were
+    no_deadline_slack seconds after its arrival, so a steady stream of RPCs
+    with deadlines cannot starve it. An RPC whose deadline passes while it is
+    queued is failed with DEADLINE_EXCEEDED without running its handler,
+    either when a worker takes it or when it holds a place needed by a new
+    RPC, and an RPC arriving while max_queue_size RPCs are queued is failed
+    with RESOURCE_EXHAUSTED.
+
+    Work submitted with submit rather than by a server is queued like an RPC
+    without a deadline and is never shed.
+    """
+
+    _max_queue_size: Optional[int]
+    _no_deadline_slack: Optional[float]
+    _queue: List[_WorkItem]
+    _sequence: Iterator[int]
+    _dequeued_count: int
+    _expired_count: int
+    _rejected_count: int
+    _total_queue_wait: float
+    _max_queue_wait: float
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        thread_name_prefix: str = "",
+        no_deadline_slack: Optional[float] = 60.0,
+    ):
+        """Constructor.
+
+        Args:
+          max_workers: The maximum number of threads running work, by default
+            the same as for a futures.ThreadPoolExecutor.
+          max_queue_size: The maximum number of RPCs waiting for a thread, or
+            None for an unbounded queue.
+          thread_name_prefix: The prefix of the names of the worker threads.
+          no_deadline_slack: The seconds after its arrival at which work
+            without a deadline is ordered, or None to run it only once no
+            work with a deadline is queued, at the risk of starving it.
+        """
+        super().__init__(max_workers, thread_name_prefix)
+        if max_queue_size is not None and max_queue_size <= 0:
+            raise ValueError("max_queue_size must be greater than 0")
+        if no_deadline_slack is not None and no_deadline_slack < 0:
+            raise ValueError("no_deadline_slack must not be negative")
+        self._max_queue_size = max_queue_size
+        self._no_deadline_slack = no_deadline_slack
+        self._queue = []
+        self._sequence = itertools.count()
+        self._dequeued_count = 0
+        self._expired_count = 0
+        self._rejected_count = 0
+        self._total_queue_wait = 0.0
+        self._max_queue_wait = 0.0
+
+    def submit(self, fn, /, *args, **kwargs) -> futures.Future:
+        return self.submit_with_deadline(None, None, fn, *args, **kwargs)
+
+    def submit_with_deadline(
+        self,
+        deadline: Optional[float],
+        on_shed: Optional[ShedCallback],
+        fn: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> futures.Future:
+        """Queues fn to run before its deadline.
+
+        Args:
+          deadline: The time.time() after which fn should no longer run, or
+            None if it has no deadline.
+          on_shed: Called instead of fn with True if the deadline passes
+            while fn is queued, or with False from this method if the queue is
+            full. If None, fn is never shed.
+          fn: The callable to run.
+          *args: The positional arguments of fn.
+          **kwargs: The keyword arguments of fn.
+
+        Returns:
+          A futures.Future of the value returned by fn or on_shed.
+        """
+        future = futures.Future()
+        now = time.time()
+        if deadline is not None:
+            priority = deadline
+        elif self._no_deadline_slack is not None:
+            priority = now + self._no_deadline_slack
+        else:
+            priority = math.inf
+        expired = ()
+        with self._condition:
+            self._check_running()
+            if self._full():
+                expired = self._remove_expired(now)
+            rejected = on_shed is not None and self._full()
+            if rejected:
+                self._rejected_count += 1
+            else:
+                heapq.heappush(
+                    self._queue,
+                    _WorkItem(
+                        priority,
+                        next(self._sequence),
+                        deadline,
+                        future,
+                        on_shed,
+                        fn,
+                        args,
+                        kwargs,
+                    ),
+                )
+                self._enqueued()
+        for work_item in expired:
+            work_item.run(True)
+        if rejected:
+            _run(future, on_shed, False)
+        return future
+
+    def stats(self) -> DeadlineAwareExecutorStats:
+        """Returns a snapshot of the queue of this executor."""
+        with self._condition:
+            return DeadlineAwareExecutorStats(
+                len(self._queue),
+                self._dequeued_count,
+                self._expired_count,
+                self._rejected_count,
+                self._total_queue_wait,
+                self._max_queue_wait,
+            )
+
+    def _queue_depth(self) -> int:
+        return len(self._queue)
+
+    def _clear(self) -> Iterable[_WorkItem]:
+        queue = self._queue
+        self._queue = []
+        return queue
+
+    def _take(self) -> Optional[Tuple[_WorkItem, bool, Any]]:
+        if not self._queue:
+            return None
+        work_item = heapq.heappop(self._queue)
+        self._dequeued(work_item)
+        expired = work_item.expired(time.time())
+        if expired:
+            self._expired_count += 1
+        return work_item, expired, None
+
+    def _full(self) -> bool:
+        return (
+            self._max_queue_size is not None
+            and len(self._queue) >= self._max_queue_size
+        )
+
+    def _dequeued(self, work_item: _WorkItem) -> None:
+        queue_wait = time.monotonic() - work_item.enqueued
+        self._dequeued_count += 1
+        self._total_queue_wait += queue_wait
+        self._max_queue_wait = max(self._max_queue_wait, queue_wait)
+
+    def _remove_expired(self, now: float) -> List[_WorkItem]:
+        expired = [
+            work_item for work_item in self._queue if work_item.expired(now)
+        ]
+        if expired:
+            self._queue = [
+                work_item
+                for work_item in self._queue
+                if not work_item.expired(now)
+            ]
+            heapq.heapify(self._queue)
+            for work_item in expired:
+                self._dequeued(work_item)
+            self._expired_count += len(expired)
+        return expired
+
+
+class TrafficClass(
+    collections.namedtuple(
+        "TrafficClass",
+        ("weight", "max_concurrency", "max_queue_size"),
+        defaults=(1, None, None),
+    )
+):
+    """A class of RPCs scheduled together by a WeightedFairExecutor.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    Attributes:
+      weight: The share of the worker threads the class gets while other
+        classes have RPCs queued, relative to the weights of those classes.
+      max_concurrency: The maximum number of RPCs of the class running at
+        once, or None for no limit other than the number of workers.
+      max_queue_size: The maximum number of RPCs of the class waiting for a
+        thread, or None for an unbounded queue.
+    """
+
+
+class WeightedFairExecutorStats(
+    collections.namedtuple(
+        "WeightedFairExecutorStats",
+        (
+            "queue_depth",
+            "running",
+            "dequeued_count",
+            "rejected_count",
+        ),
+    )
+):
+    """A snapshot of a traffic class of a WeightedFairExecutor.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    Attributes:
+      queue_depth: The number of work items of the class waiting for a
+        worker.
+      running: The number of work items of the class currently running.
+      dequeued_count: The number of work items of the class taken from its
+        queue.
+      rejected_count: The number of RPCs of the class shed because its queue
+        was full.
+    """
+
+
+class _ClassQueue:
+    __slots__ = (
+        "traffic_class",
+        "queue",
+        "running",
+        "virtual_start",
+        "dequeued_count",
+        "rejected_count",
+    )
+
+    def __init__(self, traffic_class: TrafficClass):
+        self.traffic_class = traffic_class
+        self.queue = collections.deque()
+        self.running = 0
+        self.virtual_start = 0.0
+        self.dequeued_count = 0
+        self.rejected_count = 0
+
+    def runnable(self) -> bool:
+        return bool(self.queue) and (
+            self.traffic_class.max_concurrency is None
+            or self.running < self.traffic_class.max_concurrency
+        )
+
+
+class WeightedFairExecutor(_WorkerPoolExecutor):
+    """A thread pool for grpc.server that isolates classes of RPCs.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    Passed as the thread pool of grpc.server, or as the
+    experimental_thread_pool of a method handler, it sorts every RPC into a
+    traffic class and queues every class separately. Free workers take the
+    next RPC from the class that received the least service relative to its
+    weight, so a busy class cannot starve the others, and a class never
+    holds more than its max_concurrency workers, so slow RPCs of one class
+    cannot occupy the threads needed by another.
+
+    The class of an RPC is, in order of precedence, the value of its
+    metadata_key metadata if that names a traffic class, the class of its
+    fully-qualified method or of its service in method_classes, and
+    default_class otherwise. Like all metadata keys, metadata_key is matched
+    in lowercase. Clients can pick any class through metadata, so
+    metadata_key is meant for servers trusting their clients.
+
+    Work submitted with submit rather than by a server runs in default_class
+    and is never shed.
+    """
+
+    _method_classes: Mapping[str, str]
+    _metadata_key: Optional[str]
+    _default_class: str
+    _classes: Dict[str, _ClassQueue]
+    _queued: int
+    _virtual_time: float
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        traffic_classes: Mapping[str, TrafficClass],
+        max_workers: Optional[int] = None,
+        method_classes: Optional[Mapping[str, str]] = None,
+        metadata_key: Optional[str] = None,
+        default_class: str = "default",
+        thread_name_prefix: str = "",
+    ):
+        """Constructor.
+
+        Args:
+          traffic_classes: The traffic classes by name.
+          max_workers: The maximum number of threads running work, by default
+            the same as for a futures.ThreadPoolExecutor.
+          method_classes: The names of the traffic classes of methods, keyed
+            by fully-qualified method name, such as "/pkg.Service/Method", or
+            by service name, such as "pkg.Service".
+          metadata_key: The metadata key whose value names the traffic class
+            of an RPC, or None to ignore metadata.
+          default_class: The name of the traffic class of the remaining RPCs.
+          thread_name_prefix: The prefix of the names of the worker threads.
+        """
+        super().__init__(max_workers, thread_name_prefix)
+        if default_class not in traffic_classes:
+            raise ValueError(
+                "default_class {!r} is not a traffic class".format(
+                    default_class
+                )
+            )
+        for name, traffic_class in traffic_classes.items():
+            if traffic_class.weight <= 0:
+                raise ValueError(
+                    "Weight of traffic class {!r} must be greater than"
+                    " 0".format(name)
+                )
+            if (
+                traffic_class.max_concurrency is not None
+                and traffic_class.max_concurrency <= 0
+            ):
+                raise ValueError(
+                    "max_concurrency of traffic class {!r} must be greater"
+                    " than 0".format(name)
+                )
+            if (
+                traffic_class.max_queue_size is not None
+                and traffic_class.max_queue_size <= 0
+            ):
+                raise ValueError(
+                    "max_queue_size of traffic class {!r} must be greater"
+                    " than 0".format(name)
+                )
+        method_classes = dict(method_classes or {})
+        for method, name in method_classes.items():
+            if name not in traffic_classes:
+                raise ValueError(
+                    "Method {!r} has unknown traffic class {!r}".format(
+                        method, name
+                    )
+                )
+        self._method_classes = method_classes
+        self._metadata_key = (
+            None if metadata_key is None else metadata_key.lower()
+        )
+        self._default_class = default_class
+        self._classes = {
+            name: _ClassQueue(traffic_class)
+            for name, traffic_class in traffic_classes.items()
+        }
+        self._queued = 0
+        self._virtual_time = 0.0
+
+    def submit(self, fn, /, *args, **kwargs) -> futures.Future:
+        return self._submit(self._default_class, None, fn, args, kwargs)
+
+    def submit_rpc(
+        self,
+        handler_call_details: Any,
+        on_shed: Optional[ShedCallback],
+        fn: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> futures.Future:
+        """Queues fn in the traffic class of an RPC.
+
+        Args:
+          handler_call_details: The grpc.HandlerCallDetails of the RPC.
+          on_shed: Called with False from this method instead of fn if the
+            queue of the traffic class is full. If None, fn is never shed.
+          fn: The callable to run.
+          *args: The positional arguments of fn.
+          **kwargs: The keyword arguments of fn.
+
+        Returns:
+          A futures.Future of the value returned by fn or on_shed.
+        """
+        return self._submit(
+            self.classify(handler_call_details), on_shed, fn, args, kwargs
+        )
+
+    def classify(self, handler_call_details: Any) -> str:
+        """Returns the name of the traffic class of an RPC.
+
+        Args:
+          handler_call_details: The grpc.HandlerCallDetails of the RPC.
+        """
+        if self._metadata_key is not None:
+            for key, value in handler_call_details.invocation_metadata or ():
+                if key == self._metadata_key and value in self._classes:
+                    return value
+        method = handler_call_details.method
+        name = self._method_classes.get(method)
+        if name is None:
+            service = method.lstrip("/").partition("/")[0]
+            name = self._method_classes.get(service, self._default_class)
+        return name
+
+    def stats(self) -> Dict[str, WeightedFairExecutorStats]:
+        """Returns a snapshot of every traffic class of this executor."""
+        with self._condition:
+            return {
+                name: WeightedFairExecutorStats(
+                    len(class_queue.queue),
+                    class_queue.running,
+                    class_queue.dequeued_count,
+                    class_queue.rejected_count,
+                )
+                for name, class_queue in self._classes.items()
+            }
+
+    def _queue_depth(self) -> int:
+        return self._queued
+
+    def _clear(self) -> Iterable[_WorkItem]:
+        work_items = []
+        for class_queue in self._classes.values():
+            work_items.extend(class_queue.queue)
+            class_queue.queue.clear()
+        self._queued = 0
+        return work_items
+
+    def _submit(
+        self,
+        name: str,
+        on_shed: Optional[ShedCallback],
+        fn: Callable[..., Any],
+        args: Any,
+        kwargs: Any,
+    ) -> futures.Future:
+        future = futures.Future()
+        with self._condition:
+            self._check_running()
+            class_queue = self._classes[name]
+            max_queue_size = class_queue.traffic_class.max_queue_size
+            rejected = (
+                on_shed is not None
+                and max_queue_size is not None
+                and len(class_queue.queue) >= max_queue_size
+            )
+            if rejected:
+                class_queue.rejected_count += 1
+            else:
+                if not class_queue.queue:
+                    # A class coming back from idle competes from now on
+                    # instead of spending service it did not use.
+                    class_queue.virtual_start = max(
+                        class_queue.virtual_start, self._virtual_time
+                    )
+                class_queue.queue.append(
+                    _WorkItem(
+                        None, None, None, future, on_shed, fn, args, kwargs
+                    )
+                )
+                self._queued += 1
+                self._enqueued()
+        if rejected:
+            _run(future, on_shed, False)
+        return future
+
+    def _next_class(self) -> Optional[_ClassQueue]:
+        next_class = None
+        for class_queue in self._classes.values():
+            if class_queue.runnable() and (
+                next_class is None
+                or class_queue.virtual_start < next_class.virtual_start
+            ):
+                next_class = class_queue
+        return next_class
+
+    def _take(self) -> Optional[Tuple[_WorkItem, bool, Any]]:
+        class_queue = self._next_class()
+        if class_queue is None:
+            return None
+        work_item = class_queue.queue.popleft()
+        self._queued -= 1
+        self._virtual_time = class_queue.virtual_start
+        class_queue.virtual_start += 1 / class_queue.traffic_class.weight
+        class_queue.running += 1
+        class_queue.dequeued_count += 1
+        return work_item, False, class_queue
+
+    def _finished(self, token: Any) -> None:
+        class_queue = token
+        with self._condition:
+            class_queue.running -= 1
+            if class_queue.queue:
+                # The class may have been waiting for this worker to drop
+                # below its max_concurrency.
+                self._condition.notify()
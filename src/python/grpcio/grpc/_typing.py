@@ -58,6 +58,20 @@ IntegratedCallFactory = Callable[
     ],
     cygrpc.IntegratedCall,
 ]
+IntegratedCallBatchFactory = Callable[
+    [
+        int,
+        bytes,
+        Optional[str],
+        Optional[float],
+        Optional[MetadataType],
+        Optional[cygrpc.CallCredentials],
+        Sequence[Tuple[Sequence[Sequence[cygrpc.Operation]], UserTag]],
+        Any,
+        Optional[int],
+    ],
+    Sequence[cygrpc.IntegratedCall],
+]
 ServerTagCallbackType = Tuple[
     Optional["_RPCState"], Sequence[NullaryCallbackType]
 ]
@@ -17,7 +17,7 @@ import collections
 import logging
 import threading
 import time
-from typing import Callable, Dict, Optional, Sequence
+from typing import Callable, Dict, Iterable, Optional, Sequence
 
 import grpc
 from grpc import _common
@@ -65,6 +65,9 @@ class DictionaryGenericHandler(grpc.ServiceRpcHandler):
     def service_name(self) -> str:
         return self._name
 
+    def method_handlers(self) -> Iterable[grpc.RpcMethodHandler]:
+        return self._method_handlers.values()
+
     def service(
         self, handler_call_details: grpc.HandlerCallDetails
     ) -> Optional[grpc.RpcMethodHandler]:
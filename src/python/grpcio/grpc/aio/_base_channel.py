@@ -15,7 +15,7 @@
 
 import abc
 from types import TracebackType
-from typing import Generic, Optional
+from typing import Generic, Iterable, List, Optional
 
 import grpc
 from typing_extensions import Self
@@ -66,6 +66,51 @@ class UnaryUnaryMultiCallable(Generic[RequestType, ResponseType], abc.ABC):
             metadata, status code, and details.
         """
 
+    def batch(
+        self,
+        requests: Iterable[RequestType],
+        *,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> List[_base_call.UnaryUnaryCall[RequestType, ResponseType]]:
+        """Asynchronously invokes the underlying RPC once per request.
+
+        The RPCs share a single deadline, metadata and options. The returned
+        calls may be awaited with asyncio.gather for responses in the order of
+        requests, or with asyncio.as_completed as they terminate.
+
+        This is an EXPERIMENTAL API.
+
+        Args:
+          requests: An iterable of request values, one per RPC.
+          timeout: An optional duration of time in seconds to allow for
+            all of the RPCs, measured from the start of the batch.
+          metadata: Optional :term:`metadata` to be transmitted to the
+            service-side of every RPC.
+          credentials: An optional CallCredentials for the RPCs. Only valid for
+            secure Channel.
+          wait_for_ready: An optional flag to enable :term:`wait_for_ready` mechanism.
+          compression: An element of grpc.Compression, e.g.
+            grpc.Compression.Gzip.
+
+        Returns:
+          A list of UnaryUnaryCall objects, in the order of requests.
+        """
+        return [
+            self(
+                request,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+            for request in requests
+        ]
+
 
 class UnaryStreamMultiCallable(Generic[RequestType, ResponseType], abc.ABC):
     """Enables asynchronous invocation of a server-streaming RPC."""
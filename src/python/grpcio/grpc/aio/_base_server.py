@@ -280,12 +280,27 @@ class ServicerContext(Generic[RequestType, ResponseType], abc.ABC):
         """
 
     @abc.abstractmethod
-    def set_compression(self, compression: grpc.Compression) -> None:
+    def set_compression(
+        self,
+        compression: grpc.Compression,
+        *,
+        min_message_size: Optional[int] = None,
+        offload_message_size: Optional[int] = None,
+    ) -> None:
         """Set the compression algorithm to be used for the entire call.
 
         Args:
           compression: An element of grpc.compression, e.g.
             grpc.compression.Gzip.
+          min_message_size: EXPERIMENTAL: An optional size in bytes below
+            which response messages are sent uncompressed.
+          offload_message_size: EXPERIMENTAL: An optional size in bytes from
+            which response messages are compressed on a worker thread, the
+            migration thread pool of the server if it has one, before they
+            are handed to the gRPC runtime, rather than on the event loop.
+            Not supported by the promise-based server call of the gRPC
+            runtime, which compresses the precompressed messages again, so
+            clients would receive them still compressed.
         """
 
     @abc.abstractmethod
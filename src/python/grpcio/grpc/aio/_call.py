@@ -18,10 +18,12 @@ from collections.abc import AsyncIterable
 import enum
 from functools import partial
 import logging
+import time
 import traceback
 from typing import (
     Any,
     AsyncIterator,
+    Dict,
     Generator,
     Generic,
     Optional,
@@ -214,14 +216,19 @@ class Call(Generic[RequestType, ResponseType]):
     ) -> None:
         self._loop = loop
         self._cython_call = cython_call
-        self._metadata = tuple(metadata)
+        if isinstance(metadata, cygrpc.EncodedMetadata):
+            self._metadata = metadata
+        else:
+            self._metadata = tuple(metadata)
         self._request_serializer = request_serializer
         self._response_deserializer = response_deserializer
 
     def __del__(self) -> None:
         # The '_cython_call' object might be destructed before Call object
-        if hasattr(self, "_cython_call") and not self._cython_call.done():
-            self._cancel(_GC_CANCELLATION_DETAILS)
+        if hasattr(self, "_cython_call"):
+            if not self._cython_call.done():
+                self._cancel(_GC_CANCELLATION_DETAILS)
+            self._responses_abandoned()
 
     def cancelled(self) -> bool:
         return self._cython_call.cancelled()
@@ -230,6 +237,7 @@ class Call(Generic[RequestType, ResponseType]):
         """Forwards the application cancellation reasoning."""
         if not self._cython_call.done():
             self._cython_call.cancel(details)
+            self._responses_abandoned()
             return True
         return False
 
@@ -268,6 +276,55 @@ class Call(Generic[RequestType, ResponseType]):
     async def debug_error_string(self) -> str:
         return (await self._cython_call.status()).debug_error_string()
 
+    def phase_timings(self) -> Optional[Dict[str, float]]:
+        """Returns the time the RPC spent in each of its phases so far.
+
+        THIS IS AN EXPERIMENTAL API.
+
+        Returns:
+          The latency of each phase in milliseconds, keyed by the phase names
+          of grpc._observability.ObservabilityPlugin.record_client_rpc_phases,
+          or None if the RPC was started without phase timing enabled.
+        """
+        phase_timer = self._cython_call._phase_timer
+        if phase_timer is None:
+            return None
+        return phase_timer.durations_ms()
+
+    def _serialize_request(self, request: RequestType) -> Optional[bytes]:
+        phase_timer = self._cython_call._phase_timer
+        if phase_timer is None:
+            return _common.serialize(request, self._request_serializer)
+        start_ns = time.monotonic_ns()
+        serialized_request = _common.serialize(
+            request, self._request_serializer
+        )
+        phase_timer.add("serialization", start_ns)
+        return serialized_request
+
+    def _deserialize_response(self, serialized_response: bytes) -> Any:
+        phase_timer = self._cython_call._phase_timer
+        if phase_timer is None:
+            return _common.deserialize(
+                serialized_response, self._response_deserializer
+            )
+        start_ns = time.monotonic_ns()
+        response = _common.deserialize(
+            serialized_response, self._response_deserializer
+        )
+        phase_timer.add("deserialization", start_ns)
+        return response
+
+    def _response_delivered(self) -> None:
+        phase_timer = self._cython_call._phase_timer
+        if phase_timer is not None:
+            phase_timer.response_delivered()
+
+    def _responses_abandoned(self) -> None:
+        phase_timer = self._cython_call._phase_timer
+        if phase_timer is not None:
+            phase_timer.responses_abandoned()
+
     async def _raise_for_status(self) -> None:
         if self._cython_call.is_locally_cancelled():
             raise asyncio.CancelledError()
@@ -295,16 +352,18 @@ class _APIStyle(enum.IntEnum):
 
 
 class _UnaryResponseMixin(Call[RequestType, ResponseType]):
-    _call_response: asyncio.Task[Union[ResponseType, EOFType]]
+    _call_response: Optional[asyncio.Future[Union[ResponseType, EOFType]]]
 
     def _init_unary_response_mixin(
-        self, response_task: asyncio.Task[Union[ResponseType, EOFType]]
+        self,
+        response_task: Optional[asyncio.Future[Union[ResponseType, EOFType]]],
     ):
         self._call_response = response_task
 
     def cancel(self) -> bool:
         if super().cancel():
-            self._call_response.cancel()
+            if self._call_response is not None:
+                self._call_response.cancel()
             return True
         return False
 
@@ -321,11 +380,17 @@ class _UnaryResponseMixin(Call[RequestType, ResponseType]):
                 self.cancel()
             raise
 
+        return self._unwrap_response(response)
+
+    def _unwrap_response(
+        self, response: Union[ResponseType, EOFType]
+    ) -> ResponseType:
         # NOTE(lidiz) If we raise RpcError in the task, and users doesn't
         # 'await' on it. AsyncIO will log 'Task exception was never retrieved'.
         # Instead, if we move the exception raising here, the spam stops.
         # Unfortunately, there can only be one 'yield from' in '__await__'. So,
         # we need to access the private instance variable.
+        self._response_delivered()
         if response is cygrpc.EOF:
             if self._cython_call.is_locally_cancelled():
                 raise asyncio.CancelledError()
@@ -389,7 +454,9 @@ class _StreamResponseMixin(Call[RequestType, ResponseType]):
 
         if raw_response is cygrpc.EOF:
             return cygrpc.EOF
-        return _common.deserialize(raw_response, self._response_deserializer)
+        response = self._deserialize_response(raw_response)
+        self._response_delivered()
+        return response
 
     async def read(self) -> Union[ResponseType, EOFType]:
         if self.done():
@@ -493,9 +560,7 @@ class _StreamRequestMixin(Call[RequestType, ResponseType]):
             if self.done():
                 await self._raise_for_status()
 
-        serialized_request = _common.serialize(
-            request, self._request_serializer
-        )
+        serialized_request = self._serialize_request(request)
         try:
             await self._cython_call.send_serialized_message(serialized_request)
         except cygrpc.InternalError as err:
@@ -548,7 +613,10 @@ class UnaryUnaryCall(
     """
 
     _request: RequestType
-    _invocation_task: asyncio.Task[Union[ResponseType, EOFType]]
+    _invoking_inline: bool
+    _inline_outcome: Optional[
+        Tuple[Union[ResponseType, EOFType, None], Optional[BaseException]]
+    ]
 
     # pylint: disable=too-many-arguments
     def __init__(
@@ -580,13 +648,76 @@ class UnaryUnaryCall(
         )
         self._request = request
         self._context = cygrpc.build_census_context()
-        self._invocation_task = loop.create_task(self._invoke())
-        self._init_unary_response_mixin(self._invocation_task)
+        self._invoking_inline = False
+        self._inline_outcome = None
+        self._init_unary_response_mixin(None)
+        # Most applications await the call right away, in which case the RPC
+        # runs inline in the awaiting Task. Otherwise it is started on the
+        # next loop iteration, as if it had a Task of its own.
+        loop.call_soon(self._start_invocation)
+
+    def _start_invocation(self) -> None:
+        if not self._invoking_inline:
+            self._response_future()
+
+    def _response_future(self) -> asyncio.Future[Union[ResponseType, EOFType]]:
+        """Returns the future outcome of the RPC, shared by all its waiters.
+
+        Unless the RPC is already running inline, a Task is created to run it.
+        """
+        if self._call_response is None:
+            if self._invoking_inline:
+                self._init_unary_response_mixin(self._loop.create_future())
+                if self._inline_outcome is not None:
+                    self._settle_response(*self._inline_outcome)
+            else:
+                self._init_unary_response_mixin(
+                    self._loop.create_task(self._invoke())
+                )
+        return self._call_response
+
+    def _settle_response(
+        self,
+        response: Union[ResponseType, EOFType, None],
+        exception: Optional[BaseException],
+    ) -> None:
+        """Hands the outcome of an inline RPC to the other waiters, if any."""
+        self._inline_outcome = (response, exception)
+        future = self._call_response
+        if future is None or future.done():
+            return
+        if exception is None:
+            future.set_result(response)
+        elif isinstance(exception, Exception):
+            future.set_exception(exception)
+        else:
+            future.cancel()
+
+    def cancel(self) -> bool:
+        # Cancelling an RPC that has yet to start still goes through its Task,
+        # so that it is never sent.
+        if not self._invoking_inline:
+            self._response_future()
+        return super().cancel()
+
+    def __await__(self) -> Generator[Any, None, ResponseType]:
+        """Wait till the ongoing RPC request finishes."""
+        if self._invoking_inline or self._call_response is not None:
+            self._response_future()
+            return (yield from super().__await__())
+
+        # The first waiter runs the RPC itself instead of scheduling a Task.
+        self._invoking_inline = True
+        try:
+            response = yield from self._invoke().__await__()
+        except BaseException as exception:
+            self._settle_response(None, exception)
+            raise
+        self._settle_response(response, None)
+        return self._unwrap_response(response)
 
     async def _invoke(self) -> Union[ResponseType, EOFType]:
-        serialized_request = _common.serialize(
-            self._request, self._request_serializer
-        )
+        serialized_request = self._serialize_request(self._request)
 
         # NOTE(lidiz) asyncio.CancelledError is not a good transport for status,
         # because the asyncio.Task class do not cache the exception object.
@@ -601,13 +732,11 @@ class UnaryUnaryCall(
             return cygrpc.EOF
 
         if self._cython_call.is_ok():
-            return _common.deserialize(
-                serialized_response, self._response_deserializer
-            )
+            return self._deserialize_response(serialized_response)
         return cygrpc.EOF
 
     async def wait_for_connection(self) -> None:
-        await self._invocation_task
+        await self._response_future()
         if self.done():
             await self._raise_for_status()
 
@@ -660,9 +789,7 @@ class UnaryStreamCall(
         self._init_stream_response_mixin(self._send_unary_request_task)
 
     async def _send_unary_request(self) -> None:
-        serialized_request = _common.serialize(
-            self._request, self._request_serializer
-        )
+        serialized_request = self._serialize_request(self._request)
         try:
             await self._cython_call.initiate_unary_stream(
                 serialized_request, self._metadata, self._context
@@ -733,9 +860,7 @@ class StreamUnaryCall(
             raise
 
         if self._cython_call.is_ok():
-            return _common.deserialize(
-                serialized_response, self._response_deserializer
-            )
+            return self._deserialize_response(serialized_response)
         return cygrpc.EOF
 
 
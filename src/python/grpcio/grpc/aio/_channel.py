@@ -16,7 +16,7 @@
 
 import asyncio
 import types
-from typing import Any, Generic, List, Optional, Sequence, TypeVar
+from typing import Any, Generic, Iterable, List, Optional, Sequence, TypeVar
 import weakref
 
 import grpc
@@ -128,14 +128,22 @@ class _BaseMultiCallable(
 
         self._python_channel = self._references[0]
 
-    @staticmethod
     def _init_metadata(
+        self,
         metadata: Optional[MetadataType] = None,
         compression: Optional[grpc.Compression] = None,
     ) -> Metadata:
         """Based on the provided values for <metadata> or <compression> initialise the final
         metadata, as it should be used for the current call.
         """
+        if (
+            not compression
+            and not self._interceptors
+            and isinstance(metadata, cygrpc.EncodedMetadata)
+        ):
+            # Interceptors may mutate the metadata, so only calls that reach
+            # Core directly keep the pre-encoded form.
+            return metadata
         metadata = metadata or Metadata()
         if not isinstance(
             metadata, Metadata
@@ -201,6 +209,50 @@ class UnaryUnaryMultiCallable(
 
         return call
 
+    def batch(
+        self,
+        requests: Iterable[RequestType],
+        *,
+        timeout: Optional[float] = None,
+        metadata: Optional[MetadataType] = None,
+        credentials: Optional[grpc.CallCredentials] = None,
+        wait_for_ready: Optional[bool] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> List[_base_call.UnaryUnaryCall[RequestType, ResponseType]]:
+        if self._interceptors:
+            # Interceptors may alter the details of each call independently.
+            return super().batch(
+                requests,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials,
+                wait_for_ready=wait_for_ready,
+                compression=compression,
+            )
+        deadline = _timeout_to_deadline(timeout)
+        metadata = self._init_metadata(metadata, compression)
+        if not isinstance(metadata, cygrpc.EncodedMetadata):
+            # Encoded once here rather than by every call.
+            metadata = cygrpc.EncodedMetadata(metadata)
+        calls = []
+        for request in requests:
+            call = UnaryUnaryCall(
+                request,
+                deadline,
+                metadata,
+                credentials,
+                wait_for_ready,
+                self._channel,
+                self._method,
+                self._request_serializer,
+                self._response_deserializer,
+                self._loop,
+                self._registered_call_handle,
+            )
+            self._python_channel._register_call(call)
+            calls.append(call)
+        return calls
+
 
 class UnaryStreamMultiCallable(
     _BaseMultiCallable[RequestType, ResponseType, UnaryStreamClientInterceptor],
@@ -32,6 +32,7 @@ from typing import (
 )
 
 import grpc
+from grpc import _observability
 from grpc._cython import cygrpc
 
 from . import _base_call
@@ -665,19 +666,20 @@ class InterceptedUnaryUnaryCall(
         self._loop = loop
         self._channel = channel
         self._registered_call_handle = registered_call_handle
-        interceptors_task = loop.create_task(
-            self._invoke(
-                interceptors,
-                method,
-                timeout,
-                metadata,
-                credentials,
-                wait_for_ready,
-                request,
-                request_serializer,
-                response_deserializer,
+        with _observability.client_interception():
+            interceptors_task = loop.create_task(
+                self._invoke(
+                    interceptors,
+                    method,
+                    timeout,
+                    metadata,
+                    credentials,
+                    wait_for_ready,
+                    request,
+                    request_serializer,
+                    response_deserializer,
+                )
             )
-        )
         super().__init__(interceptors_task)
 
     async def _invoke(
@@ -784,19 +786,20 @@ class InterceptedUnaryStreamCall(
         self._registered_call_handle = registered_call_handle
         self._init_stream_response_mixin()
         self._last_returned_call_from_interceptors = None
-        interceptors_task = loop.create_task(
-            self._invoke(
-                interceptors,
-                method,
-                timeout,
-                metadata,
-                credentials,
-                wait_for_ready,
-                request,
-                request_serializer,
-                response_deserializer,
+        with _observability.client_interception():
+            interceptors_task = loop.create_task(
+                self._invoke(
+                    interceptors,
+                    method,
+                    timeout,
+                    metadata,
+                    credentials,
+                    wait_for_ready,
+                    request,
+                    request_serializer,
+                    response_deserializer,
+                )
             )
-        )
         super().__init__(interceptors_task)
 
     async def _invoke(
@@ -922,19 +925,20 @@ class InterceptedStreamUnaryCall(
         self._channel = channel
         self._registered_call_handle = registered_call_handle
         request_iterator = self._init_stream_request_mixin(request_iterator)
-        interceptors_task = loop.create_task(
-            self._invoke(
-                interceptors,
-                method,
-                timeout,
-                metadata,
-                credentials,
-                wait_for_ready,
-                request_iterator,
-                request_serializer,
-                response_deserializer,
+        with _observability.client_interception():
+            interceptors_task = loop.create_task(
+                self._invoke(
+                    interceptors,
+                    method,
+                    timeout,
+                    metadata,
+                    credentials,
+                    wait_for_ready,
+                    request_iterator,
+                    request_serializer,
+                    response_deserializer,
+                )
             )
-        )
         super().__init__(interceptors_task)
 
     async def _invoke(
@@ -1044,19 +1048,20 @@ class InterceptedStreamStreamCall(
         self._init_stream_response_mixin()
         request_iterator = self._init_stream_request_mixin(request_iterator)
         self._last_returned_call_from_interceptors = None
-        interceptors_task = loop.create_task(
-            self._invoke(
-                interceptors,
-                method,
-                timeout,
-                metadata,
-                credentials,
-                wait_for_ready,
-                request_iterator,
-                request_serializer,
-                response_deserializer,
+        with _observability.client_interception():
+            interceptors_task = loop.create_task(
+                self._invoke(
+                    interceptors,
+                    method,
+                    timeout,
+                    metadata,
+                    credentials,
+                    wait_for_ready,
+                    request_iterator,
+                    request_serializer,
+                    response_deserializer,
+                )
             )
-        )
         super().__init__(interceptors_task)
 
     async def _invoke(
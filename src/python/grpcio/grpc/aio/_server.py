@@ -14,11 +14,12 @@
 """Server-side implementation of gRPC Asyncio Python."""
 
 from concurrent.futures import Executor
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, Optional, Sequence, Union
 
 import grpc
 from grpc import _common
 from grpc import _compression
+from grpc import _concurrency_limiter
 from grpc import _observability
 from grpc._cython import cygrpc
 
@@ -50,7 +51,9 @@ class Server(_base_server.Server):
         generic_handlers: Optional[Sequence[grpc.GenericRpcHandler]],
         interceptors: Optional[Sequence[Any]],
         options: ChannelArgumentType,
-        maximum_concurrent_rpcs: Optional[int],
+        maximum_concurrent_rpcs: Optional[
+            Union[int, _concurrency_limiter.AdaptiveConcurrencyLimiter]
+        ],
         compression: Optional[grpc.Compression],
     ):
         self._loop = cygrpc.get_working_loop()
@@ -68,6 +71,13 @@ class Server(_base_server.Server):
                 # TODO(asheshvidyut): fix the value error below
                 # not caught by ruff.
                 raise ValueError(error_msg)
+        concurrency_limiter = None
+        if isinstance(
+            maximum_concurrent_rpcs,
+            _concurrency_limiter.AdaptiveConcurrencyLimiter,
+        ):
+            concurrency_limiter = maximum_concurrent_rpcs
+            maximum_concurrent_rpcs = None
         self._server = cygrpc.AioServer(
             self._loop,
             thread_pool,
@@ -75,6 +85,7 @@ class Server(_base_server.Server):
             interceptors,
             _augment_channel_arguments(options, compression),
             maximum_concurrent_rpcs,
+            concurrency_limiter,
         )
 
     def add_generic_rpc_handlers(
@@ -227,7 +238,9 @@ def server(
     handlers: Optional[Sequence[grpc.GenericRpcHandler]] = None,
     interceptors: Optional[Sequence[Any]] = None,
     options: Optional[ChannelArgumentType] = None,
-    maximum_concurrent_rpcs: Optional[int] = None,
+    maximum_concurrent_rpcs: Optional[
+        Union[int, _concurrency_limiter.AdaptiveConcurrencyLimiter]
+    ] = None,
     compression: Optional[grpc.Compression] = None,
 ):
     """Creates a Server with which RPCs can be serviced.
@@ -245,8 +258,9 @@ def server(
       options: An optional list of key-value pairs (:term:`channel_arguments` in gRPC runtime)
         to configure the channel.
       maximum_concurrent_rpcs: The maximum number of concurrent RPCs this server
-        will service before returning RESOURCE_EXHAUSTED status, or None to
-        indicate no limit.
+        will service before returning RESOURCE_EXHAUSTED status, None to
+        indicate no limit, or a grpc.experimental.AdaptiveConcurrencyLimiter
+        to limit every method to a limit that adapts to its latency.
       compression: An element of grpc.Compression, e.g.
         grpc.Compression.Gzip. This compression algorithm will be used for the
         lifetime of the server unless overridden by set_compression.
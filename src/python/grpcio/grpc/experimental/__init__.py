@@ -19,12 +19,21 @@ from __future__ import annotations
 
 import copy
 import functools
+import queue
 import sys
-from typing import Callable, Optional, Union
+import time
+from typing import Callable, Iterable, Iterator, Optional, Union
 import warnings
 
 import grpc
+from grpc._concurrency_limiter import AdaptiveConcurrencyLimiter
+from grpc._concurrency_limiter import AdaptiveConcurrencyLimiterStats
 from grpc._cython import cygrpc as _cygrpc
+from grpc._server_executor import DeadlineAwareExecutor
+from grpc._server_executor import DeadlineAwareExecutorStats
+from grpc._server_executor import TrafficClass
+from grpc._server_executor import WeightedFairExecutor
+from grpc._server_executor import WeightedFairExecutorStats
 
 _EXPERIMENTAL_APIS_USED = set()
 
@@ -114,6 +123,71 @@ def wrap_server_method_handler(wrapper, handler):
     return handler._replace(stream_stream=wrapper(handler.stream_stream))
 
 
+EncodedMetadata = _cygrpc.EncodedMetadata
+
+
+def encode_metadata(metadata):
+    """Validates and encodes metadata once so that it can be reused.
+
+    The returned object is an immutable tuple of (key, value) pairs and may be
+    passed as the metadata argument of any synchronous or asyncio
+    multi-callable, including with_call and future. Calls made with it share
+    the already-encoded keys and values instead of encoding them again, which
+    makes metadata repeated across many calls (e.g. authorization or routing
+    headers) nearly free. Adding compression or asyncio client interceptors to
+    a call falls back to the regular per-call encoding.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    Args:
+      metadata: An iterable of (key, value) pairs. Keys must be legal header
+        names; values of keys ending in "-bin" must be bytes.
+
+    Returns:
+      An EncodedMetadata.
+
+    Raises:
+      TypeError: If a binary value is not bytes.
+      ValueError: If a key or non-binary value is not a legal header.
+    """
+    return EncodedMetadata(metadata)
+
+
+def as_completed(
+    futures: Iterable[grpc.Future], timeout: Optional[float] = None
+) -> Iterator[grpc.Future]:
+    """Yields futures, such as those returned by batch, as they terminate.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    Args:
+      futures: The grpc.Futures to wait for.
+      timeout: An optional duration of time in seconds to wait for all of the
+        futures to terminate.
+
+    Yields:
+      Every one of futures, in the order in which they terminate.
+
+    Raises:
+      grpc.FutureTimeoutError: If futures remain pending after timeout.
+    """
+    futures = tuple(futures)
+    terminated = queue.SimpleQueue()
+    for future in futures:
+        future.add_done_callback(terminated.put)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for _ in futures:
+        if deadline is None:
+            yield terminated.get()
+        else:
+            try:
+                yield terminated.get(
+                    timeout=max(0.0, deadline - time.monotonic())
+                )
+            except queue.Empty:
+                raise grpc.FutureTimeoutError() from None
+
+
 # A Callable to return in the async case
 # See the `ssl_channel_credentials_with_custom_signer` docstring for more detail on usage.
 PrivateKeySignCancel = Callable[[], None]
@@ -170,9 +244,19 @@ def ssl_channel_credentials_with_custom_signer(
 
 
 __all__ = (
+    "AdaptiveConcurrencyLimiter",
+    "AdaptiveConcurrencyLimiterStats",
     "ChannelOptions",
+    "DeadlineAwareExecutor",
+    "DeadlineAwareExecutorStats",
+    "EncodedMetadata",
     "ExperimentalApiWarning",
+    "TrafficClass",
     "UsageError",
+    "WeightedFairExecutor",
+    "WeightedFairExecutorStats",
+    "as_completed",
+    "encode_metadata",
     "insecure_channel_credentials",
     "ssl_channel_credentials_with_custom_signer",
     "wrap_server_method_handler",
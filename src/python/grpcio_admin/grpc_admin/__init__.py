@@ -13,6 +13,7 @@
 # limitations under the License.
 """gRPC Python's Admin interface."""
 
+from grpc_admin import _profiler
 from grpc_channelz.v1 import channelz
 import grpc_csds
 
@@ -32,11 +33,15 @@ def add_admin_servicers(server):
     are automatically available via the admin interface just by upgrading your
     gRPC version.
 
+    Besides channelz and CSDS, the services include a sampling profiler of
+    the threads of the process, grpc.admin.v1.Profiler.
+
     Args:
         server: A gRPC server to which all admin services will be added.
     """
     channelz.add_channelz_servicer(server)
     grpc_csds.add_csds_servicer(server)
+    _profiler.add_profiler_servicer(server)
 
 
 __all__ = ["add_admin_servicers"]
@@ -0,0 +1,198 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A sampling profiler of the threads of a server, served as an admin service.
+
+The Profile method samples the stacks of all threads of the process for a
+bounded duration and returns them in the collapsed format read by flame graph
+tools: one line per distinct stack, with its frames from the root to the leaf
+separated by semicolons, followed by the number of samples taking it. Stacks
+of threads serving an RPC of a sync server start with the method of the RPC.
+On an asyncio server, the samples are taken from a thread of the default
+executor of the event loop, so the stacks of the event loop thread are
+included.
+
+The request is a JSON object, optionally setting "duration_seconds", the
+time to sample for, and "interval_seconds", the time between samples. The
+response is the collapsed stacks encoded in UTF-8. One profile runs at a time.
+"""
+
+import asyncio
+import collections
+import json
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import grpc
+from grpc._cython import cygrpc
+
+SERVICE_NAME = "grpc.admin.v1.Profiler"
+PROFILE_METHOD = "Profile"
+
+_DEFAULT_DURATION_S = 10.0
+_MAX_DURATION_S = 60.0
+_DEFAULT_INTERVAL_S = 0.01
+_MIN_INTERVAL_S = 0.001
+_MAX_STACK_DEPTH = 128
+_PROFILE_RUNNING_DETAILS = "Another profile is already running."
+
+_profile_lock = threading.Lock()
+
+
+def _parse_request(request: bytes) -> Tuple[float, float]:
+    """Returns the duration and interval of a profile request.
+
+    Raises:
+      ValueError: If the request is not a valid profile request.
+    """
+    arguments = json.loads(request) if request else {}
+    if not isinstance(arguments, dict):
+        raise ValueError("The request must be a JSON object.")
+    duration_s = arguments.get("duration_seconds", _DEFAULT_DURATION_S)
+    interval_s = arguments.get("interval_seconds", _DEFAULT_INTERVAL_S)
+    for name, value in (
+        ("duration_seconds", duration_s),
+        ("interval_seconds", interval_s),
+    ):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError("%s must be a number." % name)
+    if not 0 < duration_s <= _MAX_DURATION_S:
+        raise ValueError(
+            "duration_seconds must be in (0, %s]." % _MAX_DURATION_S
+        )
+    if interval_s < _MIN_INTERVAL_S:
+        raise ValueError(
+            "interval_seconds must be at least %s." % _MIN_INTERVAL_S
+        )
+    return float(duration_s), float(interval_s)
+
+
+def _collapse(frame, method: Optional[bytes]) -> str:
+    labels = []
+    while frame is not None and len(labels) < _MAX_STACK_DEPTH:
+        code = frame.f_code
+        labels.append(
+            "%s (%s:%d)" % (code.co_name, code.co_filename, code.co_firstlineno)
+        )
+        frame = frame.f_back
+    if method is not None:
+        labels.append(method.decode("utf-8", "replace"))
+    labels.reverse()
+    return ";".join(labels)
+
+
+class _Profile:
+    """The collapsed stacks sampled from all threads but the profiling one."""
+
+    _profiling_thread_id: int
+    _stacks: Dict[str, int]
+
+    def __init__(self):
+        self._profiling_thread_id = threading.get_ident()
+        self._stacks = collections.Counter()
+
+    def sample(self) -> None:
+        methods = cygrpc.get_serving_thread_methods()
+        # pylint: disable=protected-access
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id != self._profiling_thread_id:
+                self._stacks[_collapse(frame, methods.get(thread_id))] += 1
+
+    def collapsed(self) -> bytes:
+        return "".join(
+            "%s %d\n" % stack_and_count
+            for stack_and_count in sorted(self._stacks.items())
+        ).encode("utf-8")
+
+
+def _run_profile(
+    duration_s: float, interval_s: float, is_active: Callable[[], bool]
+) -> bytes:
+    """Samples all other threads until duration_s passed or the RPC ended."""
+    profile = _Profile()
+    end = time.monotonic() + duration_s
+    while is_active():
+        profile.sample()
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(interval_s, remaining))
+    return profile.collapsed()
+
+
+def _profile(request: bytes, context: grpc.ServicerContext) -> bytes:
+    try:
+        duration_s, interval_s = _parse_request(request)
+    except ValueError as error:
+        context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(error))
+    # pylint: disable=consider-using-with
+    if not _profile_lock.acquire(blocking=False):
+        context.abort(
+            grpc.StatusCode.RESOURCE_EXHAUSTED, _PROFILE_RUNNING_DETAILS
+        )
+    try:
+        return _run_profile(duration_s, interval_s, context.is_active)
+    finally:
+        _profile_lock.release()
+
+
+async def _profile_async(
+    request: bytes, context: grpc.aio.ServicerContext
+) -> bytes:
+    try:
+        duration_s, interval_s = _parse_request(request)
+    except ValueError as error:
+        await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(error))
+    # pylint: disable=consider-using-with
+    if not _profile_lock.acquire(blocking=False):
+        await context.abort(
+            grpc.StatusCode.RESOURCE_EXHAUSTED, _PROFILE_RUNNING_DETAILS
+        )
+    try:
+        # Sampling from the event loop thread would leave out the very
+        # thread running the handlers.
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            _run_profile,
+            duration_s,
+            interval_s,
+            lambda: not context.done(),
+        )
+    finally:
+        _profile_lock.release()
+
+
+def add_profiler_servicer(server) -> None:
+    """Adds the profiler service to a sync or asyncio server.
+
+    Args:
+      server: A gRPC server to which the profiler service will be added.
+    """
+    if isinstance(server, grpc.aio.Server):
+        behavior = _profile_async
+    else:
+        behavior = _profile
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                SERVICE_NAME,
+                {
+                    PROFILE_METHOD: grpc.unary_unary_rpc_method_handler(
+                        behavior
+                    ),
+                },
+            ),
+        )
+    )
@@ -13,7 +13,7 @@
 # limitations under the License.
 """Channelz debug service implementation in gRPC Python."""
 
-from google.protobuf import json_format
+from google.protobuf import message
 import grpc
 from grpc._cython import cygrpc
 import grpc_channelz.v1.channelz_pb2 as _channelz_pb2
@@ -26,95 +26,92 @@ class ChannelzServicer(_channelz_pb2_grpc.ChannelzServicer):
     @staticmethod
     def GetTopChannels(request, context):
         try:
-            return json_format.Parse(
-                cygrpc.channelz_get_top_channels(request.start_channel_id),
-                _channelz_pb2.GetTopChannelsResponse(),
+            return _channelz_pb2.GetTopChannelsResponse.FromString(
+                cygrpc.channelz_get_top_channels_proto(
+                    request.start_channel_id, request.max_results
+                )
             )
-        except (ValueError, json_format.ParseError) as e:
+        except (ValueError, message.DecodeError) as e:
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
 
     @staticmethod
     def GetServers(request, context):
         try:
-            return json_format.Parse(
-                cygrpc.channelz_get_servers(request.start_server_id),
-                _channelz_pb2.GetServersResponse(),
+            return _channelz_pb2.GetServersResponse.FromString(
+                cygrpc.channelz_get_servers_proto(
+                    request.start_server_id, request.max_results
+                )
             )
-        except (ValueError, json_format.ParseError) as e:
+        except (ValueError, message.DecodeError) as e:
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
 
     @staticmethod
     def GetServer(request, context):
         try:
-            return json_format.Parse(
-                cygrpc.channelz_get_server(request.server_id),
-                _channelz_pb2.GetServerResponse(),
+            return _channelz_pb2.GetServerResponse.FromString(
+                cygrpc.channelz_get_server_proto(request.server_id)
             )
         except ValueError as e:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details(str(e))
-        except json_format.ParseError as e:
+        except message.DecodeError as e:
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
 
     @staticmethod
     def GetServerSockets(request, context):
         try:
-            return json_format.Parse(
-                cygrpc.channelz_get_server_sockets(
+            return _channelz_pb2.GetServerSocketsResponse.FromString(
+                cygrpc.channelz_get_server_sockets_proto(
                     request.server_id,
                     request.start_socket_id,
                     request.max_results,
-                ),
-                _channelz_pb2.GetServerSocketsResponse(),
+                )
             )
         except ValueError as e:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details(str(e))
-        except json_format.ParseError as e:
+        except message.DecodeError as e:
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
 
     @staticmethod
     def GetChannel(request, context):
         try:
-            return json_format.Parse(
-                cygrpc.channelz_get_channel(request.channel_id),
-                _channelz_pb2.GetChannelResponse(),
+            return _channelz_pb2.GetChannelResponse.FromString(
+                cygrpc.channelz_get_channel_proto(request.channel_id)
             )
         except ValueError as e:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details(str(e))
-        except json_format.ParseError as e:
+        except message.DecodeError as e:
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
 
     @staticmethod
     def GetSubchannel(request, context):
         try:
-            return json_format.Parse(
-                cygrpc.channelz_get_subchannel(request.subchannel_id),
-                _channelz_pb2.GetSubchannelResponse(),
+            return _channelz_pb2.GetSubchannelResponse.FromString(
+                cygrpc.channelz_get_subchannel_proto(request.subchannel_id)
             )
         except ValueError as e:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details(str(e))
-        except json_format.ParseError as e:
+        except message.DecodeError as e:
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
 
     @staticmethod
     def GetSocket(request, context):
         try:
-            return json_format.Parse(
-                cygrpc.channelz_get_socket(request.socket_id),
-                _channelz_pb2.GetSocketResponse(),
+            return _channelz_pb2.GetSocketResponse.FromString(
+                cygrpc.channelz_get_socket_proto(request.socket_id)
             )
         except ValueError as e:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details(str(e))
-        except json_format.ParseError as e:
+        except message.DecodeError as e:
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
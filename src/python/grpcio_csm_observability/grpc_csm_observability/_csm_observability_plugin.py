@@ -12,16 +12,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import os
 import re
-from typing import AnyStr, Callable, Dict, Iterable, List, Optional, Union
+import threading
+from typing import (
+    AnyStr,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
 
 from google.protobuf import struct_pb2
+import grpc
+from grpc_observability._observability import BufferOverflowPolicy
 from grpc_observability._observability import OptionalLabelType
 from grpc_observability._open_telemetry_plugin import OpenTelemetryLabelInjector
 from grpc_observability._open_telemetry_plugin import OpenTelemetryPlugin
 from grpc_observability._open_telemetry_plugin import OpenTelemetryPluginOption
+from opentelemetry.metrics import CallbackOptions
 from opentelemetry.metrics import MeterProvider
+from opentelemetry.metrics import Observation
 from opentelemetry.resourcedetector.gcp_resource_detector import (
     GoogleCloudResourceDetector,
 )
@@ -60,6 +75,73 @@ _METADATA_EXCHANGE_MAP_BY_TYPE = {
     TYPE_GCE: METADATA_EXCHANGE_KEY_GCE_MAP,
 }
 
+# The number of distinct peers is small compared to the number of RPCs, so a
+# small cache is enough to avoid re-parsing the exchanged Struct per metric.
+PEER_LABELS_CACHE_SIZE = 1024
+PEER_LABELS_CACHE_HITS_METRIC = "grpc.csm.peer_labels_cache.hits"
+PEER_LABELS_CACHE_MISSES_METRIC = "grpc.csm.peer_labels_cache.misses"
+
+
+class PeerLabelsCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _PeerLabelsCache:
+    """A bounded LRU cache from serialized peer metadata to remote labels.
+
+    Values stored in this cache are shared between callers and must not be
+    mutated.
+    """
+
+    _lock: threading.Lock
+    _maxsize: int
+    _entries: "collections.OrderedDict[AnyStr, Dict[str, str]]"
+    _hits: int
+    _misses: int
+
+    def __init__(self, maxsize: int):
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, serialized_data: AnyStr) -> Dict[str, str]:
+        with self._lock:
+            remote_labels = self._entries.get(serialized_data)
+            if remote_labels is not None:
+                self._entries.move_to_end(serialized_data)
+                self._hits += 1
+                return remote_labels
+            self._misses += 1
+        # Parse outside of the lock, a concurrent miss for the same key only
+        # results in duplicated work.
+        remote_labels = _parse_remote_labels(serialized_data)
+        with self._lock:
+            self._entries[serialized_data] = remote_labels
+            self._entries.move_to_end(serialized_data)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return remote_labels
+
+    def info(self) -> PeerLabelsCacheInfo:
+        with self._lock:
+            return PeerLabelsCacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_PEER_LABELS_CACHE = _PeerLabelsCache(PEER_LABELS_CACHE_SIZE)
+
 
 class CSMOpenTelemetryLabelInjector(OpenTelemetryLabelInjector):
     """
@@ -163,6 +245,16 @@ class CSMOpenTelemetryLabelInjector(OpenTelemetryLabelInjector):
 
         return {**remote_labels, **passthrough_labels}
 
+    @staticmethod
+    def peer_labels_cache_info() -> PeerLabelsCacheInfo:
+        """Returns hit and miss statistics of the peer labels cache."""
+        return _PEER_LABELS_CACHE.info()
+
+    @staticmethod
+    def clear_peer_labels_cache() -> None:
+        """Drops all cached peer labels and resets the statistics."""
+        _PEER_LABELS_CACHE.clear()
+
 
 class CsmOpenTelemetryPluginOption(OpenTelemetryPluginOption):
     """
@@ -236,6 +328,10 @@ class CsmOpenTelemetryPlugin(OpenTelemetryPlugin):
         plugin_options: Optional[Iterable[OpenTelemetryPluginOption]] = None,
         meter_provider: Optional[MeterProvider] = None,
         generic_method_attribute_filter: Optional[Callable[[str], bool]] = None,
+        export_interval: Optional[float] = None,
+        max_export_buffer_size: Optional[int] = None,
+        export_buffer_overflow_policy: Optional[BufferOverflowPolicy] = None,
+        enable_export_buffer_metrics: bool = False,
     ):
         plugin_options = plugin_options or []
         new_options = list(plugin_options) + [CsmOpenTelemetryPluginOption()]
@@ -243,7 +339,13 @@ class CsmOpenTelemetryPlugin(OpenTelemetryPlugin):
             plugin_options=new_options,
             meter_provider=meter_provider,
             generic_method_attribute_filter=generic_method_attribute_filter,
+            export_interval=export_interval,
+            max_export_buffer_size=max_export_buffer_size,
+            export_buffer_overflow_policy=export_buffer_overflow_policy,
+            enable_export_buffer_metrics=enable_export_buffer_metrics,
         )
+        if meter_provider:
+            _register_peer_labels_cache_metrics(meter_provider)
 
     def _get_enabled_optional_labels(self) -> List[OptionalLabelType]:
         return [OptionalLabelType.XDS_SERVICE_LABELS]
@@ -256,17 +358,49 @@ def get_value_from_struct(key: str, struct: struct_pb2.Struct) -> str:
     return value.string_value
 
 
+def _register_peer_labels_cache_metrics(meter_provider: MeterProvider) -> None:
+    meter = meter_provider.get_meter("grpc-python-csm", grpc.__version__)
+
+    def _observe_hits(
+        _options: CallbackOptions,
+    ) -> Iterable[Observation]:
+        yield Observation(_PEER_LABELS_CACHE.info().hits)
+
+    def _observe_misses(
+        _options: CallbackOptions,
+    ) -> Iterable[Observation]:
+        yield Observation(_PEER_LABELS_CACHE.info().misses)
+
+    meter.create_observable_counter(
+        name=PEER_LABELS_CACHE_HITS_METRIC,
+        callbacks=[_observe_hits],
+        unit="{lookup}",
+        description="Number of peer metadata lookups served from the cache.",
+    )
+    meter.create_observable_counter(
+        name=PEER_LABELS_CACHE_MISSES_METRIC,
+        callbacks=[_observe_misses],
+        unit="{lookup}",
+        description="Number of peer metadata lookups that required parsing.",
+    )
+
+
 def _deserialize_remote_labels(
     serialized_data: Optional[AnyStr],
 ) -> Dict[str, str]:
-    remote_keys_unknown = dict.fromkeys(
-        METADATA_EXCHANGE_KEY_FIXED_MAP.values(), UNKNOWN_VALUE
-    )
-
     # If CSM label injector is enabled on server side but client didn't send
     # XEnvoyPeerMetadata, we'll record remote label as unknown.
     if serialized_data is None:
-        return remote_keys_unknown
+        return dict.fromkeys(
+            METADATA_EXCHANGE_KEY_FIXED_MAP.values(), UNKNOWN_VALUE
+        )
+    return _PEER_LABELS_CACHE.get(serialized_data)
+
+
+def _parse_remote_labels(serialized_data: AnyStr) -> Dict[str, str]:
+    remote_keys_unknown = dict.fromkeys(
+        METADATA_EXCHANGE_KEY_FIXED_MAP.values(), UNKNOWN_VALUE
+    )
 
     pb_struct = struct_pb2.Struct()
     try:
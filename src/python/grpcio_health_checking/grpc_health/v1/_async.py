@@ -14,13 +14,43 @@
 """Reference implementation for health checking in gRPC Python."""
 
 import asyncio
-import collections
 from typing import MutableMapping
 
 import grpc
 from grpc_health.v1 import health_pb2 as _health_pb2
 from grpc_health.v1 import health_pb2_grpc as _health_pb2_grpc
 
+# One shared response per status, sent to every watcher. They must never be
+# mutated.
+_RESPONSES = {
+    status: _health_pb2.HealthCheckResponse(status=status)
+    for status in _health_pb2.HealthCheckResponse.ServingStatus.values()
+}
+
+
+def _response(
+    status: "_health_pb2.HealthCheckResponse.ServingStatus",
+) -> _health_pb2.HealthCheckResponse:
+    response = _RESPONSES.get(status)
+    if response is None:
+        response = _health_pb2.HealthCheckResponse(status=status)
+    return response
+
+
+class _ServiceWatchers:
+    """The watchers of a service, all woken up at once on status changes."""
+
+    count: int
+    changed: asyncio.Event
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.changed = asyncio.Event()
+
+    def notify(self) -> None:
+        self.changed.set()
+        self.changed = asyncio.Event()
+
 
 class HealthServicer(_health_pb2_grpc.HealthServicer):
     """An AsyncIO implementation of health checking servicer."""
@@ -28,12 +58,16 @@ class HealthServicer(_health_pb2_grpc.HealthServicer):
     _server_status: MutableMapping[
         str, "_health_pb2.HealthCheckResponse.ServingStatus"
     ]
-    _server_watchers: MutableMapping[str, asyncio.Condition]
+    _status_versions: MutableMapping[str, int]
+    _version: int
+    _server_watchers: MutableMapping[str, _ServiceWatchers]
     _gracefully_shutting_down: bool
 
     def __init__(self) -> None:
         self._server_status = {"": _health_pb2.HealthCheckResponse.SERVING}
-        self._server_watchers = collections.defaultdict(asyncio.Condition)
+        self._status_versions = {"": 0}
+        self._version = 0
+        self._server_watchers = {}
         self._gracefully_shutting_down = False
 
     async def Check(
@@ -44,51 +78,56 @@ class HealthServicer(_health_pb2_grpc.HealthServicer):
         if status is None:
             await context.abort(grpc.StatusCode.NOT_FOUND)
         else:
-            return _health_pb2.HealthCheckResponse(status=status)
+            return _response(status)
 
     async def Watch(
         self, request: _health_pb2.HealthCheckRequest, context
     ) -> None:
-        condition = self._server_watchers[request.service]
+        service = request.service
+        watchers = self._server_watchers.get(service)
+        if watchers is None:
+            watchers = self._server_watchers[service] = _ServiceWatchers()
+        watchers.count += 1
+        last_version = None
         last_status = None
         try:
-            async with condition:
-                while True:
-                    status = self._server_status.get(
-                        request.service,
-                        _health_pb2.HealthCheckResponse.SERVICE_UNKNOWN,
-                    )
-
-                    # NOTE(lidiz) If the observed status is the same, it means
-                    # there are missing intermediate statuses. It's considered
-                    # acceptable since peer only interested in eventual status.
-                    if status != last_status:
-                        # Responds with current health state
-                        await context.write(
-                            _health_pb2.HealthCheckResponse(status=status)
-                        )
-
-                    # Records the last sent status
-                    last_status = status
-
+            while True:
+                version = self._status_versions.get(service, 0)
+                if version == last_version:
                     # Polling on health state changes
-                    await condition.wait()
+                    await watchers.changed.wait()
+                    continue
+                last_version = version
+                status = self._server_status.get(
+                    service, _health_pb2.HealthCheckResponse.SERVICE_UNKNOWN
+                )
+
+                # NOTE(lidiz) If the observed status is the same, it means
+                # there are missing intermediate statuses. It's considered
+                # acceptable since peer only interested in eventual status.
+                if status != last_status:
+                    # Responds with current health state. Statuses set while
+                    # writing are coalesced into the latest one.
+                    await context.write(_response(status))
+
+                # Records the last sent status
+                last_status = status
         finally:
-            if request.service in self._server_watchers:
-                del self._server_watchers[request.service]
+            watchers.count -= 1
+            if not watchers.count:
+                del self._server_watchers[service]
 
-    async def _set(
+    def _set(
         self,
         service: str,
         status: _health_pb2.HealthCheckResponse.ServingStatus,
     ) -> None:
-        if service in self._server_watchers:
-            condition = self._server_watchers.get(service)
-            async with condition:
-                self._server_status[service] = status
-                condition.notify_all()
-        else:
-            self._server_status[service] = status
+        self._version += 1
+        self._server_status[service] = status
+        self._status_versions[service] = self._version
+        watchers = self._server_watchers.get(service)
+        if watchers is not None:
+            watchers.notify()
 
     async def set(
         self,
@@ -104,7 +143,7 @@ class HealthServicer(_health_pb2_grpc.HealthServicer):
         """
         if self._gracefully_shutting_down:
             return
-        await self._set(service, status)
+        self._set(service, status)
 
     async def enter_graceful_shutdown(self) -> None:
         """Permanently sets the status of all services to NOT_SERVING.
@@ -117,6 +156,4 @@ class HealthServicer(_health_pb2_grpc.HealthServicer):
             return
         self._gracefully_shutting_down = True
         for service in self._server_status:
-            await self._set(
-                service, _health_pb2.HealthCheckResponse.NOT_SERVING
-            )
+            self._set(service, _health_pb2.HealthCheckResponse.NOT_SERVING)
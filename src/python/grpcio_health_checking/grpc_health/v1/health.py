@@ -13,7 +13,7 @@
 # limitations under the License.
 """Reference implementation for health checking in gRPC Python."""
 
-import collections
+from concurrent import futures
 import threading
 
 import grpc
@@ -29,10 +29,25 @@ SERVICE_NAME = _health_pb2.DESCRIPTOR.services_by_name["Health"].full_name
 OVERALL_HEALTH = ""
 
 
+# One shared response per status, sent to every watcher. They must never be
+# mutated.
+_RESPONSES = {
+    status: _health_pb2.HealthCheckResponse(status=status)
+    for status in _health_pb2.HealthCheckResponse.ServingStatus.values()
+}
+
+
+def _response(status):
+    response = _RESPONSES.get(status)
+    if response is None:
+        response = _health_pb2.HealthCheckResponse(status=status)
+    return response
+
+
 class _Watcher:
     def __init__(self):
         self._condition = threading.Condition()
-        self._responses = collections.deque()
+        self._response = None
         self._open = True
 
     def __iter__(self):
@@ -40,10 +55,11 @@ class _Watcher:
 
     def _next(self):
         with self._condition:
-            while not self._responses and self._open:
+            while self._response is None and self._open:
                 self._condition.wait()
-            if self._responses:
-                return self._responses.popleft()
+            if self._response is not None:
+                response, self._response = self._response, None
+                return response
             raise StopIteration()
 
     def next(self):
@@ -54,7 +70,9 @@ class _Watcher:
 
     def add(self, response):
         with self._condition:
-            self._responses.append(response)
+            # Peers are only interested in the eventual status, so a status
+            # not yet consumed is replaced rather than queued.
+            self._response = response
             self._condition.notify()
 
     def close(self):
@@ -73,68 +91,156 @@ def _watcher_to_send_response_callback_adapter(watcher):
     return send_response_callback
 
 
+class _Subscription:
+    """Delivers the latest status of a service to a single watcher.
+
+    Statuses are versioned so that one delivered late never overwrites a
+    newer one. Responses are sent by a drain running on the executor, if
+    any, so that notifying never waits for the watcher. Once the executor
+    has been shut down, they are sent in place. Statuses set while a
+    response is being sent are coalesced into the latest one, which the
+    drain sends next.
+    """
+
+    def __init__(self, send_response_callback, executor):
+        self._send_response_callback = send_response_callback
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._version = -1
+        self._response = None
+        self._sending = False
+        self._closed = False
+
+    def notify(self, version, response):
+        with self._lock:
+            if self._closed or version <= self._version:
+                return
+            self._version = version
+            self._response = response
+            if self._sending:
+                return
+            self._sending = True
+        if self._executor is None:
+            self._drain()
+            return
+        try:
+            self._executor.submit(self._drain)
+        except RuntimeError:
+            # The servicer shut its executor down on entering graceful
+            # shutdown; the response is sent in place instead.
+            self._drain()
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                response, self._response = self._response, None
+                if response is None or self._closed:
+                    self._sending = False
+                    return
+            self._send_response_callback(response)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._response = None
+        self._send_response_callback(None)
+
+
+def _notify(subscriptions, version, response):
+    for subscription in subscriptions:
+        subscription.notify(version, response)
+
+
 class HealthServicer(_health_pb2_grpc.HealthServicer):
-    """Servicer handling RPCs for service statuses."""
+    """Servicer handling RPCs for service statuses.
+
+    With experimental_non_blocking, the default, watchers are sent their
+    responses from a thread pool of the servicer, so that a slow watcher
+    holds up neither set nor the other watchers. Otherwise every Watch RPC
+    occupies a thread of the server for as long as it lasts.
+    """
 
     def __init__(
         self, experimental_non_blocking=True, experimental_thread_pool=None
     ):
         self._lock = threading.RLock()
         self._server_status = {"": _health_pb2.HealthCheckResponse.SERVING}
-        self._send_response_callbacks = {}
+        self._status_versions = {"": 0}
+        self._version = 0
+        self._subscriptions = {}
+        self._delivery_executor = futures.ThreadPoolExecutor(
+            thread_name_prefix="grpc_health_watch"
+        )
         self.Watch.__func__.experimental_non_blocking = (
             experimental_non_blocking
         )
         self.Watch.__func__.experimental_thread_pool = experimental_thread_pool
         self._gracefully_shutting_down = False
 
-    def _on_close_callback(self, send_response_callback, service):
+    def _on_close_callback(self, subscription, service):
         def callback():
             with self._lock:
-                self._send_response_callbacks[service].remove(
-                    send_response_callback
-                )
-            send_response_callback(None)
+                subscriptions = self._subscriptions[service]
+                subscriptions.remove(subscription)
+                if not subscriptions:
+                    del self._subscriptions[service]
+            subscription.close()
 
         return callback
 
     def Check(self, request, context):
         with self._lock:
             status = self._server_status.get(request.service)
-            if status is None:
-                context.set_code(grpc.StatusCode.NOT_FOUND)
-                return _health_pb2.HealthCheckResponse()
-            return _health_pb2.HealthCheckResponse(status=status)
+        if status is None:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            return _health_pb2.HealthCheckResponse()
+        return _response(status)
 
     # pylint: disable=arguments-differ
     def Watch(self, request, context, send_response_callback=None):
         blocking_watcher = None
+        executor = self._delivery_executor
         if send_response_callback is None:
             # The server does not support the experimental_non_blocking
             # parameter. For backwards compatibility, return a blocking response
-            # generator.
+            # generator. The thread of the server iterating it sends the
+            # responses, and adding one to it never blocks, so they are
+            # delivered in place.
             blocking_watcher = _Watcher()
             send_response_callback = _watcher_to_send_response_callback_adapter(
                 blocking_watcher
             )
+            executor = None
         service = request.service
+        subscription = _Subscription(send_response_callback, executor)
         with self._lock:
             status = self._server_status.get(service)
             if status is None:
                 status = (
                     _health_pb2.HealthCheckResponse.SERVICE_UNKNOWN
                 )  # pylint: disable=no-member
-            send_response_callback(
-                _health_pb2.HealthCheckResponse(status=status)
-            )
-            if service not in self._send_response_callbacks:
-                self._send_response_callbacks[service] = set()
-            self._send_response_callbacks[service].add(send_response_callback)
-            context.add_callback(
-                self._on_close_callback(send_response_callback, service)
-            )
+            version = self._status_versions.get(service, 0)
+            self._subscriptions.setdefault(service, set()).add(subscription)
+            context.add_callback(self._on_close_callback(subscription, service))
+        subscription.notify(version, _response(status))
         return blocking_watcher
 
+    def _set(self, service, status):
+        """Records the status of a service while holding the lock.
+
+        Returns:
+          The subscriptions to the service, the version of the status and the
+          response to notify them of outside of the lock.
+        """
+        self._version += 1
+        self._server_status[service] = status
+        self._status_versions[service] = self._version
+        return (
+            tuple(self._subscriptions.get(service, ())),
+            self._version,
+            _response(status),
+        )
+
     def set(self, service, status):
         """Sets the status of a service.
 
@@ -146,14 +252,8 @@ class HealthServicer(_health_pb2_grpc.HealthServicer):
         with self._lock:
             if self._gracefully_shutting_down:
                 return
-            self._server_status[service] = status
-            if service in self._send_response_callbacks:
-                for send_response_callback in self._send_response_callbacks[
-                    service
-                ]:
-                    send_response_callback(
-                        _health_pb2.HealthCheckResponse(status=status)
-                    )
+            notification = self._set(service, status)
+        _notify(*notification)
 
     def enter_graceful_shutdown(self):
         """Permanently sets the status of all services to NOT_SERVING.
@@ -167,8 +267,15 @@ class HealthServicer(_health_pb2_grpc.HealthServicer):
         with self._lock:
             if self._gracefully_shutting_down:
                 return
-            for service in self._server_status:
-                self.set(
+            notifications = [
+                self._set(
                     service, _health_pb2.HealthCheckResponse.NOT_SERVING
                 )  # pylint: disable=no-member
+                for service in tuple(self._server_status)
+            ]
             self._gracefully_shutting_down = True
+        for notification in notifications:
+            _notify(*notification)
+        # No status is set from here on, so the pool only has to finish the
+        # responses already submitted to it.
+        self._delivery_executor.shutdown(wait=False)
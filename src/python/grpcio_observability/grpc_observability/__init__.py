@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from grpc_observability._observability import BufferOverflowPolicy
 from grpc_observability._open_telemetry_plugin import OpenTelemetryPlugin
 
-__all__ = ("OpenTelemetryPlugin",)
+__all__ = ("BufferOverflowPolicy", "OpenTelemetryPlugin")
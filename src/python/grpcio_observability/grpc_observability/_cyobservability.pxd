@@ -12,17 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from libcpp.deque cimport deque
 from libcpp.string cimport string
 from libcpp.vector cimport vector
 
 ctypedef   signed long long int64_t
 
-cdef extern from "<queue>" namespace "std" nogil:
-  cdef cppclass queue[T]:
-    bint empty()
-    T& front()
-    void pop()
-
 cdef extern from "<mutex>" namespace "std" nogil:
   cdef cppclass mutex:
     mutex()
@@ -86,8 +81,13 @@ cdef extern from "observability_util.h" namespace "grpc_observability":
                                     bint add_csm_optional_labels,
                                     bint registered_method) except +
   cdef void* CreateServerCallTracerFactory(const vector[Label] exchange_labels, const char* identifier) except +
-  cdef queue[NativeCensusData]* g_census_data_buffer
+  cdef void SetCensusBufferConfig(int max_buffer_size,
+                                  BufferOverflowPolicy policy) nogil
+  cdef CensusBufferStats GetCensusBufferStats() nogil
+  cdef deque[NativeCensusData]* g_census_data_buffer
   cdef void AwaitNextBatchLocked(unique_lock[mutex]&, int) nogil
+  cdef void DrainAndAggregateCensusData(vector[AggregatedCensusData]* metrics,
+                                        vector[SpanCensusData]* spans) nogil
   cdef bint PythonCensusStatsEnabled() nogil
   cdef bint PythonCensusTracingEnabled() nogil
   cdef mutex g_census_data_buffer_mutex
@@ -100,6 +100,16 @@ cdef extern from "observability_util.h" namespace "grpc_observability":
     SpanCensusData span_data
     vector[Label] labels
 
+  ctypedef struct CensusBufferStats:
+    int64_t dropped
+    int64_t queue_depth
+
+  cppclass AggregatedCensusData "::grpc_observability::AggregatedCensusData":
+    Measurement measurement_data
+    vector[Label] labels
+    string identifier
+    vector[MeasurementValue] values
+
   ctypedef struct CloudMonitoring:
     pass
 
@@ -122,6 +132,11 @@ cdef extern from "constants.h" namespace "grpc_observability":
     kSpanData
     kMetricData
 
+  ctypedef enum BufferOverflowPolicy:
+    kDropNewest
+    kDropOldest
+    kSample
+
   ctypedef enum MeasurementType:
     kMeasurementDouble
     kMeasurementInt
@@ -27,6 +27,7 @@ from grpc_observability import _observability
 # Time we wait for batch exporting census data
 # TODO(xuanwn): change interval to a more appropriate number
 CENSUS_EXPORT_BATCH_INTERVAL_SECS = float(os.environ.get('GRPC_PYTHON_CENSUS_EXPORT_BATCH_INTERVAL_SECS', 0.5))
+cdef double _export_interval_secs = CENSUS_EXPORT_BATCH_INTERVAL_SECS
 GRPC_PYTHON_CENSUS_EXPORT_THREAD_TIMEOUT = float(os.environ.get('GRPC_PYTHON_CENSUS_EXPORT_THREAD_TIMEOUT', 10))
 cdef const char* CLIENT_CALL_TRACER = "client_call_tracer"
 cdef const char* SERVER_CALL_TRACER_FACTORY = "server_call_tracer_factory"
@@ -85,13 +86,46 @@ class MetricsName(enum.Enum):
 # Delay map creation due to circular dependencies
 _CY_METRICS_NAME_TO_PY_METRICS_NAME_MAPPING = {x.value: x for x in MetricsName}
 
-def cyobservability_init(object exporter) -> None:
+def cyobservability_init(object exporter, object export_interval_secs=None,
+                         object max_export_buffer_size=None,
+                         object buffer_overflow_policy=None) -> None:
+  """Initializes native observability and starts the export thread.
+
+  Args:
+    exporter: The _observability.Exporter census data is exported to.
+    export_interval_secs: The maximum time between two exports, or None to use
+      CENSUS_EXPORT_BATCH_INTERVAL_SECS.
+    max_export_buffer_size: The maximum number of census data entries buffered
+      between two exports, or None to use the default.
+    buffer_overflow_policy: An _observability.BufferOverflowPolicy applied once
+      the buffer is full, or None to drop the newest entries.
+  """
   exporter: _observability.Exporter
 
+  global _export_interval_secs
   NativeObservabilityInit()
+  if export_interval_secs is None:
+    _export_interval_secs = CENSUS_EXPORT_BATCH_INTERVAL_SECS
+  else:
+    _export_interval_secs = export_interval_secs
+  if buffer_overflow_policy is None:
+    buffer_overflow_policy = _observability.BufferOverflowPolicy.DROP_NEWEST
+  SetCensusBufferConfig(max_export_buffer_size or 0,
+                        <BufferOverflowPolicy>buffer_overflow_policy.value)
   _start_exporting_thread(exporter)
 
 
+def export_interval_secs() -> float:
+  """Returns the interval the export thread currently waits between exports."""
+  return _export_interval_secs
+
+
+def census_buffer_stats() -> Tuple[int, int]:
+  """Returns the number of dropped census data entries and the queue depth."""
+  cdef CensusBufferStats stats = GetCensusBufferStats()
+  return stats.dropped, stats.queue_depth
+
+
 def _start_exporting_thread(object exporter) -> None:
   exporter: _observability.Exporter
 
@@ -226,7 +260,8 @@ def _cy_metric_name_to_py_metric_name(cMetricsName metric_name) -> MetricsName:
     raise ValueError('Invalid metric name %s' % metric_name)
 
 
-def _get_stats_data(object measurement, object labels, object identifier) -> _observability.StatsData:
+def _get_stats_data(object measurement, object labels, object identifier,
+                    list aggregated_values=None) -> _observability.StatsData:
   """Convert a Python measurement to StatsData.
 
   Args:
@@ -239,29 +274,43 @@ def _get_stats_data(object measurement, object labels, object identifier) -> _ob
       value -> {value_double: float | value_int: int}
   labels: Labels assciociated with stats data with type of Mapping[str, AnyStr].
   identifier: Specifies the plugins associated with this stats data.
+  aggregated_values: Individual values if measurement is the sum of several
+    measurements sharing the same labels, or None.
   """
   measurement: Measurement
   labels: Mapping[str, AnyStr]
 
   metric_name = _cy_metric_name_to_py_metric_name(measurement['name'])
   identifiers = set(identifier.split(PLUGIN_IDENTIFIER_SEP))
+  if aggregated_values is None:
+    aggregated_values = []
   if measurement['type'] == kMeasurementDouble:
     py_stat = _observability.StatsData(name=metric_name, measure_double=True,
                                        value_float=measurement['value']['value_double'],
                                        labels=labels,
                                        identifiers=identifiers,
                                        registered_method=measurement['registered_method'],
-                                       include_exchange_labels=measurement['include_exchange_labels'],)
+                                       include_exchange_labels=measurement['include_exchange_labels'],
+                                       aggregated_values=aggregated_values,)
   else:
     py_stat = _observability.StatsData(name=metric_name, measure_double=False,
                                        value_int=measurement['value']['value_int'],
                                        labels=labels,
                                        identifiers=identifiers,
                                        registered_method=measurement['registered_method'],
-                                       include_exchange_labels=measurement['include_exchange_labels'],)
+                                       include_exchange_labels=measurement['include_exchange_labels'],
+                                       aggregated_values=aggregated_values,)
   return py_stat
 
 
+cdef list _c_values_to_values(MeasurementType measurement_type,
+                              vector[MeasurementValue]& c_values):
+  cdef size_t i
+  if measurement_type == kMeasurementDouble:
+    return [c_values[i].value_double for i in range(c_values.size())]
+  return [c_values[i].value_int for i in range(c_values.size())]
+
+
 def _get_tracing_data(SpanCensusData span_data, vector[Label] span_labels,
                       vector[Annotation] span_annotations) -> _observability.TracingData:
   py_span_labels = _c_label_to_labels(span_labels)
@@ -302,7 +351,7 @@ cdef void _export_census_data(object exporter):
   """Main function running in export thread."""
   exporter: _observability.Exporter
 
-  cdef int export_interval_ms = CENSUS_EXPORT_BATCH_INTERVAL_SECS * 1000
+  cdef int export_interval_ms = _export_interval_secs * 1000
   while True:
     with nogil:
       while not GLOBAL_SHUTDOWN_EXPORT_THREAD:
@@ -330,27 +379,30 @@ cdef void _export_census_data(object exporter):
 cdef void _flush_census_data(object exporter):
   exporter: _observability.Exporter
 
-  lk = new unique_lock[mutex](g_census_data_buffer_mutex)
-  if g_census_data_buffer.empty():
-    del lk
+  cdef vector[AggregatedCensusData] c_metrics
+  cdef vector[SpanCensusData] c_spans
+  cdef size_t i
+  # Group metrics sharing the same labels before crossing into Python, so the
+  # export cost scales with label cardinality rather than RPC volume.
+  with nogil:
+    DrainAndAggregateCensusData(&c_metrics, &c_spans)
+  if c_metrics.empty() and c_spans.empty():
     return
   py_metrics_batch = []
   py_spans_batch = []
-  while not g_census_data_buffer.empty():
-    c_census_data = g_census_data_buffer.front()
-    if c_census_data.type == kMetricData:
-      py_labels = _c_label_to_labels(c_census_data.labels)
-      py_identifier = _decode(c_census_data.identifier)
-      py_measurement = _c_measurement_to_measurement(c_census_data.measurement_data)
-      py_metric = _get_stats_data(py_measurement, py_labels, py_identifier)
-      py_metrics_batch.append(py_metric)
-    else:
-      py_span = _get_tracing_data(c_census_data.span_data, c_census_data.span_data.span_labels,
-                                  c_census_data.span_data.span_annotations)
-      py_spans_batch.append(py_span)
-    g_census_data_buffer.pop()
-
-  del lk
+  for i in range(c_metrics.size()):
+    py_labels = _c_label_to_labels(c_metrics[i].labels)
+    py_identifier = _decode(c_metrics[i].identifier)
+    py_measurement = _c_measurement_to_measurement(c_metrics[i].measurement_data)
+    py_values = _c_values_to_values(c_metrics[i].measurement_data.type,
+                                    c_metrics[i].values)
+    py_metric = _get_stats_data(py_measurement, py_labels, py_identifier, py_values)
+    py_metrics_batch.append(py_metric)
+  for i in range(c_spans.size()):
+    py_span = _get_tracing_data(c_spans[i], c_spans[i].span_labels,
+                                c_spans[i].span_annotations)
+    py_spans_batch.append(py_span)
+
   exporter.export_stats_data(py_metrics_batch)
   exporter.export_tracing_data(py_spans_batch)
 
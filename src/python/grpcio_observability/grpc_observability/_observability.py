@@ -60,6 +60,9 @@ class StatsData:
         belongs to.
       registered_method: Whether the method in this data is a registered method
         in stubs.
+      aggregated_values: If this StatsData merges several measurements sharing
+        the same name and labels, the individual measurement values; value_int
+        or value_float then holds their sum. Empty for a single measurement.
     """
 
     # type disabled reason: forward reference, circular import.
@@ -71,6 +74,7 @@ class StatsData:
     labels: Dict[str, Union[str, bytes]] = field(default_factory=dict)
     identifiers: Set[str] = field(default_factory=set)
     registered_method: bool = False
+    aggregated_values: List[Union[int, float]] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
@@ -113,6 +117,24 @@ class TracingData:
     span_annotations: List[Tuple[str, str]] = field(default_factory=list)
 
 
+@enum.unique
+class BufferOverflowPolicy(enum.Enum):
+    """What to do with new census data once the export buffer is full.
+
+    Values must match BufferOverflowPolicy in constants.h.
+
+    Attributes:
+      DROP_NEWEST: Discard the incoming data.
+      DROP_OLDEST: Discard the oldest buffered data to make room.
+      SAMPLE: Keep a uniform random sample of the data recorded since the
+        last export.
+    """
+
+    DROP_NEWEST = 0
+    DROP_OLDEST = 1
+    SAMPLE = 2
+
+
 @enum.unique
 class OptionalLabelType(enum.Enum):
     """What kinds of optional labels to add to metrics."""
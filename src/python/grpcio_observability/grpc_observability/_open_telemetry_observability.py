@@ -23,11 +23,14 @@ from grpc_observability import _observability
 from grpc_observability import _open_telemetry_measures
 from grpc_observability._cyobservability import MetricsName
 from grpc_observability._cyobservability import PLUGIN_IDENTIFIER_SEP
+from grpc_observability._observability import BufferOverflowPolicy
 from grpc_observability._observability import OptionalLabelType
 from grpc_observability._observability import StatsData
+from opentelemetry.metrics import CallbackOptions
 from opentelemetry.metrics import Counter
 from opentelemetry.metrics import Histogram
 from opentelemetry.metrics import Meter
+from opentelemetry.metrics import Observation
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,6 +48,8 @@ GRPC_METHOD_LABEL = "grpc.method"
 GRPC_TARGET_LABEL = "grpc.target"
 GRPC_CLIENT_METRIC_PREFIX = "grpc.client"
 GRPC_OTHER_LABEL_VALUE = "other"
+CENSUS_DROPPED_MEASUREMENTS_METRIC = "grpc.python.census.dropped_measurements"
+CENSUS_QUEUE_DEPTH_METRIC = "grpc.python.census.queue_depth"
 _observability_lock: threading.RLock = threading.RLock()
 _OPEN_TELEMETRY_OBSERVABILITY: Optional["OpenTelemetryObservability"] = None
 
@@ -90,6 +95,8 @@ class _OpenTelemetryPlugin:
             self._metric_to_recorder = self._register_metrics(
                 meter, enabled_metrics
             )
+            if self._plugin.enable_export_buffer_metrics:
+                self._register_census_buffer_metrics(meter)
 
     def _should_record(self, stats_data: StatsData) -> bool:
         # Decide if this plugin should record the stats_data.
@@ -138,7 +145,9 @@ class _OpenTelemetryPlugin:
         if isinstance(recorder, Counter):
             recorder.add(value, attributes=decoded_labels)
         elif isinstance(recorder, Histogram):
-            recorder.record(value, attributes=decoded_labels)
+            # Histograms need every sample, counters only need the sum.
+            for sample in stats_data.aggregated_values or (value,):
+                recorder.record(sample, attributes=decoded_labels)
 
     def maybe_record_stats_data(self, stats_data: StatsData) -> None:
         # Records stats data to MeterProvider.
@@ -278,6 +287,33 @@ class _OpenTelemetryPlugin:
             metric_to_recorder_map[metric.cyname] = recorder
         return metric_to_recorder_map
 
+    @staticmethod
+    def _register_census_buffer_metrics(meter: Meter) -> None:
+        def _observe_dropped(
+            _options: CallbackOptions,
+        ) -> Iterable[Observation]:
+            dropped, _ = _cyobservability.census_buffer_stats()
+            yield Observation(dropped)
+
+        def _observe_queue_depth(
+            _options: CallbackOptions,
+        ) -> Iterable[Observation]:
+            _, queue_depth = _cyobservability.census_buffer_stats()
+            yield Observation(queue_depth)
+
+        meter.create_observable_counter(
+            name=CENSUS_DROPPED_MEASUREMENTS_METRIC,
+            callbacks=[_observe_dropped],
+            unit="{measurement}",
+            description="Number of measurements dropped because the export buffer was full",
+        )
+        meter.create_observable_gauge(
+            name=CENSUS_QUEUE_DEPTH_METRIC,
+            callbacks=[_observe_queue_depth],
+            unit="{measurement}",
+            description="Number of measurements waiting to be exported",
+        )
+
     @staticmethod
     def _to_str(item: Union[str, AnyStr]) -> str:
         if isinstance(item, bytes):
@@ -295,9 +331,17 @@ class _OpenTelemetryPlugin:
 def start_open_telemetry_observability(
     *,
     plugins: Iterable[_OpenTelemetryPlugin],
+    export_interval: Optional[float] = None,
+    max_export_buffer_size: Optional[int] = None,
+    export_buffer_overflow_policy: Optional[BufferOverflowPolicy] = None,
 ) -> None:
     _start_open_telemetry_observability(
-        OpenTelemetryObservability(plugins=plugins)
+        OpenTelemetryObservability(
+            plugins=plugins,
+            export_interval=export_interval,
+            max_export_buffer_size=max_export_buffer_size,
+            export_buffer_overflow_policy=export_buffer_overflow_policy,
+        )
     )
 
 
@@ -333,6 +377,12 @@ class OpenTelemetryObservability(grpc._observability.ObservabilityPlugin):
 
     Args:
       plugins: _OpenTelemetryPlugins to enable.
+      export_interval: The maximum time in seconds between two exports, or None
+        for the default.
+      max_export_buffer_size: The maximum number of buffered measurements, or
+        None for the default.
+      export_buffer_overflow_policy: The BufferOverflowPolicy applied once the
+        buffer is full, or None for the default.
     """
 
     _exporter: "grpc_observability.Exporter"
@@ -340,12 +390,25 @@ class OpenTelemetryObservability(grpc._observability.ObservabilityPlugin):
     _registered_methods: Set[bytes]
     _client_option_activated: bool
     _server_option_activated: bool
+    _export_interval: Optional[float]
+    _max_export_buffer_size: Optional[int]
+    _export_buffer_overflow_policy: Optional[BufferOverflowPolicy]
 
     def __init__(
         self,
         *,
         plugins: Iterable[_OpenTelemetryPlugin],
+        export_interval: Optional[float] = None,
+        max_export_buffer_size: Optional[int] = None,
+        export_buffer_overflow_policy: Optional[BufferOverflowPolicy] = None,
     ):
+        if export_interval is not None and export_interval <= 0:
+            raise ValueError("export_interval must be positive")
+        if max_export_buffer_size is not None and max_export_buffer_size <= 0:
+            raise ValueError("max_export_buffer_size must be positive")
+        self._export_interval = export_interval
+        self._max_export_buffer_size = max_export_buffer_size
+        self._export_buffer_overflow_policy = export_buffer_overflow_policy
         self._exporter = _OpenTelemetryExporterDelegator(plugins)
         self._registered_methods = set()
         self._plugins = list(plugins)
@@ -361,7 +424,12 @@ class OpenTelemetryObservability(grpc._observability.ObservabilityPlugin):
             raise ValueError(error_msg)
 
         try:
-            _cyobservability.cyobservability_init(self._exporter)
+            _cyobservability.cyobservability_init(
+                self._exporter,
+                export_interval_secs=self._export_interval,
+                max_export_buffer_size=self._max_export_buffer_size,
+                buffer_overflow_policy=self._export_buffer_overflow_policy,
+            )
         # TODO(xuanwn): Use specific exceptions
         except Exception as e:  # pylint: disable=broad-except
             _LOGGER.exception("Initiate observability failed with: %s", e)
@@ -373,11 +441,11 @@ class OpenTelemetryObservability(grpc._observability.ObservabilityPlugin):
         # immediately after exit, it's possible that core didn't call RecordEnd
         # in callTracer, and all data recorded by calling RecordEnd will be
         # lost.
-        # CENSUS_EXPORT_BATCH_INTERVAL_SECS: The time equals to the time in
+        # export_interval_secs: The time equals to the time in
         # AwaitNextBatchLocked.
         # TODO(xuanwn): explicit synchronization
         # https://github.com/grpc/grpc/issues/33262
-        time.sleep(_cyobservability.CENSUS_EXPORT_BATCH_INTERVAL_SECS)
+        time.sleep(_cyobservability.export_interval_secs())
         self.set_tracing(False)
         self.set_stats(False)
         _cyobservability.observability_deinit()
@@ -15,6 +15,7 @@
 from typing import AnyStr, Callable, Dict, Iterable, List, Optional
 
 from grpc_observability import _open_telemetry_observability
+from grpc_observability._observability import BufferOverflowPolicy
 from grpc_observability._observability import OptionalLabelType
 from opentelemetry.metrics import MeterProvider
 
@@ -94,6 +95,10 @@ class OpenTelemetryPlugin:
     meter_provider: Optional[MeterProvider]
     target_attribute_filter: Callable[[str], bool]
     generic_method_attribute_filter: Callable[[str], bool]
+    export_interval: Optional[float]
+    max_export_buffer_size: Optional[int]
+    export_buffer_overflow_policy: Optional[BufferOverflowPolicy]
+    enable_export_buffer_metrics: bool
     _plugins: List[_open_telemetry_observability._OpenTelemetryPlugin]
 
     def __init__(
@@ -103,6 +108,10 @@ class OpenTelemetryPlugin:
         meter_provider: Optional[MeterProvider] = None,
         target_attribute_filter: Optional[Callable[[str], bool]] = None,
         generic_method_attribute_filter: Optional[Callable[[str], bool]] = None,
+        export_interval: Optional[float] = None,
+        max_export_buffer_size: Optional[int] = None,
+        export_buffer_overflow_policy: Optional[BufferOverflowPolicy] = None,
+        enable_export_buffer_metrics: bool = False,
     ):
         """
         Args:
@@ -125,6 +134,17 @@ class OpenTelemetryPlugin:
         this function returns.
         Return True means the original method name will be used, False means method name will
         be replaced with "other".
+          export_interval: The maximum time in seconds recorded data is buffered before
+        being handed to the MeterProvider, or None to use the default of 0.5 seconds
+        (overridable with GRPC_PYTHON_CENSUS_EXPORT_BATCH_INTERVAL_SECS).
+          max_export_buffer_size: The maximum number of measurements buffered between
+        two exports, or None to use the default of 10000 (overridable with
+        GRPC_PYTHON_CENSUS_MAX_EXPORT_BUFFER_SIZE).
+          export_buffer_overflow_policy: A BufferOverflowPolicy deciding which
+        measurements are dropped once the buffer is full, or None for DROP_NEWEST.
+          enable_export_buffer_metrics: Whether to export the number of dropped
+        measurements and the buffer depth as grpc.python.census.dropped_measurements
+        and grpc.python.census.queue_depth through meter_provider.
         """
         self.plugin_options = plugin_options or []
         self.meter_provider = meter_provider
@@ -134,6 +154,10 @@ class OpenTelemetryPlugin:
         self.generic_method_attribute_filter = (
             generic_method_attribute_filter or (lambda _target: False)
         )
+        self.export_interval = export_interval
+        self.max_export_buffer_size = max_export_buffer_size
+        self.export_buffer_overflow_policy = export_buffer_overflow_policy
+        self.enable_export_buffer_metrics = enable_export_buffer_metrics
         self._plugins = [
             _open_telemetry_observability._OpenTelemetryPlugin(self)
         ]
@@ -146,7 +170,10 @@ class OpenTelemetryPlugin:
             RuntimeError: If a global plugin was already registered.
         """
         _open_telemetry_observability.start_open_telemetry_observability(
-            plugins=self._plugins
+            plugins=self._plugins,
+            export_interval=self.export_interval,
+            max_export_buffer_size=self.max_export_buffer_size,
+            export_buffer_overflow_policy=self.export_buffer_overflow_policy,
         )
 
     def deregister_global(self) -> None:
@@ -160,7 +187,10 @@ class OpenTelemetryPlugin:
 
     def __enter__(self) -> None:
         _open_telemetry_observability.start_open_telemetry_observability(
-            plugins=self._plugins
+            plugins=self._plugins,
+            export_interval=self.export_interval,
+            max_export_buffer_size=self.max_export_buffer_size,
+            export_buffer_overflow_policy=self.export_buffer_overflow_policy,
         )
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -32,6 +32,17 @@ typedef enum { kMeasurementDouble = 0, kMeasurementInt } MeasurementType;
 
 typedef enum { kSpanData = 0, kMetricData } DataType;
 
+// What to do with new census data once the export buffer is full.
+typedef enum {
+  // Discard the incoming entry.
+  kDropNewest = 0,
+  // Discard the oldest buffered entry to make room for the incoming one.
+  kDropOldest,
+  // Keep a uniform random sample of all entries recorded since the last
+  // export.
+  kSample
+} BufferOverflowPolicy;
+
 typedef enum {
   kRpcClientApiLatencyMeasureName = 0,
   kRpcClientSentMessagesPerRpcMeasureName,
@@ -17,19 +17,22 @@
 #include <chrono>
 #include <cstdlib>
 #include <map>
+#include <random>
 #include <string>
 
 #include "client_call_tracer.h"
 #include "constants.h"
 #include "python_observability_context.h"
 #include "server_call_tracer.h"
+#include "absl/container/flat_hash_map.h"
 #include "absl/status/statusor.h"
+#include "absl/strings/str_cat.h"
 #include "absl/strings/string_view.h"
 #include "absl/types/optional.h"
 
 namespace grpc_observability {
 
-std::queue<CensusData>* g_census_data_buffer;
+std::deque<CensusData>* g_census_data_buffer;
 std::mutex g_census_data_buffer_mutex;
 std::condition_variable g_census_data_buffer_cv;
 // TODO(xuanwn): Change below to a more appropriate number.
@@ -56,6 +59,70 @@ int GetMaxExportBufferSize() {
   return kMaxExportBufferSize;
 }
 
+// Guarded by g_census_data_buffer_mutex.
+int g_max_export_buffer_size = kMaxExportBufferSize;
+float g_export_threshold = kExportThreshold;
+BufferOverflowPolicy g_buffer_overflow_policy = kDropNewest;
+int64_t g_dropped_census_data = 0;
+// Number of entries recorded since the buffer was last drained, used by
+// kSample.
+int64_t g_census_data_seen_in_batch = 0;
+
+// Adds |data| to a full buffer according to g_buffer_overflow_policy.
+// Requires g_census_data_buffer_mutex to be held.
+void AddCensusDataToFullBufferLocked(const CensusData& data) {
+  ++g_dropped_census_data;
+  switch (g_buffer_overflow_policy) {
+    case kDropOldest:
+      g_census_data_buffer->pop_front();
+      g_census_data_buffer->push_back(data);
+      break;
+    case kSample: {
+      // Reservoir sampling: every entry recorded in this batch has the same
+      // probability of being exported.
+      static thread_local std::minstd_rand generator(std::random_device{}());
+      std::uniform_int_distribution<int64_t> distribution(
+          0, g_census_data_seen_in_batch - 1);
+      int64_t slot = distribution(generator);
+      if (slot < static_cast<int64_t>(g_census_data_buffer->size())) {
+        (*g_census_data_buffer)[slot] = data;
+      }
+      break;
+    }
+    case kDropNewest:
+    default:
+      VLOG(2) << "Reached maximum census data buffer size, discarding this "
+                 "CensusData entry";
+      break;
+  }
+}
+
+// Builds a key which uniquely identifies the metric name, measurement
+// attributes, identifier and labels of |data|. Every variable length field is
+// prefixed by its size so different label sets never produce the same key.
+std::string AggregationKey(const CensusData& data) {
+  const Measurement& measurement = data.measurement_data;
+  std::string key = absl::StrCat(
+      static_cast<int>(measurement.name), ",",
+      static_cast<int>(measurement.type), ",", measurement.registered_method,
+      ",", measurement.include_exchange_labels, ",", data.identifier.size(),
+      ":", data.identifier);
+  for (const auto& label : data.labels) {
+    absl::StrAppend(&key, ",", label.key.size(), ":", label.key,
+                    label.value.size(), ":", label.value);
+  }
+  return key;
+}
+
+void AddMeasurementValue(MeasurementType type, const MeasurementValue& value,
+                         MeasurementValue* sum) {
+  if (type == kMeasurementDouble) {
+    sum->value_double += value.value_double;
+  } else {
+    sum->value_int += value.value_int;
+  }
+}
+
 }  // namespace
 
 void RecordIntMetric(MetricsName name, int64_t value,
@@ -94,7 +161,15 @@ void RecordSpan(const SpanCensusData& span_census_data) {
 }
 
 void NativeObservabilityInit() {
-  g_census_data_buffer = new std::queue<CensusData>;
+  {
+    std::unique_lock<std::mutex> lk(g_census_data_buffer_mutex);
+    g_max_export_buffer_size = GetMaxExportBufferSize();
+    g_export_threshold = GetExportThreadHold();
+    g_buffer_overflow_policy = kDropNewest;
+    g_dropped_census_data = 0;
+    g_census_data_seen_in_batch = 0;
+  }
+  g_census_data_buffer = new std::deque<CensusData>;
   // Forces linking of instrument library
   grpc_core::CreateCollectionScope({}, {});
 }
@@ -124,20 +199,72 @@ void AwaitNextBatchLocked(std::unique_lock<std::mutex>& lock, int timeout_ms) {
       lock, now + std::chrono::milliseconds(timeout_ms));
 }
 
+void SetCensusBufferConfig(int max_buffer_size, BufferOverflowPolicy policy) {
+  std::unique_lock<std::mutex> lk(g_census_data_buffer_mutex);
+  if (max_buffer_size > 0) {
+    g_max_export_buffer_size = max_buffer_size;
+  }
+  g_buffer_overflow_policy = policy;
+}
+
+CensusBufferStats GetCensusBufferStats() {
+  std::unique_lock<std::mutex> lk(g_census_data_buffer_mutex);
+  CensusBufferStats stats;
+  stats.dropped = g_dropped_census_data;
+  stats.queue_depth =
+      g_census_data_buffer == nullptr ? 0 : g_census_data_buffer->size();
+  return stats;
+}
+
 void AddCensusDataToBuffer(const CensusData& data) {
   std::unique_lock<std::mutex> lk(g_census_data_buffer_mutex);
-  if (g_census_data_buffer->size() >= GetMaxExportBufferSize()) {
-    VLOG(2) << "Reached maximum census data buffer size, discarding this "
-               "CensusData entry";
+  ++g_census_data_seen_in_batch;
+  if (g_census_data_buffer->size() >= g_max_export_buffer_size) {
+    AddCensusDataToFullBufferLocked(data);
   } else {
-    g_census_data_buffer->push(data);
+    g_census_data_buffer->push_back(data);
   }
   if (g_census_data_buffer->size() >=
-      (GetExportThreadHold() * GetMaxExportBufferSize())) {
+      (g_export_threshold * g_max_export_buffer_size)) {
     g_census_data_buffer_cv.notify_all();
   }
 }
 
+void DrainAndAggregateCensusData(std::vector<AggregatedCensusData>* metrics,
+                                 std::vector<SpanCensusData>* spans) {
+  std::deque<CensusData> pending;
+  {
+    std::unique_lock<std::mutex> lk(g_census_data_buffer_mutex);
+    std::swap(pending, *g_census_data_buffer);
+    g_census_data_seen_in_batch = 0;
+  }
+  absl::flat_hash_map<std::string, size_t> group_index;
+  while (!pending.empty()) {
+    CensusData& data = pending.front();
+    if (data.type == kMetricData) {
+      const MeasurementValue value = data.measurement_data.value;
+      auto inserted =
+          group_index.emplace(AggregationKey(data), metrics->size());
+      if (inserted.second) {
+        AggregatedCensusData aggregated;
+        aggregated.measurement_data = data.measurement_data;
+        aggregated.labels = std::move(data.labels);
+        aggregated.identifier = std::move(data.identifier);
+        aggregated.values.push_back(value);
+        metrics->push_back(std::move(aggregated));
+      } else {
+        AggregatedCensusData& aggregated = (*metrics)[inserted.first->second];
+        AddMeasurementValue(aggregated.measurement_data.type, value,
+                            &aggregated.measurement_data.value);
+        aggregated.values.push_back(value);
+      }
+    } else {
+      spans->push_back(std::move(data.span_data));
+    }
+    pending.pop_front();
+  }
+}
+
 absl::string_view StatusCodeToString(grpc_status_code code) {
   switch (code) {
     case GRPC_STATUS_OK:
@@ -20,8 +20,8 @@
 
 #include <algorithm>
 #include <condition_variable>
+#include <deque>
 #include <mutex>
-#include <queue>
 #include <string>
 #include <utility>
 #include <vector>
@@ -49,8 +49,27 @@ struct CensusData {
   CensusData(const SpanCensusData& sd) : type(kSpanData), span_data(sd) {}
 };
 
+// Metric data sharing the same metric name, identifier and labels, merged
+// together so that label processing in Python happens once per group.
+struct AggregatedCensusData {
+  // The value field holds the sum of all values in the group.
+  Measurement measurement_data;
+  std::vector<Label> labels;
+  std::string identifier;
+  // Individual values in the group, in the order they were recorded.
+  std::vector<MeasurementValue> values;
+};
+
+// Counters describing the state of the census data buffer.
+struct CensusBufferStats {
+  // Total number of entries discarded because the buffer was full.
+  int64_t dropped;
+  // Number of entries currently waiting to be exported.
+  int64_t queue_depth;
+};
+
 // extern is required for Cython
-extern std::queue<CensusData>* g_census_data_buffer;
+extern std::deque<CensusData>* g_census_data_buffer;
 extern std::mutex g_census_data_buffer_mutex;
 extern std::condition_variable g_census_data_buffer_cv;
 
@@ -66,10 +85,22 @@ void* CreateServerCallTracerFactory(const std::vector<Label> exchange_labels,
 
 void NativeObservabilityInit();
 
+// Overrides the maximum buffer size and overflow policy. Non-positive
+// |max_buffer_size| keeps the size configured through the environment.
+void SetCensusBufferConfig(int max_buffer_size, BufferOverflowPolicy policy);
+
+CensusBufferStats GetCensusBufferStats();
+
 void AwaitNextBatchLocked(std::unique_lock<std::mutex>& lock, int timeout_ms);
 
 void AddCensusDataToBuffer(const CensusData& buffer);
 
+// Drains g_census_data_buffer, grouping metric data by metric name,
+// identifier and labels into |metrics| and moving span data into |spans|.
+// The buffer lock is only held while the buffer is swapped out.
+void DrainAndAggregateCensusData(std::vector<AggregatedCensusData>* metrics,
+                                 std::vector<SpanCensusData>* spans);
+
 void RecordIntMetric(MetricsName name, int64_t value,
                      const std::vector<Label>& labels, std::string identifier,
                      const bool registered_method,
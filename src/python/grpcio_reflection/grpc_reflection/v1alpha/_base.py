@@ -40,26 +40,68 @@ def _collect_transitive_dependencies(descriptor, seen_files):
             _collect_transitive_dependencies(dependency, seen_files)
 
 
-def _file_descriptor_response(descriptor, original_request):
-    # collect all dependencies
-    descriptors = {}
-    _collect_transitive_dependencies(descriptor, descriptors)
-
-    # serialize all descriptors
-    serialized_proto_list = []
-    for d_value in descriptors.values():
-        proto = descriptor_pb2.FileDescriptorProto()
-        d_value.CopyToProto(proto)
-        serialized_proto_list.append(proto.SerializeToString())
+def _serialize_file_descriptor(descriptor):
+    proto = descriptor_pb2.FileDescriptorProto()
+    descriptor.CopyToProto(proto)
+    return proto.SerializeToString()
 
+
+def _file_descriptor_response(serialized_proto_list, original_request):
     return _reflection_pb2.ServerReflectionResponse(
         file_descriptor_response=_reflection_pb2.FileDescriptorResponse(
-            file_descriptor_proto=(serialized_proto_list)
+            file_descriptor_proto=serialized_proto_list
         ),
         original_request=original_request,
     )
 
 
+class _SerializedDescriptorCache:
+    """Serialized transitive closures of the files of a DescriptorPool.
+
+    Descriptor pools only ever grow and a file added to one never changes, so
+    entries only need to be dropped when the servicer switches pools. Lookups
+    that fail are not cached, as the file or symbol may be added later.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        # Serialized FileDescriptorProto by file name.
+        self._files = {}
+        # Tuple of serialized FileDescriptorProtos by file name, the file's
+        # own first and then its transitive dependencies.
+        self._closures = {}
+        # Same as _closures, by the fully-qualified name of a symbol.
+        self._symbol_closures = {}
+
+    def _serialized_file(self, descriptor):
+        serialized = self._files.get(descriptor.name)
+        if serialized is None:
+            serialized = _serialize_file_descriptor(descriptor)
+            self._files[descriptor.name] = serialized
+        return serialized
+
+    def closure(self, descriptor):
+        closure = self._closures.get(descriptor.name)
+        if closure is None:
+            descriptors = {}
+            _collect_transitive_dependencies(descriptor, descriptors)
+            closure = tuple(
+                self._serialized_file(dependency)
+                for dependency in descriptors.values()
+            )
+            self._closures[descriptor.name] = closure
+        return closure
+
+    def symbol_closure(self, fully_qualified_name):
+        closure = self._symbol_closures.get(fully_qualified_name)
+        if closure is None:
+            closure = self.closure(
+                self.pool.FindFileContainingSymbol(fully_qualified_name)
+            )
+            self._symbol_closures[fully_qualified_name] = closure
+        return closure
+
+
 class BaseReflectionServicer(_reflection_pb2_grpc.ServerReflectionServicer):
     """Base class for reflection servicer."""
 
@@ -72,24 +114,31 @@ class BaseReflectionServicer(_reflection_pb2_grpc.ServerReflectionServicer):
         """
         self._service_names = tuple(sorted(service_names))
         self._pool = _POOL if pool is None else pool
+        self._descriptor_cache = _SerializedDescriptorCache(self._pool)
+
+    def _cache(self):
+        cache = self._descriptor_cache
+        if cache.pool is not self._pool:
+            cache = _SerializedDescriptorCache(self._pool)
+            self._descriptor_cache = cache
+        return cache
 
     def _file_by_filename(self, request, filename):
+        cache = self._cache()
         try:
             descriptor = self._pool.FindFileByName(filename)
         except KeyError:
             return _not_found_error(request)
         else:
-            return _file_descriptor_response(descriptor, request)
+            return _file_descriptor_response(cache.closure(descriptor), request)
 
     def _file_containing_symbol(self, request, fully_qualified_name):
         try:
-            descriptor = self._pool.FindFileContainingSymbol(
-                fully_qualified_name
-            )
+            closure = self._cache().symbol_closure(fully_qualified_name)
         except KeyError:
             return _not_found_error(request)
         else:
-            return _file_descriptor_response(descriptor, request)
+            return _file_descriptor_response(closure, request)
 
     def _file_containing_extension(
         self, request, containing_type, extension_number
@@ -101,13 +150,13 @@ class BaseReflectionServicer(_reflection_pb2_grpc.ServerReflectionServicer):
             extension_descriptor = self._pool.FindExtensionByNumber(
                 message_descriptor, extension_number
             )
-            descriptor = self._pool.FindFileContainingSymbol(
+            closure = self._cache().symbol_closure(
                 extension_descriptor.full_name
             )
         except KeyError:
             return _not_found_error(request)
         else:
-            return _file_descriptor_response(descriptor, request)
+            return _file_descriptor_response(closure, request)
 
     def _all_extension_numbers_of_type(self, request, containing_type):
         try:
@@ -17,11 +17,17 @@ For usage instructions, see the Python Reflection documentation at
 ``doc/python/server_reflection.md``.
 """
 
+import hashlib
 import logging
-from typing import Any, Dict, Iterable, List, Set
+import os
+import queue
+import tempfile
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
 
 from google.protobuf.descriptor_database import DescriptorDatabase
 from google.protobuf.descriptor_pb2 import FileDescriptorProto
+from google.protobuf.descriptor_pb2 import FileDescriptorSet
+from google.protobuf.message import DecodeError
 import grpc
 from grpc_reflection.v1alpha.reflection_pb2 import ExtensionNumberResponse
 from grpc_reflection.v1alpha.reflection_pb2 import ExtensionRequest
@@ -32,6 +38,39 @@ from grpc_reflection.v1alpha.reflection_pb2 import ServerReflectionResponse
 from grpc_reflection.v1alpha.reflection_pb2 import ServiceResponse
 from grpc_reflection.v1alpha.reflection_pb2_grpc import ServerReflectionStub
 
+_DESCRIPTOR_SET_CACHE_SUFFIX = ".binpb"
+
+
+class _ReflectionStream:
+    """A single ServerReflectionInfo stream carrying pipelined requests."""
+
+    def __init__(self, stub: ServerReflectionStub):
+        self._requests = queue.SimpleQueue()
+        self._responses = stub.ServerReflectionInfo(
+            iter(self._requests.get, None)
+        )
+
+    def exchange(
+        self, requests: Sequence[ServerReflectionRequest]
+    ) -> List[ServerReflectionResponse]:
+        """Sends all of requests before returning their responses in order."""
+        for request in requests:
+            self._requests.put(request)
+        return [next(self._responses) for _ in requests]
+
+    def close(self) -> None:
+        """Half-closes the stream and drains its remaining responses.
+
+        A failure of the stream is left to exchange to report: close runs
+        while the error it raised may still be propagating.
+        """
+        self._requests.put(None)
+        try:
+            for _ in self._responses:
+                pass
+        except grpc.RpcError:
+            pass
+
 
 class ProtoReflectionDescriptorDatabase(DescriptorDatabase):
     """
@@ -43,6 +82,16 @@ class ProtoReflectionDescriptorDatabase(DescriptorDatabase):
     information. It implements the DescriptorDatabase interface.
 
     It is typically used to feed a DescriptorPool instance.
+
+    By default descriptors are requested from the server one file at a time,
+    as the DescriptorPool asks for them. With prefetch, the descriptors of
+    every service of the server and all of their dependencies are instead
+    loaded up front, over a single stream with the requests of each round of
+    dependencies pipelined. Given a cache_dir, prefetched descriptors are
+    also saved to and later loaded from a FileDescriptorSet in that
+    directory keyed by server_identity, so that later instances need no
+    round trip for them at all. The cache is never refreshed; remove its
+    file, or change server_identity, when the server's services change.
     """
 
     # Implementation based on C++ version found here (version tag 1.39.1):
@@ -50,12 +99,137 @@ class ProtoReflectionDescriptorDatabase(DescriptorDatabase):
     # while implementing the Python interface given here:
     #   https://googleapis.dev/python/protobuf/3.17.0/google/protobuf/descriptor_database.html
 
-    def __init__(self, channel: grpc.Channel):
+    def __init__(
+        self,
+        channel: grpc.Channel,
+        *,
+        prefetch: bool = False,
+        cache_dir: Optional[str] = None,
+        server_identity: Optional[str] = None,
+    ):
+        """
+        Args:
+            channel: A channel to a server with the Reflection service.
+            prefetch: Whether to load all the server's descriptors right away,
+                as with the prefetch method.
+            cache_dir: An optional directory in which to persist prefetched
+                descriptors.
+            server_identity: A string identifying the server, such as its
+                target, under which to persist its descriptors. Required if
+                and only if cache_dir is given.
+        """
         DescriptorDatabase.__init__(self)
+        if (cache_dir is None) != (server_identity is None):
+            raise ValueError(
+                "cache_dir and server_identity must be given together."
+            )
         self._logger = logging.getLogger(__name__)
         self._stub = ServerReflectionStub(channel)
         self._known_files: Set[str] = set()
+        self._file_protos: Dict[str, FileDescriptorProto] = {}
         self._cached_extension_numbers: Dict[str, List[int]] = {}
+        self._cache_path = None
+        if cache_dir is not None:
+            self._cache_path = os.path.join(
+                cache_dir,
+                hashlib.sha256(server_identity.encode()).hexdigest()
+                + _DESCRIPTOR_SET_CACHE_SUFFIX,
+            )
+        if prefetch:
+            self.prefetch()
+
+    def prefetch(self) -> None:
+        """
+        Load the descriptors of all the services of the server.
+
+        The descriptors come from the persisted cache if there is one.
+        Otherwise the services are listed, the files containing them are
+        requested all at once, and any of their dependencies missing from
+        the responses are requested in further rounds on the same stream.
+        Services that cannot be found are skipped.
+        """
+        if self._load_cache():
+            return
+        stream = _ReflectionStream(self._stub)
+        try:
+            (response,) = stream.exchange(
+                [ServerReflectionRequest(list_services="")]
+            )
+            requests = [
+                ServerReflectionRequest(file_containing_symbol=service.name)
+                for service in response.list_services_response.service
+            ]
+            unavailable_files = set()
+            while requests:
+                responses = stream.exchange(requests)
+                for request, response in zip(requests, responses):
+                    if (
+                        response.WhichOneof("message_response")
+                        == "error_response"
+                    ):
+                        self._logger.warning(
+                            "Failed to prefetch descriptors for %s: %s",
+                            request,
+                            response.error_response.error_message,
+                        )
+                        if request.HasField("file_by_filename"):
+                            unavailable_files.add(request.file_by_filename)
+                    else:
+                        self._add_file_from_response(
+                            response.file_descriptor_response
+                        )
+                requests = [
+                    ServerReflectionRequest(file_by_filename=name)
+                    for name in self._missing_dependencies()
+                    if name not in unavailable_files
+                ]
+        finally:
+            stream.close()
+        self._store_cache()
+
+    def _missing_dependencies(self) -> List[str]:
+        return sorted(
+            {
+                dependency
+                for proto in self._file_protos.values()
+                for dependency in proto.dependency
+                if dependency not in self._known_files
+            }
+        )
+
+    def _load_cache(self) -> bool:
+        if self._cache_path is None:
+            return False
+        try:
+            with open(self._cache_path, "rb") as cache_file:
+                descriptor_set = FileDescriptorSet.FromString(cache_file.read())
+        except FileNotFoundError:
+            return False
+        except DecodeError:
+            self._logger.warning(
+                "Ignoring corrupt descriptor cache %s.", self._cache_path
+            )
+            return False
+        for proto in descriptor_set.file:
+            self._add_file(proto)
+        return True
+
+    def _store_cache(self) -> None:
+        if self._cache_path is None:
+            return
+        descriptor_set = FileDescriptorSet(file=self._file_protos.values())
+        cache_dir = os.path.dirname(self._cache_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Written aside and then renamed so that concurrent readers never
+        # observe a partial descriptor set.
+        descriptor, temporary_path = tempfile.mkstemp(dir=cache_dir)
+        try:
+            with os.fdopen(descriptor, "wb") as cache_file:
+                cache_file.write(descriptor_set.SerializeToString())
+            os.replace(temporary_path, self._cache_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
 
     def get_services(self) -> Iterable[str]:
         """
@@ -219,9 +393,11 @@ class ProtoReflectionDescriptorDatabase(DescriptorDatabase):
         for proto in protos:
             desc = FileDescriptorProto()
             desc.ParseFromString(proto)
-            if desc.name not in self._known_files:
-                self._logger.info(
-                    "Loading descriptors from file: %s", desc.name
-                )
-                self._known_files.add(desc.name)
-                self.Add(desc)
+            self._add_file(desc)
+
+    def _add_file(self, desc: FileDescriptorProto) -> None:
+        if desc.name not in self._known_files:
+            self._logger.info("Loading descriptors from file: %s", desc.name)
+            self._known_files.add(desc.name)
+            self._file_protos[desc.name] = desc
+            self.Add(desc)
@@ -53,7 +53,9 @@ class ServicerContext(grpc.ServicerContext):
     def auth_context(self):
         raise NotImplementedError()
 
-    def set_compression(self):
+    def set_compression(
+        self, compression, *, min_message_size=None, offload_message_size=None
+    ):
         raise NotImplementedError()
 
     def send_initial_metadata(self, initial_metadata):
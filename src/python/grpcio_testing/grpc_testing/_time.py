@@ -14,6 +14,8 @@
 """Test times."""
 
 import collections
+import heapq
+import itertools
 import logging
 import threading
 import time as _time
@@ -41,10 +43,60 @@ def _call_in_thread(behaviors):
     calling.join()
 
 
+class _Timer:
+    """A behavior scheduled to be called at a particular time."""
+
+    __slots__ = ("time", "behavior", "cancelled", "called")
+
+    def __init__(self, time, behavior):
+        self.time = time
+        self.behavior = behavior
+        self.cancelled = False
+        self.called = False
+
+
 class _State:
+    """Timers ordered in a binary heap.
+
+    Cancelled timers are left in the heap and skipped when they reach its
+    top; the heap is rebuilt without them once they make up more than half
+    of its entries so that memory stays proportional to live timers.
+    """
+
     def __init__(self):
         self.condition = threading.Condition()
-        self.times_to_behaviors = collections.defaultdict(list)
+        self._heap = []
+        self._sequence = itertools.count()
+        self._cancelled_count = 0
+
+    def schedule(self, behavior, time):
+        timer = _Timer(time, behavior)
+        heapq.heappush(self._heap, (time, next(self._sequence), timer))
+        return timer
+
+    def cancel(self, timer):
+        timer.cancelled = True
+        self._cancelled_count += 1
+        if self._cancelled_count * 2 > len(self._heap):
+            self._heap = [
+                entry for entry in self._heap if not entry[2].cancelled
+            ]
+            heapq.heapify(self._heap)
+            self._cancelled_count = 0
+
+    def earliest_time(self):
+        while self._heap:
+            time, unused_sequence, timer = self._heap[0]
+            if not timer.cancelled:
+                return time
+            heapq.heappop(self._heap)
+            self._cancelled_count -= 1
+        return None
+
+    def pop_earliest(self):
+        unused_time, unused_sequence, timer = heapq.heappop(self._heap)
+        timer.called = True
+        return timer
 
 
 class _Delta(
@@ -63,49 +115,34 @@ class _Delta(
 def _process(state, now):
     mature_behaviors = []
     earliest_mature_time = None
-    while state.times_to_behaviors:
-        earliest_time = min(state.times_to_behaviors)
-        if earliest_time <= now:
-            if earliest_mature_time is None:
-                earliest_mature_time = earliest_time
-            earliest_mature_behaviors = state.times_to_behaviors.pop(
-                earliest_time
-            )
-            mature_behaviors.extend(earliest_mature_behaviors)
-        else:
-            earliest_immature_time = earliest_time
+    while True:
+        earliest_time = state.earliest_time()
+        if earliest_time is None or now < earliest_time:
             break
-    else:
-        earliest_immature_time = None
-    return _Delta(
-        mature_behaviors, earliest_mature_time, earliest_immature_time
-    )
+        if earliest_mature_time is None:
+            earliest_mature_time = earliest_time
+        mature_behaviors.append(state.pop_earliest().behavior)
+    return _Delta(mature_behaviors, earliest_mature_time, earliest_time)
 
 
 class _Future(grpc.Future):
-    def __init__(self, state, behavior, time):
+    def __init__(self, state, timer):
         self._state = state
-        self._behavior = behavior
-        self._time = time
-        self._cancelled = False
+        self._timer = timer
 
     def cancel(self):
         with self._state.condition:
-            if self._cancelled:
+            if self._timer.cancelled:
                 return True
-            behaviors_at_time = self._state.times_to_behaviors.get(self._time)
-            if behaviors_at_time is None:
+            if self._timer.called:
                 return False
-            behaviors_at_time.remove(self._behavior)
-            if not behaviors_at_time:
-                self._state.times_to_behaviors.pop(self._time)
-                self._state.condition.notify_all()
-            self._cancelled = True
+            self._state.cancel(self._timer)
+            self._state.condition.notify_all()
             return True
 
     def cancelled(self):
         with self._state.condition:
-            return self._cancelled
+            return self._timer.cancelled
 
     def running(self):
         raise NotImplementedError()
@@ -153,21 +190,21 @@ class StrictRealTime(grpc_testing.Time):
     def _ensure_called_through(self, time):
         with self._state.condition:
             while (
-                self._state.times_to_behaviors
-                and min(self._state.times_to_behaviors) < time
+                self._state.earliest_time() is not None
+                and self._state.earliest_time() < time
             ) or (self._calling is not None and self._calling < time):
                 self._state.condition.wait()
 
     def _call_at(self, behavior, time):
         with self._state.condition:
-            self._state.times_to_behaviors[time].append(behavior)
+            timer = self._state.schedule(behavior, time)
             if self._active:
                 self._state.condition.notify_all()
             else:
                 activity = threading.Thread(target=self._activity)
                 activity.start()
                 self._active = True
-            return _Future(self._state, behavior, time)
+            return _Future(self._state, timer)
 
     def time(self):
         return _time.time()
@@ -196,22 +233,22 @@ class StrictFakeTime(grpc_testing.Time):
     def time(self):
         return self._time
 
-    def call_in(self, behavior, delay):
-        if delay <= 0:
-            _call_in_thread((behavior,))
-        else:
-            with self._state.condition:
-                time = self._time + delay
-                self._state.times_to_behaviors[time].append(behavior)
-        return _Future(self._state, behavior, time)
-
-    def call_at(self, behavior, time):
+    def _call_at(self, behavior, time):
         with self._state.condition:
             if time <= self._time:
+                timer = _Timer(time, behavior)
+                timer.called = True
                 _call_in_thread((behavior,))
             else:
-                self._state.times_to_behaviors[time].append(behavior)
-        return _Future(self._state, behavior, time)
+                timer = self._state.schedule(behavior, time)
+            return _Future(self._state, timer)
+
+    def call_in(self, behavior, delay):
+        with self._state.condition:
+            return self._call_at(behavior, self._time + delay)
+
+    def call_at(self, behavior, time):
+        return self._call_at(behavior, time)
 
     def sleep_for(self, duration):
         if duration > 0:
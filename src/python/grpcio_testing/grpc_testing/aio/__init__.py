@@ -0,0 +1,630 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Objects for use in testing gRPC AsyncIO Python-using application code.
+
+Everything in this module runs on a single event loop without threads or
+network I/O. Deadlines and ServicerContext.time_remaining follow the clock of
+the running event loop, so combining these fixtures with the loop returned by
+fake_time_event_loop makes time-dependent tests both fast and deterministic.
+"""
+
+import abc
+
+from grpc import aio
+
+
+class UnaryUnaryChannelRpc(abc.ABC):
+    """Fixture for a unary-unary RPC invoked by a system under test.
+
+    Enables users to "play server" for the RPC.
+    """
+
+    @abc.abstractmethod
+    def send_initial_metadata(self, initial_metadata):
+        """Sends the RPC's initial metadata to the system under test.
+
+        Args:
+          initial_metadata: The RPC's initial metadata to be "sent" to
+            the system under test.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def cancelled(self):
+        """Waits until the system under test has cancelled the RPC."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def terminate(self, response, trailing_metadata, code, details):
+        """Terminates the RPC.
+
+        Args:
+          response: The response for the RPC.
+          trailing_metadata: The RPC's trailing metadata.
+          code: The RPC's status code.
+          details: The RPC's status details.
+        """
+        raise NotImplementedError()
+
+
+class UnaryStreamChannelRpc(abc.ABC):
+    """Fixture for a unary-stream RPC invoked by a system under test.
+
+    Enables users to "play server" for the RPC.
+    """
+
+    @abc.abstractmethod
+    def send_initial_metadata(self, initial_metadata):
+        """Sends the RPC's initial metadata to the system under test.
+
+        Args:
+          initial_metadata: The RPC's initial metadata to be "sent" to
+            the system under test.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def send_response(self, response):
+        """Sends a response to the system under test.
+
+        Args:
+          response: A response message to be "sent" to the system under test.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def cancelled(self):
+        """Waits until the system under test has cancelled the RPC."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def terminate(self, trailing_metadata, code, details):
+        """Terminates the RPC.
+
+        Args:
+          trailing_metadata: The RPC's trailing metadata.
+          code: The RPC's status code.
+          details: The RPC's status details.
+        """
+        raise NotImplementedError()
+
+
+class StreamUnaryChannelRpc(abc.ABC):
+    """Fixture for a stream-unary RPC invoked by a system under test.
+
+    Enables users to "play server" for the RPC.
+    """
+
+    @abc.abstractmethod
+    def send_initial_metadata(self, initial_metadata):
+        """Sends the RPC's initial metadata to the system under test.
+
+        Args:
+          initial_metadata: The RPC's initial metadata to be "sent" to
+            the system under test.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def take_request(self):
+        """Draws one of the requests added to the RPC by the system under test.
+
+        This method waits until the system under test has added to the RPC
+        the request to be returned.
+
+        Successive calls to this method return requests in the same order in
+        which the system under test added them to the RPC.
+
+        Returns:
+          A request message added to the RPC by the system under test.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def requests_closed(self):
+        """Waits until the system under test has closed the request stream."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def cancelled(self):
+        """Waits until the system under test has cancelled the RPC."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def terminate(self, response, trailing_metadata, code, details):
+        """Terminates the RPC.
+
+        Args:
+          response: The response for the RPC.
+          trailing_metadata: The RPC's trailing metadata.
+          code: The RPC's status code.
+          details: The RPC's status details.
+        """
+        raise NotImplementedError()
+
+
+class StreamStreamChannelRpc(abc.ABC):
+    """Fixture for a stream-stream RPC invoked by a system under test.
+
+    Enables users to "play server" for the RPC.
+    """
+
+    @abc.abstractmethod
+    def send_initial_metadata(self, initial_metadata):
+        """Sends the RPC's initial metadata to the system under test.
+
+        Args:
+          initial_metadata: The RPC's initial metadata to be "sent" to the
+            system under test.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def take_request(self):
+        """Draws one of the requests added to the RPC by the system under test.
+
+        This method waits until the system under test has added to the RPC
+        the request to be returned.
+
+        Successive calls to this method return requests in the same order in
+        which the system under test added them to the RPC.
+
+        Returns:
+          A request message added to the RPC by the system under test.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def send_response(self, response):
+        """Sends a response to the system under test.
+
+        Args:
+          response: A response messages to be "sent" to the system under test.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def requests_closed(self):
+        """Waits until the system under test has closed the request stream."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def cancelled(self):
+        """Waits until the system under test has cancelled the RPC."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def terminate(self, trailing_metadata, code, details):
+        """Terminates the RPC.
+
+        Args:
+          trailing_metadata: The RPC's trailing metadata.
+          code: The RPC's status code.
+          details: The RPC's status details.
+        """
+        raise NotImplementedError()
+
+
+class Channel(aio.Channel, metaclass=abc.ABCMeta):
+    """A grpc.aio.Channel double with which to test a system that invokes RPCs."""
+
+    @abc.abstractmethod
+    async def take_unary_unary(self, method_descriptor):
+        """Draws an RPC currently being made by the system under test.
+
+        If the given descriptor does not identify any RPC currently being made
+        by the system under test, this method waits until the system under
+        test invokes such an RPC.
+
+        Args:
+          method_descriptor: A descriptor.MethodDescriptor describing a
+            unary-unary RPC method.
+
+        Returns:
+          A (invocation_metadata, request, unary_unary_channel_rpc) tuple of
+            the RPC's invocation metadata, its request, and a
+            UnaryUnaryChannelRpc with which to "play server" for the RPC.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def take_unary_stream(self, method_descriptor):
+        """Draws an RPC currently being made by the system under test.
+
+        If the given descriptor does not identify any RPC currently being made
+        by the system under test, this method waits until the system under
+        test invokes such an RPC.
+
+        Args:
+          method_descriptor: A descriptor.MethodDescriptor describing a
+            unary-stream RPC method.
+
+        Returns:
+          A (invocation_metadata, request, unary_stream_channel_rpc) tuple of
+            the RPC's invocation metadata, its request, and a
+            UnaryStreamChannelRpc with which to "play server" for the RPC.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def take_stream_unary(self, method_descriptor):
+        """Draws an RPC currently being made by the system under test.
+
+        If the given descriptor does not identify any RPC currently being made
+        by the system under test, this method waits until the system under
+        test invokes such an RPC.
+
+        Args:
+          method_descriptor: A descriptor.MethodDescriptor describing a
+            stream-unary RPC method.
+
+        Returns:
+          A (invocation_metadata, stream_unary_channel_rpc) tuple of the RPC's
+            invocation metadata and a StreamUnaryChannelRpc with which to "play
+            server" for the RPC.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def take_stream_stream(self, method_descriptor):
+        """Draws an RPC currently being made by the system under test.
+
+        If the given descriptor does not identify any RPC currently being made
+        by the system under test, this method waits until the system under
+        test invokes such an RPC.
+
+        Args:
+          method_descriptor: A descriptor.MethodDescriptor describing a
+            stream-stream RPC method.
+
+        Returns:
+          A (invocation_metadata, stream_stream_channel_rpc) tuple of the RPC's
+            invocation metadata and a StreamStreamChannelRpc with which to
+            "play server" for the RPC.
+        """
+        raise NotImplementedError()
+
+
+class UnaryUnaryServerRpc(abc.ABC):
+    """Fixture for a unary-unary RPC serviced by a system under test.
+
+    Enables users to "play client" for the RPC.
+    """
+
+    @abc.abstractmethod
+    async def initial_metadata(self):
+        """Accesses the initial metadata emitted by the system under test.
+
+        This method waits until the system under test has added initial
+        metadata to the RPC (or has provided one or more response messages or
+        has terminated the RPC, either of which will cause gRPC Python to
+        synthesize initial metadata for the RPC).
+
+        Returns:
+          The initial metadata for the RPC.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def cancel(self):
+        """Cancels the RPC."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def termination(self):
+        """Waits until the system under test has terminated the RPC.
+
+        Returns:
+          A (response, trailing_metadata, code, details) sequence with the RPC's
+            response, trailing metadata, code, and details.
+        """
+        raise NotImplementedError()
+
+
+class UnaryStreamServerRpc(abc.ABC):
+    """Fixture for a unary-stream RPC serviced by a system under test.
+
+    Enables users to "play client" for the RPC.
+    """
+
+    @abc.abstractmethod
+    async def initial_metadata(self):
+        """Accesses the initial metadata emitted by the system under test.
+
+        This method waits until the system under test has added initial
+        metadata to the RPC (or has provided one or more response messages or
+        has terminated the RPC, either of which will cause gRPC Python to
+        synthesize initial metadata for the RPC).
+
+        Returns:
+          The initial metadata for the RPC.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def take_response(self):
+        """Draws one of the responses added to the RPC by the system under test.
+
+        Successive calls to this method return responses in the same order in
+        which the system under test added them to the RPC.
+
+        Returns:
+          A response message added to the RPC by the system under test.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def cancel(self):
+        """Cancels the RPC."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def termination(self):
+        """Waits until the system under test has terminated the RPC.
+
+        Returns:
+          A (trailing_metadata, code, details) sequence with the RPC's trailing
+            metadata, code, and details.
+        """
+        raise NotImplementedError()
+
+
+class StreamUnaryServerRpc(abc.ABC):
+    """Fixture for a stream-unary RPC serviced by a system under test.
+
+    Enables users to "play client" for the RPC.
+    """
+
+    @abc.abstractmethod
+    async def initial_metadata(self):
+        """Accesses the initial metadata emitted by the system under test.
+
+        This method waits until the system under test has added initial
+        metadata to the RPC (or has provided one or more response messages or
+        has terminated the RPC, either of which will cause gRPC Python to
+        synthesize initial metadata for the RPC).
+
+        Returns:
+          The initial metadata for the RPC.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def send_request(self, request):
+        """Sends a request to the system under test.
+
+        Args:
+          request: A request message for the RPC to be "sent" to the system
+            under test.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def requests_closed(self):
+        """Indicates the end of the RPC's request stream."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def cancel(self):
+        """Cancels the RPC."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def termination(self):
+        """Waits until the system under test has terminated the RPC.
+
+        Returns:
+          A (response, trailing_metadata, code, details) sequence with the RPC's
+            response, trailing metadata, code, and details.
+        """
+        raise NotImplementedError()
+
+
+class StreamStreamServerRpc(abc.ABC):
+    """Fixture for a stream-stream RPC serviced by a system under test.
+
+    Enables users to "play client" for the RPC.
+    """
+
+    @abc.abstractmethod
+    async def initial_metadata(self):
+        """Accesses the initial metadata emitted by the system under test.
+
+        This method waits until the system under test has added initial
+        metadata to the RPC (or has provided one or more response messages or
+        has terminated the RPC, either of which will cause gRPC Python to
+        synthesize initial metadata for the RPC).
+
+        Returns:
+          The initial metadata for the RPC.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def send_request(self, request):
+        """Sends a request to the system under test.
+
+        Args:
+          request: A request message for the RPC to be "sent" to the system
+            under test.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def requests_closed(self):
+        """Indicates the end of the RPC's request stream."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def take_response(self):
+        """Draws one of the responses added to the RPC by the system under test.
+
+        Successive calls to this method return responses in the same order in
+        which the system under test added them to the RPC.
+
+        Returns:
+          A response message added to the RPC by the system under test.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def cancel(self):
+        """Cancels the RPC."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def termination(self):
+        """Waits until the system under test has terminated the RPC.
+
+        Returns:
+          A (trailing_metadata, code, details) sequence with the RPC's trailing
+            metadata, code, and details.
+        """
+        raise NotImplementedError()
+
+
+class Server(abc.ABC):
+    """A server with which to test a system that services RPCs with grpc.aio.
+
+    Servicer methods may be coroutine functions, async generator functions or
+    plain functions; they are run as tasks on the running event loop. The
+    invoke_* methods must therefore be called while an event loop is running.
+    """
+
+    @abc.abstractmethod
+    def invoke_unary_unary(
+        self, method_descriptor, invocation_metadata, request, timeout
+    ):
+        """Invokes an RPC to be serviced by the system under test.
+
+        Args:
+          method_descriptor: A descriptor.MethodDescriptor describing a unary-unary
+            RPC method.
+          invocation_metadata: The RPC's invocation metadata.
+          request: The RPC's request.
+          timeout: A duration of time in seconds for the RPC or None to
+            indicate that the RPC has no time limit.
+
+        Returns:
+          A UnaryUnaryServerRpc with which to "play client" for the RPC.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def invoke_unary_stream(
+        self, method_descriptor, invocation_metadata, request, timeout
+    ):
+        """Invokes an RPC to be serviced by the system under test.
+
+        Args:
+          method_descriptor: A descriptor.MethodDescriptor describing a unary-stream
+            RPC method.
+          invocation_metadata: The RPC's invocation metadata.
+          request: The RPC's request.
+          timeout: A duration of time in seconds for the RPC or None to
+            indicate that the RPC has no time limit.
+
+        Returns:
+          A UnaryStreamServerRpc with which to "play client" for the RPC.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def invoke_stream_unary(
+        self, method_descriptor, invocation_metadata, timeout
+    ):
+        """Invokes an RPC to be serviced by the system under test.
+
+        Args:
+          method_descriptor: A descriptor.MethodDescriptor describing a stream-unary
+            RPC method.
+          invocation_metadata: The RPC's invocation metadata.
+          timeout: A duration of time in seconds for the RPC or None to
+            indicate that the RPC has no time limit.
+
+        Returns:
+          A StreamUnaryServerRpc with which to "play client" for the RPC.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def invoke_stream_stream(
+        self, method_descriptor, invocation_metadata, timeout
+    ):
+        """Invokes an RPC to be serviced by the system under test.
+
+        Args:
+          method_descriptor: A descriptor.MethodDescriptor describing a stream-stream
+            RPC method.
+          invocation_metadata: The RPC's invocation metadata.
+          timeout: A duration of time in seconds for the RPC or None to
+            indicate that the RPC has no time limit.
+
+        Returns:
+          A StreamStreamServerRpc with which to "play client" for the RPC.
+        """
+        raise NotImplementedError()
+
+
+def fake_time_event_loop(now=0.0):
+    """Creates an event loop whose clock only advances when it is idle.
+
+    Whenever every task on the returned loop is waiting for a timer (for
+    example in asyncio.sleep, asyncio.wait_for or an RPC deadline) the loop's
+    clock jumps straight to the earliest timer instead of sleeping, so
+    simulated time passes instantly. The clock can also be moved forward
+    explicitly with the loop's advance method.
+
+    Args:
+      now: The initial value of the loop's clock.
+
+    Returns:
+      An asyncio.AbstractEventLoop with a simulated clock.
+    """
+    from grpc_testing.aio import _time
+
+    return _time.FakeTimeEventLoop(now)
+
+
+def channel(service_descriptors):
+    """Creates a Channel for use in tests of a gRPC AsyncIO-using system.
+
+    Args:
+      service_descriptors: An iterable of descriptor.ServiceDescriptors
+        describing the RPCs that will be made on the returned Channel by the
+        system under test.
+
+    Returns:
+      A Channel for use in tests.
+    """
+    from grpc_testing.aio import _channel
+
+    return _channel.testing_channel(service_descriptors)
+
+
+def server_from_dictionary(descriptors_to_servicers):
+    """Creates a Server for use in tests of a gRPC AsyncIO-using system.
+
+    Args:
+      descriptors_to_servicers: A dictionary from descriptor.ServiceDescriptors
+        defining RPC services to servicer objects (usually instances of classes
+        that implement "Servicer" interfaces defined in generated "_pb2_grpc"
+        modules) implementing those services.
+
+    Returns:
+      A Server for use in tests.
+    """
+    from grpc_testing.aio import _server
+
+    return _server.server_from_dictionary(descriptors_to_servicers)
@@ -0,0 +1,638 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""An in-memory grpc.aio.Channel double."""
+
+import asyncio
+import collections
+import logging
+
+import grpc
+from grpc import aio
+from grpc_testing import _common
+import grpc_testing.aio
+from grpc_testing.aio import _common as _aio_common
+
+_LOCALLY_CANCELLED_DETAILS = "Locally cancelled!"
+_DEADLINE_EXCEEDED_DETAILS = "Deadline Exceeded"
+_LOGGER = logging.getLogger(__name__)
+
+
+# pylint: disable=too-many-public-methods
+class _RpcState:
+    def __init__(self, invocation_metadata, requests, requests_closed, timeout):
+        self._signal = _aio_common.Signal()
+        self._invocation_metadata = invocation_metadata
+        self._requests = requests
+        self._requests_closed = requests_closed
+        self._initial_metadata = None
+        self._responses = []
+        self._trailing_metadata = None
+        self._code = None
+        self._details = None
+        self._locally_cancelled = False
+        self._callbacks = []
+        self._deadline = _aio_common.deadline(timeout)
+        if self._deadline is None:
+            self._expiry = None
+        else:
+            self._expiry = asyncio.get_running_loop().call_at(
+                self._deadline,
+                self._finish,
+                _common.FUSSED_EMPTY_METADATA,
+                grpc.StatusCode.DEADLINE_EXCEEDED,
+                _DEADLINE_EXCEEDED_DETAILS,
+            )
+
+    def _finish(self, trailing_metadata, code, details):
+        if self._code is not None:
+            return False
+        if self._initial_metadata is None:
+            self._initial_metadata = _common.FUSSED_EMPTY_METADATA
+        self._trailing_metadata = trailing_metadata
+        self._code = code
+        self._details = details
+        if self._expiry is not None:
+            self._expiry.cancel()
+        self._signal.notify_all()
+        callbacks = self._callbacks
+        self._callbacks = None
+        loop = asyncio.get_running_loop()
+        for callback in callbacks:
+            loop.call_soon(callback)
+        return True
+
+    # Methods used by the invoking side of the RPC.
+
+    async def initial_metadata(self):
+        return await self._signal.wait_for(lambda: self._initial_metadata)
+
+    def add_request(self, request):
+        if self._code is None and not self._requests_closed:
+            self._requests.append(request)
+            self._signal.notify_all()
+            return True
+        return False
+
+    def close_requests(self):
+        if self._code is None and not self._requests_closed:
+            self._requests_closed = True
+            self._signal.notify_all()
+
+    async def take_response(self):
+        await self._signal.wait_for(
+            lambda: self._responses or self._code is not None
+        )
+        if self._responses and self._code in (None, grpc.StatusCode.OK):
+            return _common.ChannelRpcRead(
+                self._responses.pop(0), None, None, None
+            )
+        return _common.ChannelRpcRead(
+            None, self._trailing_metadata, self._code, self._details
+        )
+
+    async def termination(self):
+        await self._signal.wait_for(lambda: self._code is not None)
+        return self._trailing_metadata, self._code, self._details
+
+    def cancel(self, code, details):
+        if self._finish(_common.FUSSED_EMPTY_METADATA, code, details):
+            self._locally_cancelled = code is grpc.StatusCode.CANCELLED
+            return True
+        return False
+
+    def locally_cancelled(self):
+        return self._locally_cancelled
+
+    def is_active(self):
+        return self._code is None
+
+    def time_remaining(self):
+        return _aio_common.time_remaining(self._deadline)
+
+    def add_callback(self, callback):
+        if self._code is None:
+            self._callbacks.append(callback)
+            return True
+        return False
+
+    def initial_metadata_now(self):
+        return self._initial_metadata
+
+    def termination_now(self):
+        return self._trailing_metadata, self._code, self._details
+
+    # Methods used by the test "playing server" for the RPC.
+
+    def take_invocation_metadata(self):
+        if self._invocation_metadata is None:
+            error_msg = "Expected invocation metadata!"
+            raise ValueError(error_msg)
+        invocation_metadata = self._invocation_metadata
+        self._invocation_metadata = None
+        return invocation_metadata
+
+    async def take_invocation_metadata_and_request(self):
+        invocation_metadata = self.take_invocation_metadata()
+        await self._signal.wait_for(lambda: self._requests)
+        return invocation_metadata, self._requests.pop(0)
+
+    def send_initial_metadata(self, initial_metadata):
+        if self._initial_metadata is None:
+            self._initial_metadata = _common.fuss_with_metadata(
+                initial_metadata
+            )
+            self._signal.notify_all()
+
+    async def take_request(self):
+        await self._signal.wait_for(lambda: self._requests)
+        return self._requests.pop(0)
+
+    async def requests_closed(self):
+        await self._signal.wait_for(lambda: self._requests_closed)
+
+    def send_response(self, response):
+        if self._code is None:
+            if self._initial_metadata is None:
+                self._initial_metadata = _common.FUSSED_EMPTY_METADATA
+            self._responses.append(response)
+            self._signal.notify_all()
+
+    def terminate_with_response(
+        self, response, trailing_metadata, code, details
+    ):
+        if self._code is None:
+            self._responses.append(response)
+            self._finish(
+                _common.fuss_with_metadata(trailing_metadata), code, details
+            )
+
+    def terminate(self, trailing_metadata, code, details):
+        self._finish(
+            _common.fuss_with_metadata(trailing_metadata), code, details
+        )
+
+    async def cancelled(self):
+        await self._signal.wait_for(lambda: self._code is not None)
+        if self._code is not grpc.StatusCode.CANCELLED:
+            error_msg = f"Status code unexpectedly {self._code}!"
+            raise ValueError(error_msg)
+
+
+class _ChannelState:
+    def __init__(self):
+        self._signal = _aio_common.Signal()
+        self._rpc_states = collections.defaultdict(list)
+
+    def invoke_rpc(
+        self,
+        method_full_rpc_name,
+        invocation_metadata,
+        requests,
+        requests_closed,
+        timeout,
+    ):
+        rpc_state = _RpcState(
+            invocation_metadata, requests, requests_closed, timeout
+        )
+        self._rpc_states[method_full_rpc_name].append(rpc_state)
+        self._signal.notify_all()
+        return rpc_state
+
+    async def take_rpc_state(self, method_descriptor):
+        method_full_rpc_name = "/{}/{}".format(
+            method_descriptor.containing_service.full_name,
+            method_descriptor.name,
+        )
+        method_rpc_states = self._rpc_states[method_full_rpc_name]
+        await self._signal.wait_for(lambda: method_rpc_states)
+        return method_rpc_states.pop(0)
+
+
+def _metadata(tuplified_metadata):
+    return aio.Metadata.from_tuple(tuple(tuplified_metadata))
+
+
+def _error(rpc_state):
+    trailing_metadata, code, details = rpc_state.termination_now()
+    if code is grpc.StatusCode.CANCELLED and rpc_state.locally_cancelled():
+        return asyncio.CancelledError()
+    return aio.AioRpcError(
+        code,
+        _metadata(rpc_state.initial_metadata_now()),
+        _metadata(trailing_metadata),
+        details,
+    )
+
+
+class _Call(aio.Call):
+    def __init__(self, rpc_state):
+        self._rpc_state = rpc_state
+
+    def cancelled(self):
+        return self._rpc_state.locally_cancelled()
+
+    def done(self):
+        return not self._rpc_state.is_active()
+
+    def time_remaining(self):
+        return self._rpc_state.time_remaining()
+
+    def cancel(self):
+        return self._rpc_state.cancel(
+            grpc.StatusCode.CANCELLED, _LOCALLY_CANCELLED_DETAILS
+        )
+
+    def add_done_callback(self, callback):
+        if not self._rpc_state.add_callback(lambda: callback(self)):
+            callback(self)
+
+    async def initial_metadata(self):
+        return _metadata(await self._rpc_state.initial_metadata())
+
+    async def trailing_metadata(self):
+        trailing_metadata, _, _ = await self._rpc_state.termination()
+        return _metadata(trailing_metadata)
+
+    async def code(self):
+        _, code, _ = await self._rpc_state.termination()
+        return code
+
+    async def details(self):
+        _, _, details = await self._rpc_state.termination()
+        return details
+
+    async def wait_for_connection(self):
+        pass
+
+
+class _UnaryResponseMixin:
+    async def _unary_response(self):
+        read = await self._rpc_state.take_response()
+        if read.code is None:
+            _, code, _ = await self._rpc_state.termination()
+            if code is grpc.StatusCode.OK:
+                return read.response
+        raise _error(self._rpc_state)
+
+    def __await__(self):
+        return self._unary_response().__await__()
+
+
+class _StreamResponseMixin:
+    async def read(self):
+        read = await self._rpc_state.take_response()
+        if read.code is None:
+            return read.response
+        if read.code is grpc.StatusCode.OK:
+            return aio.EOF
+        raise _error(self._rpc_state)
+
+    async def _responses(self):
+        while True:
+            response = await self.read()
+            if response is aio.EOF:
+                return
+            yield response
+
+    def __aiter__(self):
+        return self._responses()
+
+
+class _StreamRequestMixin:
+    def _init_requests(self, request_iterator):
+        if request_iterator is None:
+            self._consumer = None
+        else:
+            self._consumer = asyncio.get_running_loop().create_task(
+                _consume_requests(request_iterator, self._rpc_state)
+            )
+
+    async def write(self, request):
+        if self._consumer is not None:
+            raise aio.UsageError(
+                "Please don't mix two styles of API for streaming requests"
+            )
+        if not self._rpc_state.add_request(request):
+            raise _error(self._rpc_state)
+
+    async def done_writing(self):
+        if self._consumer is not None:
+            raise aio.UsageError(
+                "Please don't mix two styles of API for streaming requests"
+            )
+        self._rpc_state.close_requests()
+
+
+async def _consume_requests(request_iterator, rpc_state):
+    try:
+        if hasattr(request_iterator, "__aiter__"):
+            async for request in request_iterator:
+                if not rpc_state.add_request(request):
+                    return
+        else:
+            for request in request_iterator:
+                if not rpc_state.add_request(request):
+                    return
+                await asyncio.sleep(0)
+    except Exception:  # pylint: disable=broad-except
+        details = "Exception iterating requests!"
+        _LOGGER.exception(details)
+        rpc_state.cancel(grpc.StatusCode.UNKNOWN, details)
+    else:
+        rpc_state.close_requests()
+
+
+class _UnaryUnaryCall(_UnaryResponseMixin, _Call, aio.UnaryUnaryCall):
+    pass
+
+
+class _UnaryStreamCall(_StreamResponseMixin, _Call, aio.UnaryStreamCall):
+    pass
+
+
+class _StreamUnaryCall(
+    _StreamRequestMixin, _UnaryResponseMixin, _Call, aio.StreamUnaryCall
+):
+    def __init__(self, rpc_state, request_iterator):
+        super().__init__(rpc_state)
+        self._init_requests(request_iterator)
+
+
+class _StreamStreamCall(
+    _StreamRequestMixin, _StreamResponseMixin, _Call, aio.StreamStreamCall
+):
+    def __init__(self, rpc_state, request_iterator):
+        super().__init__(rpc_state)
+        self._init_requests(request_iterator)
+
+
+# All per-call credentials, wait_for_ready and compression parameters are
+# unused by this test infrastructure.
+# pylint: disable=unused-argument
+class _MultiCallable:
+    def __init__(self, method_full_rpc_name, channel_state):
+        self._method_full_rpc_name = method_full_rpc_name
+        self._channel_state = channel_state
+
+    def _invoke(self, requests, requests_closed, timeout, metadata):
+        return self._channel_state.invoke_rpc(
+            self._method_full_rpc_name,
+            _common.fuss_with_metadata(metadata),
+            requests,
+            requests_closed,
+            timeout,
+        )
+
+
+class _UnaryUnary(_MultiCallable, aio.UnaryUnaryMultiCallable):
+    def __call__(
+        self,
+        request,
+        *,
+        timeout=None,
+        metadata=None,
+        credentials=None,
+        wait_for_ready=None,
+        compression=None,
+    ):
+        return _UnaryUnaryCall(self._invoke([request], True, timeout, metadata))
+
+
+class _UnaryStream(_MultiCallable, aio.UnaryStreamMultiCallable):
+    def __call__(
+        self,
+        request,
+        *,
+        timeout=None,
+        metadata=None,
+        credentials=None,
+        wait_for_ready=None,
+        compression=None,
+    ):
+        return _UnaryStreamCall(
+            self._invoke([request], True, timeout, metadata)
+        )
+
+
+class _StreamUnary(_MultiCallable, aio.StreamUnaryMultiCallable):
+    def __call__(
+        self,
+        request_iterator=None,
+        timeout=None,
+        metadata=None,
+        credentials=None,
+        wait_for_ready=None,
+        compression=None,
+    ):
+        return _StreamUnaryCall(
+            self._invoke([], False, timeout, metadata), request_iterator
+        )
+
+
+class _StreamStream(_MultiCallable, aio.StreamStreamMultiCallable):
+    def __call__(
+        self,
+        request_iterator=None,
+        timeout=None,
+        metadata=None,
+        credentials=None,
+        wait_for_ready=None,
+        compression=None,
+    ):
+        return _StreamStreamCall(
+            self._invoke([], False, timeout, metadata), request_iterator
+        )
+
+
+class _UnaryUnaryChannelRpc(grpc_testing.aio.UnaryUnaryChannelRpc):
+    def __init__(self, rpc_state):
+        self._rpc_state = rpc_state
+
+    def send_initial_metadata(self, initial_metadata):
+        self._rpc_state.send_initial_metadata(initial_metadata)
+
+    async def cancelled(self):
+        await self._rpc_state.cancelled()
+
+    def terminate(self, response, trailing_metadata, code, details):
+        self._rpc_state.terminate_with_response(
+            response, trailing_metadata, code, details
+        )
+
+
+class _UnaryStreamChannelRpc(grpc_testing.aio.UnaryStreamChannelRpc):
+    def __init__(self, rpc_state):
+        self._rpc_state = rpc_state
+
+    def send_initial_metadata(self, initial_metadata):
+        self._rpc_state.send_initial_metadata(initial_metadata)
+
+    def send_response(self, response):
+        self._rpc_state.send_response(response)
+
+    async def cancelled(self):
+        await self._rpc_state.cancelled()
+
+    def terminate(self, trailing_metadata, code, details):
+        self._rpc_state.terminate(trailing_metadata, code, details)
+
+
+class _StreamUnaryChannelRpc(grpc_testing.aio.StreamUnaryChannelRpc):
+    def __init__(self, rpc_state):
+        self._rpc_state = rpc_state
+
+    def send_initial_metadata(self, initial_metadata):
+        self._rpc_state.send_initial_metadata(initial_metadata)
+
+    async def take_request(self):
+        return await self._rpc_state.take_request()
+
+    async def requests_closed(self):
+        await self._rpc_state.requests_closed()
+
+    async def cancelled(self):
+        await self._rpc_state.cancelled()
+
+    def terminate(self, response, trailing_metadata, code, details):
+        self._rpc_state.terminate_with_response(
+            response, trailing_metadata, code, details
+        )
+
+
+class _StreamStreamChannelRpc(grpc_testing.aio.StreamStreamChannelRpc):
+    def __init__(self, rpc_state):
+        self._rpc_state = rpc_state
+
+    def send_initial_metadata(self, initial_metadata):
+        self._rpc_state.send_initial_metadata(initial_metadata)
+
+    async def take_request(self):
+        return await self._rpc_state.take_request()
+
+    def send_response(self, response):
+        self._rpc_state.send_response(response)
+
+    async def requests_closed(self):
+        await self._rpc_state.requests_closed()
+
+    async def cancelled(self):
+        await self._rpc_state.cancelled()
+
+    def terminate(self, trailing_metadata, code, details):
+        self._rpc_state.terminate(trailing_metadata, code, details)
+
+
+# All serializer and deserializer parameters are not (yet) used by this
+# test infrastructure.
+class TestingChannel(grpc_testing.aio.Channel):
+    def __init__(self, state):
+        self._state = state
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self, grace=None):
+        # NOTE: As with the synchronous testing channel, in-flight RPCs are
+        # left for the test to terminate.
+        pass
+
+    def get_state(self, try_to_connect=False):
+        return grpc.ChannelConnectivity.READY
+
+    async def wait_for_state_change(self, last_observed_state):
+        raise NotImplementedError()
+
+    async def channel_ready(self):
+        pass
+
+    def unary_unary(
+        self,
+        method,
+        request_serializer=None,
+        response_deserializer=None,
+        _registered_method=False,
+    ):
+        return _UnaryUnary(method, self._state)
+
+    def unary_stream(
+        self,
+        method,
+        request_serializer=None,
+        response_deserializer=None,
+        _registered_method=False,
+    ):
+        return _UnaryStream(method, self._state)
+
+    def stream_unary(
+        self,
+        method,
+        request_serializer=None,
+        response_deserializer=None,
+        _registered_method=False,
+    ):
+        return _StreamUnary(method, self._state)
+
+    def stream_stream(
+        self,
+        method,
+        request_serializer=None,
+        response_deserializer=None,
+        _registered_method=False,
+    ):
+        return _StreamStream(method, self._state)
+
+    async def take_unary_unary(self, method_descriptor):
+        rpc_state = await self._state.take_rpc_state(method_descriptor)
+        (
+            invocation_metadata,
+            request,
+        ) = await rpc_state.take_invocation_metadata_and_request()
+        return invocation_metadata, request, _UnaryUnaryChannelRpc(rpc_state)
+
+    async def take_unary_stream(self, method_descriptor):
+        rpc_state = await self._state.take_rpc_state(method_descriptor)
+        (
+            invocation_metadata,
+            request,
+        ) = await rpc_state.take_invocation_metadata_and_request()
+        return invocation_metadata, request, _UnaryStreamChannelRpc(rpc_state)
+
+    async def take_stream_unary(self, method_descriptor):
+        rpc_state = await self._state.take_rpc_state(method_descriptor)
+        return (
+            rpc_state.take_invocation_metadata(),
+            _StreamUnaryChannelRpc(rpc_state),
+        )
+
+    async def take_stream_stream(self, method_descriptor):
+        rpc_state = await self._state.take_rpc_state(method_descriptor)
+        return (
+            rpc_state.take_invocation_metadata(),
+            _StreamStreamChannelRpc(rpc_state),
+        )
+
+
+# pylint: enable=unused-argument
+
+
+# descriptors is reserved for later use.
+# pylint: disable=unused-argument
+def testing_channel(descriptors):
+    return TestingChannel(_ChannelState())
+
+
+# pylint: enable=unused-argument
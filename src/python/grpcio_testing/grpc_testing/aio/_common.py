@@ -0,0 +1,56 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Common implementation for the AsyncIO test fixtures."""
+
+import asyncio
+
+
+class Signal:
+    """An asyncio analogue of threading.Condition without a lock.
+
+    All state guarded by a Signal lives on a single event loop, so mutations
+    need no locking; notify_all may be called from plain functions and wait_for
+    suspends the calling coroutine until the given predicate holds.
+    """
+
+    def __init__(self):
+        self._waiters = []
+
+    def notify_all(self):
+        waiters = self._waiters
+        self._waiters = []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def wait_for(self, predicate):
+        while True:
+            result = predicate()
+            if result:
+                return result
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
+
+
+def deadline(timeout):
+    if timeout is None:
+        return None
+    return asyncio.get_running_loop().time() + timeout
+
+
+def time_remaining(deadline_):
+    if deadline_ is None:
+        return None
+    return max(0.0, deadline_ - asyncio.get_running_loop().time())
@@ -0,0 +1,557 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""An in-memory server that drives grpc.aio servicers on the running loop."""
+
+import asyncio
+import copy
+import inspect
+import logging
+
+import grpc
+from grpc import aio
+from grpc_testing import _common
+import grpc_testing.aio
+from grpc_testing.aio import _common as _aio_common
+
+_LOGGER = logging.getLogger(__name__)
+
+_CLIENT_INACTIVE = object()
+
+
+class _Handler:
+    """The client's view of an RPC being serviced by the system under test."""
+
+    def __init__(self, requests_closed, deadline):
+        self._signal = _aio_common.Signal()
+        self._requests = []
+        self._requests_closed = requests_closed
+        self._initial_metadata = None
+        self._responses = []
+        self._trailing_metadata = None
+        self._code = None
+        self._details = None
+        self._unary_response = None
+        self._termination_callbacks = []
+        if deadline is None:
+            self._expiry = None
+        else:
+            self._expiry = asyncio.get_running_loop().call_at(
+                deadline, self._expire
+            )
+
+    def _call_termination_callbacks(self):
+        termination_callbacks = self._termination_callbacks
+        self._termination_callbacks = None
+        if self._expiry is not None:
+            self._expiry.cancel()
+        self._signal.notify_all()
+        for termination_callback in termination_callbacks:
+            termination_callback()
+
+    def _expire(self):
+        if self._code is None:
+            if self._initial_metadata is None:
+                self._initial_metadata = _common.FUSSED_EMPTY_METADATA
+            self._trailing_metadata = _common.FUSSED_EMPTY_METADATA
+            self._code = grpc.StatusCode.DEADLINE_EXCEEDED
+            self._details = "Took too much time!"
+            self._call_termination_callbacks()
+
+    # Methods used by the system under test.
+
+    def send_initial_metadata(self, initial_metadata):
+        self._initial_metadata = initial_metadata
+        self._signal.notify_all()
+
+    async def take_request(self):
+        await self._signal.wait_for(
+            lambda: self._code is not None
+            or self._requests
+            or self._requests_closed
+        )
+        if self._code is not None:
+            return _common.TERMINATED
+        if self._requests:
+            return _common.ServerRpcRead(self._requests.pop(0), False, False)
+        return _common.REQUESTS_CLOSED
+
+    def add_response(self, response):
+        self._responses.append(response)
+        self._signal.notify_all()
+
+    def send_termination(self, trailing_metadata, code, details):
+        self._trailing_metadata = trailing_metadata
+        self._code = code
+        self._details = details
+        if self._expiry is not None:
+            self._expiry.cancel()
+        self._signal.notify_all()
+
+    def add_termination_callback(self, callback):
+        if self._code is None:
+            self._termination_callbacks.append(callback)
+            return True
+        return False
+
+    # Methods used by the test "playing client" for the RPC.
+
+    async def initial_metadata(self):
+        await self._signal.wait_for(
+            lambda: self._initial_metadata is not None or self._code is not None
+        )
+        if self._initial_metadata is None:
+            error_msg = "No initial metadata despite status code!"
+            raise ValueError(error_msg)
+        return self._initial_metadata
+
+    def add_request(self, request):
+        self._requests.append(request)
+        self._signal.notify_all()
+
+    async def take_response(self):
+        await self._signal.wait_for(
+            lambda: self._responses or self._code is not None
+        )
+        if self._responses:
+            return self._responses.pop(0)
+        error_msg = "No more responses!"
+        raise ValueError(error_msg)
+
+    def requests_closed(self):
+        self._requests_closed = True
+        self._signal.notify_all()
+
+    def cancel(self):
+        if self._code is None:
+            self._code = _CLIENT_INACTIVE
+            self._call_termination_callbacks()
+
+    async def unary_response_termination(self):
+        await self._signal.wait_for(lambda: self._code is not None)
+        if self._code is _CLIENT_INACTIVE:
+            error_msg = "Huh? Cancelled but wanting status?"
+            raise ValueError(error_msg)
+        if self._unary_response is None and self._responses:
+            self._unary_response = self._responses.pop(0)
+        return (
+            self._unary_response,
+            self._trailing_metadata,
+            self._code,
+            self._details,
+        )
+
+    async def stream_response_termination(self):
+        await self._signal.wait_for(lambda: self._code is not None)
+        if self._code is _CLIENT_INACTIVE:
+            error_msg = "Huh? Cancelled but wanting status?"
+            raise ValueError(error_msg)
+        return self._trailing_metadata, self._code, self._details
+
+
+# pylint: disable=too-many-public-methods
+class _ServicerContext(aio.ServicerContext):
+    def __init__(self, handler, invocation_metadata, deadline):
+        self._handler = handler
+        self._invocation_metadata = invocation_metadata
+        self._deadline = deadline
+        self._initial_metadata_sent = False
+        self._pending_trailing_metadata = None
+        self._pending_code = None
+        self._pending_details = None
+        self._callbacks = []
+        self._active = True
+        self._cancelled = False
+        self._task = None
+
+    def _ensure_initial_metadata_sent(self):
+        if not self._initial_metadata_sent:
+            self._handler.send_initial_metadata(_common.FUSSED_EMPTY_METADATA)
+            self._initial_metadata_sent = True
+
+    def _call_back(self):
+        callbacks = self._callbacks
+        self._callbacks = None
+        loop = asyncio.get_running_loop()
+        for callback in callbacks:
+            loop.call_soon(callback, self)
+
+    def _terminate(self, trailing_metadata, code, details):
+        if self._active:
+            self._active = False
+            self._ensure_initial_metadata_sent()
+            self._handler.send_termination(trailing_metadata, code, details)
+            self._call_back()
+
+    def _ensure_writable(self):
+        if not self._active:
+            raise asyncio.CancelledError()
+
+    # Methods used by the service runners.
+
+    def set_task(self, task):
+        self._task = task
+
+    def extrinsic_abort(self):
+        if self._active:
+            self._active = False
+            self._cancelled = True
+            self._call_back()
+            if self._task is not None:
+                self._task.cancel()
+
+    def complete(self):
+        if self._pending_trailing_metadata is None:
+            trailing_metadata = _common.FUSSED_EMPTY_METADATA
+        else:
+            trailing_metadata = self._pending_trailing_metadata
+        code = (
+            self._pending_code
+            if self._pending_code is not None
+            else grpc.StatusCode.OK
+        )
+        details = "" if self._pending_details is None else self._pending_details
+        self._terminate(trailing_metadata, code, details)
+
+    def exception_abort(self, exception):
+        if self._active:
+            _LOGGER.exception("Exception calling application!")
+            self._terminate(
+                _common.FUSSED_EMPTY_METADATA,
+                grpc.StatusCode.UNKNOWN,
+                "Exception calling application: {}".format(exception),
+            )
+
+    def add_response(self, response):
+        self._ensure_writable()
+        self._ensure_initial_metadata_sent()
+        self._handler.add_response(response)
+
+    async def take_request(self):
+        read = await self._handler.take_request()
+        if read.terminated:
+            raise asyncio.CancelledError()
+        if read.requests_closed:
+            return aio.EOF
+        return read.request
+
+    # grpc.aio.ServicerContext methods.
+
+    async def read(self):
+        return await self.take_request()
+
+    async def write(self, message):
+        self.add_response(message)
+
+    async def send_initial_metadata(self, initial_metadata):
+        if self._initial_metadata_sent:
+            error_msg = "ServicerContext.send_initial_metadata called too late!"
+            raise ValueError(error_msg)
+        self._handler.send_initial_metadata(
+            _common.fuss_with_metadata(initial_metadata)
+        )
+        self._initial_metadata_sent = True
+
+    async def abort(self, code, details="", trailing_metadata=tuple()):
+        self._terminate(
+            _common.fuss_with_metadata(trailing_metadata), code, details
+        )
+        raise aio.AbortError()
+
+    async def abort_with_status(self, status):
+        await self.abort(status.code, status.details, status.trailing_metadata)
+
+    def set_trailing_metadata(self, trailing_metadata):
+        self._pending_trailing_metadata = _common.fuss_with_metadata(
+            trailing_metadata
+        )
+
+    def invocation_metadata(self):
+        return self._invocation_metadata
+
+    def set_code(self, code):
+        self._pending_code = code
+
+    def set_details(self, details):
+        self._pending_details = details
+
+    def set_compression(
+        self, compression, *, min_message_size=None, offload_message_size=None
+    ):
+        raise NotImplementedError()
+
+    def disable_next_message_compression(self):
+        raise NotImplementedError()
+
+    def peer(self):
+        raise NotImplementedError()
+
+    def peer_identities(self):
+        raise NotImplementedError()
+
+    def peer_identity_key(self):
+        raise NotImplementedError()
+
+    def auth_context(self):
+        raise NotImplementedError()
+
+    def time_remaining(self):
+        if self._active:
+            return _aio_common.time_remaining(self._deadline)
+        return 0.0
+
+    def trailing_metadata(self):
+        return self._pending_trailing_metadata
+
+    def code(self):
+        return self._pending_code
+
+    def details(self):
+        return self._pending_details
+
+    def add_done_callback(self, callback):
+        if self._callbacks is None:
+            asyncio.get_running_loop().call_soon(callback, self)
+        else:
+            self._callbacks.append(callback)
+
+    def cancelled(self):
+        return self._cancelled
+
+    def done(self):
+        return not self._active
+
+
+class _RequestIterator:
+    def __init__(self, servicer_context):
+        self._servicer_context = servicer_context
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        request = await self._servicer_context.take_request()
+        if request is aio.EOF:
+            raise StopAsyncIteration()
+        return request
+
+
+async def _resolve(result):
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+async def _unary_response(argument, implementation, servicer_context):
+    try:
+        response = await _resolve(implementation(argument, servicer_context))
+    except (aio.AbortError, asyncio.CancelledError):
+        return
+    except Exception as exception:  # pylint: disable=broad-except
+        servicer_context.exception_abort(exception)
+    else:
+        if servicer_context.done():
+            return
+        servicer_context.add_response(response)
+        servicer_context.complete()
+
+
+async def _stream_response(argument, implementation, servicer_context):
+    try:
+        responses = implementation(argument, servicer_context)
+        if hasattr(responses, "__aiter__"):
+            async for response in responses:
+                servicer_context.add_response(copy.deepcopy(response))
+        elif inspect.isawaitable(responses):
+            # NOTE: Reader/writer style handlers stream responses with
+            # ServicerContext.write and return None.
+            await responses
+        elif responses is not None:
+            for response in responses:
+                servicer_context.add_response(copy.deepcopy(response))
+                await asyncio.sleep(0)
+    except (aio.AbortError, asyncio.CancelledError):
+        return
+    except Exception as exception:  # pylint: disable=broad-except
+        servicer_context.exception_abort(exception)
+    else:
+        servicer_context.complete()
+
+
+def _implementation(descriptors_to_servicers, method_descriptor):
+    servicer = descriptors_to_servicers[method_descriptor.containing_service]
+    return getattr(servicer, method_descriptor.name)
+
+
+class _UnaryUnaryServerRpc(grpc_testing.aio.UnaryUnaryServerRpc):
+    def __init__(self, handler):
+        self._handler = handler
+
+    async def initial_metadata(self):
+        return await self._handler.initial_metadata()
+
+    def cancel(self):
+        self._handler.cancel()
+
+    async def termination(self):
+        return await self._handler.unary_response_termination()
+
+
+class _UnaryStreamServerRpc(grpc_testing.aio.UnaryStreamServerRpc):
+    def __init__(self, handler):
+        self._handler = handler
+
+    async def initial_metadata(self):
+        return await self._handler.initial_metadata()
+
+    async def take_response(self):
+        return await self._handler.take_response()
+
+    def cancel(self):
+        self._handler.cancel()
+
+    async def termination(self):
+        return await self._handler.stream_response_termination()
+
+
+class _StreamUnaryServerRpc(grpc_testing.aio.StreamUnaryServerRpc):
+    def __init__(self, handler):
+        self._handler = handler
+
+    async def initial_metadata(self):
+        return await self._handler.initial_metadata()
+
+    def send_request(self, request):
+        self._handler.add_request(request)
+
+    def requests_closed(self):
+        self._handler.requests_closed()
+
+    def cancel(self):
+        self._handler.cancel()
+
+    async def termination(self):
+        return await self._handler.unary_response_termination()
+
+
+class _StreamStreamServerRpc(grpc_testing.aio.StreamStreamServerRpc):
+    def __init__(self, handler):
+        self._handler = handler
+
+    async def initial_metadata(self):
+        return await self._handler.initial_metadata()
+
+    def send_request(self, request):
+        self._handler.add_request(request)
+
+    def requests_closed(self):
+        self._handler.requests_closed()
+
+    async def take_response(self):
+        return await self._handler.take_response()
+
+    def cancel(self):
+        self._handler.cancel()
+
+    async def termination(self):
+        return await self._handler.stream_response_termination()
+
+
+class _Server(grpc_testing.aio.Server):
+    def __init__(self, descriptors_to_servicers):
+        self._descriptors_to_servicers = descriptors_to_servicers
+
+    def _invoke(
+        self,
+        service_behavior,
+        method_descriptor,
+        invocation_metadata,
+        request,
+        requests_closed,
+        timeout,
+    ):
+        implementation = _implementation(
+            self._descriptors_to_servicers, method_descriptor
+        )
+        deadline = _aio_common.deadline(timeout)
+        handler = _Handler(requests_closed, deadline)
+        servicer_context = _ServicerContext(
+            handler, invocation_metadata, deadline
+        )
+        if request is None:
+            argument = _RequestIterator(servicer_context)
+        else:
+            argument = request
+        if handler.add_termination_callback(servicer_context.extrinsic_abort):
+            servicer_context.set_task(
+                asyncio.get_running_loop().create_task(
+                    service_behavior(argument, implementation, servicer_context)
+                )
+            )
+        return handler
+
+    def invoke_unary_unary(
+        self, method_descriptor, invocation_metadata, request, timeout
+    ):
+        handler = self._invoke(
+            _unary_response,
+            method_descriptor,
+            invocation_metadata,
+            request,
+            True,
+            timeout,
+        )
+        return _UnaryUnaryServerRpc(handler)
+
+    def invoke_unary_stream(
+        self, method_descriptor, invocation_metadata, request, timeout
+    ):
+        handler = self._invoke(
+            _stream_response,
+            method_descriptor,
+            invocation_metadata,
+            request,
+            True,
+            timeout,
+        )
+        return _UnaryStreamServerRpc(handler)
+
+    def invoke_stream_unary(
+        self, method_descriptor, invocation_metadata, timeout
+    ):
+        handler = self._invoke(
+            _unary_response,
+            method_descriptor,
+            invocation_metadata,
+            None,
+            False,
+            timeout,
+        )
+        return _StreamUnaryServerRpc(handler)
+
+    def invoke_stream_stream(
+        self, method_descriptor, invocation_metadata, timeout
+    ):
+        handler = self._invoke(
+            _stream_response,
+            method_descriptor,
+            invocation_metadata,
+            None,
+            False,
+            timeout,
+        )
+        return _StreamStreamServerRpc(handler)
+
+
+def server_from_dictionary(descriptors_to_servicers):
+    return _Server(descriptors_to_servicers)
@@ -0,0 +1,98 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""An event loop with a simulated clock."""
+
+import asyncio
+import selectors
+
+
+class _AutojumpSelector:
+    """Wraps a real selector, turning idle waits into clock advances.
+
+    The event loop asks its selector to wait for at most the time remaining
+    until its earliest timer. Instead of sleeping, this selector polls the
+    wrapped selector without blocking and, if nothing is ready, moves the
+    clock forward by the requested amount so that the timer matures on the
+    loop's next iteration.
+    """
+
+    def __init__(self, selector, clock):
+        self._selector = selector
+        self._clock = clock
+
+    def register(self, fileobj, events, data=None):
+        return self._selector.register(fileobj, events, data=data)
+
+    def unregister(self, fileobj):
+        return self._selector.unregister(fileobj)
+
+    def modify(self, fileobj, events, data=None):
+        return self._selector.modify(fileobj, events, data=data)
+
+    def select(self, timeout=None):
+        ready = self._selector.select(0)
+        if ready:
+            return ready
+        elif timeout is None:
+            # NOTE: No timers are pending so only another thread waking the
+            # loop (e.g. call_soon_threadsafe) can make progress.
+            return self._selector.select(None)
+        else:
+            if timeout > 0:
+                self._clock.advance(timeout)
+            return ready
+
+    def close(self):
+        self._selector.close()
+
+    def get_key(self, fileobj):
+        return self._selector.get_key(fileobj)
+
+    def get_map(self):
+        return self._selector.get_map()
+
+
+class _Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def advance(self, duration):
+        self.now += duration
+
+
+class FakeTimeEventLoop(asyncio.SelectorEventLoop):
+    """A SelectorEventLoop whose time() is simulated."""
+
+    def __init__(self, now):
+        self._fake_clock = _Clock(now)
+        super().__init__(
+            selector=_AutojumpSelector(
+                selectors.DefaultSelector(), self._fake_clock
+            )
+        )
+
+    def time(self):
+        return self._fake_clock.now
+
+    def advance(self, duration):
+        """Moves the loop's clock forward.
+
+        Timers that mature as a result run on the loop's next iteration.
+
+        Args:
+          duration: A non-negative number of seconds.
+        """
+        if duration < 0:
+            raise ValueError("Cannot move time backwards!")
+        self._fake_clock.advance(duration)
@@ -13,8 +13,11 @@
 # limitations under the License.
 """A test to ensure that admin services are registered correctly."""
 
+import asyncio
 from concurrent.futures import ThreadPoolExecutor
 import logging
+import threading
+import time
 import unittest
 
 import grpc
@@ -24,6 +27,10 @@ from grpc_channelz.v1 import channelz_pb2_grpc
 from grpc_csds import csds_pb2
 from grpc_csds import csds_pb2_grpc
 
+_PROFILE_METHOD = "/grpc.admin.v1.Profiler/Profile"
+_BLOCK_METHOD = "/test/Block"
+_SHORT_TIMEOUT_S = 10
+
 
 class TestAdmin(unittest.TestCase):
     def setUp(self):
@@ -50,6 +57,113 @@ class TestAdmin(unittest.TestCase):
         # No exception raised and the response is valid
         self.assertGreater(len(resp.channel), 0)
 
+    def test_has_profiler(self):
+        profile = self._channel.unary_unary(_PROFILE_METHOD)
+        collapsed = profile(b'{"duration_seconds": 0.05}').decode("utf-8")
+        # Every line is a stack followed by its number of samples.
+        for line in collapsed.splitlines():
+            stack, count = line.rsplit(" ", 1)
+            self.assertTrue(stack)
+            self.assertGreater(int(count), 0)
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self._started = threading.Event()
+        self._release = threading.Event()
+        self._server = grpc.server(ThreadPoolExecutor(max_workers=4))
+        self._server.add_registered_method_handlers(
+            "test",
+            {"Block": grpc.unary_unary_rpc_method_handler(self._block)},
+        )
+        port = self._server.add_insecure_port("localhost:0")
+        grpc_admin.add_admin_servicers(self._server)
+        self._server.start()
+
+        self._channel = grpc.insecure_channel("localhost:%s" % port)
+        self._profile = self._channel.unary_unary(_PROFILE_METHOD)
+
+    def tearDown(self):
+        self._release.set()
+        self._channel.close()
+        self._server.stop(0)
+
+    def _block(self, request, context):
+        self._started.set()
+        self._release.wait()
+        return request
+
+    def test_tags_stacks_with_method(self):
+        block_future = self._channel.unary_unary(
+            _BLOCK_METHOD, _registered_method=True
+        ).future(b"")
+        self.assertTrue(self._started.wait(_SHORT_TIMEOUT_S))
+
+        collapsed = self._profile(b'{"duration_seconds": 0.1}').decode("utf-8")
+        self._release.set()
+
+        self.assertEqual(b"", block_future.result())
+        tagged_stacks = [
+            line
+            for line in collapsed.splitlines()
+            if line.startswith(_BLOCK_METHOD + ";")
+        ]
+        self.assertTrue(tagged_stacks)
+        self.assertIn(";_block (", tagged_stacks[0])
+
+    def test_rejects_invalid_request(self):
+        for request in (b"[]", b'{"duration_seconds": 3600}', b"{"):
+            with self.assertRaises(grpc.RpcError) as exception_context:
+                self._profile(request)
+            self.assertIs(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                exception_context.exception.code(),
+            )
+
+    def test_one_profile_at_a_time(self):
+        running_profile = self._profile.future(b'{"duration_seconds": 30}')
+
+        deadline = time.monotonic() + _SHORT_TIMEOUT_S
+        while not running_profile.done() and time.monotonic() < deadline:
+            try:
+                self._profile(b'{"duration_seconds": 0.001}')
+            except grpc.RpcError as rpc_error:
+                self.assertIs(
+                    grpc.StatusCode.RESOURCE_EXHAUSTED, rpc_error.code()
+                )
+                running_profile.cancel()
+                return
+            time.sleep(0.01)
+
+        # Otherwise a short profile ran first and kept the long one out.
+        self.assertTrue(running_profile.done())
+        self.assertIs(
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            running_profile.exception().code(),
+        )
+
+
+class TestAsyncProfiler(unittest.TestCase):
+    def test_samples_event_loop_thread(self):
+        async def profile():
+            server = grpc.aio.server()
+            port = server.add_insecure_port("localhost:0")
+            grpc_admin.add_admin_servicers(server)
+            await server.start()
+            try:
+                async with grpc.aio.insecure_channel(
+                    "localhost:%s" % port
+                ) as channel:
+                    return await channel.unary_unary(_PROFILE_METHOD)(
+                        b'{"duration_seconds": 0.1}'
+                    )
+            finally:
+                await server.stop(None)
+
+        collapsed = asyncio.run(profile()).decode("utf-8")
+
+        self.assertIn("_run_once (", collapsed)
+
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
@@ -72,13 +72,13 @@ class _ChannelServerPair:
             futures.ThreadPoolExecutor(max_workers=3),
             options=_DISABLE_REUSE_PORT + _ENABLE_CHANNELZ,
         )
-        port = self.server.add_insecure_port("[::]:0")
+        self.port = self.server.add_insecure_port("[::]:0")
         self.server.add_generic_rpc_handlers((_GenericHandler(),))
         self.server.start()
 
         # Channel will enable channelz service...
         self.channel = grpc.insecure_channel(
-            "localhost:%d" % port, _ENABLE_CHANNELZ
+            "localhost:%d" % self.port, _ENABLE_CHANNELZ
         )
 
 
@@ -220,6 +220,44 @@ class ChannelzServicerTest(unittest.TestCase):
         )
         self.assertEqual(len(resp.channel), k_channels)
 
+    def test_get_top_channels_pagination(self):
+        k_channels = 4
+        self._pairs = _generate_channel_server_pairs(k_channels)
+        channel_ids = []
+        start_channel_id = 0
+        while True:
+            resp = self._channelz_stub.GetTopChannels(
+                channelz_pb2.GetTopChannelsRequest(
+                    start_channel_id=start_channel_id, max_results=1
+                )
+            )
+            self.assertLessEqual(len(resp.channel), 1)
+            channel_ids.extend(
+                channel.ref.channel_id for channel in resp.channel
+            )
+            if resp.end:
+                break
+            start_channel_id = channel_ids[-1] + 1
+        self.assertEqual(len(channel_ids), k_channels)
+        self.assertEqual(len(set(channel_ids)), k_channels)
+
+    def test_get_servers_pagination(self):
+        k_servers = 3
+        self._pairs = _generate_channel_server_pairs(k_servers)
+        resp = self._channelz_stub.GetServers(
+            channelz_pb2.GetServersRequest(start_server_id=0, max_results=2)
+        )
+        self.assertEqual(len(resp.server), 2)
+        self.assertFalse(resp.end)
+        resp = self._channelz_stub.GetServers(
+            channelz_pb2.GetServersRequest(
+                start_server_id=resp.server[-1].ref.server_id + 1,
+                max_results=2,
+            )
+        )
+        self.assertEqual(len(resp.server), 1)
+        self.assertTrue(resp.end)
+
     def test_many_subchannels(self):
         k_channels = 4
         self._pairs = _generate_channel_server_pairs(k_channels)
@@ -489,6 +527,38 @@ class ChannelzServicerTest(unittest.TestCase):
             msg="Client address string must not be empty",
         )
 
+    def test_server_sockets_pagination(self):
+        self._pairs = _generate_channel_server_pairs(1)
+        self._send_successful_unary_unary(0)
+        with grpc.insecure_channel(
+            "localhost:%d" % self._pairs[0].port, _ENABLE_CHANNELZ
+        ) as channel:
+            channel.unary_unary(
+                _SUCCESSFUL_UNARY_UNARY,
+                _registered_method=True,
+            )(_REQUEST)
+
+            gs_resp = self._channelz_stub.GetServers(
+                channelz_pb2.GetServersRequest(start_server_id=0)
+            )
+            server_id = gs_resp.server[0].ref.server_id
+            gss_resp = self._channelz_stub.GetServerSockets(
+                channelz_pb2.GetServerSocketsRequest(
+                    server_id=server_id, start_socket_id=0, max_results=1
+                )
+            )
+            self.assertEqual(len(gss_resp.socket_ref), 1)
+            self.assertFalse(gss_resp.end)
+            gss_resp = self._channelz_stub.GetServerSockets(
+                channelz_pb2.GetServerSocketsRequest(
+                    server_id=server_id,
+                    start_socket_id=gss_resp.socket_ref[0].socket_id + 1,
+                    max_results=1,
+                )
+            )
+            self.assertEqual(len(gss_resp.socket_ref), 1)
+            self.assertTrue(gss_resp.end)
+
     def test_server_listen_sockets(self):
         self._pairs = _generate_channel_server_pairs(1)
 
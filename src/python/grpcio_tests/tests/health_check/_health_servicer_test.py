@@ -33,12 +33,20 @@ _UNKNOWN_SERVICE = "grpc.test.TestServiceUnknown"
 _NOT_SERVING_SERVICE = "grpc.test.TestServiceNotServing"
 _WATCH_SERVICE = "grpc.test.WatchService"
 
+_WATCHER_COUNT = 20
+_STATUS_CHANGE_COUNT = 100
+
 
 def _consume_responses(response_iterator, response_queue):
     for response in response_iterator:
         response_queue.put(response)
 
 
+class _ServicerContext:
+    def add_callback(self, callback):
+        return True
+
+
 class BaseWatchTests:
     class WatchTests(unittest.TestCase):
         def start_server(self, non_blocking=False, thread_pool=None):
@@ -200,6 +208,57 @@ class BaseWatchTests:
             self.assertTrue(response_queue1.empty())
             self.assertTrue(response_queue2.empty())
 
+        def test_many_watchers_converge_to_latest_status(self):
+            request = health_pb2.HealthCheckRequest(service=_WATCH_SERVICE)
+            rendezvous_and_queues = []
+            threads = []
+            for _ in range(_WATCHER_COUNT):
+                rendezvous = self._stub.Watch(request)
+                response_queue = queue.Queue()
+                rendezvous_and_queues.append((rendezvous, response_queue))
+                thread = threading.Thread(
+                    target=_consume_responses,
+                    args=(rendezvous, response_queue),
+                )
+                thread.start()
+                threads.append(thread)
+            for _, response_queue in rendezvous_and_queues:
+                response = response_queue.get(
+                    timeout=test_constants.SHORT_TIMEOUT
+                )
+                self.assertEqual(
+                    health_pb2.HealthCheckResponse.SERVICE_UNKNOWN,
+                    response.status,
+                )
+
+            for index in range(_STATUS_CHANGE_COUNT):
+                self._servicer.set(
+                    _WATCH_SERVICE,
+                    (
+                        health_pb2.HealthCheckResponse.NOT_SERVING
+                        if index % 2
+                        else health_pb2.HealthCheckResponse.SERVING
+                    ),
+                )
+            self._servicer.set(
+                _WATCH_SERVICE, health_pb2.HealthCheckResponse.UNKNOWN
+            )
+
+            for _, response_queue in rendezvous_and_queues:
+                # Intermediate statuses may have been coalesced away, but the
+                # latest one is always delivered.
+                response = response_queue.get(
+                    timeout=test_constants.SHORT_TIMEOUT
+                )
+                while response.status != health_pb2.HealthCheckResponse.UNKNOWN:
+                    response = response_queue.get(
+                        timeout=test_constants.SHORT_TIMEOUT
+                    )
+            for rendezvous, _ in rendezvous_and_queues:
+                rendezvous.cancel()
+            for thread in threads:
+                thread.join()
+
         @unittest.skip("https://github.com/grpc/grpc/issues/18127")
         def test_cancelled_watch_removed_from_watch_list(self):
             request = health_pb2.HealthCheckRequest(service=_WATCH_SERVICE)
@@ -225,11 +284,12 @@ class BaseWatchTests:
             timeout = time.time() + test_constants.TIME_ALLOWANCE
             while (
                 time.time() < timeout
-                and self._servicer._send_response_callbacks[_WATCH_SERVICE]
+                and _WATCH_SERVICE in self._servicer._subscriptions
             ):
                 time.sleep(1)
-            self.assertFalse(
-                self._servicer._send_response_callbacks[_WATCH_SERVICE],
+            self.assertNotIn(
+                _WATCH_SERVICE,
+                self._servicer._subscriptions,
                 "watch set should be empty",
             )
             self.assertTrue(response_queue.empty())
@@ -301,6 +361,42 @@ class HealthServicerTest(BaseWatchTests.WatchTests):
     def test_health_service_name(self):
         self.assertEqual(health.SERVICE_NAME, "grpc.health.v1.Health")
 
+    def test_set_does_not_wait_for_slow_watcher(self):
+        request = health_pb2.HealthCheckRequest(service=_WATCH_SERVICE)
+        release = threading.Event()
+        response_queue = queue.Queue()
+        self._servicer.Watch(
+            request, _ServicerContext(), lambda response: release.wait()
+        )
+        self._servicer.Watch(request, _ServicerContext(), response_queue.put)
+
+        set_thread = threading.Thread(
+            target=self._servicer.set,
+            args=(_WATCH_SERVICE, health_pb2.HealthCheckResponse.SERVING),
+        )
+        set_thread.start()
+        set_thread.join(test_constants.SHORT_TIMEOUT)
+        set_returned = not set_thread.is_alive()
+        response = response_queue.get(timeout=test_constants.SHORT_TIMEOUT)
+        while response.status != health_pb2.HealthCheckResponse.SERVING:
+            response = response_queue.get(timeout=test_constants.SHORT_TIMEOUT)
+        release.set()
+
+        self.assertTrue(set_returned)
+
+    def test_watch_after_graceful_shutdown(self):
+        self._servicer.enter_graceful_shutdown()
+        request = health_pb2.HealthCheckRequest(service=_SERVING_SERVICE)
+        response_queue = queue.Queue()
+        self._servicer.Watch(request, _ServicerContext(), response_queue.put)
+
+        response = response_queue.get(timeout=test_constants.SHORT_TIMEOUT)
+        self.assertEqual(
+            health_pb2.HealthCheckResponse.NOT_SERVING, response.status
+        )
+        with self.assertRaises(RuntimeError):
+            self._servicer._delivery_executor.submit(lambda: None)
+
 
 class HealthServicerBackwardsCompatibleWatchTest(BaseWatchTests.WatchTests):
     def setUp(self):
@@ -27,6 +27,9 @@ from grpc_csm_observability import CsmOpenTelemetryPlugin
 from grpc_csm_observability._csm_observability_plugin import (
     CSMOpenTelemetryLabelInjector,
 )
+from grpc_csm_observability._csm_observability_plugin import (
+    PEER_LABELS_CACHE_SIZE,
+)
 from grpc_csm_observability._csm_observability_plugin import TYPE_GCE
 from grpc_csm_observability._csm_observability_plugin import TYPE_GKE
 from grpc_csm_observability._csm_observability_plugin import UNKNOWN_VALUE
@@ -560,6 +563,9 @@ class MetadataExchangeTest(unittest.TestCase):
     "Observability is not supported in Windows and MacOS",
 )
 class DeserializeLabelsTest(unittest.TestCase):
+    def setUp(self):
+        CSMOpenTelemetryLabelInjector.clear_peer_labels_cache()
+
     def _serialize_metadata(self, fields):
         struct = struct_pb2.Struct(
             fields={
@@ -708,6 +714,42 @@ class DeserializeLabelsTest(unittest.TestCase):
         self.assertEqual(result["grpc.method"], grpc_method)
         self.assertNotIn("XEnvoyPeerMetadata", result)
 
+    def testRepeatedMetadataIsServedFromCache(self):
+        metadata = self._serialize_metadata(
+            {"type": TYPE_GCE, "canonical_service": "my_canonical_service"}
+        )
+
+        first = CSMOpenTelemetryLabelInjector.deserialize_labels(
+            {"XEnvoyPeerMetadata": metadata, "grpc.method": "test/A"}
+        )
+        second = CSMOpenTelemetryLabelInjector.deserialize_labels(
+            {"XEnvoyPeerMetadata": metadata, "grpc.method": "test/B"}
+        )
+
+        cache_info = CSMOpenTelemetryLabelInjector.peer_labels_cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 1)
+        self.assertEqual(cache_info.currsize, 1)
+        self.assertEqual(first["grpc.method"], "test/A")
+        self.assertEqual(second["grpc.method"], "test/B")
+        self.assertEqual(
+            second["csm.remote_workload_canonical_service"],
+            "my_canonical_service",
+        )
+
+    def testCacheIsBounded(self):
+        for i in range(PEER_LABELS_CACHE_SIZE + 10):
+            metadata = self._serialize_metadata(
+                {"type": TYPE_GCE, "canonical_service": f"service_{i}"}
+            )
+            CSMOpenTelemetryLabelInjector.deserialize_labels(
+                {"XEnvoyPeerMetadata": metadata}
+            )
+
+        cache_info = CSMOpenTelemetryLabelInjector.peer_labels_cache_info()
+        self.assertEqual(cache_info.currsize, PEER_LABELS_CACHE_SIZE)
+        self.assertEqual(cache_info.misses, PEER_LABELS_CACHE_SIZE + 10)
+
 
 def validate_metrics_exist(
     testCase: unittest.TestCase, all_metrics: Dict[str, Any]
@@ -22,7 +22,10 @@ from tests.observability import _from_observability_import_star
 
 class AllTest(unittest.TestCase):
     def testBaseOtel(self):
-        expected_observability_code_elements = ("OpenTelemetryPlugin",)
+        expected_observability_code_elements = (
+            "BufferOverflowPolicy",
+            "OpenTelemetryPlugin",
+        )
 
         self.assertCountEqual(
             expected_observability_code_elements,
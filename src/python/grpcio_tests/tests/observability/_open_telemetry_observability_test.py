@@ -24,6 +24,14 @@ import unittest
 import grpc
 import grpc_observability
 from grpc_observability import _open_telemetry_measures
+from grpc_observability._cyobservability import MetricsName
+from grpc_observability._observability import StatsData
+from grpc_observability._open_telemetry_observability import (
+    CENSUS_DROPPED_MEASUREMENTS_METRIC,
+)
+from grpc_observability._open_telemetry_observability import (
+    CENSUS_QUEUE_DEPTH_METRIC,
+)
 from grpc_observability._open_telemetry_observability import (
     GRPC_OTHER_LABEL_VALUE,
 )
@@ -34,6 +42,7 @@ from grpc_observability._open_telemetry_observability import GRPC_METHOD_LABEL
 from grpc_observability._open_telemetry_observability import GRPC_TARGET_LABEL
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import AggregationTemporality
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
 from opentelemetry.sdk.metrics.export import MetricExportResult
 from opentelemetry.sdk.metrics.export import MetricExporter
 from opentelemetry.sdk.metrics.export import MetricsData
@@ -499,6 +508,34 @@ class OpenTelemetryObservabilityTest(unittest.TestCase):
         self.assertTrue(GRPC_OTHER_LABEL_VALUE in server_method_values)
         self.assertTrue(UNARY_METHOD_NAME not in server_method_values)
 
+    def testExportBufferMetrics(self):
+        otel_plugin = grpc_observability.OpenTelemetryPlugin(
+            meter_provider=self._provider,
+            export_interval=0.1,
+            max_export_buffer_size=1,
+            export_buffer_overflow_policy=grpc_observability.BufferOverflowPolicy.DROP_OLDEST,
+            enable_export_buffer_metrics=True,
+        )
+        otel_plugin.register_global()
+
+        server, port = _test_server.start_server()
+        self._server = server
+        _test_server.unary_unary_call(port=port)
+
+        self.assert_eventually(
+            lambda: CENSUS_DROPPED_MEASUREMENTS_METRIC in self.all_metrics,
+            message=lambda: f"{CENSUS_DROPPED_MEASUREMENTS_METRIC} not exported",
+        )
+        self.assertIn(CENSUS_QUEUE_DEPTH_METRIC, self.all_metrics)
+        otel_plugin.deregister_global()
+
+    def testInvalidExportIntervalRaises(self):
+        otel_plugin = grpc_observability.OpenTelemetryPlugin(
+            meter_provider=self._provider, export_interval=0
+        )
+        with self.assertRaises(ValueError):
+            otel_plugin.register_global()
+
     def assert_eventually(
         self,
         predicate: Callable[[], bool],
@@ -591,6 +628,70 @@ class DecodeLabelsTest(unittest.TestCase):
         self.assertIsInstance(decoded[key], str)
 
 
+@unittest.skipIf(
+    os.name == "nt" or "darwin" in sys.platform,
+    "Observability is not supported in Windows and MacOS",
+)
+class AggregatedStatsDataTest(unittest.TestCase):
+    def setUp(self):
+        self._reader = InMemoryMetricReader()
+        otel_plugin = grpc_observability.OpenTelemetryPlugin(
+            meter_provider=MeterProvider(metric_readers=[self._reader])
+        )
+        self._plugin = _OpenTelemetryPlugin(otel_plugin)
+        self._plugin.activate_client_plugin_options(b"localhost")
+        self._labels = {
+            GRPC_METHOD_LABEL: "test/UnaryUnary",
+            GRPC_TARGET_LABEL: "localhost",
+        }
+
+    def _get_data_points(self, metric_name):
+        metrics_data = self._reader.get_metrics_data()
+        for resource_metric in metrics_data.resource_metrics:
+            for scope_metric in resource_metric.scope_metrics:
+                for metric in scope_metric.metrics:
+                    if metric.name == metric_name:
+                        return list(metric.data.data_points)
+        return []
+
+    def testAggregatedCounterIsAddedOnce(self):
+        self._plugin.maybe_record_stats_data(
+            StatsData(
+                name=MetricsName.CLIENT_STARTED_RPCS,
+                measure_double=False,
+                value_int=3,
+                labels=self._labels,
+                registered_method=True,
+                aggregated_values=[1, 1, 1],
+            )
+        )
+
+        data_points = self._get_data_points(
+            _open_telemetry_measures.CLIENT_ATTEMPT_STARTED.name
+        )
+        self.assertEqual(len(data_points), 1)
+        self.assertEqual(data_points[0].value, 3)
+
+    def testAggregatedHistogramRecordsEverySample(self):
+        self._plugin.maybe_record_stats_data(
+            StatsData(
+                name=MetricsName.CLIENT_ROUNDTRIP_LATENCY,
+                measure_double=True,
+                value_float=0.6,
+                labels=self._labels,
+                registered_method=True,
+                aggregated_values=[0.1, 0.2, 0.3],
+            )
+        )
+
+        data_points = self._get_data_points(
+            _open_telemetry_measures.CLIENT_ATTEMPT_DURATION.name
+        )
+        self.assertEqual(len(data_points), 1)
+        self.assertEqual(data_points[0].count, 3)
+        self.assertAlmostEqual(data_points[0].sum, 0.6)
+
+
 if __name__ == "__main__":
     logging.basicConfig()
     unittest.main(verbosity=2)
@@ -0,0 +1,139 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the qps worker histogram."""
+
+import logging
+import math
+import random
+import threading
+import unittest
+
+from tests.qps import histogram
+
+_RESOLUTION = 0.01
+_MAX_POSSIBLE = 60e9
+_SAMPLE_COUNT = 10000
+_THREAD_COUNT = 4
+
+
+def _samples():
+    rng = random.Random(0)
+    return [rng.lognormvariate(12, 1) for _ in range(_SAMPLE_COUNT)]
+
+
+class HistogramTest(unittest.TestCase):
+    def setUp(self):
+        self._histogram = histogram.Histogram(_RESOLUTION, _MAX_POSSIBLE)
+
+    def assertWithinResolution(self, expected, actual):
+        self.assertLessEqual(abs(expected - actual), 2 * _RESOLUTION * expected)
+
+    def testWireFormat(self):
+        for sample in _samples():
+            self._histogram.add(sample)
+
+        data = self._histogram.get_data()
+
+        self.assertEqual(
+            int(math.log(_MAX_POSSIBLE, 1 + _RESOLUTION)) + 1, len(data.bucket)
+        )
+        self.assertEqual(_SAMPLE_COUNT, data.count)
+        self.assertEqual(_SAMPLE_COUNT, sum(data.bucket))
+        self.assertEqual(min(_samples()), data.min_seen)
+        self.assertEqual(max(_samples()), data.max_seen)
+        self.assertAlmostEqual(sum(_samples()), data.sum, delta=1)
+
+    def testPercentiles(self):
+        samples = sorted(_samples())
+        for sample in samples:
+            self._histogram.add(sample)
+
+        for percent in (50, 90, 99):
+            self.assertWithinResolution(
+                samples[int(_SAMPLE_COUNT * percent / 100)],
+                self._histogram.percentile(percent),
+            )
+        self.assertEqual(samples[0], self._histogram.percentile(0))
+        self.assertEqual(samples[-1], self._histogram.percentile(100))
+
+    def testEmpty(self):
+        data = self._histogram.get_data()
+
+        self.assertEqual(0, data.count)
+        self.assertEqual(0, sum(data.bucket))
+        self.assertEqual(0.0, self._histogram.percentile(50))
+
+    def testOutOfRangeSamples(self):
+        self._histogram.add(0)
+        self._histogram.add(_MAX_POSSIBLE * 2)
+
+        data = self._histogram.get_data()
+
+        self.assertEqual(2, data.count)
+        self.assertEqual(1, data.bucket[0])
+        self.assertEqual(1, data.bucket[-1])
+        self.assertEqual(_MAX_POSSIBLE, data.max_seen)
+
+    def testThreadsRecordConcurrently(self):
+        samples = _samples()
+
+        def record():
+            for sample in samples:
+                self._histogram.add(sample)
+
+        threads = [
+            threading.Thread(target=record) for _ in range(_THREAD_COUNT)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        data = self._histogram.get_data()
+        self.assertEqual(_THREAD_COUNT * _SAMPLE_COUNT, data.count)
+        self.assertEqual(_THREAD_COUNT * _SAMPLE_COUNT, sum(data.bucket))
+
+    def testReset(self):
+        for sample in _samples():
+            self._histogram.add(sample)
+        self._histogram.merge(self._histogram.get_data())
+
+        self._histogram.reset()
+        self._histogram.add(1000)
+
+        data = self._histogram.get_data()
+        self.assertEqual(1, data.count)
+        self.assertEqual(1000, data.min_seen)
+        self.assertEqual(1000, data.max_seen)
+
+    def testMerge(self):
+        samples = _samples()
+        other = histogram.Histogram(_RESOLUTION, _MAX_POSSIBLE)
+        for sample in samples[: _SAMPLE_COUNT // 2]:
+            self._histogram.add(sample)
+        for sample in samples[_SAMPLE_COUNT // 2 :]:
+            other.add(sample)
+
+        self._histogram.merge(other.get_data())
+
+        data = self._histogram.get_data()
+        self.assertEqual(_SAMPLE_COUNT, data.count)
+        self.assertEqual(_SAMPLE_COUNT, sum(data.bucket))
+        self.assertEqual(min(samples), data.min_seen)
+        self.assertEqual(max(samples), data.max_seen)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -14,6 +14,7 @@
 """Defines test client behaviors (UNARY/STREAMING) (SYNC/ASYNC)."""
 
 import abc
+import collections
 from concurrent import futures
 import queue
 import threading
@@ -256,3 +257,130 @@ class ServerStreamingSyncBenchmarkClient(BenchmarkClient):
         if self._pool is not None:
             self._pool.shutdown(wait=False)
         self._stub = None
+
+
+class _AsyncStream:
+    """A ping-pong stream fed from a queue and read through its rendezvous."""
+
+    def __init__(self, stub, request, handle_response):
+        self._stub = stub
+        self._request = request
+        self._handle_response = handle_response
+        self._request_queue = queue.SimpleQueue()
+        self._send_times = collections.deque()
+        self._call = None
+
+    def send_request(self):
+        self._send_times.append(time.time())
+        self._request_queue.put(self._request)
+
+    def start(self):
+        self._call = self._stub.StreamingCall(
+            iter(self._request_queue.get, None), _TIMEOUT
+        )
+
+    def read_responses(self):
+        try:
+            for _ in self._call:
+                self._handle_response(
+                    self, time.time() - self._send_times.popleft()
+                )
+        except grpc.RpcError as rpc_error:
+            if rpc_error.code() is not grpc.StatusCode.CANCELLED:
+                raise
+
+    def stop(self):
+        self._request_queue.put(None)
+        if self._call is not None:
+            self._call.cancel()
+
+
+class StreamingAsyncBenchmarkClient(BenchmarkClient):
+    """Ping-pong streaming client that never blocks the caller.
+
+    Requests are handed to the call's request iterator through a queue and
+    every response is dispatched from the call's response iterator.
+    """
+
+    def __init__(self, server, config, hist):
+        super(StreamingAsyncBenchmarkClient, self).__init__(
+            server, config, hist
+        )
+        self._pool = futures.ThreadPoolExecutor(
+            max_workers=config.outstanding_rpcs_per_channel
+        )
+        self._streams = [
+            _AsyncStream(self._stub, self._request, self._handle_response)
+            for _ in range(config.outstanding_rpcs_per_channel)
+        ]
+        self._curr_stream = 0
+
+    def send_request(self):
+        # Closed loop replies on the stream that completed, so this round
+        # robin only spreads the initial and open loop requests.
+        self._streams[self._curr_stream].send_request()
+        self._curr_stream = (self._curr_stream + 1) % len(self._streams)
+
+    def start(self):
+        for stream in self._streams:
+            stream.start()
+            self._pool.submit(stream.read_responses)
+
+    def stop(self):
+        for stream in self._streams:
+            stream.stop()
+        self._pool.shutdown(wait=True)
+        self._stub = None
+
+
+class ServerStreamingAsyncBenchmarkClient(BenchmarkClient):
+    """Server-streaming client that reads every call through its rendezvous.
+
+    Each send_request() starts a call without blocking the caller; terminated
+    calls are forgotten from their done callback. Calls stream until stop(),
+    and each one occupies a reader thread for its lifetime, so at most
+    outstanding_rpcs_per_channel calls are started; the worker only runs
+    this client under closed-loop load.
+    """
+
+    def __init__(self, server, config, hist):
+        super(ServerStreamingAsyncBenchmarkClient, self).__init__(
+            server, config, hist
+        )
+        self._max_calls = config.outstanding_rpcs_per_channel
+        self._pool = futures.ThreadPoolExecutor(max_workers=self._max_calls)
+        self._lock = threading.Lock()
+        self._calls = set()
+        self._is_running = True
+
+    def send_request(self):
+        with self._lock:
+            if not self._is_running or len(self._calls) >= self._max_calls:
+                return
+            call = self._stub.StreamingFromServer(self._request, _TIMEOUT)
+            self._calls.add(call)
+        call.add_done_callback(self._forget_call)
+        self._pool.submit(self._read_responses, call)
+
+    def _forget_call(self, call):
+        with self._lock:
+            self._calls.discard(call)
+
+    def _read_responses(self, call):
+        start_time = time.time()
+        try:
+            for _ in call:
+                self._handle_response(self, time.time() - start_time)
+                start_time = time.time()
+        except grpc.RpcError as rpc_error:
+            if rpc_error.code() is not grpc.StatusCode.CANCELLED:
+                raise
+
+    def stop(self):
+        with self._lock:
+            self._is_running = False
+            calls = tuple(self._calls)
+        for call in calls:
+            call.cancel()
+        self._pool.shutdown(wait=True)
+        self._stub = None
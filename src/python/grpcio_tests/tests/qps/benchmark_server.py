@@ -28,6 +28,13 @@ class BenchmarkServer(benchmark_service_pb2_grpc.BenchmarkServiceServicer):
             payload = messages_pb2.Payload(body=b"\0" * request.response_size)
             yield messages_pb2.SimpleResponse(payload=payload)
 
+    def StreamingFromServer(self, request, context):
+        payload = messages_pb2.Payload(body=b"\0" * request.response_size)
+        response = messages_pb2.SimpleResponse(payload=payload)
+        # Sends responses at full capacity until the client cancels.
+        while context.is_active():
+            yield response
+
 
 class GenericBenchmarkServer(
     benchmark_service_pb2_grpc.BenchmarkServiceServicer
@@ -43,3 +50,8 @@ class GenericBenchmarkServer(
     def StreamingCall(self, request_iterator, context):
         for request in request_iterator:
             yield self._response
+
+    def StreamingFromServer(self, request, context):
+        # Sends responses at full capacity until the client cancels.
+        while context.is_active():
+            yield self._response
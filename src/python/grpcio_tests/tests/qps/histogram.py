@@ -12,69 +12,209 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
 import math
 import threading
 
 from src.proto.grpc.testing import stats_pb2
 
 
+def percentile(data, resolution, percent):
+    """Computes a percentile of a HistogramData like the core histogram does.
+
+    Values are assumed to be spread uniformly within each bucket.
+
+    Args:
+      data: A stats_pb2.HistogramData.
+      resolution: The resolution of the histogram that produced data.
+      percent: The percentile to compute, between 0 and 100.
+
+    Returns:
+      The value below which percent percent of the samples fall.
+    """
+    count_below = data.count * percent / 100.0
+    if data.count == 0:
+        return 0.0
+    if count_below <= 0:
+        return data.min_seen
+    if count_below >= data.count:
+        return data.max_seen
+
+    multiplier = 1.0 + resolution
+    count_so_far = 0.0
+    lower_index = 0
+    for lower_index, bucket in enumerate(data.bucket):
+        count_so_far += bucket
+        if count_so_far >= count_below:
+            break
+    if count_so_far == count_below:
+        # The threshold falls between this bucket and the next non-empty one.
+        upper_index = lower_index + 1
+        while upper_index < len(data.bucket) and not data.bucket[upper_index]:
+            upper_index += 1
+        return (multiplier**lower_index + multiplier**upper_index) / 2.0
+    lower_bound = multiplier**lower_index
+    upper_bound = multiplier ** (lower_index + 1)
+    value = upper_bound - (
+        (upper_bound - lower_bound)
+        * (count_so_far - count_below)
+        / data.bucket[lower_index]
+    )
+    return min(max(value, data.min_seen), data.max_seen)
+
+
+class _Shard:
+    """The samples recorded by a single thread.
+
+    Samples are counted in log-linear buckets: every power of two is split
+    into sub_buckets linear buckets, so that the bucket of a sample is found
+    from its binary exponent and mantissa without computing a logarithm.
+    """
+
+    __slots__ = (
+        "generation",
+        "counts",
+        "sum",
+        "sum_of_squares",
+        "count",
+        "min",
+        "max",
+    )
+
+    def __init__(self, generation, size, max_possible):
+        self.generation = generation
+        self.counts = array.array("Q", [0]) * size
+        self.sum = 0
+        self.sum_of_squares = 0
+        self.count = 0
+        self.min = max_possible
+        self.max = 0
+
+
 class Histogram:
     """Histogram class used for recording performance testing data.
 
-    This class is thread safe.
+    This class is thread safe. Every thread records into its own shard
+    without taking a lock; the shards are merged into the wire format of
+    the core histogram, whose buckets grow by a factor of 1 + resolution,
+    only when get_data is called.
     """
 
     def __init__(self, resolution, max_possible):
         self._lock = threading.Lock()
+        self._local = threading.local()
         self._resolution = resolution
         self._max_possible = max_possible
-        self._sum = 0
-        self._sum_of_squares = 0
         self.multiplier = 1.0 + self._resolution
-        self._count = 0
-        self._min = self._max_possible
-        self._max = 0
-        self._buckets = [0] * (self._bucket_for(self._max_possible) + 1)
+        self._bucket_count = self._bucket_for(self._max_possible) + 1
+        # Sub-buckets are at most as wide as the buckets of the wire format.
+        self._sub_buckets = 1 << max(
+            0, math.ceil(math.log2(1.0 / self._resolution))
+        )
+        _, max_exponent = math.frexp(self._max_possible)
+        self._shard_size = (max_exponent + 1) * self._sub_buckets
+        # The middle of a sub-bucket stands for all of its samples.
+        self._wire_buckets = [
+            self._bucket_for(self._value_of(index))
+            for index in range(self._shard_size)
+        ]
+        self._generation = 0
+        self._shards = []
+        self._merged = self._empty_data()
 
     def reset(self):
+        # Threads notice the new generation on their next add and start a
+        # new shard; a sample racing with the reset may go to either side.
         with self._lock:
-            self._sum = 0
-            self._sum_of_squares = 0
-            self._count = 0
-            self._min = self._max_possible
-            self._max = 0
-            self._buckets = [0] * (self._bucket_for(self._max_possible) + 1)
+            self._generation += 1
+            self._shards = []
+            self._merged = self._empty_data()
 
     def add(self, val):
-        with self._lock:
-            self._sum += val
-            self._sum_of_squares += val * val
-            self._count += 1
-            self._min = min(self._min, val)
-            self._max = max(self._max, val)
-            self._buckets[self._bucket_for(val)] += 1
+        shard = getattr(self._local, "shard", None)
+        if shard is None or shard.generation != self._generation:
+            shard = self._new_shard()
+        if val > self._max_possible:
+            val = self._max_possible
+        if val < 1:
+            index = 0
+        else:
+            mantissa, exponent = math.frexp(val)
+            index = exponent * self._sub_buckets + int(
+                (mantissa - 0.5) * 2 * self._sub_buckets
+            )
+        shard.counts[index] += 1
+        shard.sum += val
+        shard.sum_of_squares += val * val
+        shard.count += 1
+        if val < shard.min:
+            shard.min = val
+        if val > shard.max:
+            shard.max = val
 
     def get_data(self):
         with self._lock:
             data = stats_pb2.HistogramData()
-            data.bucket.extend(self._buckets)
-            data.min_seen = self._min
-            data.max_seen = self._max
-            data.sum = self._sum
-            data.sum_of_squares = self._sum_of_squares
-            data.count = self._count
-            return data
+            data.CopyFrom(self._merged)
+            shards = tuple(self._shards)
+        buckets = list(data.bucket)
+        for shard in shards:
+            for index, count in enumerate(shard.counts):
+                if count:
+                    buckets[self._wire_buckets[index]] += count
+            data.min_seen = min(data.min_seen, shard.min)
+            data.max_seen = max(data.max_seen, shard.max)
+            data.sum += shard.sum
+            data.sum_of_squares += shard.sum_of_squares
+            data.count += shard.count
+        del data.bucket[:]
+        data.bucket.extend(buckets)
+        return data
 
     def merge(self, another_data):
         with self._lock:
-            for i in range(len(self._buckets)):
-                self._buckets[i] += another_data.bucket[i]
-            self._min = min(self._min, another_data.min_seen)
-            self._max = max(self._max, another_data.max_seen)
-            self._sum += another_data.sum
-            self._sum_of_squares += another_data.sum_of_squares
-            self._count += another_data.count
+            merged = self._merged
+            buckets = [
+                bucket + another_bucket
+                for bucket, another_bucket in zip(
+                    merged.bucket, another_data.bucket
+                )
+            ]
+            del merged.bucket[:]
+            merged.bucket.extend(buckets)
+            merged.min_seen = min(merged.min_seen, another_data.min_seen)
+            merged.max_seen = max(merged.max_seen, another_data.max_seen)
+            merged.sum += another_data.sum
+            merged.sum_of_squares += another_data.sum_of_squares
+            merged.count += another_data.count
+
+    def percentile(self, percent):
+        """Computes a percentile of the samples recorded so far."""
+        return percentile(self.get_data(), self._resolution, percent)
+
+    def _new_shard(self):
+        with self._lock:
+            shard = _Shard(
+                self._generation, self._shard_size, self._max_possible
+            )
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def _empty_data(self):
+        data = stats_pb2.HistogramData()
+        data.bucket.extend([0] * self._bucket_count)
+        data.min_seen = self._max_possible
+        return data
+
+    def _value_of(self, index):
+        exponent, sub_bucket = divmod(index, self._sub_buckets)
+        return math.ldexp(
+            0.5 + (sub_bucket + 0.5) / (2 * self._sub_buckets), exponent
+        )
 
     def _bucket_for(self, val):
         val = min(val, self._max_possible)
+        if val < 1:
+            return 0
         return int(math.log(val, self.multiplier))
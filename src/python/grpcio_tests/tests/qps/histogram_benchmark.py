@@ -0,0 +1,82 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the recording overhead of the qps worker histogram."""
+
+import argparse
+import random
+import threading
+import time
+
+from tests.qps import histogram
+
+_RESOLUTION = 0.01
+_MAX_POSSIBLE = 60e9
+
+
+def _record(hist, samples):
+    for sample in samples:
+        hist.add(sample)
+
+
+def _iterate(unused_hist, samples):
+    for _ in samples:
+        pass
+
+
+def _run(target, hist, samples, thread_count):
+    threads = [
+        threading.Thread(target=target, args=(hist, samples))
+        for _ in range(thread_count)
+    ]
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start_time
+
+
+def measure(sample_count, thread_count):
+    """Returns the wall time in nanoseconds spent recording one sample."""
+    samples = [random.lognormvariate(12, 1) for _ in range(sample_count)]
+    hist = histogram.Histogram(_RESOLUTION, _MAX_POSSIBLE)
+    recording_time = _run(_record, hist, samples, thread_count)
+    iterating_time = _run(_iterate, hist, samples, thread_count)
+    return (
+        (recording_time - iterating_time) / (sample_count * thread_count) * 1e9
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=1000000,
+        help="The number of samples each thread records",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        nargs="+",
+        default=(1, 4, 16),
+        help="The numbers of concurrently recording threads to measure",
+    )
+    args = parser.parse_args()
+    for thread_count in args.threads:
+        print(
+            "{} thread(s): {:.1f} ns/sample".format(
+                thread_count, measure(args.samples, thread_count)
+            )
+        )
@@ -0,0 +1,476 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A single-host driver for the Python qps workers.
+
+This is a pure-Python stand-in for the C++ qps_json_driver. It reads the
+Python scenarios from tools/run_tests/performance/scenario_config.py, spawns
+the server and client workers as local subprocesses talking over loopback and
+reports the same ScenarioResult summary as the C++ driver.
+"""
+
+import argparse
+import collections
+import importlib.util
+import json
+import logging
+import os
+import queue
+import re
+import subprocess
+import sys
+import time
+
+from google.protobuf import json_format
+import grpc
+
+from src.proto.grpc.testing import control_pb2
+from src.proto.grpc.testing import stats_pb2
+from src.proto.grpc.testing import worker_service_pb2_grpc
+from tests.qps import histogram
+from tests.unit.framework.common import get_socket
+
+_LOGGER = logging.getLogger(__name__)
+
+_WORKER_MODULES = {
+    "python": "tests.qps.qps_worker",
+    "python_asyncio": "tests_aio.benchmark.worker",
+}
+
+_SCENARIO_CONFIG_PATH = os.path.join(
+    "tools", "run_tests", "performance", "scenario_config.py"
+)
+_WORKER_STARTUP_TIMEOUT_S = 60
+_WORKER_SHUTDOWN_TIMEOUT_S = 10
+
+
+def _default_grpc_root():
+    # "bazel run" points at the source tree, which holds the scenario configs
+    # that are not part of the runfiles.
+    workspace = os.environ.get("BUILD_WORKSPACE_DIRECTORY")
+    if workspace:
+        return workspace
+    return os.path.abspath(
+        os.path.join(os.path.dirname(__file__), *([os.pardir] * 5))
+    )
+
+
+def load_scenarios(grpc_root, language, name_regex=".*", category=None):
+    """Loads the scenarios of a Python language from scenario_config.py.
+
+    Args:
+      grpc_root: The root of the gRPC source tree.
+      language: "python" or "python_asyncio".
+      name_regex: Only scenarios whose name matches this regex are loaded.
+      category: If not None, only scenarios of this category are loaded.
+
+    Returns:
+      A list of control_pb2.Scenario.
+    """
+    spec = importlib.util.spec_from_file_location(
+        "scenario_config", os.path.join(grpc_root, _SCENARIO_CONFIG_PATH)
+    )
+    scenario_config = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(scenario_config)
+
+    scenarios = []
+    for scenario in scenario_config.LANGUAGES[language].scenarios():
+        if not re.search(name_regex, scenario["name"]):
+            continue
+        if category is not None and category not in scenario.get(
+            "CATEGORIES", scenario_config.DEFAULT_CATEGORIES
+        ):
+            continue
+        scenarios.append(
+            json_format.ParseDict(
+                scenario_config.remove_nonproto_fields(scenario),
+                control_pb2.Scenario(),
+            )
+        )
+    return scenarios
+
+
+def _pick_an_unused_port():
+    _, port, sock = get_socket()
+    sock.close()
+    return port
+
+
+def _worker_environment():
+    # The workers import the same generated protos and test packages as the
+    # driver, wherever those were found.
+    python_path = os.pathsep.join(path or os.getcwd() for path in sys.path)
+    return dict(os.environ, PYTHONPATH=python_path)
+
+
+class _Worker:
+    """A qps worker running in a local subprocess."""
+
+    def __init__(self, language):
+        self._port = _pick_an_unused_port()
+        self._process = subprocess.Popen(
+            (
+                sys.executable,
+                "-m",
+                _WORKER_MODULES[language],
+                "--driver_port",
+                str(self._port),
+            ),
+            env=_worker_environment(),
+        )
+        self._channel = grpc.insecure_channel("localhost:%d" % self._port)
+        self.stub = worker_service_pb2_grpc.WorkerServiceStub(self._channel)
+        try:
+            grpc.channel_ready_future(self._channel).result(
+                timeout=_WORKER_STARTUP_TIMEOUT_S
+            )
+        except grpc.FutureTimeoutError:
+            self.close()
+            raise RuntimeError(
+                "Worker at port {} did not start".format(self._port)
+            ) from None
+
+    def close(self):
+        if self._process.poll() is None:
+            try:
+                self.stub.QuitWorker(
+                    control_pb2.Void(), timeout=_WORKER_SHUTDOWN_TIMEOUT_S
+                )
+            except grpc.RpcError:
+                pass
+            try:
+                self._process.wait(timeout=_WORKER_SHUTDOWN_TIMEOUT_S)
+            except subprocess.TimeoutExpired:
+                _LOGGER.warning("Killing worker at port %d", self._port)
+                self._process.kill()
+                self._process.wait()
+        self._channel.close()
+
+
+class _WorkerStream:
+    """A RunServer or RunClient stream: a setup followed by marks."""
+
+    def __init__(self, method, args_type, setup):
+        self._args_type = args_type
+        self._requests = queue.SimpleQueue()
+        self._requests.put(args_type(setup=setup))
+        self._responses = method(iter(self._requests.get, None))
+        self.status = next(self._responses)
+
+    def mark(self, reset):
+        self._requests.put(self._args_type(mark=control_pb2.Mark(reset=reset)))
+        self.status = next(self._responses)
+        return self.status
+
+    def close(self):
+        """Half-closes the stream and returns whether the RPC succeeded."""
+        self._requests.put(None)
+        try:
+            for _ in self._responses:
+                pass
+        except grpc.RpcError as rpc_error:
+            # Servers and clients shut down together, so either may observe
+            # the other side going away first.
+            return rpc_error.code() is grpc.StatusCode.CANCELLED
+        return True
+
+
+def run_scenario(scenario, language, num_clients=1):
+    """Runs a scenario against local workers.
+
+    Args:
+      scenario: The control_pb2.Scenario to run.
+      language: The language of the workers, "python" or "python_asyncio".
+      num_clients: The number of client workers to use if the scenario asks
+        for as many as are available.
+
+    Returns:
+      The control_pb2.ScenarioResult of the run, summary included.
+    """
+    num_clients = scenario.num_clients or num_clients
+    workers = []
+    try:
+        for _ in range(scenario.num_servers + num_clients):
+            workers.append(_Worker(language))
+
+        server_streams = [
+            _WorkerStream(
+                worker.stub.RunServer,
+                control_pb2.ServerArgs,
+                scenario.server_config,
+            )
+            for worker in workers[: scenario.num_servers]
+        ]
+        client_config = control_pb2.ClientConfig()
+        client_config.CopyFrom(scenario.client_config)
+        client_config.server_targets.extend(
+            "localhost:%d" % stream.status.port for stream in server_streams
+        )
+        client_streams = [
+            _WorkerStream(
+                worker.stub.RunClient, control_pb2.ClientArgs, client_config
+            )
+            for worker in workers[scenario.num_servers :]
+        ]
+
+        _LOGGER.info("Warming up for %d seconds", scenario.warmup_seconds)
+        time.sleep(scenario.warmup_seconds)
+        for stream in server_streams + client_streams:
+            stream.mark(reset=True)
+        _LOGGER.info("Running for %d seconds", scenario.benchmark_seconds)
+        time.sleep(scenario.benchmark_seconds)
+
+        result = control_pb2.ScenarioResult(scenario=scenario)
+        latencies = histogram.Histogram(
+            scenario.client_config.histogram_params.resolution,
+            scenario.client_config.histogram_params.max_possible,
+        )
+        request_results = collections.Counter()
+        for stream in client_streams:
+            stats = stream.mark(reset=True).stats
+            result.client_stats.add().CopyFrom(stats)
+            latencies.merge(stats.latencies)
+            for request_result in stats.request_results:
+                request_results[
+                    request_result.status_code
+                ] += request_result.count
+        for stream in server_streams:
+            result.server_stats.add().CopyFrom(stream.mark(reset=True).stats)
+            result.server_cores.append(stream.status.cores)
+        result.latencies.CopyFrom(latencies.get_data())
+        result.request_results.extend(
+            stats_pb2.RequestResultCount(status_code=code, count=count)
+            for code, count in sorted(request_results.items())
+        )
+        result.client_success.extend(
+            stream.close() for stream in client_streams
+        )
+        result.server_success.extend(
+            stream.close() for stream in server_streams
+        )
+    finally:
+        for worker in workers:
+            worker.close()
+
+    summarize(result)
+    return result
+
+
+def _divide(numerator, denominator):
+    return numerator / denominator if denominator else 0.0
+
+
+def summarize(result):
+    """Fills in the summary of a ScenarioResult as the C++ driver does."""
+    summary = result.summary
+    resolution = result.scenario.client_config.histogram_params.resolution
+    latencies = result.latencies
+    summary.latency_50 = histogram.percentile(latencies, resolution, 50)
+    summary.latency_90 = histogram.percentile(latencies, resolution, 90)
+    summary.latency_95 = histogram.percentile(latencies, resolution, 95)
+    summary.latency_99 = histogram.percentile(latencies, resolution, 99)
+    summary.latency_999 = histogram.percentile(latencies, resolution, 99.9)
+
+    client_stats = result.client_stats
+    server_stats = result.server_stats
+    summary.qps = sum(
+        _divide(stats.latencies.count, stats.time_elapsed)
+        for stats in client_stats
+    )
+    summary.server_system_time = 100 * sum(
+        _divide(stats.time_system, stats.time_elapsed) for stats in server_stats
+    )
+    summary.server_user_time = 100 * sum(
+        _divide(stats.time_user, stats.time_elapsed) for stats in server_stats
+    )
+    summary.client_system_time = 100 * sum(
+        _divide(stats.time_system, stats.time_elapsed) for stats in client_stats
+    )
+    summary.client_user_time = 100 * sum(
+        _divide(stats.time_user, stats.time_elapsed) for stats in client_stats
+    )
+
+    total_cpu_time = sum(stats.total_cpu_time for stats in server_stats)
+    idle_cpu_time = sum(stats.idle_cpu_time for stats in server_stats)
+    if total_cpu_time:
+        summary.server_cpu_usage = 100 - 100 * idle_cpu_time / total_cpu_time
+
+    if result.request_results:
+        time_estimate = _divide(
+            sum(stats.time_elapsed for stats in client_stats),
+            len(client_stats),
+        )
+        successes = sum(
+            request_result.count
+            for request_result in result.request_results
+            if request_result.status_code == 0
+        )
+        failures = sum(
+            request_result.count
+            for request_result in result.request_results
+            if request_result.status_code != 0
+        )
+        summary.successful_requests_per_second = _divide(
+            successes, time_estimate
+        )
+        summary.failed_requests_per_second = _divide(failures, time_estimate)
+
+    count = result.latencies.count
+    summary.qps_per_server_core = _divide(summary.qps, sum(result.server_cores))
+    summary.client_polls_per_request = _divide(
+        sum(stats.cq_poll_count for stats in client_stats), count
+    )
+    summary.server_polls_per_request = _divide(
+        sum(stats.cq_poll_count for stats in server_stats), count
+    )
+    summary.server_queries_per_cpu_sec = _divide(
+        count,
+        sum(stats.time_system + stats.time_user for stats in server_stats),
+    )
+    summary.client_queries_per_cpu_sec = _divide(
+        count,
+        sum(stats.time_system + stats.time_user for stats in client_stats),
+    )
+
+
+def report(result):
+    """Logs the summary of a ScenarioResult in the C++ driver's format."""
+    summary = result.summary
+    _LOGGER.info("QPS: %g", summary.qps)
+    if summary.failed_requests_per_second > 0:
+        _LOGGER.info(
+            "failed requests/second: %g", summary.failed_requests_per_second
+        )
+        _LOGGER.info(
+            "successful requests/second: %g",
+            summary.successful_requests_per_second,
+        )
+    _LOGGER.info(
+        "QPS: %g (%g/server core)", summary.qps, summary.qps_per_server_core
+    )
+    _LOGGER.info(
+        "Latencies (50/90/95/99/99.9%%-ile): %g/%g/%g/%g/%g us",
+        summary.latency_50 / 1000,
+        summary.latency_90 / 1000,
+        summary.latency_95 / 1000,
+        summary.latency_99 / 1000,
+        summary.latency_999 / 1000,
+    )
+    _LOGGER.info("Server system time: %g", summary.server_system_time)
+    _LOGGER.info("Server user time:   %g", summary.server_user_time)
+    _LOGGER.info("Client system time: %g", summary.client_system_time)
+    _LOGGER.info("Client user time:   %g", summary.client_user_time)
+    _LOGGER.info("Server CPU usage: %g", summary.server_cpu_usage)
+    _LOGGER.info(
+        "Client Polls per Request: %g", summary.client_polls_per_request
+    )
+    _LOGGER.info(
+        "Server Polls per Request: %g", summary.server_polls_per_request
+    )
+    _LOGGER.info(
+        "Server Queries/CPU-sec: %g", summary.server_queries_per_cpu_sec
+    )
+    _LOGGER.info(
+        "Client Queries/CPU-sec: %g", summary.client_queries_per_cpu_sec
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(
+        description="Runs the Python qps scenarios against local workers"
+    )
+    parser.add_argument(
+        "--language",
+        choices=sorted(_WORKER_MODULES),
+        default="python",
+        help="The workers to run the scenarios of",
+    )
+    parser.add_argument(
+        "--scenario",
+        default=".*",
+        help="Regex of the names of the scenarios to run",
+    )
+    parser.add_argument(
+        "--category",
+        default=None,
+        help="Only run the scenarios of this category, e.g. smoketest",
+    )
+    parser.add_argument(
+        "--num_clients",
+        type=int,
+        default=1,
+        help="The number of client workers of scenarios that ask for all",
+    )
+    parser.add_argument(
+        "--warmup_seconds",
+        type=int,
+        default=None,
+        help="Overrides the warmup time of the scenarios",
+    )
+    parser.add_argument(
+        "--benchmark_seconds",
+        type=int,
+        default=None,
+        help="Overrides the benchmark time of the scenarios",
+    )
+    parser.add_argument(
+        "--grpc_root",
+        default=_default_grpc_root(),
+        help="The root of the gRPC source tree",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="Only list the names of the selected scenarios",
+    )
+    parser.add_argument(
+        "--json_file_out",
+        default=None,
+        help="File to write the ScenarioResults to as a JSON list",
+    )
+    args = parser.parse_args()
+
+    scenarios = load_scenarios(
+        args.grpc_root, args.language, args.scenario, args.category
+    )
+    if not scenarios:
+        parser.error("No scenario matches {}".format(args.scenario))
+    if args.list:
+        for scenario in scenarios:
+            print(scenario.name)
+        sys.exit(0)
+
+    results = []
+    for scenario in scenarios:
+        if args.warmup_seconds is not None:
+            scenario.warmup_seconds = args.warmup_seconds
+        if args.benchmark_seconds is not None:
+            scenario.benchmark_seconds = args.benchmark_seconds
+        _LOGGER.info("Running scenario %s", scenario.name)
+        result = run_scenario(scenario, args.language, args.num_clients)
+        report(result)
+        results.append(result)
+
+    if args.json_file_out:
+        with open(args.json_file_out, "w") as json_file:
+            json.dump(
+                [json_format.MessageToDict(result) for result in results],
+                json_file,
+                indent=2,
+            )
+    if not all(
+        all(result.client_success) and all(result.server_success)
+        for result in results
+    ):
+        sys.exit(1)
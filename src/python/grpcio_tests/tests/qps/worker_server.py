@@ -128,6 +128,9 @@ class WorkerServer(worker_service_pb2_grpc.WorkerServiceServicer):
                 "StreamingCall": grpc.stream_stream_rpc_method_handler(
                     servicer.StreamingCall
                 ),
+                "StreamingFromServer": grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamingFromServer
+                ),
                 "UnaryCall": grpc.unary_unary_rpc_method_handler(
                     servicer.UnaryCall
                 ),
@@ -221,8 +224,26 @@ class WorkerServer(worker_service_pb2_grpc.WorkerServiceServicer):
                 client = benchmark_client.UnaryAsyncBenchmarkClient(
                     server, config, qps_data
                 )
+            elif config.rpc_type == control_pb2.STREAMING:
+                client = benchmark_client.StreamingAsyncBenchmarkClient(
+                    server, config, qps_data
+                )
+            elif config.rpc_type == control_pb2.STREAMING_FROM_SERVER:
+                # Each call streams until the client stops, so only a closed
+                # loop bounds the number of streams the client has to read.
+                if config.load_params.WhichOneof("load") != "closed_loop":
+                    raise Exception(
+                        "Async server-streaming clients require closed-loop"
+                        " load"
+                    )
+                no_ping_pong = True
+                client = benchmark_client.ServerStreamingAsyncBenchmarkClient(
+                    server, config, qps_data
+                )
             else:
-                raise Exception("Async streaming client not supported")
+                raise Exception(
+                    "Unsupported rpc type {}".format(config.rpc_type)
+                )
         else:
             raise Exception(
                 "Unsupported client type {}".format(config.client_type)
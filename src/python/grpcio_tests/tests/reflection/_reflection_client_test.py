@@ -13,6 +13,8 @@
 # limitations under the License.
 """Tests of grpc_reflection.v1alpha.reflection."""
 
+import os
+import tempfile
 import unittest
 
 from google.protobuf.descriptor_pool import DescriptorPool
@@ -147,6 +149,72 @@ class ReflectionClientTest(unittest.TestCase):
         with self.assertRaises(KeyError):
             self.desc_pool.FindExtensionByName(message_name)
 
+    def _assert_services_found_offline(self, reflection_db):
+        self._server.stop(None)
+        desc_pool = DescriptorPool(reflection_db)
+        service_desc = desc_pool.FindServiceByName(self._SERVICE_NAMES[0])
+        self.assertEqual(_PROTO_FILE_NAME, service_desc.file.name)
+        self.assertEqual(
+            _EMPTY_PROTO_SYMBOL_NAME,
+            desc_pool.FindMessageTypeByName(_EMPTY_PROTO_SYMBOL_NAME).full_name,
+        )
+        self.assertIsNotNone(
+            desc_pool.FindServiceByName(self._SERVICE_NAMES[1])
+        )
+
+    def testPrefetch(self):
+        reflection_db = ProtoReflectionDescriptorDatabase(
+            self._channel, prefetch=True
+        )
+        self._assert_services_found_offline(reflection_db)
+
+    def testPersistentCache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            ProtoReflectionDescriptorDatabase(
+                self._channel,
+                prefetch=True,
+                cache_dir=cache_dir,
+                server_identity="test-server",
+            )
+            self.assertEqual(1, len(os.listdir(cache_dir)))
+
+            reflection_db = ProtoReflectionDescriptorDatabase(
+                self._channel,
+                prefetch=True,
+                cache_dir=cache_dir,
+                server_identity="test-server",
+            )
+            self._assert_services_found_offline(reflection_db)
+
+    def testCorruptCacheRefetched(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            ProtoReflectionDescriptorDatabase(
+                self._channel,
+                prefetch=True,
+                cache_dir=cache_dir,
+                server_identity="test-server",
+            )
+            (cache_file_name,) = os.listdir(cache_dir)
+            cache_path = os.path.join(cache_dir, cache_file_name)
+            with open(cache_path, "wb") as cache_file:
+                cache_file.write(b"\xff\xff\xff")
+
+            reflection_db = ProtoReflectionDescriptorDatabase(
+                self._channel,
+                prefetch=True,
+                cache_dir=cache_dir,
+                server_identity="test-server",
+            )
+
+            self._assert_services_found_offline(reflection_db)
+            self.assertGreater(os.path.getsize(cache_path), 3)
+
+    def testCacheDirWithoutServerIdentity(self):
+        with self.assertRaises(ValueError):
+            ProtoReflectionDescriptorDatabase(
+                self._channel, cache_dir=tempfile.gettempdir()
+            )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -221,6 +221,55 @@ class ReflectionServicerTest(unittest.TestCase):
         )
         self.assertEqual(expected_responses, responses)
 
+    def testRepeatedFileBySymbol(self):
+        request = reflection_pb2.ServerReflectionRequest(
+            file_containing_symbol=_EMPTY_EXTENSIONS_SYMBOL_NAME
+        )
+        responses = tuple(self._stub.ServerReflectionInfo(iter((request,) * 3)))
+        expected_response = reflection_pb2.ServerReflectionResponse(
+            valid_host="",
+            file_descriptor_response=reflection_pb2.FileDescriptorResponse(
+                file_descriptor_proto=(
+                    _file_descriptor_to_proto(empty2_extensions_pb2.DESCRIPTOR),
+                    _file_descriptor_to_proto(empty2_pb2.DESCRIPTOR),
+                )
+            ),
+            original_request=request,
+        )
+        self.assertEqual((expected_response,) * 3, responses)
+
+    def testFileAddedToPoolAfterNotFound(self):
+        pool = descriptor_pool.DescriptorPool()
+        servicer = reflection.ReflectionServicer(_SERVICE_NAMES, pool=pool)
+        requests = (
+            reflection_pb2.ServerReflectionRequest(
+                file_by_filename=_EMPTY_PROTO_FILE_NAME
+            ),
+            reflection_pb2.ServerReflectionRequest(
+                file_containing_symbol=_EMPTY_PROTO_SYMBOL_NAME
+            ),
+        )
+        not_found_responses = tuple(
+            servicer.ServerReflectionInfo(iter(requests), None)
+        )
+        file_descriptor_proto = descriptor_pb2.FileDescriptorProto()
+        empty_pb2.DESCRIPTOR.CopyToProto(file_descriptor_proto)
+        pool.Add(file_descriptor_proto)
+        found_responses = tuple(
+            servicer.ServerReflectionInfo(iter(requests), None)
+        )
+
+        for response in not_found_responses:
+            self.assertEqual(
+                grpc.StatusCode.NOT_FOUND.value[0],
+                response.error_response.error_code,
+            )
+        for response in found_responses:
+            self.assertSequenceEqual(
+                (file_descriptor_proto.SerializeToString(),),
+                response.file_descriptor_response.file_descriptor_proto,
+            )
+
     def testReflectionServiceName(self):
         self.assertEqual(
             reflection.SERVICE_NAME, "grpc.reflection.v1alpha.ServerReflection"
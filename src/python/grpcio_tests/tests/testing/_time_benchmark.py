@@ -0,0 +1,148 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Simulates many concurrent deadlines against grpc_testing's fake time."""
+
+import argparse
+import collections
+import random
+import threading
+import time
+
+import grpc_testing
+
+_DEFAULT_DEADLINE_COUNT = 100000
+_DEFAULT_HORIZON_S = 3600.0
+_DEFAULT_STEP_S = 1.0
+
+
+class SimulationResult(
+    collections.namedtuple(
+        "SimulationResult",
+        (
+            "scheduled",
+            "cancelled",
+            "called",
+            "violations",
+            "schedule_duration_s",
+            "cancel_duration_s",
+            "advance_duration_s",
+        ),
+    )
+):
+    pass
+
+
+class _Recorder:
+    def __init__(self, fake_time):
+        self._lock = threading.Lock()
+        self._fake_time = fake_time
+        self.called = set()
+        self.violations = 0
+
+    def behavior(self, index, deadline):
+        def call():
+            with self._lock:
+                self.called.add(index)
+                if self._fake_time.time() < deadline:
+                    self.violations += 1
+
+        return call
+
+
+def simulate(
+    deadline_count=_DEFAULT_DEADLINE_COUNT,
+    horizon_s=_DEFAULT_HORIZON_S,
+    step_s=_DEFAULT_STEP_S,
+    cancel_fraction=0.5,
+    seed=0,
+):
+    """Schedules, cancels and runs deadlines on a StrictFakeTime.
+
+    Args:
+      deadline_count: The number of deadlines pending at once.
+      horizon_s: Deadlines are spread uniformly over this many seconds.
+      step_s: The amount of fake time advanced per sleep_for call.
+      cancel_fraction: The fraction of deadlines cancelled before maturing,
+        as an RPC completing ahead of its deadline would.
+      seed: The seed for the deadline and cancellation choices.
+
+    Returns:
+      A SimulationResult. Its violations count behaviors that were called
+        before their deadline or despite having been cancelled.
+    """
+    generator = random.Random(seed)
+    fake_time = grpc_testing.strict_fake_time(0.0)
+    recorder = _Recorder(fake_time)
+
+    start = time.perf_counter()
+    futures = []
+    for index in range(deadline_count):
+        deadline = generator.uniform(step_s, horizon_s)
+        futures.append(
+            fake_time.call_at(recorder.behavior(index, deadline), deadline)
+        )
+    scheduled = time.perf_counter()
+
+    cancelled = set()
+    for index, future in enumerate(futures):
+        if generator.random() < cancel_fraction and future.cancel():
+            cancelled.add(index)
+    cancelled_at = time.perf_counter()
+
+    while fake_time.time() < horizon_s:
+        fake_time.sleep_for(step_s)
+    advanced = time.perf_counter()
+
+    return SimulationResult(
+        deadline_count,
+        len(cancelled),
+        len(recorder.called),
+        recorder.violations + len(recorder.called & cancelled),
+        scheduled - start,
+        cancelled_at - scheduled,
+        advanced - cancelled_at,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--deadlines", type=int, default=_DEFAULT_DEADLINE_COUNT
+    )
+    parser.add_argument("--horizon", type=float, default=_DEFAULT_HORIZON_S)
+    parser.add_argument("--step", type=float, default=_DEFAULT_STEP_S)
+    parser.add_argument("--cancel_fraction", type=float, default=0.5)
+    args = parser.parse_args()
+    result = simulate(
+        deadline_count=args.deadlines,
+        horizon_s=args.horizon,
+        step_s=args.step,
+        cancel_fraction=args.cancel_fraction,
+    )
+    print(
+        "scheduled {} deadlines in {:.3f}s, cancelled {} in {:.3f}s, "
+        "called {} in {:.3f}s ({} violations)".format(
+            result.scheduled,
+            result.schedule_duration_s,
+            result.cancelled,
+            result.cancel_duration_s,
+            result.called,
+            result.advance_duration_s,
+            result.violations,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
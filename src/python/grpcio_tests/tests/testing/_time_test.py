@@ -19,8 +19,11 @@ import unittest
 
 import grpc_testing
 
+from tests.testing import _time_benchmark
+
 _QUANTUM = 0.3
 _MANY = 10000
+_SIMULATED_DEADLINES = 100000
 # Tests that run in real time can either wait for the scheduler to
 # eventually run what needs to be run (and risk timing out) or declare
 # that the scheduler didn't schedule work reasonably fast enough. We
@@ -161,6 +164,13 @@ class StrictFakeTimeTest(TimeTest, unittest.TestCase):
             random.randint(0, int(time.time()))
         )
 
+    def test_many_concurrent_deadlines(self):
+        result = _time_benchmark.simulate(deadline_count=_SIMULATED_DEADLINES)
+
+        self.assertEqual(_SIMULATED_DEADLINES, result.scheduled)
+        self.assertEqual(_SIMULATED_DEADLINES, result.cancelled + result.called)
+        self.assertEqual(0, result.violations)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,217 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the adaptive concurrency limiter of servers."""
+
+from concurrent import futures
+import logging
+import threading
+import time
+import unittest
+
+import grpc
+import grpc.experimental
+
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_BLOCKING = "Blocking"
+_OTHER = "Other"
+_BLOCKING_METHOD = "/test/Blocking"
+_OTHER_METHOD = "/test/Other"
+_REQUEST = b"\x00\x00\x00"
+_SATURATING_RPCS = 1000
+
+
+def _saturate(limiter, method, latency):
+    for _ in range(_SATURATING_RPCS):
+        admitted = 0
+        while limiter.try_acquire(method):
+            admitted += 1
+        for _ in range(admitted):
+            limiter.release(method, latency)
+
+
+class AdaptiveConcurrencyLimiterTest(unittest.TestCase):
+    def testRejectsAtLimit(self):
+        limiter = grpc.experimental.AdaptiveConcurrencyLimiter(
+            initial_limit=2, min_limit=1, max_limit=2
+        )
+
+        self.assertTrue(limiter.try_acquire(_BLOCKING_METHOD))
+        self.assertTrue(limiter.try_acquire(_BLOCKING_METHOD))
+        self.assertFalse(limiter.try_acquire(_BLOCKING_METHOD))
+        self.assertTrue(limiter.try_acquire(_OTHER_METHOD))
+
+        stats = limiter.stats()
+        self.assertEqual(
+            grpc.experimental.AdaptiveConcurrencyLimiterStats(2, 2, 1),
+            stats[_BLOCKING_METHOD],
+        )
+        self.assertEqual(
+            grpc.experimental.AdaptiveConcurrencyLimiterStats(2, 1, 0),
+            stats[_OTHER_METHOD],
+        )
+
+    def testLimitGrowsWhileLatencyIsSteady(self):
+        limiter = grpc.experimental.AdaptiveConcurrencyLimiter(
+            initial_limit=10, max_limit=100
+        )
+
+        _saturate(limiter, _BLOCKING_METHOD, 0.01)
+
+        self.assertEqual(100, limiter.stats()[_BLOCKING_METHOD].limit)
+
+    def testLimitShrinksWhenLatencyRises(self):
+        limiter = grpc.experimental.AdaptiveConcurrencyLimiter(
+            initial_limit=100, max_limit=100
+        )
+        _saturate(limiter, _BLOCKING_METHOD, 0.01)
+
+        for _ in range(10):
+            for _ in range(100):
+                limiter.try_acquire(_BLOCKING_METHOD)
+            for _ in range(100):
+                limiter.release(_BLOCKING_METHOD, 0.1)
+
+        self.assertLess(limiter.stats()[_BLOCKING_METHOD].limit, 100)
+
+    def testUnusedLimitDoesNotGrow(self):
+        limiter = grpc.experimental.AdaptiveConcurrencyLimiter(initial_limit=10)
+
+        for _ in range(_SATURATING_RPCS):
+            limiter.try_acquire(_BLOCKING_METHOD)
+            limiter.release(_BLOCKING_METHOD, 0.01)
+
+        self.assertEqual(10, limiter.stats()[_BLOCKING_METHOD].limit)
+
+    def testUnservicedRpcsDoNotAffectLimit(self):
+        limiter = grpc.experimental.AdaptiveConcurrencyLimiter(
+            initial_limit=1, max_limit=10
+        )
+
+        for _ in range(_SATURATING_RPCS):
+            limiter.try_acquire(_BLOCKING_METHOD)
+            limiter.release(_BLOCKING_METHOD, None)
+
+        self.assertEqual(
+            grpc.experimental.AdaptiveConcurrencyLimiterStats(1, 0, 0),
+            limiter.stats()[_BLOCKING_METHOD],
+        )
+
+    def testInvalidArguments(self):
+        with self.assertRaises(ValueError):
+            grpc.experimental.AdaptiveConcurrencyLimiter(min_limit=0)
+        with self.assertRaises(ValueError):
+            grpc.experimental.AdaptiveConcurrencyLimiter(
+                initial_limit=10, max_limit=5
+            )
+        with self.assertRaises(ValueError):
+            grpc.experimental.AdaptiveConcurrencyLimiter(tolerance=0.5)
+
+
+class _CountingInterceptor(grpc.ServerInterceptor):
+    def __init__(self):
+        self.intercepted = []
+
+    def intercept_service(self, continuation, handler_call_details):
+        self.intercepted.append(handler_call_details.method)
+        return continuation(handler_call_details)
+
+
+class AdaptiveConcurrencyServerTest(unittest.TestCase):
+    def setUp(self):
+        self._started = threading.Event()
+        self._release = threading.Event()
+        self._limiter = grpc.experimental.AdaptiveConcurrencyLimiter(
+            initial_limit=1, min_limit=1, max_limit=1
+        )
+        self._interceptor = _CountingInterceptor()
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=4),
+            interceptors=(self._interceptor,),
+            maximum_concurrent_rpcs=self._limiter,
+        )
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _BLOCKING: grpc.unary_unary_rpc_method_handler(
+                    self._handle_blocking
+                ),
+                _OTHER: grpc.unary_unary_rpc_method_handler(
+                    lambda request, servicer_context: request
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._release.set()
+        self._server.stop(None)
+        self._channel.close()
+
+    def _handle_blocking(self, request, servicer_context):
+        self._started.set()
+        self._release.wait()
+        return request
+
+    def _unary_unary(self, method):
+        return self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, method),
+            _registered_method=True,
+        )
+
+    def testRejectsBeforeInterceptors(self):
+        blocked_future = self._unary_unary(_BLOCKING).future(_REQUEST)
+        self.assertTrue(self._started.wait(test_constants.SHORT_TIMEOUT))
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._unary_unary(_BLOCKING)(_REQUEST)
+        self._release.set()
+
+        self.assertEqual(_REQUEST, blocked_future.result())
+        self.assertIs(
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            exception_context.exception.code(),
+        )
+        self.assertEqual([_BLOCKING_METHOD], self._interceptor.intercepted)
+        self.assertEqual(
+            1, self._limiter.stats()[_BLOCKING_METHOD].rejected_count
+        )
+
+    def testLimitsMethodsSeparately(self):
+        blocked_future = self._unary_unary(_BLOCKING).future(_REQUEST)
+        self.assertTrue(self._started.wait(test_constants.SHORT_TIMEOUT))
+
+        self.assertEqual(_REQUEST, self._unary_unary(_OTHER)(_REQUEST))
+        self._release.set()
+
+        self.assertEqual(_REQUEST, blocked_future.result())
+
+    def testReleasesCompletedRpcs(self):
+        self._release.set()
+
+        self.assertEqual(_REQUEST, self._unary_unary(_BLOCKING)(_REQUEST))
+
+        # The permit is released once the handler's thread finishes, which
+        # may be after the client received the response.
+        while self._limiter.stats()[_BLOCKING_METHOD].in_flight:
+            time.sleep(0.01)
+        self.assertEqual(_REQUEST, self._unary_unary(_BLOCKING)(_REQUEST))
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
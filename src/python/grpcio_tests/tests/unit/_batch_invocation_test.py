@@ -0,0 +1,167 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of unary-unary batch invocation."""
+
+import logging
+import threading
+import unittest
+
+import grpc
+import grpc.experimental
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+
+_BATCH_SIZE = 50
+_ERROR_REQUEST = b"error"
+_BLOCKING_REQUEST = b"blocking"
+_UNSERIALIZABLE_REQUEST = b"unserializable"
+
+
+class _Handler:
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+        self.unblock = threading.Event()
+
+    def handle_unary_unary(self, request, servicer_context):
+        with self.lock:
+            self.calls += 1
+        if request == _ERROR_REQUEST:
+            servicer_context.abort(grpc.StatusCode.INVALID_ARGUMENT, "error")
+        elif request == _BLOCKING_REQUEST:
+            self.unblock.wait(test_constants.LONG_TIMEOUT)
+        return request
+
+
+def _serialize(request):
+    if request == _UNSERIALIZABLE_REQUEST:
+        raise ValueError("Unserializable request!")
+    return request
+
+
+class _PassThroughInterceptor(grpc.UnaryUnaryClientInterceptor):
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return continuation(client_call_details, request)
+
+
+class BatchInvocationTest(unittest.TestCase):
+    def setUp(self):
+        self._handler = _Handler()
+        self._server = test_common.test_server(max_workers=_BATCH_SIZE + 1)
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                    self._handler.handle_unary_unary
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+        self._multicallable = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY),
+            request_serializer=_serialize,
+            _registered_method=True,
+        )
+
+    def tearDown(self):
+        self._handler.unblock.set()
+        self._server.stop(None)
+        self._channel.close()
+
+    def testResultsInRequestOrder(self):
+        requests = [b"%d" % index for index in range(_BATCH_SIZE)]
+
+        futures = self._multicallable.batch(requests)
+
+        self.assertEqual(requests, [future.result() for future in futures])
+        for future in futures:
+            self.assertIs(grpc.StatusCode.OK, future.code())
+
+    def testAsCompleted(self):
+        futures = self._multicallable.batch([_BLOCKING_REQUEST, b"0", b"1"])
+        completed = grpc.experimental.as_completed(futures)
+
+        self.assertCountEqual(futures[1:], [next(completed), next(completed)])
+        self.assertFalse(futures[0].done())
+        self._handler.unblock.set()
+        self.assertIs(futures[0], next(completed))
+        with self.assertRaises(StopIteration):
+            next(completed)
+
+    def testAsCompletedTimeout(self):
+        futures = self._multicallable.batch([_BLOCKING_REQUEST])
+
+        with self.assertRaises(grpc.FutureTimeoutError):
+            list(
+                grpc.experimental.as_completed(
+                    futures, timeout=test_constants.SHORT_TIMEOUT
+                )
+            )
+
+    def testErrorIsConfinedToItsCall(self):
+        futures = self._multicallable.batch([b"0", _ERROR_REQUEST, b"2"])
+
+        self.assertEqual(b"0", futures[0].result())
+        self.assertIs(
+            grpc.StatusCode.INVALID_ARGUMENT, futures[1].exception().code()
+        )
+        self.assertEqual(b"2", futures[2].result())
+
+    def testSharedDeadline(self):
+        futures = self._multicallable.batch(
+            [_BLOCKING_REQUEST] * 3, timeout=test_constants.SHORT_TIMEOUT
+        )
+
+        for future in futures:
+            self.assertIs(
+                grpc.StatusCode.DEADLINE_EXCEEDED, future.exception().code()
+            )
+
+    def testSerializationFailureStartsNoCall(self):
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._multicallable.batch([b"0", _UNSERIALIZABLE_REQUEST])
+
+        self.assertIs(
+            grpc.StatusCode.INTERNAL, exception_context.exception.code()
+        )
+        self.assertEqual(b"0", self._multicallable(b"0"))
+        self.assertEqual(1, self._handler.calls)
+
+    def testEmptyBatch(self):
+        self.assertEqual([], self._multicallable.batch([]))
+
+    def testBatchThroughInterceptor(self):
+        channel = grpc.intercept_channel(
+            self._channel, _PassThroughInterceptor()
+        )
+        multicallable = channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY),
+            _registered_method=True,
+        )
+        requests = [b"%d" % index for index in range(_BATCH_SIZE)]
+
+        futures = multicallable.batch(requests)
+
+        self.assertEqual(requests, [future.result() for future in futures])
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -0,0 +1,199 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of timing the phases of RPCs made by the sync client."""
+
+from concurrent import futures
+import gc
+import logging
+import unittest
+
+import grpc
+from grpc import _observability
+
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_UNARY_STREAM = "UnaryStream"
+_UNARY_UNARY_METHOD = "/test/UnaryUnary"
+_REQUEST = b"\x00\x00\x00"
+_RESPONSE_COUNT = 3
+
+
+class _PhaseRecordingPlugin(_observability.ObservabilityPlugin):
+    def __init__(self):
+        self.recorded = []
+
+    def create_client_call_tracer(self, method_name, target):
+        return None
+
+    def save_trace_context(self, trace_id, span_id, is_sampled):
+        pass
+
+    def create_server_call_tracer_factory(self, *, xds=False):
+        return None
+
+    def record_rpc_latency(self, method, target, rpc_latency, status_code):
+        pass
+
+    def record_client_rpc_phases(self, method, target, phases):
+        self.recorded.append((method, target, phases))
+
+
+class _PassThroughInterceptor(grpc.UnaryUnaryClientInterceptor):
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return continuation(client_call_details, request)
+
+
+def _unary_stream(request, servicer_context):
+    for _ in range(_RESPONSE_COUNT):
+        yield request
+
+
+class ClientRpcPhaseTimingTest(unittest.TestCase):
+    def setUp(self):
+        self._plugin = _PhaseRecordingPlugin()
+        _observability.observability_init(self._plugin)
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                    lambda request, servicer_context: request
+                ),
+                _UNARY_STREAM: grpc.unary_stream_rpc_method_handler(
+                    _unary_stream
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._target = "localhost:%d" % port
+        self._channel = grpc.insecure_channel(self._target)
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+        _observability.observability_deinit()
+
+    def _multi_callable(self, method, multi_callable):
+        return multi_callable(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, method),
+            _registered_method=True,
+        )
+
+    def testUnaryUnaryPhases(self):
+        self._plugin.set_phase_timing(True)
+
+        response, call = self._multi_callable(
+            _UNARY_UNARY, self._channel.unary_unary
+        ).with_call(_REQUEST)
+
+        self.assertEqual(_REQUEST, response)
+        method, target, phases = self._plugin.recorded[0]
+        self.assertEqual(_UNARY_UNARY_METHOD, method)
+        self.assertEqual(self._target, target)
+        self.assertEqual(
+            {
+                "serialization",
+                "initial_metadata",
+                "deserialization",
+                "delivery",
+                "total",
+            },
+            set(phases),
+        )
+        for phase, duration in phases.items():
+            self.assertGreaterEqual(duration, 0, phase)
+        self.assertEqual(phases, call.phase_timings())
+
+    def testRecordedOnceResponseIsTaken(self):
+        self._plugin.set_phase_timing(True)
+
+        response_future = self._multi_callable(
+            _UNARY_UNARY, self._channel.unary_unary
+        ).future(_REQUEST)
+        self.assertIsNone(
+            response_future.exception(timeout=test_constants.SHORT_TIMEOUT)
+        )
+
+        # Taking the exception of a successful RPC delivers no response.
+        self.assertEqual([], self._plugin.recorded)
+        self.assertEqual(_REQUEST, response_future.result())
+        self.assertEqual(1, len(self._plugin.recorded))
+        _, _, phases = self._plugin.recorded[0]
+        self.assertIn("delivery", phases)
+
+    def testRecordedWhenResponseIsNeverTaken(self):
+        self._plugin.set_phase_timing(True)
+
+        response_future = self._multi_callable(
+            _UNARY_UNARY, self._channel.unary_unary
+        ).future(_REQUEST)
+        self.assertIsNone(
+            response_future.exception(timeout=test_constants.SHORT_TIMEOUT)
+        )
+        del response_future
+        gc.collect()
+
+        self.assertEqual(1, len(self._plugin.recorded))
+        _, _, phases = self._plugin.recorded[0]
+        self.assertNotIn("delivery", phases)
+        self.assertIn("total", phases)
+
+    def testUnaryStreamPhases(self):
+        self._plugin.set_phase_timing(True)
+
+        responses = list(
+            self._multi_callable(_UNARY_STREAM, self._channel.unary_stream)(
+                _REQUEST
+            )
+        )
+
+        self.assertEqual([_REQUEST] * _RESPONSE_COUNT, responses)
+        self.assertEqual(1, len(self._plugin.recorded))
+        _, _, phases = self._plugin.recorded[0]
+        self.assertIn("deserialization", phases)
+        self.assertIn("delivery", phases)
+
+    def testInterceptorPhase(self):
+        self._plugin.set_phase_timing(True)
+        intercepted_channel = grpc.intercept_channel(
+            self._channel, _PassThroughInterceptor()
+        )
+
+        self.assertEqual(
+            _REQUEST,
+            self._multi_callable(_UNARY_UNARY, intercepted_channel.unary_unary)(
+                _REQUEST
+            ),
+        )
+
+        _, _, phases = self._plugin.recorded[0]
+        self.assertIn("interceptors", phases)
+        self.assertLessEqual(phases["interceptors"], phases["total"])
+
+    def testDisabledByDefault(self):
+        response, call = self._multi_callable(
+            _UNARY_UNARY, self._channel.unary_unary
+        ).with_call(_REQUEST)
+
+        self.assertEqual(_REQUEST, response)
+        self.assertIsNone(call.phase_timings())
+        self.assertEqual([], self._plugin.recorded)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
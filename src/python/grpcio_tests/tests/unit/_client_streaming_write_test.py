@@ -0,0 +1,164 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of writing the requests of client-streaming RPCs without iterators."""
+
+import logging
+import unittest
+from unittest import mock
+
+import grpc
+from grpc import _channel
+import grpc.experimental
+
+from tests.unit import test_common
+
+_SERVICE_NAME = "test"
+_STREAM_UNARY = "StreamUnary"
+_STREAM_STREAM = "StreamStream"
+
+_REQUEST = b"\x00\x00\x00"
+_ABORT_REQUEST = b"abort"
+_UNSERIALIZABLE_REQUEST = b"unserializable"
+_REQUEST_COUNT = 10
+_STREAM_COUNT = 100
+
+
+def _handle_stream_unary(request_iterator, servicer_context):
+    return b"".join(request_iterator)
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        if request == _ABORT_REQUEST:
+            servicer_context.abort(grpc.StatusCode.INVALID_ARGUMENT, "abort")
+        yield request
+
+
+def _serialize(request):
+    if request == _UNSERIALIZABLE_REQUEST:
+        raise ValueError("Unserializable request!")
+    return request
+
+
+class ClientStreamingWriteTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server(max_workers=_STREAM_COUNT + 1)
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _STREAM_UNARY: grpc.stream_unary_rpc_method_handler(
+                    _handle_stream_unary
+                ),
+                _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                    _handle_stream_stream
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+        self._stream_unary = self._channel.stream_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_UNARY),
+            request_serializer=_serialize,
+            _registered_method=True,
+        )
+        self._stream_stream = self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            request_serializer=_serialize,
+            _registered_method=True,
+        )
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def testStreamUnaryWrite(self):
+        call = self._stream_unary.future()
+        for _ in range(_REQUEST_COUNT):
+            call.write(_REQUEST)
+        call.done_writing()
+
+        self.assertEqual(_REQUEST * _REQUEST_COUNT, call.result())
+        self.assertIs(grpc.StatusCode.OK, call.code())
+
+    def testStreamStreamWrite(self):
+        call = self._stream_stream()
+        for _ in range(_REQUEST_COUNT):
+            call.write(_REQUEST)
+            self.assertEqual(_REQUEST, next(call))
+        call.done_writing()
+
+        with self.assertRaises(StopIteration):
+            next(call)
+        self.assertIs(grpc.StatusCode.OK, call.code())
+
+    def testWritesStartNoThreads(self):
+        # Counting threads would also count the handler threads of the
+        # in-process server, so check that no consumer thread is started.
+        with mock.patch.object(
+            _channel,
+            "_consume_request_iterator",
+            wraps=_channel._consume_request_iterator,
+        ) as consume_request_iterator:
+            calls = [self._stream_stream() for _ in range(_STREAM_COUNT)]
+            for call in calls:
+                call.write(_REQUEST)
+
+        consume_request_iterator.assert_not_called()
+        for call in calls:
+            self.assertEqual(_REQUEST, next(call))
+            call.done_writing()
+            self.assertIs(grpc.StatusCode.OK, call.code())
+
+    def testWriteAfterDoneWriting(self):
+        call = self._stream_stream()
+        call.done_writing()
+
+        with self.assertRaises(grpc.experimental.UsageError):
+            call.write(_REQUEST)
+
+    def testWriteToIteratorCall(self):
+        call = self._stream_stream(iter((_REQUEST,)))
+
+        with self.assertRaises(grpc.experimental.UsageError):
+            call.write(_REQUEST)
+        with self.assertRaises(grpc.experimental.UsageError):
+            call.done_writing()
+        self.assertEqual([_REQUEST], list(call))
+
+    def testWriteAfterAbort(self):
+        call = self._stream_stream()
+        call.write(_ABORT_REQUEST)
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            while True:
+                call.write(_REQUEST)
+        self.assertIs(
+            grpc.StatusCode.INVALID_ARGUMENT,
+            exception_context.exception.code(),
+        )
+
+    def testWriteUnserializableRequest(self):
+        call = self._stream_unary.future()
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            call.write(_UNSERIALIZABLE_REQUEST)
+        self.assertIs(
+            grpc.StatusCode.INTERNAL, exception_context.exception.code()
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -20,8 +20,10 @@ import itertools
 import logging
 import os
 import unittest
+from unittest import mock
 
 import grpc
+from grpc import _compression
 from grpc import _grpcio_metadata
 
 from tests.unit import _tcp_proxy
@@ -39,6 +41,7 @@ _STREAM_LENGTH = test_constants.STREAM_LENGTH // 16
 _HOST = "localhost"
 
 _REQUEST = b"\x00" * 100
+_LARGE_REQUEST = b"\x00" * 64 * 1024
 _COMPRESSION_RATIO_THRESHOLD = 0.05
 _COMPRESSION_METHODS = (
     None,
@@ -115,6 +118,20 @@ def set_call_compression(
     servicer_context.set_compression(compression_method)
 
 
+def set_call_compression_policy(
+    min_message_size,
+    offload_message_size,
+    request_or_iterator,
+    servicer_context,
+):
+    del request_or_iterator
+    servicer_context.set_compression(
+        grpc.Compression.Gzip,
+        min_message_size=min_message_size,
+        offload_message_size=offload_message_size,
+    )
+
+
 def disable_next_compression(request, servicer_context):
     del request
     servicer_context.disable_next_message_compression()
@@ -125,6 +142,11 @@ def disable_first_compression(request, servicer_context):
         servicer_context.disable_next_message_compression()
 
 
+def offload_and_disable_first(request, servicer_context):
+    set_call_compression_policy(0, 0, request, servicer_context)
+    disable_first_compression(request, servicer_context)
+
+
 class _MethodHandler(grpc.RpcMethodHandler):
     def __init__(
         self, request_streaming, response_streaming, pre_response_callback
@@ -398,6 +420,74 @@ class CompressionTest(unittest.TestCase):
             _REQUEST,
         )
 
+    def _get_response_compression_ratio(self, client_function, policy):
+        _, response_compression_ratio = _get_compression_ratios(
+            client_function,
+            {},
+            {},
+            {},
+            get_method_handlers(None),
+            {},
+            {},
+            {},
+            get_method_handlers(
+                functools.partial(set_call_compression_policy, *policy)
+            ),
+            _LARGE_REQUEST,
+        )
+        return response_compression_ratio
+
+    def testOffloadedCompression(self):
+        for client_function, response_count in (
+            (_unary_unary_client, 1),
+            (_unary_stream_client, _STREAM_LENGTH),
+        ):
+            with mock.patch.object(
+                _compression,
+                "compress_message",
+                wraps=_compression.compress_message,
+            ) as compress_message:
+                self.assertCompressed(
+                    self._get_response_compression_ratio(
+                        client_function, (None, 0)
+                    )
+                )
+            self.assertEqual(response_count, compress_message.call_count)
+
+    def testOffloadedCompressionAfterDisabledMessage(self):
+        server_handler = get_method_handlers(offload_and_disable_first)
+        with mock.patch.object(
+            _compression,
+            "compress_message",
+            wraps=_compression.compress_message,
+        ) as compress_message:
+            with _instrumented_client_server_pair(
+                {}, {}, server_handler
+            ) as pipeline:
+                client_channel, _, _ = pipeline
+                _stream_stream_client(client_channel, {}, _REQUEST)
+
+        # Every response but the first was compressed ahead of core.
+        self.assertEqual(_STREAM_LENGTH - 1, compress_message.call_count)
+
+    def testMinMessageSize(self):
+        for policy in (
+            (len(_LARGE_REQUEST) + 1, None),
+            (len(_LARGE_REQUEST) + 1, 0),
+        ):
+            self.assertNotCompressed(
+                self._get_response_compression_ratio(
+                    _unary_unary_client, policy
+                )
+            )
+
+    def testMessagesOverMinMessageSizeCompressed(self):
+        self.assertCompressed(
+            self._get_response_compression_ratio(
+                _unary_unary_client, (len(_LARGE_REQUEST), None)
+            )
+        )
+
 
 def _get_compression_str(name, value):
     return "{}{}".format(name, _COMPRESSION_NAMES[value])
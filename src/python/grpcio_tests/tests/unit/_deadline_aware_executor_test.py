@@ -0,0 +1,291 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the deadline-aware executor of the sync server."""
+
+import logging
+import threading
+import time
+import unittest
+
+import grpc
+import grpc.experimental
+
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_REQUEST = b"\x00\x00\x00"
+
+
+class _Blocker:
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.started.set()
+        self.release.wait()
+
+
+class DeadlineAwareExecutorTest(unittest.TestCase):
+    def setUp(self):
+        self._executor = grpc.experimental.DeadlineAwareExecutor(
+            max_workers=1, max_queue_size=4
+        )
+        self._blocker = _Blocker()
+        self._executor.submit(self._blocker)
+        self.assertTrue(
+            self._blocker.started.wait(test_constants.SHORT_TIMEOUT)
+        )
+
+    def tearDown(self):
+        self._blocker.release.set()
+        self._executor.shutdown()
+
+    def testRunsInDeadlineOrder(self):
+        order = []
+        now = time.time()
+        futures = [
+            self._executor.submit_with_deadline(
+                deadline, lambda expired: None, order.append, deadline
+            )
+            for deadline in (None, now + 30, now + 10, now + 20)
+        ]
+
+        self._blocker.release.set()
+        for future in futures:
+            future.result(timeout=test_constants.SHORT_TIMEOUT)
+
+        self.assertEqual([now + 10, now + 20, now + 30, None], order)
+
+    def testShedsExpiredWork(self):
+        ran = []
+        shed = []
+        future = self._executor.submit_with_deadline(
+            time.time() + 0.1, shed.append, ran.append, True
+        )
+
+        time.sleep(0.2)
+        self._blocker.release.set()
+        future.result(timeout=test_constants.SHORT_TIMEOUT)
+
+        self.assertEqual([], ran)
+        self.assertEqual([True], shed)
+        self.assertEqual(1, self._executor.stats().expired_count)
+
+    def testWorkWithoutDeadlineIsNotStarved(self):
+        executor = grpc.experimental.DeadlineAwareExecutor(
+            max_workers=1, no_deadline_slack=0
+        )
+        blocker = _Blocker()
+        executor.submit(blocker)
+        self.assertTrue(blocker.started.wait(test_constants.SHORT_TIMEOUT))
+        order = []
+        no_deadline_future = executor.submit_with_deadline(
+            None, lambda expired: None, order.append, None
+        )
+        deadline = time.time() + 10
+        deadline_future = executor.submit_with_deadline(
+            deadline, lambda expired: None, order.append, deadline
+        )
+
+        blocker.release.set()
+        no_deadline_future.result(timeout=test_constants.SHORT_TIMEOUT)
+        deadline_future.result(timeout=test_constants.SHORT_TIMEOUT)
+        executor.shutdown()
+
+        self.assertEqual([None, deadline], order)
+
+    def testShedsExpiredWorkHoldingQueuePlaces(self):
+        shed = []
+        for _ in range(4):
+            self._executor.submit_with_deadline(
+                time.time() + 0.1, shed.append, lambda: None
+            )
+        time.sleep(0.2)
+
+        future = self._executor.submit_with_deadline(
+            None, shed.append, lambda: True
+        )
+
+        self.assertEqual([True] * 4, shed)
+        stats = self._executor.stats()
+        self.assertEqual(1, stats.queue_depth)
+        self.assertEqual(4, stats.expired_count)
+        self.assertEqual(0, stats.rejected_count)
+        self._blocker.release.set()
+        self.assertTrue(future.result(timeout=test_constants.SHORT_TIMEOUT))
+
+    def testRejectsWorkBeyondQueueSize(self):
+        shed = []
+        for _ in range(4):
+            self._executor.submit_with_deadline(None, shed.append, lambda: None)
+
+        self._executor.submit_with_deadline(None, shed.append, lambda: None)
+
+        self.assertEqual([False], shed)
+        stats = self._executor.stats()
+        self.assertEqual(4, stats.queue_depth)
+        self.assertEqual(1, stats.rejected_count)
+
+    def testPlainWorkIsNeverShed(self):
+        futures = [self._executor.submit(lambda: True) for _ in range(8)]
+
+        self._blocker.release.set()
+
+        for future in futures:
+            self.assertTrue(future.result(timeout=test_constants.SHORT_TIMEOUT))
+
+    def testStats(self):
+        self._executor.submit(time.sleep, 0)
+        time.sleep(0.1)
+
+        self.assertEqual(1, self._executor.stats().queue_depth)
+        self._blocker.release.set()
+        self._executor.shutdown()
+
+        stats = self._executor.stats()
+        self.assertEqual(0, stats.queue_depth)
+        self.assertEqual(2, stats.dequeued_count)
+        self.assertGreaterEqual(stats.max_queue_wait, 0.1)
+        self.assertGreaterEqual(stats.total_queue_wait, stats.max_queue_wait)
+
+    def testSubmitAfterShutdown(self):
+        self._blocker.release.set()
+        self._executor.shutdown()
+
+        with self.assertRaises(RuntimeError):
+            self._executor.submit(lambda: None)
+
+
+class _ServerTestBase(unittest.TestCase):
+    def _start_server(self, executor):
+        self._blocker = _Blocker()
+        self._handled = []
+        self._executor = executor
+        self._server = grpc.server(self._executor)
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                    self._handle_unary_unary
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+        self._unary_unary = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY),
+            _registered_method=True,
+        )
+
+    def tearDown(self):
+        self._blocker.release.set()
+        self._server.stop(None)
+        self._channel.close()
+        self._executor.shutdown()
+
+    def _handle_unary_unary(self, request, servicer_context):
+        self._handled.append(request)
+        if request == _REQUEST:
+            self._blocker()
+        return request
+
+
+class DeadlineAwareServerTest(_ServerTestBase):
+    def setUp(self):
+        self._start_server(
+            grpc.experimental.DeadlineAwareExecutor(
+                max_workers=1, max_queue_size=1
+            )
+        )
+
+    def testExpiredRpcIsNotHandled(self):
+        blocked_future = self._unary_unary.future(_REQUEST)
+        self.assertTrue(
+            self._blocker.started.wait(test_constants.SHORT_TIMEOUT)
+        )
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._unary_unary(b"expired", timeout=0.1)
+        self._blocker.release.set()
+
+        self.assertEqual(_REQUEST, blocked_future.result())
+        # The expired RPC is due before this one and is shed first.
+        self.assertEqual(b"after", self._unary_unary(b"after"))
+        self.assertIs(
+            grpc.StatusCode.DEADLINE_EXCEEDED,
+            exception_context.exception.code(),
+        )
+        self.assertEqual([_REQUEST, b"after"], self._handled)
+        self.assertEqual(1, self._executor.stats().expired_count)
+
+    def testRpcBeyondQueueSizeIsRejected(self):
+        blocked_future = self._unary_unary.future(_REQUEST)
+        self.assertTrue(
+            self._blocker.started.wait(test_constants.SHORT_TIMEOUT)
+        )
+        queued_future = self._unary_unary.future(b"queued")
+        while not self._executor.stats().queue_depth:
+            time.sleep(0.01)
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._unary_unary(b"rejected")
+        self._blocker.release.set()
+
+        self.assertEqual(_REQUEST, blocked_future.result())
+        self.assertEqual(b"queued", queued_future.result())
+        self.assertIs(
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            exception_context.exception.code(),
+        )
+        self.assertNotIn(b"rejected", self._handled)
+
+
+class DeadlineFreeRpcTest(_ServerTestBase):
+    def setUp(self):
+        self._start_server(
+            grpc.experimental.DeadlineAwareExecutor(
+                max_workers=1, no_deadline_slack=0
+            )
+        )
+
+    def _wait_for_queue_depth(self, queue_depth):
+        while self._executor.stats().queue_depth < queue_depth:
+            time.sleep(0.01)
+
+    def testRpcWithoutDeadlineIsNotStarved(self):
+        blocked_future = self._unary_unary.future(_REQUEST)
+        self.assertTrue(
+            self._blocker.started.wait(test_constants.SHORT_TIMEOUT)
+        )
+        no_deadline_future = self._unary_unary.future(b"no deadline")
+        self._wait_for_queue_depth(1)
+        deadline_future = self._unary_unary.future(
+            b"deadline", timeout=test_constants.LONG_TIMEOUT
+        )
+        self._wait_for_queue_depth(2)
+
+        self._blocker.release.set()
+
+        self.assertEqual(_REQUEST, blocked_future.result())
+        self.assertEqual(b"no deadline", no_deadline_future.result())
+        self.assertEqual(b"deadline", deadline_future.result())
+        self.assertEqual([_REQUEST, b"no deadline", b"deadline"], self._handled)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
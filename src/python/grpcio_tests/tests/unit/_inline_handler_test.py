@@ -0,0 +1,181 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of running unary handlers inline on the serving thread."""
+
+from concurrent import futures
+import logging
+import threading
+import time
+import unittest
+
+import grpc
+
+_SERVICE_NAME = "test"
+_INLINE = "Inline"
+_SLOW = "Slow"
+_ABORTING = "Aborting"
+_RAISING = "Raising"
+
+_POOL_THREAD_NAME_PREFIX = "pool"
+_INLINE_BUDGET = 0.05
+_REQUEST = b"\x00\x00\x00"
+_TRAILING_METADATA = (("trailing-md-key", "trailing-md-value"),)
+
+
+class _Handlers:
+    def __init__(self):
+        self.thread_names = []
+
+    def inline(self, request, servicer_context):
+        self.thread_names.append(threading.current_thread().name)
+        servicer_context.set_trailing_metadata(_TRAILING_METADATA)
+        return request
+
+    def slow(self, request, servicer_context):
+        self.thread_names.append(threading.current_thread().name)
+        time.sleep(_INLINE_BUDGET * 2)
+        return request
+
+    def aborting(self, request, servicer_context):
+        servicer_context.abort(grpc.StatusCode.PERMISSION_DENIED, "denied")
+
+    def raising(self, request, servicer_context):
+        raise ValueError("raised")
+
+
+class InlineHandlerTest(unittest.TestCase):
+    def setUp(self):
+        self._handlers = _Handlers()
+        method_handlers = {
+            _INLINE: grpc.unary_unary_rpc_method_handler(self._handlers.inline),
+            _SLOW: grpc.unary_unary_rpc_method_handler(self._handlers.slow),
+            _ABORTING: grpc.unary_unary_rpc_method_handler(
+                self._handlers.aborting
+            ),
+            _RAISING: grpc.unary_unary_rpc_method_handler(
+                self._handlers.raising
+            ),
+        }
+        for method_handler in method_handlers.values():
+            method_handler.unary_unary.__func__.experimental_inline_budget = (
+                _INLINE_BUDGET
+            )
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix=_POOL_THREAD_NAME_PREFIX
+            )
+        )
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME, method_handlers
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def _unary_unary(self, method):
+        return self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, method),
+            _registered_method=True,
+        )
+
+    def testRunsOutsideThreadPool(self):
+        for _ in range(10):
+            response, call = self._unary_unary(_INLINE).with_call(_REQUEST)
+
+            self.assertEqual(_REQUEST, response)
+            self.assertEqual(_TRAILING_METADATA, call.trailing_metadata())
+        for thread_name in self._handlers.thread_names:
+            self.assertFalse(thread_name.startswith(_POOL_THREAD_NAME_PREFIX))
+
+    def testConcurrentRpcs(self):
+        rpc_futures = [
+            self._unary_unary(_INLINE).future(_REQUEST) for _ in range(100)
+        ]
+
+        for rpc_future in rpc_futures:
+            self.assertEqual(_REQUEST, rpc_future.result())
+
+    def testOverrunDemotesToThreadPool(self):
+        self.assertEqual(_REQUEST, self._unary_unary(_SLOW)(_REQUEST))
+        self.assertEqual(_REQUEST, self._unary_unary(_SLOW)(_REQUEST))
+
+        thread_names = self._handlers.thread_names
+        self.assertEqual(2, len(thread_names))
+        inline_thread_name = thread_names[0]
+        demoted_thread_name = thread_names[1]
+        self.assertFalse(
+            inline_thread_name.startswith(_POOL_THREAD_NAME_PREFIX)
+        )
+        self.assertTrue(
+            demoted_thread_name.startswith(_POOL_THREAD_NAME_PREFIX)
+        )
+
+    def testAbort(self):
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._unary_unary(_ABORTING)(_REQUEST)
+
+        self.assertIs(
+            grpc.StatusCode.PERMISSION_DENIED,
+            exception_context.exception.code(),
+        )
+        self.assertEqual("denied", exception_context.exception.details())
+
+    def testException(self):
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._unary_unary(_RAISING)(_REQUEST)
+
+        self.assertIs(
+            grpc.StatusCode.UNKNOWN, exception_context.exception.code()
+        )
+
+
+class InlineBudgetValidationTest(unittest.TestCase):
+    def setUp(self):
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def testInvalidBudgetRejected(self):
+        for budget in (0, -1, "0.01", True):
+            with self.subTest(budget=budget):
+
+                def handler(request, servicer_context):
+                    return request
+
+                handler.experimental_inline_budget = budget
+                handlers = {
+                    _INLINE: grpc.unary_unary_rpc_method_handler(handler),
+                }
+                with self.assertRaises(ValueError):
+                    self._server.add_registered_method_handlers(
+                        _SERVICE_NAME, handlers
+                    )
+                with self.assertRaises(ValueError):
+                    self._server.add_generic_rpc_handlers(
+                        (
+                            grpc.method_handlers_generic_handler(
+                                _SERVICE_NAME, handlers
+                            ),
+                        )
+                    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
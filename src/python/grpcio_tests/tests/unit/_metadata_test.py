@@ -19,6 +19,7 @@ import weakref
 
 import grpc
 from grpc import _channel
+import grpc.experimental
 
 from tests.unit import test_common
 from tests.unit.framework.common import test_constants
@@ -267,6 +268,63 @@ class MetadataTest(unittest.TestCase):
             )
         )
 
+    def testEncodedMetadataReusedAcrossCalls(self):
+        encoded_metadata = grpc.experimental.encode_metadata(
+            _INVOCATION_METADATA
+        )
+        multi_callable = self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _UNARY_UNARY),
+            _registered_method=True,
+        )
+        for _ in range(test_constants.STREAM_LENGTH):
+            self.assertEqual(
+                _RESPONSE, multi_callable(_REQUEST, metadata=encoded_metadata)
+            )
+        unused_response, call = multi_callable.with_call(
+            _REQUEST, metadata=encoded_metadata
+        )
+        future = multi_callable.future(
+            _REQUEST,
+            metadata=encoded_metadata,
+            compression=grpc.Compression.Gzip,
+        )
+
+        self.assertEqual(_RESPONSE, future.result())
+        self.assertTrue(
+            test_common.metadata_transmitted(
+                _EXPECTED_INITIAL_METADATA, call.initial_metadata()
+            )
+        )
+        self.assertEqual(_EXPECTED_INVOCATION_METADATA, encoded_metadata)
+
+    def testEncodedMetadataStreamStream(self):
+        encoded_metadata = grpc.experimental.encode_metadata(
+            _INVOCATION_METADATA
+        )
+        multi_callable = self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            _registered_method=True,
+        )
+        call = multi_callable(
+            iter([_REQUEST] * test_constants.STREAM_LENGTH),
+            metadata=encoded_metadata,
+        )
+        for _ in call:
+            pass
+        self.assertTrue(
+            test_common.metadata_transmitted(
+                _EXPECTED_TRAILING_METADATA, call.trailing_metadata()
+            )
+        )
+
+    def testEncodedMetadataValidatesOnce(self):
+        with self.assertRaises(ValueError):
+            grpc.experimental.encode_metadata((("Illegal Key", "value"),))
+        with self.assertRaises(ValueError):
+            grpc.experimental.encode_metadata((("key", "illegal\nvalue"),))
+        with self.assertRaises(TypeError):
+            grpc.experimental.encode_metadata((("key-bin", "not bytes"),))
+
 
 if __name__ == "__main__":
     logging.basicConfig()
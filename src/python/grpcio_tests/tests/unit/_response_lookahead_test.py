@@ -0,0 +1,228 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of pipelined sending of server-streaming responses."""
+
+import logging
+import threading
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_UNARY_STREAM = "UnaryStream"
+_STREAM_STREAM = "StreamStream"
+_ABORTING_UNARY_STREAM = "AbortingUnaryStream"
+_CANCELLED_UNARY_STREAM = "CancelledUnaryStream"
+
+_LOOKAHEAD = 4
+_RESPONSE_COUNT = 1000
+_ABORT_AFTER = 10
+_INITIAL_METADATA = (("initial-md-key", "initial-md-value"),)
+_TRAILING_METADATA = (("trailing-md-key", "trailing-md-value"),)
+
+
+def _response(index):
+    return index.to_bytes(4, "big")
+
+
+def _handle_unary_stream(request, servicer_context):
+    servicer_context.send_initial_metadata(_INITIAL_METADATA)
+    servicer_context.set_trailing_metadata(_TRAILING_METADATA)
+    for index in range(int.from_bytes(request, "big")):
+        if index % 2:
+            servicer_context.disable_next_message_compression()
+        yield _response(index)
+
+
+_handle_unary_stream.experimental_response_lookahead = _LOOKAHEAD
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+_handle_stream_stream.experimental_response_lookahead = _LOOKAHEAD
+
+
+def _handle_aborting_unary_stream(request, servicer_context):
+    for index in range(_ABORT_AFTER):
+        yield _response(index)
+    servicer_context.abort(grpc.StatusCode.INVALID_ARGUMENT, "abort")
+
+
+_handle_aborting_unary_stream.experimental_response_lookahead = _LOOKAHEAD
+
+
+class _CancelledHandler:
+    def __init__(self):
+        self.experimental_response_lookahead = _LOOKAHEAD
+        self.started = threading.Event()
+        self.finished = threading.Event()
+
+    def __call__(self, request, servicer_context):
+        try:
+            self.started.set()
+            index = 0
+            while True:
+                yield _response(index)
+                index += 1
+        finally:
+            self.finished.set()
+
+
+class ResponseLookaheadValidationTest(unittest.TestCase):
+    def setUp(self):
+        self._server = test_common.test_server()
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def testInvalidLookaheadRejected(self):
+        for lookahead in (0, -1, "2", True):
+            with self.subTest(lookahead=lookahead):
+
+                def handler(request, servicer_context):
+                    yield request
+
+                handler.experimental_response_lookahead = lookahead
+                handlers = {
+                    _UNARY_STREAM: grpc.unary_stream_rpc_method_handler(
+                        handler
+                    ),
+                }
+                with self.assertRaises(ValueError):
+                    self._server.add_registered_method_handlers(
+                        _SERVICE_NAME, handlers
+                    )
+                with self.assertRaises(ValueError):
+                    self._server.add_generic_rpc_handlers(
+                        (
+                            grpc.method_handlers_generic_handler(
+                                _SERVICE_NAME, handlers
+                            ),
+                        )
+                    )
+
+
+class ResponseLookaheadTest(unittest.TestCase):
+    def setUp(self):
+        self._cancelled_handler = _CancelledHandler()
+        handlers = {
+            _UNARY_STREAM: grpc.unary_stream_rpc_method_handler(
+                _handle_unary_stream
+            ),
+            _STREAM_STREAM: grpc.stream_stream_rpc_method_handler(
+                _handle_stream_stream
+            ),
+            _ABORTING_UNARY_STREAM: grpc.unary_stream_rpc_method_handler(
+                _handle_aborting_unary_stream
+            ),
+            _CANCELLED_UNARY_STREAM: grpc.unary_stream_rpc_method_handler(
+                self._cancelled_handler
+            ),
+        }
+        self._server = test_common.test_server()
+        self._server.add_registered_method_handlers(_SERVICE_NAME, handlers)
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel(
+            "localhost:%d" % port, compression=grpc.Compression.Gzip
+        )
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def _unary_stream(self, method):
+        return self._channel.unary_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, method),
+            _registered_method=True,
+        )
+
+    def testResponsesInOrder(self):
+        call = self._unary_stream(_UNARY_STREAM)(
+            _response(_RESPONSE_COUNT), timeout=test_constants.LONG_TIMEOUT
+        )
+
+        self.assertEqual(
+            [_response(index) for index in range(_RESPONSE_COUNT)],
+            list(call),
+        )
+        self.assertEqual(_INITIAL_METADATA, call.initial_metadata())
+        self.assertEqual(_TRAILING_METADATA, call.trailing_metadata())
+        self.assertIs(grpc.StatusCode.OK, call.code())
+
+    def testNoResponses(self):
+        call = self._unary_stream(_UNARY_STREAM)(
+            _response(0), timeout=test_constants.LONG_TIMEOUT
+        )
+
+        self.assertEqual([], list(call))
+        self.assertIs(grpc.StatusCode.OK, call.code())
+
+    def testStreamStream(self):
+        requests = [_response(index) for index in range(_RESPONSE_COUNT)]
+        stream_stream = self._channel.stream_stream(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, _STREAM_STREAM),
+            _registered_method=True,
+        )
+
+        call = stream_stream(
+            iter(requests), timeout=test_constants.LONG_TIMEOUT
+        )
+
+        self.assertEqual(requests, list(call))
+        self.assertIs(grpc.StatusCode.OK, call.code())
+
+    def testAbortAfterResponses(self):
+        call = self._unary_stream(_ABORTING_UNARY_STREAM)(
+            b"", timeout=test_constants.LONG_TIMEOUT
+        )
+
+        responses = []
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            for response in call:
+                responses.append(response)
+        self.assertIs(
+            grpc.StatusCode.INVALID_ARGUMENT,
+            exception_context.exception.code(),
+        )
+        self.assertEqual(
+            [_response(index) for index in range(len(responses))], responses
+        )
+
+    def testClientCancellationStopsHandler(self):
+        call = self._unary_stream(_CANCELLED_UNARY_STREAM)(
+            b"", timeout=test_constants.LONG_TIMEOUT
+        )
+        self.assertEqual(_response(0), next(call))
+        self.assertTrue(
+            self._cancelled_handler.started.wait(test_constants.SHORT_TIMEOUT)
+        )
+
+        call.cancel()
+
+        self.assertTrue(
+            self._cancelled_handler.finished.wait(test_constants.LONG_TIMEOUT)
+        )
+        self.assertIs(grpc.StatusCode.CANCELLED, call.code())
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
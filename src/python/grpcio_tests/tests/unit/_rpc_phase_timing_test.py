@@ -0,0 +1,164 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of timing the phases of RPCs handled by the sync server."""
+
+from concurrent import futures
+import logging
+import threading
+import unittest
+
+import grpc
+from grpc import _observability
+
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_UNARY_UNARY = "UnaryUnary"
+_UNARY_STREAM = "UnaryStream"
+_UNARY_UNARY_METHOD = "/test/UnaryUnary"
+_UNARY_STREAM_METHOD = "/test/UnaryStream"
+_REQUEST = b"\x00\x00\x00"
+_RESPONSE_COUNT = 3
+
+
+class _PhaseRecordingPlugin(_observability.ObservabilityPlugin):
+    def __init__(self):
+        self.recorded = []
+        self.recorded_event = threading.Event()
+
+    def create_client_call_tracer(self, method_name, target):
+        return None
+
+    def save_trace_context(self, trace_id, span_id, is_sampled):
+        pass
+
+    def create_server_call_tracer_factory(self, *, xds=False):
+        return None
+
+    def record_rpc_latency(self, method, target, rpc_latency, status_code):
+        pass
+
+    def record_server_rpc_phases(self, method, phases):
+        self.recorded.append((method, phases))
+        self.recorded_event.set()
+
+
+class _PassThroughInterceptor(grpc.ServerInterceptor):
+    def intercept_service(self, continuation, handler_call_details):
+        return continuation(handler_call_details)
+
+
+def _unary_stream(request, servicer_context):
+    for _ in range(_RESPONSE_COUNT):
+        yield request
+
+
+class RpcPhaseTimingTest(unittest.TestCase):
+    def setUp(self):
+        self._plugin = _PhaseRecordingPlugin()
+        _observability.observability_init(self._plugin)
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=2),
+            interceptors=(_PassThroughInterceptor(),),
+        )
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _UNARY_UNARY: grpc.unary_unary_rpc_method_handler(
+                    lambda request, servicer_context: request
+                ),
+                _UNARY_STREAM: grpc.unary_stream_rpc_method_handler(
+                    _unary_stream
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+        _observability.observability_deinit()
+
+    def _multi_callable(self, method, multi_callable):
+        return multi_callable(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, method),
+            _registered_method=True,
+        )
+
+    def testUnaryUnaryPhases(self):
+        self._plugin.set_phase_timing(True)
+
+        response = self._multi_callable(
+            _UNARY_UNARY, self._channel.unary_unary
+        )(_REQUEST)
+
+        self.assertEqual(_REQUEST, response)
+        self.assertTrue(
+            self._plugin.recorded_event.wait(test_constants.SHORT_TIMEOUT)
+        )
+        method, phases = self._plugin.recorded[0]
+        self.assertEqual(_UNARY_UNARY_METHOD, method)
+        self.assertEqual(
+            {
+                "lookup",
+                "interceptors",
+                "deserialization",
+                "queue",
+                "handler",
+                "serialization",
+                "send",
+                "total",
+            },
+            set(phases),
+        )
+        for phase, duration in phases.items():
+            self.assertGreaterEqual(duration, 0, phase)
+            self.assertLessEqual(duration, phases["total"], phase)
+
+    def testUnaryStreamPhases(self):
+        self._plugin.set_phase_timing(True)
+
+        responses = list(
+            self._multi_callable(_UNARY_STREAM, self._channel.unary_stream)(
+                _REQUEST
+            )
+        )
+
+        self.assertEqual([_REQUEST] * _RESPONSE_COUNT, responses)
+        self.assertTrue(
+            self._plugin.recorded_event.wait(test_constants.SHORT_TIMEOUT)
+        )
+        method, phases = self._plugin.recorded[0]
+        self.assertEqual(_UNARY_STREAM_METHOD, method)
+        self.assertIn("handler", phases)
+        self.assertIn("serialization", phases)
+        self.assertIn("send", phases)
+
+    def testDisabledByDefault(self):
+        self.assertEqual(
+            _REQUEST,
+            self._multi_callable(_UNARY_UNARY, self._channel.unary_unary)(
+                _REQUEST
+            ),
+        )
+        self._server.stop(None).wait()
+
+        self.assertEqual([], self._plugin.recorded)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
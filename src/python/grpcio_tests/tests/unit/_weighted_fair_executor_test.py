@@ -0,0 +1,268 @@
+# Copyright 2026 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the weighted-fair executor of the sync server."""
+
+import collections
+import logging
+import threading
+import time
+import unittest
+
+import grpc
+import grpc.experimental
+
+from tests.unit.framework.common import test_constants
+
+_SERVICE_NAME = "test"
+_BATCH = "Batch"
+_INTERACTIVE = "Interactive"
+_BATCH_METHOD = "/test/Batch"
+_INTERACTIVE_METHOD = "/test/Interactive"
+_PRIORITY_KEY = "x-traffic-class"
+_REQUEST = b"\x00\x00\x00"
+
+_HandlerCallDetails = collections.namedtuple(
+    "_HandlerCallDetails", ("method", "invocation_metadata")
+)
+
+
+class _Blocker:
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.started.set()
+        self.release.wait()
+
+
+class WeightedFairExecutorTest(unittest.TestCase):
+    def setUp(self):
+        self._executor = grpc.experimental.WeightedFairExecutor(
+            {
+                "default": grpc.experimental.TrafficClass(),
+                "heavy": grpc.experimental.TrafficClass(weight=3),
+                "capped": grpc.experimental.TrafficClass(
+                    max_concurrency=1, max_queue_size=1
+                ),
+            },
+            max_workers=1,
+            method_classes={
+                "/test.Heavy/Method": "heavy",
+                "test.Capped": "capped",
+            },
+            metadata_key=_PRIORITY_KEY,
+        )
+        self._blocker = _Blocker()
+        self._executor.submit(self._blocker)
+        self.assertTrue(
+            self._blocker.started.wait(test_constants.SHORT_TIMEOUT)
+        )
+
+    def tearDown(self):
+        self._blocker.release.set()
+        self._executor.shutdown()
+
+    def _submit_rpc(self, method, on_shed, fn, *args, metadata=()):
+        return self._executor.submit_rpc(
+            _HandlerCallDetails(method, metadata), on_shed, fn, *args
+        )
+
+    def testClassify(self):
+        self.assertEqual(
+            "heavy",
+            self._executor.classify(
+                _HandlerCallDetails("/test.Heavy/Method", ())
+            ),
+        )
+        self.assertEqual(
+            "capped",
+            self._executor.classify(
+                _HandlerCallDetails("/test.Capped/Method", ())
+            ),
+        )
+        self.assertEqual(
+            "default",
+            self._executor.classify(
+                _HandlerCallDetails("/test.Heavy/Other", ())
+            ),
+        )
+        self.assertEqual(
+            "capped",
+            self._executor.classify(
+                _HandlerCallDetails(
+                    "/test.Heavy/Method", ((_PRIORITY_KEY, "capped"),)
+                )
+            ),
+        )
+        self.assertEqual(
+            "heavy",
+            self._executor.classify(
+                _HandlerCallDetails(
+                    "/test.Heavy/Method", ((_PRIORITY_KEY, "unknown"),)
+                )
+            ),
+        )
+
+    def testMetadataKeyIsLowercased(self):
+        executor = grpc.experimental.WeightedFairExecutor(
+            {
+                "default": grpc.experimental.TrafficClass(),
+                "heavy": grpc.experimental.TrafficClass(),
+            },
+            metadata_key=_PRIORITY_KEY.upper(),
+        )
+
+        self.assertEqual(
+            "heavy",
+            executor.classify(
+                _HandlerCallDetails(
+                    "/test.Service/Method", ((_PRIORITY_KEY, "heavy"),)
+                )
+            ),
+        )
+        executor.shutdown()
+
+    def testDequeuesInProportionToWeight(self):
+        order = []
+        futures = [
+            self._submit_rpc(method, None, order.append, method)
+            for method in ("/test.Heavy/Method", "/test.Other/Method")
+            for _ in range(6)
+        ]
+
+        self._blocker.release.set()
+        for future in futures:
+            future.result(timeout=test_constants.SHORT_TIMEOUT)
+
+        self.assertEqual(
+            ["heavy"] * 3 + ["default"] + ["heavy"] * 3 + ["default"] * 5,
+            [
+                self._executor.classify(_HandlerCallDetails(method, ()))
+                for method in order
+            ],
+        )
+
+    def testRejectsWorkBeyondClassQueueSize(self):
+        shed = []
+        self._submit_rpc("/test.Capped/Method", shed.append, lambda: None)
+
+        self._submit_rpc("/test.Capped/Method", shed.append, lambda: None)
+        self._submit_rpc("/test.Other/Method", shed.append, lambda: None)
+
+        self.assertEqual([False], shed)
+        stats = self._executor.stats()
+        self.assertEqual(
+            grpc.experimental.WeightedFairExecutorStats(1, 0, 0, 1),
+            stats["capped"],
+        )
+        self.assertEqual(
+            grpc.experimental.WeightedFairExecutorStats(1, 1, 1, 0),
+            stats["default"],
+        )
+
+    def testSubmitAfterShutdown(self):
+        self._blocker.release.set()
+        self._executor.shutdown()
+
+        with self.assertRaises(RuntimeError):
+            self._executor.submit(lambda: None)
+
+    def testInvalidArguments(self):
+        with self.assertRaises(ValueError):
+            grpc.experimental.WeightedFairExecutor(
+                {"other": grpc.experimental.TrafficClass()}
+            )
+        with self.assertRaises(ValueError):
+            grpc.experimental.WeightedFairExecutor(
+                {"default": grpc.experimental.TrafficClass(weight=0)}
+            )
+        with self.assertRaises(ValueError):
+            grpc.experimental.WeightedFairExecutor(
+                {"default": grpc.experimental.TrafficClass()},
+                method_classes={"test.Service": "unknown"},
+            )
+
+
+class WeightedFairServerTest(unittest.TestCase):
+    def setUp(self):
+        self._blocker = _Blocker()
+        self._executor = grpc.experimental.WeightedFairExecutor(
+            {
+                "default": grpc.experimental.TrafficClass(),
+                "batch": grpc.experimental.TrafficClass(
+                    max_concurrency=1, max_queue_size=1
+                ),
+            },
+            max_workers=2,
+            method_classes={_BATCH_METHOD: "batch"},
+        )
+        self._server = grpc.server(self._executor)
+        self._server.add_registered_method_handlers(
+            _SERVICE_NAME,
+            {
+                _BATCH: grpc.unary_unary_rpc_method_handler(self._handle_batch),
+                _INTERACTIVE: grpc.unary_unary_rpc_method_handler(
+                    lambda request, servicer_context: request
+                ),
+            },
+        )
+        port = self._server.add_insecure_port("[::]:0")
+        self._server.start()
+        self._channel = grpc.insecure_channel("localhost:%d" % port)
+
+    def tearDown(self):
+        self._blocker.release.set()
+        self._server.stop(None)
+        self._channel.close()
+        self._executor.shutdown()
+
+    def _handle_batch(self, request, servicer_context):
+        self._blocker()
+        return request
+
+    def _unary_unary(self, method):
+        return self._channel.unary_unary(
+            grpc._common.fully_qualified_method(_SERVICE_NAME, method),
+            _registered_method=True,
+        )
+
+    def testCappedClassDoesNotBlockOtherClasses(self):
+        blocked_future = self._unary_unary(_BATCH).future(_REQUEST)
+        self.assertTrue(
+            self._blocker.started.wait(test_constants.SHORT_TIMEOUT)
+        )
+        queued_future = self._unary_unary(_BATCH).future(_REQUEST)
+        while not self._executor.stats()["batch"].queue_depth:
+            time.sleep(0.01)
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._unary_unary(_BATCH)(_REQUEST)
+        self.assertEqual(_REQUEST, self._unary_unary(_INTERACTIVE)(_REQUEST))
+        self._blocker.release.set()
+
+        self.assertEqual(_REQUEST, blocked_future.result())
+        self.assertEqual(_REQUEST, queued_future.result())
+        self.assertIs(
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            exception_context.exception.code(),
+        )
+        stats = self._executor.stats()
+        self.assertEqual(1, stats["batch"].rejected_count)
+        self.assertEqual(1, stats["default"].dequeued_count)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main(verbosity=2)
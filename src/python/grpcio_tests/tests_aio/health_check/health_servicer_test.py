@@ -34,6 +34,7 @@ _NOT_SERVING_SERVICE = "grpc.test.TestServiceNotServing"
 _WATCH_SERVICE = "grpc.test.WatchService"
 
 _LARGE_NUMBER_OF_STATUS_CHANGES = 1000
+_WATCHER_COUNT = 20
 
 
 async def _pipe_to_queue(call, queue):
@@ -216,6 +217,48 @@ class HealthServicerTest(AioTestBase):
         self.assertTrue(queue1.empty())
         self.assertTrue(queue2.empty())
 
+    async def test_many_watchers_converge_to_latest_status(self):
+        request = health_pb2.HealthCheckRequest(service=_WATCH_SERVICE)
+        calls_and_queues = [
+            (self._stub.Watch(request), asyncio.Queue())
+            for _ in range(_WATCHER_COUNT)
+        ]
+        tasks = [
+            self.loop.create_task(_pipe_to_queue(call, queue))
+            for call, queue in calls_and_queues
+        ]
+        for _, queue in calls_and_queues:
+            self.assertEqual(
+                health_pb2.HealthCheckResponse.SERVICE_UNKNOWN,
+                (await queue.get()).status,
+            )
+
+        for index in range(_LARGE_NUMBER_OF_STATUS_CHANGES):
+            await self._servicer.set(
+                _WATCH_SERVICE,
+                (
+                    health_pb2.HealthCheckResponse.NOT_SERVING
+                    if index % 2
+                    else health_pb2.HealthCheckResponse.SERVING
+                ),
+            )
+        await self._servicer.set(
+            _WATCH_SERVICE, health_pb2.HealthCheckResponse.UNKNOWN
+        )
+
+        for _, queue in calls_and_queues:
+            # Intermediate statuses may have been coalesced away, but the
+            # latest one is always delivered.
+            status = (await queue.get()).status
+            while status != health_pb2.HealthCheckResponse.UNKNOWN:
+                status = (await queue.get()).status
+
+        for call, _ in calls_and_queues:
+            call.cancel()
+        for task in tasks:
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
     async def test_cancelled_watch_removed_from_watch_list(self):
         request = health_pb2.HealthCheckRequest(service=_WATCH_SERVICE)
         call = self._stub.Watch(request)
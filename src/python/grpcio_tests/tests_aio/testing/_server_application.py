@@ -0,0 +1,84 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""An example gRPC AsyncIO Python-using server-side application."""
+
+import asyncio
+
+import grpc
+from grpc import aio
+
+# requests_pb2 is a semantic dependency of this module.
+from tests.testing import _application_common
+from tests.testing.proto import requests_pb2  # pylint: disable=unused-import
+from tests.testing.proto import services_pb2
+from tests.testing.proto import services_pb2_grpc
+
+SLOW_DURATION_S = 60.0
+
+
+class FirstServiceServicer(services_pb2_grpc.FirstServiceServicer):
+    """Services RPCs with coroutines and async generators."""
+
+    async def UnUn(self, request, context):
+        if request == _application_common.UNARY_UNARY_REQUEST:
+            return _application_common.UNARY_UNARY_RESPONSE
+        elif request == _application_common.ABORT_REQUEST:
+            await context.abort(
+                grpc.StatusCode.PERMISSION_DENIED,
+                "Denying permission to test abort.",
+            )
+        elif request == _application_common.ERRONEOUS_UNARY_UNARY_REQUEST:
+            # NOTE: Sleeps far longer than any deadline used in the tests.
+            await asyncio.sleep(SLOW_DURATION_S)
+            return _application_common.ERRONEOUS_UNARY_UNARY_RESPONSE
+        else:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("Something is wrong with your request!")
+            return services_pb2.Down()
+
+    async def UnStre(self, request, context):
+        if _application_common.UNARY_STREAM_REQUEST != request:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("Something is wrong with your request!")
+            return
+        await context.write(_application_common.STREAM_UNARY_RESPONSE)
+        await context.write(_application_common.STREAM_UNARY_RESPONSE)
+
+    async def StreUn(self, request_iterator, context):
+        await context.send_initial_metadata(
+            (
+                (
+                    "server_application_metadata_key",
+                    "Hi there!",
+                ),
+            )
+        )
+        async for request in request_iterator:
+            if request != _application_common.STREAM_UNARY_REQUEST:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details("Something is wrong with your request!")
+                return services_pb2.Strange()
+        return _application_common.STREAM_UNARY_RESPONSE
+
+    async def StreStre(self, request_iterator, context):
+        while True:
+            request = await context.read()
+            if request is aio.EOF:
+                return
+            if request != _application_common.STREAM_STREAM_REQUEST:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details("Something is wrong with your request!")
+                return
+            yield _application_common.STREAM_STREAM_RESPONSE
+            yield _application_common.STREAM_STREAM_RESPONSE
@@ -0,0 +1,227 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of grpc_testing.aio.Channel and the fake time event loop."""
+
+import asyncio
+import logging
+import unittest
+
+import grpc
+from grpc import aio
+import grpc_testing.aio
+
+from tests.testing import _application_common
+from tests.testing import _application_testing_common
+from tests.testing.proto import services_pb2
+from tests.testing.proto import services_pb2_grpc
+
+_LONG_TIMEOUT_S = 3600.0
+
+
+# TODO(https://github.com/protocolbuffers/protobuf/issues/3452): Drop this skip.
+@unittest.skipIf(
+    services_pb2.DESCRIPTOR.services_by_name.get("FirstService") is None,
+    "Fix protobuf issue 3452!",
+)
+class ClientTest(unittest.TestCase):
+    def setUp(self):
+        # Every test runs on a fresh loop with a simulated clock so that long
+        # deadlines elapse instantly.
+        self._loop = grpc_testing.aio.fake_time_event_loop()
+        self._channel = grpc_testing.aio.channel(
+            services_pb2.DESCRIPTOR.services_by_name.values()
+        )
+        self._stub = services_pb2_grpc.FirstServiceStub(self._channel)
+
+    def tearDown(self):
+        self._loop.close()
+
+    def _run(self, coroutine):
+        return self._loop.run_until_complete(coroutine)
+
+    def test_successful_unary_unary(self):
+        async def test():
+            call = self._stub.UnUn(_application_common.UNARY_UNARY_REQUEST)
+            (
+                invocation_metadata,
+                request,
+                rpc,
+            ) = await self._channel.take_unary_unary(
+                _application_testing_common.FIRST_SERVICE_UNUN
+            )
+            rpc.send_initial_metadata((("key", "value"),))
+            rpc.terminate(
+                _application_common.UNARY_UNARY_RESPONSE,
+                (),
+                grpc.StatusCode.OK,
+                "",
+            )
+
+            self.assertEqual(_application_common.UNARY_UNARY_REQUEST, request)
+            self.assertEqual(
+                _application_common.UNARY_UNARY_RESPONSE, await call
+            )
+            self.assertEqual(
+                "value", (await call.initial_metadata()).get("key")
+            )
+            self.assertIs(grpc.StatusCode.OK, await call.code())
+
+        self._run(test())
+
+    def test_successful_unary_stream(self):
+        async def test():
+            call = self._stub.UnStre(_application_common.UNARY_STREAM_REQUEST)
+            (
+                invocation_metadata,
+                request,
+                rpc,
+            ) = await self._channel.take_unary_stream(
+                _application_testing_common.FIRST_SERVICE_UNSTRE
+            )
+            rpc.send_response(_application_common.STREAM_UNARY_RESPONSE)
+            rpc.send_response(_application_common.STREAM_UNARY_RESPONSE)
+            rpc.terminate((), grpc.StatusCode.OK, "")
+
+            responses = [response async for response in call]
+            self.assertEqual(
+                [_application_common.STREAM_UNARY_RESPONSE] * 2, responses
+            )
+            self.assertIs(grpc.StatusCode.OK, await call.code())
+
+        self._run(test())
+
+    def test_successful_stream_unary(self):
+        async def requests():
+            for _ in range(3):
+                yield _application_common.STREAM_UNARY_REQUEST
+
+        async def test():
+            call = self._stub.StreUn(requests())
+            (
+                invocation_metadata,
+                rpc,
+            ) = await self._channel.take_stream_unary(
+                _application_testing_common.FIRST_SERVICE_STREUN
+            )
+            received = [await rpc.take_request() for _ in range(3)]
+            await rpc.requests_closed()
+            rpc.terminate(
+                _application_common.STREAM_UNARY_RESPONSE,
+                (),
+                grpc.StatusCode.OK,
+                "",
+            )
+
+            self.assertEqual(
+                [_application_common.STREAM_UNARY_REQUEST] * 3, received
+            )
+            self.assertEqual(
+                _application_common.STREAM_UNARY_RESPONSE, await call
+            )
+
+        self._run(test())
+
+    def test_successful_stream_stream(self):
+        async def test():
+            call = self._stub.StreStre()
+            (
+                invocation_metadata,
+                rpc,
+            ) = await self._channel.take_stream_stream(
+                _application_testing_common.FIRST_SERVICE_STRESTRE
+            )
+            await call.write(_application_common.STREAM_STREAM_REQUEST)
+            request = await rpc.take_request()
+            rpc.send_response(_application_common.STREAM_STREAM_RESPONSE)
+            response = await call.read()
+            await call.done_writing()
+            await rpc.requests_closed()
+            rpc.terminate((), grpc.StatusCode.OK, "")
+
+            self.assertEqual(_application_common.STREAM_STREAM_REQUEST, request)
+            self.assertEqual(
+                _application_common.STREAM_STREAM_RESPONSE, response
+            )
+            self.assertIs(aio.EOF, await call.read())
+
+        self._run(test())
+
+    def test_error_status_raises(self):
+        async def test():
+            call = self._stub.UnUn(
+                _application_common.ERRONEOUS_UNARY_UNARY_REQUEST
+            )
+            _, _, rpc = await self._channel.take_unary_unary(
+                _application_testing_common.FIRST_SERVICE_UNUN
+            )
+            rpc.terminate(
+                _application_common.ERRONEOUS_UNARY_UNARY_RESPONSE,
+                (),
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "",
+            )
+
+            with self.assertRaises(aio.AioRpcError) as exception_context:
+                await call
+            self.assertIs(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                exception_context.exception.code(),
+            )
+
+        self._run(test())
+
+    def test_local_cancel(self):
+        async def test():
+            call = self._stub.UnUn(_application_common.UNARY_UNARY_REQUEST)
+            _, _, rpc = await self._channel.take_unary_unary(
+                _application_testing_common.FIRST_SERVICE_UNUN
+            )
+            self.assertTrue(call.cancel())
+            await rpc.cancelled()
+
+            self.assertTrue(call.cancelled())
+            with self.assertRaises(asyncio.CancelledError):
+                await call
+
+        self._run(test())
+
+    def test_deadline_elapses_on_fake_clock(self):
+        async def test():
+            start = self._loop.time()
+            call = self._stub.UnUn(
+                _application_common.UNARY_UNARY_REQUEST,
+                timeout=_LONG_TIMEOUT_S,
+            )
+            await self._channel.take_unary_unary(
+                _application_testing_common.FIRST_SERVICE_UNUN
+            )
+
+            self.assertIs(grpc.StatusCode.DEADLINE_EXCEEDED, await call.code())
+            self.assertEqual(start + _LONG_TIMEOUT_S, self._loop.time())
+            self.assertEqual(0.0, call.time_remaining())
+
+        self._run(test())
+
+    def test_sleep_on_fake_clock(self):
+        async def test():
+            start = self._loop.time()
+            await asyncio.sleep(_LONG_TIMEOUT_S)
+            return self._loop.time() - start
+
+        self.assertEqual(_LONG_TIMEOUT_S, self._run(test()))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
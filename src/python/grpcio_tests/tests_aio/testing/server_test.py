@@ -0,0 +1,169 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of grpc_testing.aio.Server driving an AsyncIO servicer."""
+
+import asyncio
+import logging
+import unittest
+
+import grpc
+import grpc_testing.aio
+
+from tests.testing import _application_common
+from tests.testing import _application_testing_common
+from tests.testing.proto import services_pb2
+from tests_aio.testing import _server_application
+from tests_aio.unit._test_base import AioTestBase
+
+
+# TODO(https://github.com/protocolbuffers/protobuf/issues/3452): Drop this skip.
+@unittest.skipIf(
+    services_pb2.DESCRIPTOR.services_by_name.get("FirstService") is None,
+    "Fix protobuf issue 3452!",
+)
+class FirstServiceServicerTest(AioTestBase):
+    async def setUp(self):
+        servicer = _server_application.FirstServiceServicer()
+        self._server = grpc_testing.aio.server_from_dictionary(
+            {_application_testing_common.FIRST_SERVICE: servicer}
+        )
+
+    async def test_successful_unary_unary(self):
+        rpc = self._server.invoke_unary_unary(
+            _application_testing_common.FIRST_SERVICE_UNUN,
+            (),
+            _application_common.UNARY_UNARY_REQUEST,
+            None,
+        )
+        await rpc.initial_metadata()
+        response, trailing_metadata, code, details = await rpc.termination()
+
+        self.assertEqual(_application_common.UNARY_UNARY_RESPONSE, response)
+        self.assertIs(code, grpc.StatusCode.OK)
+
+    async def test_successful_unary_stream(self):
+        rpc = self._server.invoke_unary_stream(
+            _application_testing_common.FIRST_SERVICE_UNSTRE,
+            (),
+            _application_common.UNARY_STREAM_REQUEST,
+            None,
+        )
+        await rpc.initial_metadata()
+        first_response = await rpc.take_response()
+        second_response = await rpc.take_response()
+        trailing_metadata, code, details = await rpc.termination()
+
+        self.assertEqual(
+            _application_common.STREAM_UNARY_RESPONSE, first_response
+        )
+        self.assertEqual(
+            _application_common.STREAM_UNARY_RESPONSE, second_response
+        )
+        self.assertIs(code, grpc.StatusCode.OK)
+
+    async def test_successful_stream_unary(self):
+        rpc = self._server.invoke_stream_unary(
+            _application_testing_common.FIRST_SERVICE_STREUN, (), None
+        )
+        rpc.send_request(_application_common.STREAM_UNARY_REQUEST)
+        rpc.send_request(_application_common.STREAM_UNARY_REQUEST)
+        rpc.send_request(_application_common.STREAM_UNARY_REQUEST)
+        rpc.requests_closed()
+        initial_metadata = await rpc.initial_metadata()
+        response, trailing_metadata, code, details = await rpc.termination()
+
+        self.assertIn(
+            ("server_application_metadata_key", "Hi there!"),
+            initial_metadata,
+        )
+        self.assertEqual(_application_common.STREAM_UNARY_RESPONSE, response)
+        self.assertIs(code, grpc.StatusCode.OK)
+
+    async def test_successful_stream_stream(self):
+        rpc = self._server.invoke_stream_stream(
+            _application_testing_common.FIRST_SERVICE_STRESTRE, (), None
+        )
+        rpc.send_request(_application_common.STREAM_STREAM_REQUEST)
+        await rpc.initial_metadata()
+        responses = [await rpc.take_response(), await rpc.take_response()]
+        rpc.send_request(_application_common.STREAM_STREAM_REQUEST)
+        rpc.send_request(_application_common.STREAM_STREAM_REQUEST)
+        responses.extend(
+            [
+                await rpc.take_response(),
+                await rpc.take_response(),
+                await rpc.take_response(),
+                await rpc.take_response(),
+            ]
+        )
+        rpc.requests_closed()
+        trailing_metadata, code, details = await rpc.termination()
+
+        for response in responses:
+            self.assertEqual(
+                _application_common.STREAM_STREAM_RESPONSE, response
+            )
+        self.assertIs(code, grpc.StatusCode.OK)
+
+    async def test_misbehaving_client_unary_unary(self):
+        rpc = self._server.invoke_unary_unary(
+            _application_testing_common.FIRST_SERVICE_UNUN,
+            (),
+            _application_common.ERRONEOUS_UNARY_UNARY_REQUEST,
+            0.1,
+        )
+        response, trailing_metadata, code, details = await rpc.termination()
+
+        self.assertIs(code, grpc.StatusCode.DEADLINE_EXCEEDED)
+
+    async def test_abort(self):
+        rpc = self._server.invoke_unary_unary(
+            _application_testing_common.FIRST_SERVICE_UNUN,
+            (),
+            _application_common.ABORT_REQUEST,
+            None,
+        )
+        response, trailing_metadata, code, details = await rpc.termination()
+
+        self.assertIs(code, grpc.StatusCode.PERMISSION_DENIED)
+        self.assertEqual("Denying permission to test abort.", details)
+
+    async def test_invalid_request(self):
+        rpc = self._server.invoke_unary_stream(
+            _application_testing_common.FIRST_SERVICE_UNSTRE,
+            (),
+            _application_common.STREAM_UNARY_REQUEST,
+            None,
+        )
+        trailing_metadata, code, details = await rpc.termination()
+
+        self.assertIs(code, grpc.StatusCode.INVALID_ARGUMENT)
+
+    async def test_client_cancel_cancels_handler(self):
+        rpc = self._server.invoke_stream_stream(
+            _application_testing_common.FIRST_SERVICE_STRESTRE, (), None
+        )
+        rpc.send_request(_application_common.STREAM_STREAM_REQUEST)
+        await rpc.take_response()
+        rpc.cancel()
+        # Lets the handler task observe its cancellation.
+        await asyncio.sleep(0)
+
+        with self.assertRaises(ValueError):
+            await rpc.termination()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -16,6 +16,7 @@ import logging
 import unittest
 
 import grpc
+import grpc.experimental
 from grpc.experimental import aio
 from grpc.experimental.aio import Metadata
 import typeguard
@@ -323,6 +324,31 @@ class TestMetadataWithServer(AioTestBase):
                 await call
                 self.assertEqual(grpc.StatusCode.OK, await call.code())
 
+    async def test_encoded_metadata_with_client_interceptor(self):
+        encoded_metadata = grpc.experimental.encode_metadata(
+            _INITIAL_METADATA_FROM_CLIENT_TO_SERVER_TUPLE
+        )
+        async with aio.insecure_channel(
+            self._address,
+            interceptors=[UnaryUnaryAddMetadataInterceptor()],
+        ) as channel:
+            multicallable = channel.unary_unary(_TEST_UNARY_UNARY)
+            call = multicallable(_REQUEST, metadata=encoded_metadata)
+            self.assertEqual(_RESPONSE, await call)
+            self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_encoded_metadata_reused_across_calls(self):
+        encoded_metadata = grpc.experimental.encode_metadata(
+            tuple(_INITIAL_METADATA_FROM_CLIENT_TO_SERVER_ALL)
+        )
+        multicallable = self._channel.unary_unary(_TEST_UNARY_UNARY)
+        for compression in (None, None, grpc.Compression.Gzip):
+            call = multicallable(
+                _REQUEST, metadata=encoded_metadata, compression=compression
+            )
+            self.assertEqual(_RESPONSE, await call)
+            self.assertEqual(grpc.StatusCode.OK, await call.code())
+
 
 if __name__ == "__main__":
     logging.basicConfig()
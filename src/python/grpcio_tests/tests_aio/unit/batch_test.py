@@ -0,0 +1,129 @@
+# Copyright 2026 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of unary-unary batch invocation on grpc.aio channels."""
+
+import asyncio
+import logging
+import unittest
+
+import grpc
+from grpc.experimental import aio
+
+from src.proto.grpc.testing import messages_pb2
+from tests_aio.unit._constants import UNARY_CALL_WITH_SLEEP_VALUE
+from tests_aio.unit._test_base import AioTestBase
+from tests_aio.unit._test_server import start_test_server
+
+_UNARY_CALL_METHOD = "/grpc.testing.TestService/UnaryCall"
+_UNARY_CALL_METHOD_WITH_SLEEP = "/grpc.testing.TestService/UnaryCallWithSleep"
+
+_BATCH_SIZE = 50
+_INITIAL_METADATA_KEY = "x-grpc-test-echo-initial"
+_INITIAL_METADATA = ((_INITIAL_METADATA_KEY, "batch"),)
+
+
+class _PassThroughInterceptor(aio.UnaryUnaryClientInterceptor):
+    async def intercept_unary_unary(
+        self, continuation, client_call_details, request
+    ):
+        return await continuation(client_call_details, request)
+
+
+class TestBatch(AioTestBase):
+    async def setUp(self):
+        self._server_target, self._server = await start_test_server()
+
+    async def tearDown(self):
+        await self._server.stop(None)
+
+    def _requests(self):
+        return [
+            messages_pb2.SimpleRequest(response_size=size)
+            for size in range(_BATCH_SIZE)
+        ]
+
+    async def _test_results_in_request_order(self, channel):
+        multicallable = channel.unary_unary(
+            _UNARY_CALL_METHOD,
+            request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+            response_deserializer=messages_pb2.SimpleResponse.FromString,
+        )
+
+        calls = multicallable.batch(
+            self._requests(), metadata=_INITIAL_METADATA
+        )
+        responses = await asyncio.gather(*calls)
+
+        self.assertEqual(
+            list(range(_BATCH_SIZE)),
+            [len(response.payload.body) for response in responses],
+        )
+        for call in calls:
+            self.assertEqual(
+                "batch", (await call.initial_metadata())[_INITIAL_METADATA_KEY]
+            )
+
+    async def test_results_in_request_order(self):
+        async with aio.insecure_channel(self._server_target) as channel:
+            await self._test_results_in_request_order(channel)
+
+    async def test_results_in_request_order_with_interceptor(self):
+        async with aio.insecure_channel(
+            self._server_target, interceptors=[_PassThroughInterceptor()]
+        ) as channel:
+            await self._test_results_in_request_order(channel)
+
+    async def test_as_completed(self):
+        async with aio.insecure_channel(self._server_target) as channel:
+            multicallable = channel.unary_unary(
+                _UNARY_CALL_METHOD,
+                request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+                response_deserializer=messages_pb2.SimpleResponse.FromString,
+            )
+
+            calls = multicallable.batch(self._requests())
+            sizes = [
+                len((await call).payload.body)
+                for call in asyncio.as_completed(calls)
+            ]
+
+            self.assertCountEqual(range(_BATCH_SIZE), sizes)
+
+    async def test_shared_deadline(self):
+        async with aio.insecure_channel(self._server_target) as channel:
+            multicallable = channel.unary_unary(
+                _UNARY_CALL_METHOD_WITH_SLEEP,
+                request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+                response_deserializer=messages_pb2.SimpleResponse.FromString,
+            )
+
+            calls = multicallable.batch(
+                self._requests(), timeout=UNARY_CALL_WITH_SLEEP_VALUE / 2
+            )
+
+            for call in calls:
+                self.assertEqual(
+                    grpc.StatusCode.DEADLINE_EXCEEDED, await call.code()
+                )
+
+    async def test_empty_batch(self):
+        async with aio.insecure_channel(self._server_target) as channel:
+            multicallable = channel.unary_unary(_UNARY_CALL_METHOD)
+
+            self.assertEqual([], multicallable.batch([]))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
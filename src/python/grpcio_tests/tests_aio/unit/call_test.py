@@ -20,6 +20,7 @@ import random
 import unittest
 
 import grpc
+from grpc import _observability
 from grpc.experimental import aio
 
 from src.proto.grpc.testing import messages_pb2
@@ -39,6 +40,27 @@ _INFINITE_INTERVAL_US = 2**31 - 1
 
 _NONDETERMINISTIC_ITERATIONS = 50
 _NONDETERMINISTIC_SERVER_SLEEP_MAX_US = 1000
+_UNARY_CALL_METHOD_WITH_SLEEP = "/grpc.testing.TestService/UnaryCallWithSleep"
+
+
+class _PhaseRecordingPlugin(_observability.ObservabilityPlugin):
+    def __init__(self):
+        self.recorded = []
+
+    def create_client_call_tracer(self, method_name, target):
+        return None
+
+    def save_trace_context(self, trace_id, span_id, is_sampled):
+        pass
+
+    def create_server_call_tracer_factory(self, *, xds=False):
+        return None
+
+    def record_rpc_latency(self, method, target, rpc_latency, status_code):
+        pass
+
+    def record_client_rpc_phases(self, method, target, phases):
+        self.recorded.append((method, target, phases))
 
 
 class _MulticallableTestMixin:
@@ -210,6 +232,74 @@ class TestUnaryUnaryCall(_MulticallableTestMixin, AioTestBase):
         with self.assertRaises(asyncio.CancelledError):
             await task
 
+    async def test_call_not_awaited_is_sent(self):
+        call = self._stub.UnaryCall(messages_pb2.SimpleRequest())
+
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+        self.assertIsInstance(await call, messages_pb2.SimpleResponse)
+
+    async def test_multiple_waiters_while_awaited_inline(self):
+        async def invoke_and_await():
+            call = self._stub.UnaryCall(messages_pb2.SimpleRequest())
+            calls.put_nowait(call)
+            return await call
+
+        calls = asyncio.Queue()
+        task1 = self.loop.create_task(invoke_and_await())
+        call = await calls.get()
+        task2 = self.loop.create_task(call.wait_for_connection())
+
+        response = await call
+        self.assertIs(response, await task1)
+        await task2
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_cancel_task_awaiting_inline(self):
+        unary_call_with_sleep = self._channel.unary_unary(
+            _UNARY_CALL_METHOD_WITH_SLEEP,
+            request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+            response_deserializer=messages_pb2.SimpleResponse.FromString,
+        )
+
+        async def invoke_and_await():
+            call = unary_call_with_sleep(messages_pb2.SimpleRequest())
+            calls.put_nowait(call)
+            return await call
+
+        calls = asyncio.Queue()
+        task = self.loop.create_task(invoke_and_await())
+        call = await calls.get()
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertTrue(call.cancelled())
+        self.assertEqual(grpc.StatusCode.CANCELLED, await call.code())
+
+    async def test_phase_timings(self):
+        plugin = _PhaseRecordingPlugin()
+        plugin.set_phase_timing(True)
+        _observability.observability_init(plugin)
+        try:
+            call = self._stub.UnaryCall(messages_pb2.SimpleRequest())
+            self.assertIsInstance(await call, messages_pb2.SimpleResponse)
+        finally:
+            _observability.observability_deinit()
+
+        method, _, phases = plugin.recorded[0]
+        self.assertEqual("/grpc.testing.TestService/UnaryCall", method)
+        self.assertEqual(
+            {
+                "serialization",
+                "initial_metadata",
+                "deserialization",
+                "delivery",
+                "total",
+            },
+            set(phases),
+        )
+        self.assertEqual(phases, call.phase_timings())
+
     async def test_passing_credentials_fails_over_insecure_channel(self):
         call_credentials = grpc.composite_call_credentials(
             grpc.access_token_call_credentials("abc"),
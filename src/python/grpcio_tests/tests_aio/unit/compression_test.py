@@ -39,6 +39,8 @@ _TEST_UNARY_UNARY = "/test/TestUnaryUnary"
 _TEST_SET_COMPRESSION = "/test/TestSetCompression"
 _TEST_DISABLE_COMPRESSION_UNARY = "/test/TestDisableCompressionUnary"
 _TEST_DISABLE_COMPRESSION_STREAM = "/test/TestDisableCompressionStream"
+_TEST_OFFLOAD_COMPRESSION_UNARY = "/test/TestOffloadCompressionUnary"
+_TEST_OFFLOAD_COMPRESSION_STREAM = "/test/TestOffloadCompressionStream"
 
 _REQUEST = b"\x01" * 100
 _RESPONSE = b"\x02" * 100
@@ -82,6 +84,28 @@ async def _test_disable_compression_stream(unused_request_iterator, context):
     await context.write(_RESPONSE)
 
 
+async def _test_offload_compression_unary(request, context):
+    assert _REQUEST == request
+    context.set_compression(
+        grpc.Compression.Deflate, offload_message_size=len(_RESPONSE)
+    )
+    return _RESPONSE
+
+
+async def _test_offload_compression_stream(unused_request_iterator, context):
+    assert _REQUEST == await context.read()
+    context.set_compression(
+        grpc.Compression.Deflate,
+        min_message_size=len(_RESPONSE),
+        offload_message_size=len(_RESPONSE),
+    )
+    await context.write(_RESPONSE)
+    await context.write(_RESPONSE[:1])
+    context.disable_next_message_compression()
+    await context.write(_RESPONSE)
+    await context.write(_RESPONSE)
+
+
 _ROUTING_TABLE = {
     _TEST_UNARY_UNARY: grpc.unary_unary_rpc_method_handler(_test_unary_unary),
     _TEST_SET_COMPRESSION: grpc.stream_stream_rpc_method_handler(
@@ -93,6 +117,12 @@ _ROUTING_TABLE = {
     _TEST_DISABLE_COMPRESSION_STREAM: grpc.stream_stream_rpc_method_handler(
         _test_disable_compression_stream
     ),
+    _TEST_OFFLOAD_COMPRESSION_UNARY: grpc.unary_unary_rpc_method_handler(
+        _test_offload_compression_unary
+    ),
+    _TEST_OFFLOAD_COMPRESSION_STREAM: grpc.stream_stream_rpc_method_handler(
+        _test_offload_compression_stream
+    ),
 }
 
 
@@ -185,6 +215,27 @@ class TestCompression(AioTestBase):
         self.assertEqual(_RESPONSE, await call.read())
         self.assertEqual(grpc.StatusCode.OK, await call.code())
 
+    async def test_server_offload_compression_unary(self):
+        multicallable = self._channel.unary_unary(
+            _TEST_OFFLOAD_COMPRESSION_UNARY
+        )
+        call = multicallable(_REQUEST)
+        self.assertEqual(_RESPONSE, await call)
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_server_offload_compression_stream(self):
+        multicallable = self._channel.stream_stream(
+            _TEST_OFFLOAD_COMPRESSION_STREAM
+        )
+        call = multicallable()
+        await call.write(_REQUEST)
+        await call.done_writing()
+        self.assertEqual(_RESPONSE, await call.read())
+        self.assertEqual(_RESPONSE[:1], await call.read())
+        self.assertEqual(_RESPONSE, await call.read())
+        self.assertEqual(_RESPONSE, await call.read())
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
     async def test_server_default_compression_algorithm(self):
         server = aio.server(compression=grpc.Compression.Deflate)
         port = server.add_insecure_port("[::]:0")
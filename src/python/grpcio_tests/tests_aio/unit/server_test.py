@@ -18,6 +18,8 @@ import time
 import unittest
 
 import grpc
+from grpc import _observability
+import grpc.experimental
 from grpc.experimental import aio
 
 from tests.unit import resources
@@ -244,6 +246,26 @@ class _GenericHandler(grpc.GenericRpcHandler):
         await self._called
 
 
+class _PhaseRecordingPlugin(_observability.ObservabilityPlugin):
+    def __init__(self):
+        self.recorded = []
+
+    def create_client_call_tracer(self, method_name, target):
+        return None
+
+    def save_trace_context(self, trace_id, span_id, is_sampled):
+        pass
+
+    def create_server_call_tracer_factory(self, *, xds=False):
+        return None
+
+    def record_rpc_latency(self, method, target, rpc_latency, status_code):
+        pass
+
+    def record_server_rpc_phases(self, method, phases):
+        self.recorded.append((method, phases))
+
+
 async def _start_test_server():
     server = aio.server()
     port = server.add_insecure_port("[::]:0")
@@ -705,6 +727,69 @@ class TestServer(AioTestBase):
         await channel.close()
         await server.stop(0)
 
+    async def test_adaptive_concurrency_limiter(self):
+        limiter = grpc.experimental.AdaptiveConcurrencyLimiter(
+            initial_limit=1, min_limit=1, max_limit=1
+        )
+        server = aio.server(maximum_concurrent_rpcs=limiter)
+        port = server.add_insecure_port("[::]:0")
+        server.add_generic_rpc_handlers((_GenericHandler(),))
+        await server.start()
+        channel = aio.insecure_channel("localhost:%d" % port)
+
+        blocking_calls = [
+            channel.unary_unary(_BLOCK_BRIEFLY)(_REQUEST) for _ in range(2)
+        ]
+        other_call = channel.unary_unary(_SIMPLE_UNARY_UNARY)(_REQUEST)
+
+        self.assertEqual(_RESPONSE, await other_call)
+        results = await asyncio.gather(*blocking_calls, return_exceptions=True)
+        self.assertIn(_RESPONSE, results)
+        exceptions = [
+            result for result in results if isinstance(result, Exception)
+        ]
+        self.assertEqual(1, len(exceptions))
+        self.assertEqual(
+            grpc.StatusCode.RESOURCE_EXHAUSTED, exceptions[0].code()
+        )
+        # Give the done callbacks of the RPC tasks a chance to run.
+        await asyncio.sleep(0)
+        self.assertEqual(
+            grpc.experimental.AdaptiveConcurrencyLimiterStats(1, 0, 1),
+            limiter.stats()[_BLOCK_BRIEFLY],
+        )
+
+        await channel.close()
+        await server.stop(0)
+
+    async def test_phase_timing(self):
+        plugin = _PhaseRecordingPlugin()
+        plugin.set_phase_timing(True)
+        _observability.observability_init(plugin)
+        try:
+            response = await self._channel.unary_unary(_SIMPLE_UNARY_UNARY)(
+                _REQUEST
+            )
+            # The phases are recorded by a done callback of the RPC task.
+            while not plugin.recorded:
+                await asyncio.sleep(0.01)
+        finally:
+            _observability.observability_deinit()
+
+        self.assertEqual(_RESPONSE, response)
+        method, phases = plugin.recorded[0]
+        self.assertEqual(_SIMPLE_UNARY_UNARY, method)
+        for phase in (
+            "lookup",
+            "deserialization",
+            "handler",
+            "serialization",
+            "send",
+            "total",
+        ):
+            self.assertIn(phase, phases)
+            self.assertLessEqual(phases[phase], phases["total"])
+
     async def test_invalid_trailing_metadata(self):
         call = self._channel.unary_unary(_INVALID_TRAILING_METADATA)(_REQUEST)
 
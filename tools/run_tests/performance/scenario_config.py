@@ -1048,6 +1048,48 @@ class PythonLanguage(Language):
             server_type="ASYNC_SERVER",
         )
 
+        yield _ping_pong_scenario(
+            "python_generic_async_streaming_ping_pong",
+            rpc_type="STREAMING",
+            client_type="ASYNC_CLIENT",
+            server_type="ASYNC_GENERIC_SERVER",
+            use_generic_payload=True,
+            categories=[SCALABLE],
+        )
+
+        yield _ping_pong_scenario(
+            "python_protobuf_async_streaming_ping_pong",
+            rpc_type="STREAMING",
+            client_type="ASYNC_CLIENT",
+            server_type="ASYNC_SERVER",
+            categories=[SCALABLE],
+        )
+
+        yield _ping_pong_scenario(
+            "python_protobuf_sync_streaming_from_server",
+            rpc_type="STREAMING_FROM_SERVER",
+            client_type="SYNC_CLIENT",
+            server_type="ASYNC_SERVER",
+            categories=[SCALABLE],
+        )
+
+        yield _ping_pong_scenario(
+            "python_protobuf_async_streaming_from_server",
+            rpc_type="STREAMING_FROM_SERVER",
+            client_type="ASYNC_CLIENT",
+            server_type="ASYNC_SERVER",
+            categories=[SCALABLE],
+        )
+
+        yield _ping_pong_scenario(
+            "python_generic_async_streaming_from_server",
+            rpc_type="STREAMING_FROM_SERVER",
+            client_type="ASYNC_CLIENT",
+            server_type="ASYNC_GENERIC_SERVER",
+            use_generic_payload=True,
+            categories=[SCALABLE],
+        )
+
         yield _ping_pong_scenario(
             "python_protobuf_async_unary_ping_pong",
             rpc_type="UNARY",